@@ -1,7 +1,9 @@
 """Controllers module."""
 
 from .alert_controller import AlertController
+from .build_controller import BuildController
 from .cleanup_controller import CleanupController
+from .compose_controller import ComposeController
 from .container_controller import ContainerController
 from .system_controller import SystemController
 
@@ -10,4 +12,6 @@ __all__ = [
     "SystemController",
     "AlertController",
     "CleanupController",
+    "BuildController",
+    "ComposeController",
 ]
@@ -3,11 +3,18 @@
 Monitors system resources and generates alerts when thresholds are exceeded.
 """
 
-import psutil
-from typing import Dict, List
+from typing import Any, Dict, Hashable, List, Optional
 
+from app.core.config import settings
+from app.core.fast_json import SchemaEncoder
+from app.core.health import daemon_health
+from app.core.host_metrics import host_metrics
+from app.core.revisions import revisions
 from app.repositories.docker_repository import DockerRepository
 from app.repositories.volume_repository import VolumeRepository
+from app.schemas.alert import Alert
+
+_alert_encoder = SchemaEncoder(Alert)
 
 
 class AlertController:
@@ -29,83 +36,152 @@ class AlertController:
     DISK_CRITICAL = 95.0
 
     @staticmethod
-    def check_all() -> List[Dict[str, str]]:
-        """Check all resources and return alerts.
+    def state_key() -> Hashable:
+        """Summarize the inputs that decide which alerts are raised.
+
+        Cheap and never calls Docker: the host and daemon alerts are
+        rendered exactly as :meth:`check_all` renders them (from the
+        shared host snapshot and the cached probe), containers and
+        volumes are reduced to their revisions.
 
         Returns:
-            List of alert dictionaries with type, level, message.
+            Hashable key that changes when the alerts may change.
+        """
+        host = host_metrics.latest(max_age=settings.sampling_floor)
+        rendered = AlertController._host_alerts(host)
+        rendered += AlertController._docker_alerts()
+        return (
+            tuple(
+                (a["type"], a["level"], a["message"], a["value"])
+                for a in rendered
+            ),
+            revisions.get("containers"),
+            revisions.get("volumes"),
+        )
 
-        Example:
-            >>> alerts = AlertController.check_all()
-            >>> for alert in alerts:
-            ...     print(f"{alert['level']}: {alert['message']}")
+    @staticmethod
+    def _level(value: float, warning: float, critical: float) -> Optional[str]:
+        """Map a value to an alert level.
+
+        Args:
+            value: Measured value.
+            warning: Warning threshold.
+            critical: Critical threshold.
+
+        Returns:
+            "critical", "warning" or None.
         """
-        alerts = []
+        if value >= critical:
+            return "critical"
+        if value >= warning:
+            return "warning"
+        return None
 
-        # System resources
-        cpu = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory().percent
-        disk = psutil.disk_usage("/").percent
+    @staticmethod
+    def _host_alerts(host: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Render the CPU, memory and disk alerts of a host snapshot.
 
-        # CPU alerts
-        if cpu >= AlertController.CPU_CRITICAL:
-            alerts.append(
-                {
-                    "type": "cpu",
-                    "level": "critical",
-                    "message": f"CPU usage critically high: {cpu:.1f}%",
-                    "value": cpu,
-                }
-            )
-        elif cpu >= AlertController.CPU_WARNING:
-            alerts.append(
-                {
-                    "type": "cpu",
-                    "level": "warning",
-                    "message": f"CPU usage high: {cpu:.1f}%",
-                    "value": cpu,
-                }
-            )
+        Args:
+            host: Host snapshot from ``host_metrics``.
 
-        # Memory alerts
-        if memory >= AlertController.MEMORY_CRITICAL:
-            alerts.append(
-                {
-                    "type": "memory",
-                    "level": "critical",
-                    "message": f"Memory usage critically high: {memory:.1f}%",
-                    "value": memory,
-                }
-            )
-        elif memory >= AlertController.MEMORY_WARNING:
+        Returns:
+            List of alert dictionaries.
+        """
+        alerts = []
+        for kind, label, value, warning, critical in (
+            (
+                "cpu",
+                "CPU",
+                host["cpu_percent"],
+                AlertController.CPU_WARNING,
+                AlertController.CPU_CRITICAL,
+            ),
+            (
+                "memory",
+                "Memory",
+                host["memory"]["percent"],
+                AlertController.MEMORY_WARNING,
+                AlertController.MEMORY_CRITICAL,
+            ),
+            (
+                "disk",
+                "Disk",
+                host["disk"]["percent"],
+                AlertController.DISK_WARNING,
+                AlertController.DISK_CRITICAL,
+            ),
+        ):
+            level = AlertController._level(value, warning, critical)
+            if level is None:
+                continue
+            severity = "critically high" if level == "critical" else "high"
             alerts.append(
                 {
-                    "type": "memory",
-                    "level": "warning",
-                    "message": f"Memory usage high: {memory:.1f}%",
-                    "value": memory,
+                    "type": kind,
+                    "level": level,
+                    "message": f"{label} usage {severity}: {value:.1f}%",
+                    "value": value,
                 }
             )
+        return alerts
 
-        # Disk alerts
-        if disk >= AlertController.DISK_CRITICAL:
-            alerts.append(
+    @staticmethod
+    def _docker_alerts() -> List[Dict[str, Any]]:
+        """Render the Docker daemon alert from the cached probe state.
+
+        Returns:
+            List holding the reachability or slowness alert, if any.
+        """
+        if not daemon_health.probed:
+            return []
+        state = daemon_health.snapshot()
+        latency = state["recent_latency_ms"]
+        if not state["connected"]:
+            return [
                 {
-                    "type": "disk",
+                    "type": "docker",
                     "level": "critical",
-                    "message": f"Disk usage critically high: {disk:.1f}%",
-                    "value": disk,
+                    "message": (
+                        f"Docker daemon unreachable: {state['last_error']}"
+                    ),
+                    "value": state["consecutive_failures"],
                 }
-            )
-        elif disk >= AlertController.DISK_WARNING:
-            alerts.append(
-                {
-                    "type": "disk",
-                    "level": "warning",
-                    "message": f"Disk usage high: {disk:.1f}%",
-                    "value": disk,
-                }
-            )
+            ]
+        if latency is None:
+            return []
+        level = AlertController._level(
+            latency,
+            settings.docker_slow_warning_ms,
+            settings.docker_slow_critical_ms,
+        )
+        if level is None:
+            return []
+        return [
+            {
+                "type": "docker",
+                "level": level,
+                "message": f"Docker daemon slow: {latency:.0f}ms average ping",
+                "value": latency,
+            }
+        ]
+
+    @staticmethod
+    def check_all() -> List[Dict[str, str]]:
+        """Check all resources and return alerts.
+
+        Returns:
+            List of alert dictionaries with type, level, message.
+
+        Example:
+            >>> alerts = AlertController.check_all()
+            >>> for alert in alerts:
+            ...     print(f"{alert['level']}: {alert['message']}")
+        """
+        alerts = []
+
+        # System resources
+        host = host_metrics.latest(max_age=settings.sampling_floor)
+        alerts.extend(AlertController._host_alerts(host))
 
         # Check unused containers
         try:
@@ -125,6 +201,9 @@ class AlertController:
         except Exception:
             pass
 
+        # Docker daemon reachability and slowness (cached probe state)
+        alerts.extend(AlertController._docker_alerts())
+
         # Check unused volumes
         try:
             volume_repo = VolumeRepository()
@@ -144,3 +223,23 @@ class AlertController:
 
         return alerts
 
+    @staticmethod
+    def summary() -> Dict[str, Any]:
+        """Check all resources and count alerts by severity.
+
+        Returns:
+            JSON-ready dictionary matching AlertsResponse.
+
+        Example:
+            >>> AlertController.summary()["critical_count"]
+            0
+        """
+        alerts = AlertController.check_all()
+        return {
+            "alerts": _alert_encoder.encode_many(alerts),
+            "critical_count": sum(
+                1 for a in alerts if a["level"] == "critical"
+            ),
+            "warning_count": sum(1 for a in alerts if a["level"] == "warning"),
+            "info_count": sum(1 for a in alerts if a["level"] == "info"),
+        }
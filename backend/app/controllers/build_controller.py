@@ -0,0 +1,105 @@
+"""Build controller - Business logic for compose service builds.
+
+Reports which compose services have build contexts that differ from
+the fingerprint stamped on their current image, and manages the
+BuildKit cache against its keep-storage budget.
+"""
+
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+
+from app.repositories.build_cache_repository import BuildCacheRepository
+from app.repositories.build_repository import BuildRepository
+from app.schemas.build import (
+    BuildCachePruneResult,
+    BuildCacheReport,
+    BuildStatus,
+)
+
+
+class BuildController:
+    """Handles build status business logic.
+
+    Example:
+        >>> repo = BuildRepository()
+        >>> stale = BuildController.list_stale(repo)
+        >>> print([s.service for s in stale])
+    """
+
+    @staticmethod
+    def list_stale(repository: BuildRepository) -> List[BuildStatus]:
+        """List compose services whose image is out of date.
+
+        Args:
+            repository: Build repository instance.
+
+        Returns:
+            List of BuildStatus models for stale services.
+
+        Raises:
+            HTTPException: 500 if the build status cannot be computed.
+        """
+        try:
+            statuses = repository.list_build_status()
+            return [BuildStatus(**s) for s in statuses if s["stale"]]
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get build status: {str(e)}",
+            )
+
+    @staticmethod
+    def get_cache_report(
+        repository: BuildCacheRepository,
+    ) -> BuildCacheReport:
+        """Summarize the build cache against its budget.
+
+        Args:
+            repository: Build cache repository instance.
+
+        Returns:
+            BuildCacheReport by type and age.
+
+        Raises:
+            HTTPException: 500 if the disk usage cannot be read.
+
+        Example:
+            >>> report = BuildController.get_cache_report(repo)
+            >>> print(report.over_budget_bytes)
+        """
+        try:
+            return BuildCacheReport(**repository.get_report())
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get build cache report: {str(e)}",
+            )
+
+    @staticmethod
+    def prune_cache(
+        repository: BuildCacheRepository, budget_gb: Optional[float] = None
+    ) -> BuildCachePruneResult:
+        """Prune the build cache down to its keep-storage budget.
+
+        Args:
+            repository: Build cache repository instance.
+            budget_gb: Cache to keep in GB. Defaults to the setting.
+
+        Returns:
+            BuildCachePruneResult with bytes freed against the budget.
+
+        Raises:
+            HTTPException: 500 if the prune fails.
+
+        Example:
+            >>> BuildController.prune_cache(repo, budget_gb=5)
+        """
+        budget = None if budget_gb is None else int(budget_gb * 1024**3)
+        try:
+            return BuildCachePruneResult(**repository.prune_to_budget(budget))
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=str(e),
+            )
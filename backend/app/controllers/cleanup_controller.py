@@ -3,10 +3,32 @@
 Handles cleanup of unused containers, images, volumes, and build cache.
 """
 
-from typing import Dict
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
 
 from app.core import docker_client
+from app.core.config import settings
+from app.repositories.build_cache_repository import BuildCacheRepository
+from app.repositories.cleanup_repository import CleanupRepository
+from app.repositories.disk_usage_repository import DiskUsageRepository
 from app.repositories.volume_repository import VolumeRepository
+from app.schemas.volume import (
+    CleanupPlan,
+    CleanupPlanResult,
+    ImageEvictionResult,
+)
+
+# Step name -> CleanupController method, in report order
+_CLEANUP_STEPS = {
+    "containers": "cleanup_containers",
+    "images": "cleanup_images",
+    "volumes": "cleanup_volumes",
+    "build_cache": "cleanup_build_cache",
+}
 
 
 class CleanupController:
@@ -28,6 +50,7 @@ class CleanupController:
         """
         try:
             result = docker_client.client.containers.prune()
+            DiskUsageRepository.invalidate()
             return {
                 "containers_deleted": len(
                     result.get("ContainersDeleted") or []
@@ -43,11 +66,25 @@ class CleanupController:
     def cleanup_images() -> Dict[str, int]:
         """Remove unused images.
 
+        In the default ``lru`` mode only the least-recently-used images
+        are evicted until the image disk budget is met, so base images
+        still in regular use survive. ``prune`` mode removes every image
+        no container uses.
+
         Returns:
             Dictionary with cleanup statistics.
         """
         try:
+            if settings.image_cleanup_mode == "lru":
+                result = CleanupRepository().evict_images()
+                return {
+                    "images_deleted": len(result["evicted"]),
+                    "space_freed_mb": round(
+                        result["space_freed_bytes"] / 1024 / 1024, 2
+                    ),
+                }
             result = docker_client.client.images.prune(filters={"dangling": False})
+            DiskUsageRepository.invalidate()
             return {
                 "images_deleted": len(result.get("ImagesDeleted") or []),
                 "space_freed_mb": round(
@@ -76,46 +113,253 @@ class CleanupController:
 
     @staticmethod
     def cleanup_build_cache() -> Dict[str, int]:
-        """Remove build cache.
+        """Prune build cache down to the keep-storage budget.
+
+        Only the oldest, least-used records beyond
+        ``BUILD_CACHE_BUDGET_GB`` are removed, so rebuilds stay warm.
 
         Returns:
             Dictionary with cleanup statistics.
         """
         try:
-            result = docker_client.client.api.prune_builds()
+            result = BuildCacheRepository().prune_to_budget()
             return {
+                "build_cache_deleted": result["caches_deleted"],
                 "space_freed_mb": round(
-                    result.get("SpaceReclaimed", 0) / 1024 / 1024, 2
+                    result["space_freed_bytes"] / 1024 / 1024, 2
                 ),
             }
         except Exception as e:
             raise RuntimeError(f"Failed to cleanup build cache: {e}")
 
     @staticmethod
-    def cleanup_all() -> Dict[str, int]:
+    def cleanup_all() -> Dict[str, Any]:
         """Run all cleanup operations.
 
+        Containers are pruned first, together with the independent build
+        cache prune; images and volumes follow once containers are done,
+        since removing containers frees them. If the containers step
+        fails or times out, images and volumes are not started (their
+        reports name the blocking step), because container removal may
+        still be holding them. Every step has its own timeout and a
+        failing step never discards what the others freed.
+
         Returns:
-            Dictionary with total cleanup statistics.
+            Dictionary with total cleanup statistics and a ``steps``
+            list holding each step's name, duration_seconds,
+            space_freed_mb, deleted count and error.
 
         Example:
             >>> result = CleanupController.cleanup_all()
             >>> print(result)
         """
-        containers = CleanupController.cleanup_containers()
-        images = CleanupController.cleanup_images()
-        volumes = CleanupController.cleanup_volumes()
-        build = CleanupController.cleanup_build_cache()
+        timeout = settings.cleanup_step_timeout
+        executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="cleanup"
+        )
+        try:
+            first = {
+                name: CleanupController._submit(executor, name)
+                for name in ("containers", "build_cache")
+            }
+            steps = {
+                "containers": CleanupController._collect(
+                    "containers", *first["containers"], timeout
+                )
+            }
+            if steps["containers"]["error"] is None:
+                later = {
+                    name: CleanupController._submit(executor, name)
+                    for name in ("images", "volumes")
+                }
+            else:
+                later = {}
+                for name in ("images", "volumes"):
+                    steps[name] = CleanupController._blocked(name)
+            for name, (future, started) in {**first, **later}.items():
+                if name not in steps:
+                    steps[name] = CleanupController._collect(
+                        name, future, started, timeout
+                    )
+        finally:
+            # Timed-out steps keep running in the background
+            executor.shutdown(wait=False)
 
+        ordered = [steps[name] for name in _CLEANUP_STEPS]
         return {
-            "containers_deleted": containers["containers_deleted"],
-            "images_deleted": images["images_deleted"],
-            "volumes_deleted": volumes["volumes_deleted"],
-            "total_freed_mb": (
-                containers["space_freed_mb"]
-                + images["space_freed_mb"]
-                + volumes["space_freed_mb"]
-                + build["space_freed_mb"]
+            "containers_deleted": steps["containers"]["deleted"],
+            "images_deleted": steps["images"]["deleted"],
+            "volumes_deleted": steps["volumes"]["deleted"],
+            "total_freed_mb": round(
+                sum(step["space_freed_mb"] for step in ordered), 2
             ),
+            "steps": ordered,
+        }
+
+    @staticmethod
+    def _submit(
+        executor: ThreadPoolExecutor, name: str
+    ) -> Tuple[Future, float]:
+        """Start a cleanup step in the executor.
+
+        Args:
+            executor: Executor running the steps.
+            name: Step name from _CLEANUP_STEPS.
+
+        Returns:
+            Tuple of (future, monotonic start time).
+        """
+        step = getattr(CleanupController, _CLEANUP_STEPS[name])
+        return executor.submit(step), time.monotonic()
+
+    @staticmethod
+    def _blocked(name: str) -> Dict[str, Any]:
+        """Report a step skipped because the containers step failed.
+
+        Args:
+            name: Step name.
+
+        Returns:
+            Step report dictionary.
+        """
+        return {
+            "name": name,
+            "duration_seconds": 0.0,
+            "space_freed_mb": 0.0,
+            "deleted": 0,
+            "error": "Blocked by containers: the containers step did "
+            "not finish",
+        }
+
+    @staticmethod
+    def _collect(
+        name: str, future: Future, started: float, timeout: float
+    ) -> Dict[str, Any]:
+        """Wait for a cleanup step and turn its outcome into a report.
+
+        Args:
+            name: Step name.
+            future: Future of the running step.
+            started: Monotonic time the step was submitted.
+            timeout: Seconds the step may run.
+
+        Returns:
+            Step report dictionary.
+        """
+        report = {
+            "name": name,
+            "duration_seconds": 0.0,
+            "space_freed_mb": 0.0,
+            "deleted": 0,
+            "error": None,
         }
+        remaining = max(timeout - (time.monotonic() - started), 0)
+        try:
+            result = future.result(timeout=remaining)
+            report["space_freed_mb"] = result.get("space_freed_mb", 0.0)
+            report["deleted"] = result.get(f"{name}_deleted", 0)
+        except FutureTimeout:
+            report["error"] = f"Timed out after {timeout:.0f}s"
+        except Exception as e:
+            report["error"] = str(e)
+        report["duration_seconds"] = round(time.monotonic() - started, 3)
+        return report
 
+    @staticmethod
+    def get_plan(
+        repository: CleanupRepository, refresh: bool = False
+    ) -> CleanupPlan:
+        """Compute a dry-run cleanup plan.
+
+        Args:
+            repository: Cleanup repository instance.
+            refresh: Take a new disk usage snapshot first.
+
+        Returns:
+            CleanupPlan listing what each category would remove.
+
+        Raises:
+            HTTPException: 500 if the snapshot cannot be taken.
+
+        Example:
+            >>> plan = CleanupController.get_plan(CleanupRepository())
+            >>> print(plan.total_reclaimable_bytes)
+        """
+        try:
+            return CleanupPlan(**repository.build_plan(refresh=refresh))
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to plan cleanup: {str(e)}",
+            )
+
+    @staticmethod
+    def execute_plan(
+        repository: CleanupRepository,
+        plan_id: str,
+        categories: Optional[List[str]] = None,
+    ) -> CleanupPlanResult:
+        """Execute a previously computed cleanup plan.
+
+        Args:
+            repository: Cleanup repository instance.
+            plan_id: Identifier returned by get_plan.
+            categories: Categories to execute. Defaults to all.
+
+        Returns:
+            CleanupPlanResult with removed counts and failures.
+
+        Raises:
+            HTTPException: 404 if the plan is unknown or expired, 500 if
+                execution fails.
+
+        Example:
+            >>> result = CleanupController.execute_plan(repo, "3f2a9c1b7e40")
+        """
+        try:
+            return CleanupPlanResult(
+                **repository.execute_plan(plan_id, categories)
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to execute cleanup plan: {str(e)}",
+            )
+
+    @staticmethod
+    def evict_images(
+        repository: CleanupRepository,
+        budget_gb: Optional[float] = None,
+        dry_run: bool = False,
+    ) -> ImageEvictionResult:
+        """Evict least-recently-used images down to a disk budget.
+
+        Args:
+            repository: Cleanup repository instance.
+            budget_gb: Target image size in GB. Defaults to the
+                ``IMAGE_BUDGET_GB`` setting.
+            dry_run: Only report what would be evicted.
+
+        Returns:
+            ImageEvictionResult with evicted images and bytes freed.
+
+        Raises:
+            HTTPException: 500 if eviction fails.
+
+        Example:
+            >>> CleanupController.evict_images(repo, budget_gb=10)
+        """
+        budget = None if budget_gb is None else int(budget_gb * 1024**3)
+        try:
+            return ImageEvictionResult(
+                **repository.evict_images(budget, dry_run=dry_run)
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to evict images: {str(e)}",
+            )
@@ -0,0 +1,64 @@
+"""Compose controller - Business logic for the compose service catalog.
+
+Serves compose service definitions from the indexed catalog, including
+services that have no container yet.
+"""
+
+from typing import List
+
+from fastapi import HTTPException, status
+
+from app.core.compose_catalog import ComposeCatalog
+from app.schemas.compose import ComposeService
+
+
+class ComposeController:
+    """Handles compose catalog business logic.
+
+    Example:
+        >>> from app.core.compose_catalog import compose_catalog
+        >>> services = ComposeController.list_services(compose_catalog)
+    """
+
+    @staticmethod
+    def list_services(catalog: ComposeCatalog) -> List[ComposeService]:
+        """List every service defined in the compose files.
+
+        Args:
+            catalog: Compose catalog instance.
+
+        Returns:
+            List of ComposeService models.
+
+        Raises:
+            HTTPException: 500 if the catalog cannot be loaded.
+        """
+        try:
+            return [ComposeService(**s) for s in catalog.list_services()]
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to list compose services: {str(e)}",
+            )
+
+    @staticmethod
+    def get_service(catalog: ComposeCatalog, name: str) -> ComposeService:
+        """Get a compose service by service or container name.
+
+        Args:
+            catalog: Compose catalog instance.
+            name: Service name or container name.
+
+        Returns:
+            ComposeService model.
+
+        Raises:
+            HTTPException: 404 if no compose file defines the service.
+        """
+        service = catalog.get(name)
+        if service is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Compose service {name} not found",
+            )
+        return ComposeService(**service)
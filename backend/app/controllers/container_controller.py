@@ -11,17 +11,22 @@ The controller is responsible for:
 - Response formatting
 """
 
-from typing import List
+from typing import Any, Dict, List, Optional
 
+from app.core.container_changes import container_changes
+from app.core.fast_json import SchemaEncoder
 from app.repositories import DockerRepository
 from app.schemas import (
     ContainerAction,
     ContainerInfo,
     ContainerLogs,
     ContainerStats,
+    VolumeMount,
 )
 from fastapi import HTTPException, status
 
+_container_encoder = SchemaEncoder(ContainerInfo)
+
 
 class ContainerController:
     """Handles container-related business logic.
@@ -32,41 +37,106 @@ class ContainerController:
 
     Example:
         >>> repo = DockerRepository()
-        >>> containers = ContainerController.list_all(repo)
+        >>> rows = ContainerController.list_rows(repo)
         >>> stats = ContainerController.get_stats(repo, "postgres")
     """
 
     @staticmethod
-    def list_all(
+    def list_rows(
         repository: DockerRepository, all: bool = True
-    ) -> List[ContainerInfo]:
-        """List all Docker containers.
+    ) -> List[Dict[str, Any]]:
+        """List containers as JSON-ready rows shaped like ContainerInfo.
+
+        Skips per-row model validation: repository data is trusted and
+        only projected onto the schema's fields.
 
         Args:
             repository: Docker repository instance.
             all: Include stopped containers. Defaults to True.
 
         Returns:
-            List of ContainerInfo models.
+            List of dictionaries matching ContainerInfo.
+
+        Raises:
+            HTTPException: 500 if operation fails.
+        """
+        try:
+            return _container_encoder.encode_many(
+                repository.list_containers(all=all)
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to list containers: {str(e)}",
+            )
+
+    @staticmethod
+    def get_changes(
+        repository: DockerRepository, since: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get container list changes since a revision token.
+
+        Only containers logged as added or updated are fetched from
+        Docker. Without a token, or when it is from another process or
+        older than the change log, the full list is returned in
+        ``added`` with ``full_resync`` set.
+
+        Args:
+            repository: Docker repository instance.
+            since: Revision token from a previous response.
+
+        Returns:
+            Dictionary matching ContainerChanges.
 
         Raises:
             HTTPException: 500 if operation fails.
 
         Example:
-            >>> repo = DockerRepository()
-            >>> containers = ContainerController.list_all(repo, all=False)
-            >>> for c in containers:
-            ...     print(f"{c.name}: {c.status}")
+            >>> changes = ContainerController.get_changes(repo, "3f9a1c2e.40")
+            >>> changes["removed"]
+            ['abc123def456']
         """
+        # Token taken before reading Docker: later changes are resent
+        token = container_changes.token()
+        changes = container_changes.changes_since(since) if since else None
         try:
-            containers = repository.list_containers(all=all)
-            return [ContainerInfo(**c) for c in containers]
+            if changes is None:
+                return {
+                    "revision": token,
+                    "full_resync": True,
+                    "added": _container_encoder.encode_many(
+                        repository.list_containers(all=True)
+                    ),
+                    "updated": [],
+                    "removed": [],
+                }
+            rows = _container_encoder.encode_many(
+                repository.list_containers(
+                    all=True, ids=changes["added"] + changes["updated"]
+                )
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to list containers: {str(e)}",
+                detail=f"Failed to list container changes: {str(e)}",
             )
 
+        # Rows carry short IDs, the change log full ones
+        found = {row["id"] for row in rows}
+        added_ids = {cid[:12] for cid in changes["added"]}
+        gone = [
+            cid[:12]
+            for cid in changes["added"] + changes["updated"]
+            if cid[:12] not in found
+        ]
+        return {
+            "revision": changes["revision"],
+            "full_resync": False,
+            "added": [row for row in rows if row["id"] in added_ids],
+            "updated": [row for row in rows if row["id"] not in added_ids],
+            "removed": [cid[:12] for cid in changes["removed"]] + gone,
+        }
+
     @staticmethod
     def get_details(repository: DockerRepository, name: str) -> ContainerInfo:
         """Get detailed information about a specific container.
@@ -293,3 +363,36 @@ class ContainerController:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=str(e),
             )
+
+    @staticmethod
+    def get_volumes(
+        repository: DockerRepository, name: str
+    ) -> List[VolumeMount]:
+        """Get named volumes mounted by a container.
+
+        Args:
+            repository: Docker repository instance.
+            name: Container name or ID.
+
+        Returns:
+            List of VolumeMount models.
+
+        Raises:
+            HTTPException: 404 if not found, 500 if operation fails.
+
+        Example:
+            >>> repo = DockerRepository()
+            >>> mounts = ContainerController.get_volumes(repo, "postgres")
+        """
+        try:
+            mounts = repository.get_container_volumes(name)
+            return [VolumeMount(**m) for m in mounts]
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get container volumes: {str(e)}",
+            )
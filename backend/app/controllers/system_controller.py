@@ -1,12 +1,16 @@
 """System controller - Business logic for system resource monitoring.
 
 This module handles system-level resource monitoring operations,
-providing CPU, memory, and disk usage metrics for the host machine.
+providing CPU, memory, and disk usage metrics for the host machine
+from the shared host snapshot.
 """
 
-import psutil
+from typing import Optional
+
 from fastapi import HTTPException, status
 
+from app.core.config import settings
+from app.core.host_metrics import host_metrics
 from app.schemas import SystemMetrics
 
 
@@ -23,11 +27,16 @@ class SystemController:
     """
 
     @staticmethod
-    def get_metrics() -> SystemMetrics:
+    def get_metrics(max_age: Optional[float] = None) -> SystemMetrics:
         """Get system resource metrics.
 
-        Retrieves real-time CPU, memory, and disk usage statistics
-        for the host machine where the application is running.
+        Serves the latest consolidated host snapshot (per-core CPU,
+        load, memory, swap, every configured mount and IO rates); a new
+        one is only taken when the latest is older than ``max_age``.
+
+        Args:
+            max_age: Seconds the snapshot may be old (default: the
+                sampling floor).
 
         Returns:
             SystemMetrics model with CPU, memory, and disk information.
@@ -42,28 +51,10 @@ class SystemController:
             >>> if metrics.memory.percent > 90:
             ...     print("Low memory warning!")
         """
+        if max_age is None:
+            max_age = settings.sampling_floor
         try:
-            return SystemMetrics(
-                cpu_percent=psutil.cpu_percent(interval=1),
-                memory={
-                    "total_gb": round(
-                        psutil.virtual_memory().total / 1024**3, 2
-                    ),
-                    "used_gb": round(
-                        psutil.virtual_memory().used / 1024**3, 2
-                    ),
-                    "percent": psutil.virtual_memory().percent,
-                },
-                disk={
-                    "total_gb": round(
-                        psutil.disk_usage("/").total / 1024**3, 2
-                    ),
-                    "used_gb": round(
-                        psutil.disk_usage("/").used / 1024**3, 2
-                    ),
-                    "percent": psutil.disk_usage("/").percent,
-                },
-            )
+            return SystemMetrics(**host_metrics.latest(max_age))
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
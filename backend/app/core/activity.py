@@ -0,0 +1,65 @@
+"""Foreground request activity tracking.
+
+Background jobs that talk to the Docker daemon (cleanup policies,
+scanners) consult this tracker so they can step aside while API
+requests are being served.
+"""
+
+import threading
+import time
+
+
+class RequestActivity:
+    """Counts in-flight HTTP requests and when the last one ended.
+
+    Example:
+        >>> activity = RequestActivity()
+        >>> activity.begin()
+        >>> activity.busy()
+        True
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle tracker."""
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._last_end = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of requests being served.
+
+        Returns:
+            int: In-flight request count.
+        """
+        return self._in_flight
+
+    def begin(self) -> None:
+        """Record the start of a request."""
+        with self._lock:
+            self._in_flight += 1
+
+    def end(self) -> None:
+        """Record the end of a request."""
+        with self._lock:
+            self._in_flight = max(self._in_flight - 1, 0)
+            self._last_end = time.monotonic()
+
+    def busy(self, quiet_period: float = 0.0) -> bool:
+        """Check whether foreground traffic is active.
+
+        Args:
+            quiet_period: Seconds after the last request during which
+                the API still counts as busy.
+
+        Returns:
+            bool: True if requests are in flight or ended recently.
+        """
+        with self._lock:
+            if self._in_flight:
+                return True
+            return time.monotonic() - self._last_end < quiet_period
+
+
+# Global tracker fed by the HTTP middleware in app.main
+request_activity = RequestActivity()
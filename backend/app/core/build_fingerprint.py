@@ -0,0 +1,339 @@
+"""Content-hash fingerprinting of Docker build contexts.
+
+A build context fingerprint is a SHA-256 digest over every file the
+Docker daemon would receive for a build (honouring ``.dockerignore``),
+plus the Dockerfile path, target and build arguments. Per-file hashes
+are persisted in a JSON cache keyed on ``(mtime_ns, size)`` so that only
+files that actually changed are re-read between fingerprints.
+
+The fingerprint is stamped on built images under ``FINGERPRINT_LABEL``,
+which lets the rebuild path skip builds whose context did not change.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+
+FINGERPRINT_LABEL = "io.mylocalplace.build.fingerprint"
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class DockerIgnore:
+    """Matcher for ``.dockerignore`` patterns.
+
+    Implements Docker's matching rules: patterns are relative to the
+    context root, ``*`` and ``?`` never cross ``/``, ``**`` matches any
+    number of directories, a pattern matching a directory excludes its
+    whole subtree, and ``!`` re-includes paths. The last matching
+    pattern wins.
+
+    Example:
+        >>> ignore = DockerIgnore(["node_modules", "*.log", "!keep.log"])
+        >>> ignore.is_excluded("node_modules/react/index.js")
+        True
+        >>> ignore.is_excluded("keep.log")
+        False
+    """
+
+    def __init__(self, patterns: List[str]) -> None:
+        """Compile ignore patterns.
+
+        Args:
+            patterns: Raw pattern lines from a ``.dockerignore`` file.
+        """
+        self._rules: List[Tuple[re.Pattern, bool]] = []
+
+        for raw in patterns:
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:].strip()
+
+            line = os.path.normpath(line).replace(os.sep, "/").lstrip("/")
+            if line in ("", "."):
+                continue
+
+            self._rules.append((self._compile(line), negate))
+
+    @classmethod
+    def from_context(cls, context: Path) -> "DockerIgnore":
+        """Load the ``.dockerignore`` file of a build context.
+
+        Args:
+            context: Build context directory.
+
+        Returns:
+            DockerIgnore: Matcher (empty if no ignore file exists).
+        """
+        ignore_file = context / ".dockerignore"
+        if not ignore_file.is_file():
+            return cls([])
+        return cls(ignore_file.read_text(errors="ignore").splitlines())
+
+    @property
+    def has_exceptions(self) -> bool:
+        """Check whether any ``!`` pattern exists.
+
+        Returns:
+            bool: True if excluded directories may contain included files.
+        """
+        return any(negate for _, negate in self._rules)
+
+    def is_excluded(self, path: str) -> bool:
+        """Check whether a context-relative path is excluded.
+
+        Args:
+            path: Path relative to the context root, ``/`` separated.
+
+        Returns:
+            bool: True if the path would not be sent to the daemon.
+        """
+        parts = path.split("/")
+        candidates = ["/".join(parts[: i + 1]) for i in range(len(parts))]
+
+        excluded = False
+        for regex, negate in self._rules:
+            if any(regex.fullmatch(candidate) for candidate in candidates):
+                excluded = not negate
+        return excluded
+
+    @staticmethod
+    def _compile(pattern: str) -> re.Pattern:
+        """Translate a dockerignore pattern into a regular expression.
+
+        Args:
+            pattern: Normalized pattern.
+
+        Returns:
+            re.Pattern: Compiled expression matching whole paths.
+        """
+        regex = ""
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if pattern.startswith("**/", i):
+                regex += "(?:.*/)?"
+                i += 3
+                continue
+            if pattern.startswith("**", i):
+                regex += ".*"
+                i += 2
+                continue
+            if char == "*":
+                regex += "[^/]*"
+            elif char == "?":
+                regex += "[^/]"
+            elif char == "[":
+                end = pattern.find("]", i + 1)
+                if end == -1:
+                    regex += re.escape(char)
+                else:
+                    body = pattern[i + 1:end]
+                    if body.startswith("!"):
+                        body = "^" + body[1:]
+                    regex += f"[{body}]"
+                    i = end
+            elif char == "\\" and i + 1 < len(pattern):
+                i += 1
+                regex += re.escape(pattern[i])
+            else:
+                regex += re.escape(char)
+            i += 1
+        return re.compile(regex)
+
+
+class BuildFingerprinter:
+    """Computes build context fingerprints with a persisted hash cache.
+
+    The cache maps absolute file paths to ``[mtime_ns, size, sha256]``.
+    A file is only re-hashed when its mtime or size differs from the
+    cached entry, so fingerprinting an unchanged context costs one
+    ``stat`` per file.
+
+    Attributes:
+        cache_path: JSON file holding per-file hashes.
+
+    Example:
+        >>> fingerprinter = BuildFingerprinter(Path("/tmp/fp.json"))
+        >>> digest = fingerprinter.fingerprint(Path("./backend"))
+    """
+
+    def __init__(self, cache_path: Path) -> None:
+        """Initialize fingerprinter; the hash cache is read on first use.
+
+        Args:
+            cache_path: JSON file used to persist per-file hashes.
+        """
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._cache: Optional[Dict[str, List]] = None
+
+    def load(self) -> None:
+        """Read the persisted hash cache if not loaded yet."""
+        with self._lock:
+            if self._cache is None:
+                self._cache = self._load()
+
+    def fingerprint(
+        self,
+        context: Path,
+        dockerfile: str = "Dockerfile",
+        target: Optional[str] = None,
+        build_args: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Compute the fingerprint of a build context.
+
+        Args:
+            context: Build context directory.
+            dockerfile: Dockerfile path relative to the context.
+            target: Multi-stage build target, if any.
+            build_args: Build arguments passed to the build.
+
+        Returns:
+            str: Hex SHA-256 digest identifying the build inputs.
+
+        Raises:
+            ValueError: If the context directory does not exist.
+        """
+        context = context.resolve()
+        if not context.is_dir():
+            raise ValueError(f"Build context {context} not found")
+
+        digest = hashlib.sha256()
+        header = {
+            "dockerfile": dockerfile,
+            "target": target or "",
+            "args": build_args or {},
+        }
+        digest.update(json.dumps(header, sort_keys=True).encode())
+
+        self.load()
+        with self._lock:
+            seen = set()
+            dirty = False
+            for relpath, path in sorted(self._iter_files(context, dockerfile)):
+                file_hash, changed = self._hash_file(path)
+                dirty = dirty or changed
+                seen.add(str(path))
+                digest.update(f"{relpath}\0{file_hash}\n".encode())
+
+            stale = [
+                key
+                for key in self._cache
+                if key.startswith(f"{context}{os.sep}") and key not in seen
+            ]
+            for key in stale:
+                del self._cache[key]
+
+            if dirty or stale:
+                self._save()
+
+        return digest.hexdigest()
+
+    def _iter_files(
+        self, context: Path, dockerfile: str
+    ) -> Iterator[Tuple[str, Path]]:
+        """Yield files that would be sent to the daemon.
+
+        The Dockerfile and ``.dockerignore`` are always included, as the
+        Docker CLI sends them regardless of ignore rules.
+
+        Args:
+            context: Resolved build context directory.
+            dockerfile: Dockerfile path relative to the context.
+
+        Yields:
+            Tuples of (context-relative path, absolute path).
+        """
+        ignore = DockerIgnore.from_context(context)
+        always = {Path(dockerfile).as_posix(), ".dockerignore"}
+        can_prune = not ignore.has_exceptions
+
+        for root, dirs, files in os.walk(context):
+            rel_root = Path(root).relative_to(context).as_posix()
+            prefix = "" if rel_root == "." else f"{rel_root}/"
+
+            if can_prune:
+                dirs[:] = [
+                    d for d in dirs if not ignore.is_excluded(prefix + d)
+                ]
+            dirs.sort()
+
+            for name in files:
+                relpath = prefix + name
+                if relpath in always or not ignore.is_excluded(relpath):
+                    path = Path(root) / name
+                    if path.is_file():
+                        yield relpath, path
+
+    def _hash_file(self, path: Path) -> Tuple[str, bool]:
+        """Hash a file, reusing the cached digest when unchanged.
+
+        Args:
+            path: Absolute file path.
+
+        Returns:
+            Tuple of (hex digest, whether the cache entry was updated).
+        """
+        stat = path.stat()
+        key = str(path)
+        cached = self._cache.get(key)
+        if (
+            cached
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+        ):
+            return cached[2], False
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+        file_hash = digest.hexdigest()
+        self._cache[key] = [stat.st_mtime_ns, stat.st_size, file_hash]
+        return file_hash, True
+
+    def _load(self) -> Dict[str, List]:
+        """Load the persisted hash cache.
+
+        Returns:
+            Dict mapping file paths to cached entries (empty if missing
+            or unreadable).
+        """
+        try:
+            with open(self.cache_path) as handle:
+                data = json.load(handle)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self) -> None:
+        """Persist the hash cache atomically.
+
+        Failures are ignored: the cache only speeds up fingerprinting.
+        """
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as handle:
+                json.dump(self._cache, handle)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+
+# Global fingerprinter sharing one hash cache across repositories
+build_fingerprinter = BuildFingerprinter(
+    settings.state_path / "build-fingerprints.json"
+)
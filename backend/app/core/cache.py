@@ -0,0 +1,108 @@
+"""Thread-safe TTL cache for expensive Docker and host queries.
+
+Values are loaded on demand and shared by every caller until they
+expire or are invalidated. Concurrent misses for the same key trigger a
+single load, so a burst of requests never fans out into a burst of
+daemon calls.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Cache whose entries expire after a fixed time-to-live.
+
+    Attributes:
+        ttl: Seconds an entry stays fresh.
+
+    Example:
+        >>> cache = TTLCache(ttl=30)
+        >>> df = cache.get_or_load("df", client.df)
+        >>> cache.invalidate("df")
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Seconds an entry stays fresh.
+        """
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a fresh cached value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def age(self, key: Hashable) -> Optional[float]:
+        """Get seconds since a value was loaded.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Age in seconds, or None if nothing is cached.
+        """
+        entry = self._entries.get(key)
+        return time.monotonic() - entry[0] if entry else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        self._entries[key] = (time.monotonic(), value)
+
+    def get_or_load(
+        self, key: Hashable, loader: Callable[[], Any]
+    ) -> Any:
+        """Get a cached value, loading it once on a miss.
+
+        Args:
+            key: Cache key.
+            loader: Callable producing the value.
+
+        Returns:
+            Cached or freshly loaded value.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have loaded it while we waited
+            value = self.get(key)
+            if value is None:
+                value = loader()
+                self.set(key, value)
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry when no key is given.
+
+        Args:
+            key: Cache key to drop. Defaults to all keys.
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -0,0 +1,314 @@
+"""Policy-driven background cleanup scheduler.
+
+Evaluates the configured cleanup policies periodically and runs the ones
+that are due, subject to a global hourly rate limit and a maximum
+runtime per pass. Passes are deferred while foreground API requests are
+in flight so cleanup never competes with them for the Docker daemon,
+but only up to a maximum deferral: a dashboard that polls (or long-poll
+clients that re-request at once) keeps the API busy all the time, and
+cleanup exists to free disk, so after that it runs regardless.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from app.core.activity import RequestActivity, request_activity
+from app.core.collectors import Collector
+from app.core.config import CleanupPolicy, settings
+from app.core.host_metrics import host_metrics
+
+logger = logging.getLogger(__name__)
+
+# Mount holding images, containers, volumes and build cache
+DOCKER_ROOT = "/var/lib/docker"
+
+PolicyRunner = Callable[
+    [CleanupPolicy, float, Callable[[], bool]], Dict[str, Any]
+]
+
+
+class CleanupScheduler:
+    """Runs cleanup policies as a background collector.
+
+    The runner receives the policy, the pass deadline (monotonic time)
+    and a ``should_yield`` callable, and returns a dictionary with
+    ``deleted``, ``space_freed_bytes`` and ``interrupted``.
+
+    Attributes:
+        policies: Configured cleanup policies.
+        check_interval: Seconds between policy evaluations.
+        max_runtime: Seconds a pass may spend running policies.
+        max_runs_per_hour: Policy runs allowed per rolling hour.
+        max_deferral: Seconds passes may be deferred for traffic before
+            one runs without yielding.
+
+    Example:
+        >>> scheduler = CleanupScheduler(policies, activity)
+        >>> collectors.register(
+        ...     scheduler.collector(CleanupRepository().run_policy)
+        ... )
+        >>> scheduler.history()
+    """
+
+    def __init__(
+        self,
+        policies: List[CleanupPolicy],
+        activity: RequestActivity,
+        check_interval: float = 60.0,
+        max_runtime: float = 300.0,
+        max_runs_per_hour: int = 6,
+        quiet_period: float = 5.0,
+        max_deferral: Optional[float] = None,
+        disk_percent: Optional[Callable[[], float]] = None,
+        history_size: int = 100,
+    ) -> None:
+        """Initialize an idle scheduler.
+
+        Args:
+            policies: Cleanup policies to evaluate.
+            activity: Foreground request tracker.
+            check_interval: Seconds between policy evaluations.
+            max_runtime: Seconds a pass may spend running policies.
+            max_runs_per_hour: Policy runs allowed per rolling hour.
+            quiet_period: Seconds without requests before cleaning.
+            max_deferral: Seconds passes may be deferred for traffic
+                before one is forced. Defaults to five check intervals.
+            disk_percent: Callable returning the usage percent of the
+                Docker disk. Defaults to the ``/var/lib/docker`` mount
+                of the host snapshot, or its ``disk`` when that mount
+                is not visible.
+            history_size: Number of runs kept in history.
+        """
+        self.policies = policies
+        self.runner: Optional[PolicyRunner] = None
+        self.activity = activity
+        self.check_interval = check_interval
+        self.max_runtime = max_runtime
+        self.max_runs_per_hour = max_runs_per_hour
+        self.quiet_period = quiet_period
+        self.max_deferral = (
+            max_deferral if max_deferral is not None else 5 * check_interval
+        )
+        self.disk_percent = disk_percent or self._docker_disk_percent
+
+        self._lock = threading.Lock()
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self._last_run: Dict[str, float] = {}
+        self._run_times: Deque[float] = deque()
+        self._deferred_since: Optional[float] = None
+
+    def history(self) -> List[Dict[str, Any]]:
+        """Get past policy runs, most recent first.
+
+        Returns:
+            List of run dictionaries with policy, started_at,
+            duration_seconds, deleted, space_freed_bytes, interrupted
+            and error.
+        """
+        with self._lock:
+            return list(reversed(self._history))
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Get each policy with its scheduling state.
+
+        Returns:
+            List of dictionaries with the policy fields plus
+            seconds_until_due (0 when due now).
+        """
+        now = time.monotonic()
+        statuses = []
+        for policy in self.policies:
+            last = self._last_run.get(policy.name)
+            due_in = 0.0
+            if last is not None:
+                due_in = max(
+                    last + policy.min_interval_minutes * 60 - now, 0.0
+                )
+            statuses.append(
+                {**policy.model_dump(), "seconds_until_due": round(due_in)}
+            )
+        return statuses
+
+    def collector(self, runner: PolicyRunner) -> Collector:
+        """Declare the periodic policy pass for the collector scheduler.
+
+        Args:
+            runner: Callable executing one policy.
+
+        Returns:
+            Collector evaluating policies every check interval.
+        """
+        self.runner = runner
+        return Collector(
+            "cleanup",
+            self.tick,
+            interval=self.check_interval,
+            jitter=self.check_interval * 0.1,
+        )
+
+    def tick(self) -> Optional[float]:
+        """Run one pass.
+
+        Returns:
+            Seconds until the next pass after a deferral (retry soon
+            instead of a full interval), None otherwise.
+        """
+        if self.run_pending() is None:
+            return self.quiet_period
+        return None
+
+    def run_pending(self) -> Optional[List[Dict[str, Any]]]:
+        """Run every due policy once.
+
+        A pass deferred for longer than ``max_deferral`` runs anyway and
+        does not yield to traffic; it is still bounded by the runtime
+        and the hourly run limit.
+
+        Returns:
+            Runs performed in this pass, or None if the pass was
+            deferred because of foreground traffic.
+        """
+        if self.runner is None:
+            return None
+        forced = False
+        if self._busy():
+            now = time.monotonic()
+            if self._deferred_since is None:
+                self._deferred_since = now
+            if now - self._deferred_since < self.max_deferral:
+                return None
+            logger.info(
+                "Cleanup deferred for %.0fs, running despite traffic",
+                now - self._deferred_since,
+            )
+            forced = True
+        self._deferred_since = None
+
+        started = time.monotonic()
+        deadline = started + self.max_runtime
+        disk = self.disk_percent()
+        should_yield = (lambda: False) if forced else self._busy
+        runs = []
+
+        for policy in self.policies:
+            if not self._is_due(policy, disk):
+                continue
+            if time.monotonic() >= deadline or should_yield():
+                break
+            if not self._take_rate_slot():
+                logger.info("Cleanup rate limit reached, deferring policies")
+                break
+            runs.append(self._run_policy(policy, deadline, should_yield))
+
+        return runs
+
+    def _busy(self) -> bool:
+        """Check for foreground API traffic.
+
+        Returns:
+            bool: True if cleanup should wait.
+        """
+        return self.activity.busy(self.quiet_period)
+
+    def _docker_disk_percent(self) -> float:
+        """Read the Docker disk usage from the host snapshot.
+
+        Inside the API container ``/`` is the container's own overlay,
+        so the ``/var/lib/docker`` mount is used where it is configured.
+
+        Returns:
+            float: Usage percent of the disk Docker writes to.
+        """
+        host = host_metrics.latest(max_age=self.check_interval)
+        for mount in host["mounts"]:
+            if mount["path"] == DOCKER_ROOT:
+                return mount["percent"]
+        return host["disk"]["percent"]
+
+    def _is_due(self, policy: CleanupPolicy, disk: float) -> bool:
+        """Check whether a policy should run now.
+
+        Args:
+            policy: Cleanup policy.
+            disk: Current Docker disk usage percent.
+
+        Returns:
+            bool: True if the interval elapsed and the condition holds.
+        """
+        last = self._last_run.get(policy.name)
+        if last is not None:
+            if time.monotonic() - last < policy.min_interval_minutes * 60:
+                return False
+        if policy.disk_percent_above is not None:
+            return disk > policy.disk_percent_above
+        return True
+
+    def _take_rate_slot(self) -> bool:
+        """Consume one run from the hourly budget.
+
+        Returns:
+            bool: False if the hourly limit is reached.
+        """
+        now = time.monotonic()
+        while self._run_times and now - self._run_times[0] > 3600:
+            self._run_times.popleft()
+        if len(self._run_times) >= self.max_runs_per_hour:
+            return False
+        self._run_times.append(now)
+        return True
+
+    def _run_policy(
+        self,
+        policy: CleanupPolicy,
+        deadline: float,
+        should_yield: Callable[[], bool],
+    ) -> Dict[str, Any]:
+        """Execute one policy and record it in history.
+
+        Args:
+            policy: Cleanup policy.
+            deadline: Monotonic time the pass must end by.
+            should_yield: Callable returning True to stop early.
+
+        Returns:
+            Run dictionary.
+        """
+        started = time.monotonic()
+        run = {
+            "policy": policy.name,
+            "action": policy.action,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "duration_seconds": 0.0,
+            "deleted": 0,
+            "space_freed_bytes": 0,
+            "interrupted": False,
+            "error": None,
+        }
+        try:
+            result = self.runner(policy, deadline, should_yield)
+            run["deleted"] = result.get("deleted", 0)
+            run["space_freed_bytes"] = result.get("space_freed_bytes", 0)
+            run["interrupted"] = result.get("interrupted", False)
+        except Exception as e:
+            logger.warning("Cleanup policy %s failed: %s", policy.name, e)
+            run["error"] = str(e)
+
+        run["duration_seconds"] = round(time.monotonic() - started, 3)
+        self._last_run[policy.name] = started
+        with self._lock:
+            self._history.append(run)
+        return run
+
+
+# Global scheduler for the configured cleanup policies
+cleanup_scheduler = CleanupScheduler(
+    settings.cleanup_policies,
+    request_activity,
+    check_interval=settings.cleanup_check_interval,
+    max_runtime=settings.cleanup_max_runtime,
+    max_runs_per_hour=settings.cleanup_max_runs_per_hour,
+)
@@ -0,0 +1,475 @@
+"""Unified scheduler for periodic background collectors.
+
+Background jobs (daemon health probes, cleanup policies, volume scans)
+declare how they want to run instead of each owning a thread with its
+own sleep loop: an interval, random jitter so jobs registered together
+do not fire in lockstep, a timeout, where to run (the event loop, the
+shared thread pool, or the IO pool reserved for disk-heavy jobs) and
+optional CPU and IO budgets. The IO pool has several workers so one slow
+IO collector does not hold up the others, and an IO budget caps the
+share of time a collector keeps a worker busy.
+
+A run never starts while the previous one of the same collector is
+still going (e.g. an executor run past its timeout); the tick is counted
+as skipped. Runs, errors, timeouts, durations, lag (how late a run
+started against its due time) and CPU time are kept per collector for
+``/metrics`` and ``GET /api/v1/debug/collectors``.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = ("loop", "thread", "io")
+
+
+def _timed(func: Callable[[], Any]) -> Tuple[Any, float]:
+    """Call a function and measure the CPU time of its thread.
+
+    Args:
+        func: Callable to run.
+
+    Returns:
+        Tuple (result, CPU seconds).
+    """
+    started = time.thread_time()
+    result = func()
+    return result, time.thread_time() - started
+
+
+async def _timed_async(func: Callable[[], Any]) -> Tuple[Any, float]:
+    """Await a coroutine function; loop CPU time is not attributable.
+
+    Args:
+        func: Coroutine function to run.
+
+    Returns:
+        Tuple (result, 0.0).
+    """
+    return await func(), 0.0
+
+
+class Collector:
+    """A periodic background job and its run statistics.
+
+    ``func`` is a coroutine function for the ``loop`` executor and a
+    plain callable otherwise. It may return a number of seconds to wait
+    before the next run instead of the interval (e.g. to retry soon
+    after deferring).
+
+    Attributes:
+        name: Unique collector name (metrics label).
+        interval: Seconds between the end of a run and the next one.
+        jitter: Up to this many random seconds added to each wait.
+        timeout: Seconds a run may take; loop runs are cancelled,
+            executor runs are left to finish (and block new runs).
+        executor: ``loop``, ``thread`` or ``io``.
+        cpu_budget: Fraction of one core the collector may use on
+            average; runs over budget push the next run back.
+        io_budget: Fraction of wall time the collector may spend
+            running (holding an executor worker); long runs push the
+            next run back.
+
+    Example:
+        >>> collector = Collector("health", probe, interval=5, timeout=5)
+        >>> collectors.register(collector)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        interval: float,
+        jitter: float = 0.0,
+        timeout: Optional[float] = None,
+        executor: str = "thread",
+        cpu_budget: Optional[float] = None,
+        io_budget: Optional[float] = None,
+    ) -> None:
+        """Declare a collector.
+
+        Args:
+            name: Unique collector name.
+            func: Callable (coroutine function for ``loop``).
+            interval: Seconds between runs.
+            jitter: Maximum random extra seconds per wait.
+            timeout: Seconds a run may take, or None.
+            executor: Where runs execute.
+            cpu_budget: Fraction of one core, or None.
+            io_budget: Fraction of wall time, or None.
+
+        Raises:
+            ValueError: If the executor is unknown.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}")
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self.timeout = timeout
+        self.executor = executor
+        self.cpu_budget = cpu_budget
+        self.io_budget = io_budget
+
+        self.running = False
+        self.runs = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.skipped = 0
+        self.duration_sum = 0.0
+        self.cpu_seconds = 0.0
+        self.last_duration: Optional[float] = None
+        self.last_cpu: Optional[float] = None
+        self.last_lag: Optional[float] = None
+        self.max_lag = 0.0
+        self.last_error: Optional[str] = None
+        self.last_run_at: Optional[str] = None
+
+        self._due: Optional[float] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    def trigger(self) -> None:
+        """Request a run without waiting for the interval (any thread)."""
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None:
+            return
+        try:
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:
+            # Event loop closed meanwhile
+            pass
+
+    def next_delay(self, override: Optional[float] = None) -> float:
+        """Get the wait before the next run.
+
+        Args:
+            override: Delay returned by the last run, if any.
+
+        Returns:
+            float: Seconds, stretched to keep the CPU and IO budgets
+            and jittered.
+        """
+        delay = self.interval if override is None else override
+        if self.cpu_budget and self.last_cpu:
+            delay = max(delay, self.last_cpu / self.cpu_budget)
+        if self.io_budget and self.last_duration:
+            delay = max(delay, self.last_duration / self.io_budget)
+        return delay + random.uniform(0, self.jitter)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the collector's configuration and run statistics.
+
+        Returns:
+            Dictionary with the declared settings, running, runs,
+            errors, timeouts, skipped, durations, lag, CPU time,
+            last_error, last_run_at and next_run_in_seconds.
+        """
+        next_run_in = None
+        if self._due is not None:
+            next_run_in = round(max(self._due - time.monotonic(), 0.0), 3)
+        return {
+            "name": self.name,
+            "executor": self.executor,
+            "interval": self.interval,
+            "jitter": self.jitter,
+            "timeout": self.timeout,
+            "cpu_budget": self.cpu_budget,
+            "io_budget": self.io_budget,
+            "running": self.running,
+            "runs": self.runs,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "skipped": self.skipped,
+            "last_duration_seconds": self._round(self.last_duration),
+            "avg_duration_seconds": self._round(
+                self.duration_sum / self.runs if self.runs else None
+            ),
+            "last_lag_seconds": self._round(self.last_lag),
+            "max_lag_seconds": round(self.max_lag, 3),
+            "cpu_seconds": round(self.cpu_seconds, 3),
+            "last_error": self.last_error,
+            "last_run_at": self.last_run_at,
+            "next_run_in_seconds": next_run_in,
+        }
+
+    def _finish(
+        self, future: "asyncio.Future", started: float, lag: float
+    ) -> None:
+        """Record a completed run (on the loop thread).
+
+        Args:
+            future: Future of the run.
+            started: Monotonic start time.
+            lag: Seconds the run started late.
+        """
+        self.running = False
+        duration = time.monotonic() - started
+        self.runs += 1
+        self.duration_sum += duration
+        self.last_duration = duration
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self.last_run_at = datetime.now(timezone.utc).isoformat()
+        if future.cancelled():
+            self.last_error = "Cancelled"
+            return
+        error = future.exception()
+        if error is not None:
+            self.errors += 1
+            self.last_error = str(error) or error.__class__.__name__
+            logger.error(
+                "Collector %s failed", self.name, exc_info=error
+            )
+            return
+        self.last_error = None
+        self.last_cpu = future.result()[1]
+        self.cpu_seconds += self.last_cpu
+
+    @staticmethod
+    def _round(seconds: Optional[float]) -> Optional[float]:
+        """Round a duration for display.
+
+        Args:
+            seconds: Duration, or None.
+
+        Returns:
+            Seconds rounded to milliseconds, or None.
+        """
+        return None if seconds is None else round(seconds, 3)
+
+
+class CollectorScheduler:
+    """Runs registered collectors from tasks on the event loop.
+
+    Example:
+        >>> scheduler = CollectorScheduler(workers=4, io_workers=2)
+        >>> scheduler.register(Collector("scan", scan, interval=300))
+        >>> scheduler.start()
+        >>> await scheduler.stop()
+    """
+
+    def __init__(self, workers: int = 4, io_workers: int = 2) -> None:
+        """Initialize without collectors.
+
+        Args:
+            workers: Threads of the shared ``thread`` executor.
+            io_workers: Threads of the ``io`` executor.
+        """
+        self.workers = workers
+        self.io_workers = io_workers
+        self._collectors: Dict[str, Collector] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+
+    def register(self, collector: Collector) -> Collector:
+        """Add a collector, replacing one with the same name.
+
+        Collectors registered after :meth:`start` run once started
+        again.
+
+        Args:
+            collector: Collector to schedule.
+
+        Returns:
+            The registered collector.
+        """
+        self._collectors[collector.name] = collector
+        return collector
+
+    def get(self, name: str) -> Optional[Collector]:
+        """Look up a registered collector.
+
+        Args:
+            name: Collector name.
+
+        Returns:
+            Collector, or None.
+        """
+        return self._collectors.get(name)
+
+    def trigger(self, name: str) -> bool:
+        """Request a collector run without waiting for its interval.
+
+        Args:
+            name: Collector name.
+
+        Returns:
+            bool: False if no such collector is registered.
+        """
+        collector = self._collectors.get(name)
+        if collector is None:
+            return False
+        collector.trigger()
+        return True
+
+    def start(self) -> None:
+        """Start every registered collector on the running loop."""
+        if not self._executors:
+            self._executors = {
+                "thread": ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="collector"
+                ),
+                "io": ThreadPoolExecutor(
+                    max_workers=self.io_workers,
+                    thread_name_prefix="collector-io",
+                ),
+            }
+        for name, collector in self._collectors.items():
+            if name not in self._tasks:
+                self._tasks[name] = asyncio.create_task(self._drive(collector))
+
+    async def stop(self) -> None:
+        """Stop every collector; executor runs in progress are abandoned."""
+        tasks = list(self._tasks.values())
+        self._tasks = {}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+        self._executors = {}
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Get the statistics of every collector.
+
+        Returns:
+            List of :meth:`Collector.stats` dictionaries by name.
+        """
+        return [self._collectors[n].stats() for n in sorted(self._collectors)]
+
+    def render_prometheus(self) -> List[str]:
+        """Render per-collector metrics in Prometheus text format.
+
+        Returns:
+            Exposition lines (without trailing newline).
+        """
+        collectors = [self._collectors[n] for n in sorted(self._collectors)]
+        families = [
+            ("runs_total", "counter", "Completed collector runs",
+             lambda c: c.runs),
+            ("errors_total", "counter", "Collector runs that raised",
+             lambda c: c.errors),
+            ("timeouts_total", "counter", "Collector runs past timeout",
+             lambda c: c.timeouts),
+            ("skipped_total", "counter",
+             "Ticks skipped while the previous run was still going",
+             lambda c: c.skipped),
+            ("cpu_seconds_total", "counter", "CPU time of collector runs",
+             lambda c: f"{c.cpu_seconds:.6f}"),
+            ("lag_seconds", "gauge", "Delay of the last run's start",
+             lambda c: f"{c.last_lag or 0.0:.6f}"),
+            ("running", "gauge", "Collector run in progress (1/0)",
+             lambda c: int(c.running)),
+        ]
+        lines = []
+        for suffix, kind, help_text, value in families:
+            name = f"mylocalplace_collector_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for c in collectors:
+                lines.append(f'{name}{{collector="{c.name}"}} {value(c)}')
+
+        name = "mylocalplace_collector_duration_seconds"
+        lines.append(f"# HELP {name} Collector run duration")
+        lines.append(f"# TYPE {name} summary")
+        for c in collectors:
+            lines.append(
+                f'{name}_sum{{collector="{c.name}"}} {c.duration_sum:.6f}'
+            )
+            lines.append(f'{name}_count{{collector="{c.name}"}} {c.runs}')
+        return lines
+
+    async def _drive(self, collector: Collector) -> None:
+        """Run one collector until cancelled.
+
+        The first run starts after a random share of the jitter so
+        collectors registered together spread out.
+
+        Args:
+            collector: Collector to drive.
+        """
+        collector._loop = asyncio.get_running_loop()
+        collector._wake = asyncio.Event()
+        delay = random.uniform(0, collector.jitter)
+        try:
+            while True:
+                collector._due = time.monotonic() + delay
+                try:
+                    await asyncio.wait_for(collector._wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                collector._wake.clear()
+                # Triggered runs are early, not late
+                lag = max(time.monotonic() - collector._due, 0.0)
+                collector._due = None
+                if collector.running:
+                    collector.skipped += 1
+                    delay = collector.next_delay()
+                    continue
+                delay = collector.next_delay(await self._run(collector, lag))
+        finally:
+            collector._wake = None
+            collector._due = None
+
+    async def _run(self, collector: Collector, lag: float) -> Optional[float]:
+        """Execute one run within the collector's timeout.
+
+        Args:
+            collector: Collector to run.
+            lag: Seconds the run started late.
+
+        Returns:
+            Delay override returned by the run, or None.
+        """
+        collector.running = True
+        started = time.monotonic()
+        if collector.executor == "loop":
+            future = asyncio.ensure_future(_timed_async(collector.func))
+        else:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._executors[collector.executor], _timed, collector.func
+            )
+        future.add_done_callback(
+            lambda f: collector._finish(f, started, lag)
+        )
+        try:
+            result, _ = await asyncio.wait_for(
+                asyncio.shield(future), collector.timeout
+            )
+        except asyncio.TimeoutError:
+            collector.timeouts += 1
+            logger.warning(
+                "Collector %s exceeded its %.1fs timeout",
+                collector.name,
+                collector.timeout,
+            )
+            if collector.executor == "loop":
+                future.cancel()
+            return None
+        except asyncio.CancelledError:
+            if collector.executor == "loop":
+                future.cancel()
+            raise
+        except Exception:
+            # Recorded by the done callback
+            return None
+        if isinstance(result, bool) or not isinstance(result, (int, float)):
+            return None
+        return result
+
+
+# Global scheduler started by the application lifespan
+collectors = CollectorScheduler(
+    workers=settings.collector_workers,
+    io_workers=settings.collector_io_workers,
+)
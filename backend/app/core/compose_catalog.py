@@ -0,0 +1,316 @@
+"""Indexed catalog of compose services.
+
+Parses every configured compose file once into an in-memory index of
+service name (and container name) to its definition: owning file, build
+context, image, dependencies, ports, volumes and profiles. Files are
+re-parsed only when their mtime changes, and the freshness check itself
+is throttled so lookups stay O(1).
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.lazy_import import LazyModule
+
+yaml = LazyModule("yaml")
+
+logger = logging.getLogger(__name__)
+
+
+class ComposeCatalog:
+    """Index of services defined across the project's compose files.
+
+    Services declared with ``extends`` are resolved against the file
+    they extend, so ``local-postgres`` in docker-compose.yml reports the
+    image and volumes of ``postgres`` in services/postgres.yml. When the
+    same service name appears in several files, the first configured
+    file wins.
+
+    Attributes:
+        project_dir: Compose project directory.
+        patterns: Compose file paths or globs relative to project_dir.
+        check_interval: Minimum seconds between mtime checks.
+
+    Example:
+        >>> catalog = ComposeCatalog(Path("/srv/my-local-place"))
+        >>> service = catalog.get("local-postgres")
+        >>> print(service["file"], service["image"])
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        patterns: Optional[List[str]] = None,
+        project_name: str = "",
+        check_interval: float = 2.0,
+    ) -> None:
+        """Initialize an empty catalog.
+
+        Args:
+            project_dir: Compose project directory.
+            patterns: Compose file paths or globs. Defaults to
+                docker-compose.yml only.
+            project_name: Compose project name used for default image
+                tags. Defaults to the project directory name.
+            check_interval: Minimum seconds between mtime checks.
+        """
+        self.project_dir = project_dir.resolve()
+        self.patterns = patterns or ["docker-compose.yml"]
+        self.project_name = project_name or project_dir.name.lower()
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._files: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._by_container: Dict[str, str] = {}
+        self._checked_at = 0.0
+        self._warned_missing = False
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Look up a service by service or container name.
+
+        Args:
+            name: Compose service name or container name.
+
+        Returns:
+            Service entry, or None if no compose file defines it.
+        """
+        self.refresh()
+        service = self._index.get(name)
+        if service is None and name in self._by_container:
+            service = self._index.get(self._by_container[name])
+        return service
+
+    def list_services(self) -> List[Dict[str, Any]]:
+        """List every indexed service.
+
+        Returns:
+            Service entries in compose file order.
+        """
+        self.refresh()
+        return list(self._index.values())
+
+    def refresh(self, force: bool = False) -> bool:
+        """Re-parse compose files whose mtime changed.
+
+        Args:
+            force: Check file mtimes even within check_interval.
+
+        Returns:
+            bool: True if the index was rebuilt.
+        """
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return False
+
+        with self._lock:
+            self._checked_at = now
+            # Files pulled in through ``extends`` are tracked as well
+            files = self._resolve_files()
+            self._warn_if_missing(files)
+            extended = [path for path in self._files if path not in files]
+            changed = set()
+
+            for path in files + extended:
+                try:
+                    mtime = path.stat().st_mtime_ns
+                except OSError:
+                    self._files.pop(path, None)
+                    changed.add(path)
+                    continue
+                cached = self._files.get(path)
+                if cached is None or cached[0] != mtime:
+                    self._files[path] = (mtime, self._parse(path))
+                    changed.add(path)
+
+            if changed or not self._index:
+                self._rebuild_index(files)
+            return bool(changed)
+
+    def _warn_if_missing(self, files: List[Path]) -> None:
+        """Log once when no compose file exists under project_dir.
+
+        An empty catalog disables rebuilds, build status and compose
+        lookups, which usually means the project directory is not
+        mounted into the API container.
+
+        Args:
+            files: Compose files found by _resolve_files.
+        """
+        if files:
+            self._warned_missing = False
+        elif not self._warned_missing:
+            self._warned_missing = True
+            logger.warning(
+                "No compose files matching %s found in %s; compose "
+                "features are disabled. Mount the project directory "
+                "and set COMPOSE_PROJECT_DIR to its path.",
+                self.patterns,
+                self.project_dir,
+            )
+
+    def _resolve_files(self) -> List[Path]:
+        """Expand configured paths and globs into existing files.
+
+        Returns:
+            Compose files in configured order, without duplicates.
+        """
+        files: List[Path] = []
+        for pattern in self.patterns:
+            if any(char in pattern for char in "*?["):
+                matches = sorted(self.project_dir.glob(pattern))
+            else:
+                matches = [self.project_dir / pattern]
+            for path in matches:
+                if path.is_file() and path not in files:
+                    files.append(path)
+        return files
+
+    @staticmethod
+    def _parse(path: Path) -> Dict[str, Any]:
+        """Read the services section of a compose file.
+
+        Args:
+            path: Compose file path.
+
+        Returns:
+            Mapping of service name to raw definition (empty on error).
+        """
+        try:
+            with open(path) as handle:
+                data = yaml.safe_load(handle) or {}
+        except (OSError, yaml.YAMLError):
+            return {}
+        services = data.get("services") if isinstance(data, dict) else None
+        return services if isinstance(services, dict) else {}
+
+    def _rebuild_index(self, files: List[Path]) -> None:
+        """Rebuild the service and container name indexes.
+
+        Args:
+            files: Compose files in precedence order.
+        """
+        index: Dict[str, Dict[str, Any]] = {}
+        by_container: Dict[str, str] = {}
+
+        for path in files:
+            for name, definition in self._files.get(path, (0, {}))[1].items():
+                if name in index:
+                    continue
+                entry = self._build_entry(name, definition or {}, path)
+                index[name] = entry
+                container_name = entry["container_name"]
+                if container_name and container_name not in by_container:
+                    by_container[container_name] = name
+
+        self._index = index
+        self._by_container = by_container
+
+    def _resolve_extends(
+        self, definition: Dict[str, Any], path: Path, depth: int = 0
+    ) -> Tuple[Dict[str, Any], Path]:
+        """Merge a definition with the service it extends.
+
+        Args:
+            definition: Raw service definition.
+            path: File the definition came from.
+            depth: Recursion depth guard.
+
+        Returns:
+            Tuple of (merged definition, file the build section is
+            relative to).
+        """
+        extends = definition.get("extends")
+        if not extends or depth > 5:
+            return definition, path
+
+        if isinstance(extends, str):
+            base_file, base_name = path, extends
+        else:
+            base_file = path
+            if extends.get("file"):
+                base_file = (path.parent / extends["file"]).resolve()
+            base_name = extends.get("service", "")
+
+        if base_file not in self._files and base_file.is_file():
+            self._files[base_file] = (
+                base_file.stat().st_mtime_ns,
+                self._parse(base_file),
+            )
+        base = (self._files.get(base_file, (0, {}))[1]).get(base_name)
+        if not isinstance(base, dict):
+            return definition, path
+
+        base, base_path = self._resolve_extends(base, base_file, depth + 1)
+        merged = {**base, **definition}
+        merged.pop("extends", None)
+        build_path = path if "build" in definition else base_path
+        return merged, build_path
+
+    def _build_entry(
+        self, name: str, definition: Dict[str, Any], path: Path
+    ) -> Dict[str, Any]:
+        """Normalize a service definition into a catalog entry.
+
+        Args:
+            name: Service name.
+            definition: Raw service definition.
+            path: File declaring the service.
+
+        Returns:
+            Catalog entry dictionary.
+        """
+        merged, build_path = self._resolve_extends(definition, path)
+
+        depends_on = merged.get("depends_on") or []
+        if isinstance(depends_on, dict):
+            depends_on = list(depends_on)
+
+        build = merged.get("build")
+        if isinstance(build, str):
+            build = {"context": build}
+        if isinstance(build, dict):
+            args = build.get("args") or {}
+            if isinstance(args, list):
+                args = dict(a.split("=", 1) for a in args if "=" in a)
+            build = {
+                "context": str(
+                    (build_path.parent / build.get("context", ".")).resolve()
+                ),
+                "dockerfile": build.get("dockerfile", "Dockerfile"),
+                "target": build.get("target"),
+                "args": {k: str(v) for k, v in args.items()},
+            }
+        else:
+            build = None
+
+        image = merged.get("image")
+        if not image and build:
+            image = f"{self.project_name}-{name}"
+
+        return {
+            "name": name,
+            "file": str(path),
+            "container_name": merged.get("container_name"),
+            "image": image,
+            "build": build,
+            "depends_on": [str(d) for d in depends_on],
+            "ports": [str(p) for p in merged.get("ports") or []],
+            "volumes": [
+                v if isinstance(v, str) else str(v.get("source", ""))
+                for v in merged.get("volumes") or []
+            ],
+            "profiles": list(merged.get("profiles") or []),
+        }
+
+
+# Global catalog instance for the configured compose project
+compose_catalog = ComposeCatalog(
+    settings.project_path,
+    patterns=settings.compose_files,
+    project_name=settings.compose_project_name,
+)
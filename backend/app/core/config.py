@@ -0,0 +1,262 @@
+"""Application settings loaded from environment variables.
+
+This module centralizes runtime configuration so that paths and tuning
+knobs are not hard-coded across repositories and controllers.
+"""
+
+from pathlib import Path
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings
+
+
+class CleanupPolicy(BaseModel):
+    """Background cleanup rule run by the cleanup scheduler.
+
+    A policy runs when its ``min_interval_minutes`` has elapsed and, if
+    ``disk_percent_above`` is set, only while the filesystem holding
+    ``/var/lib/docker`` is fuller than that.
+
+    Example:
+        >>> CleanupPolicy(
+        ...     name="old-containers", action="containers",
+        ...     older_than_hours=168,
+        ... )
+    """
+
+    name: str = Field(..., description="Unique policy name")
+    action: Literal["containers", "images", "volumes", "build_cache"] = (
+        Field(..., description="Resource type to clean")
+    )
+    older_than_hours: Optional[float] = Field(
+        default=None,
+        description="Only remove objects older than this (containers: "
+        "exited for this long)",
+    )
+    dangling_only: bool = Field(
+        default=True, description="Images: only remove dangling images"
+    )
+    keep_storage_gb: Optional[float] = Field(
+        default=None,
+        description="Build cache: prune down to this size (default: "
+        "BUILD_CACHE_BUDGET_GB)",
+    )
+    disk_percent_above: Optional[float] = Field(
+        default=None,
+        description="Only run while the Docker disk is fuller than this",
+    )
+    min_interval_minutes: float = Field(
+        default=60.0, description="Minimum minutes between two runs"
+    )
+
+
+class Settings(BaseSettings):
+    """Runtime settings for the MyLocalPlace API.
+
+    Every attribute can be overridden with an environment variable of the
+    same name in upper case (e.g. ``STATE_DIR``). List values are given
+    as JSON arrays.
+
+    Attributes:
+        compose_project_dir: Directory holding the compose project.
+        compose_files: Compose files (or globs) relative to the project
+            directory.
+        compose_project_name: Compose project name used for image tags.
+        state_dir: Directory for persisted caches and state files.
+        df_cache_ttl: Seconds a Docker disk usage snapshot stays fresh.
+        scan_bind_paths: Host directories scanned alongside volumes.
+        volume_scan_rate: Scanner IO budget in filesystem entries/sec.
+        volume_scan_interval: Seconds between volume scan passes.
+        cleanup_step_timeout: Seconds each cleanup_all step may run.
+        cleanup_policies: Background cleanup policies (JSON array).
+        cleanup_check_interval: Seconds between policy evaluations.
+        cleanup_max_runtime: Seconds a scheduler pass may spend cleaning.
+        cleanup_max_runs_per_hour: Policy runs allowed per hour overall.
+        image_cleanup_mode: ``lru`` evicts least-recently-used images
+            down to image_budget_gb; ``prune`` removes every unused image.
+        image_budget_gb: Disk budget for images in LRU mode.
+        image_pins: Image tag globs never evicted (the
+            ``io.mylocalplace.pin=true`` label pins as well).
+        build_cache_budget_gb: BuildKit cache kept when pruning.
+        health_probe_interval: Seconds between Docker daemon pings.
+        health_probe_timeout: Seconds before a ping counts as failed.
+        docker_slow_warning_ms: Recent ping latency raising a warning.
+        docker_slow_critical_ms: Recent ping latency raising a critical
+            alert.
+        docker_timeout: Seconds a Docker API call may take.
+        docker_failure_threshold: Consecutive Docker failures that open
+            the circuit breaker.
+        docker_reconnect_max_backoff: Upper bound in seconds of the wait
+            between reconnect attempts.
+        compression_min_bytes: Smallest bulk response body compressed
+            when the client accepts gzip or br.
+        container_change_log_size: Container changes kept for delta
+            sync before older revisions require a full resync.
+        ws_poll_interval: Seconds between polls of WebSocket topic
+            collectors (containers, stats, system, alerts).
+        ws_send_queue_size: Messages buffered per WebSocket before the
+            oldest is dropped.
+        ws_max_log_topics: ``logs:<name>`` topics streamed at once, each
+            holding a reader thread.
+        event_replay_size: Lifecycle events kept for Server-Sent Events
+            clients resuming with ``Last-Event-ID``.
+        long_poll_max_timeout: Upper bound in seconds of the
+            ``timeout`` of ``wait_for_revision`` requests.
+        sampling_floor: Shortest sampling interval of a watched
+            container or the host, in seconds.
+        sampling_ceiling: Longest sampling interval (idle back-off),
+            in seconds.
+        sampling_read_ttl: Seconds an HTTP read keeps its container or
+            the host sampled.
+        collector_workers: Threads of the pool running background
+            collectors.
+        collector_io_workers: Threads of the pool running disk-heavy
+            collectors (volume scans).
+        host_mounts: Paths whose filesystem usage is reported in host
+            metrics (the first existing one is also ``disk``); mount
+            host disks into the API container to report them.
+
+    Example:
+        >>> settings = Settings(state_dir="/var/lib/mylocalplace")
+        >>> settings.state_path
+        PosixPath('/var/lib/mylocalplace')
+    """
+
+    compose_project_dir: str = Field(
+        default=".", description="Directory holding the compose project"
+    )
+    compose_files: List[str] = Field(
+        default_factory=lambda: ["docker-compose.yml", "services/*.yml"],
+        description="Compose files or globs relative to the project dir",
+    )
+    compose_project_name: str = Field(
+        default="", description="Compose project name (default: dir name)"
+    )
+    state_dir: str = Field(
+        default=str(Path.home() / ".cache" / "mylocalplace"),
+        description="Directory for persisted caches and state files",
+    )
+    df_cache_ttl: float = Field(
+        default=30.0, description="Docker disk usage snapshot TTL (seconds)"
+    )
+    scan_bind_paths: List[str] = Field(
+        default_factory=list,
+        description="Bind-mount directories scanned alongside volumes",
+    )
+    volume_scan_rate: float = Field(
+        default=2000.0, description="Scanner IO budget (entries per second)"
+    )
+    volume_scan_interval: float = Field(
+        default=300.0, description="Seconds between volume scan passes"
+    )
+    cleanup_step_timeout: float = Field(
+        default=120.0, description="Timeout of each cleanup_all step (s)"
+    )
+    cleanup_policies: List[CleanupPolicy] = Field(
+        default_factory=list, description="Background cleanup policies"
+    )
+    cleanup_check_interval: float = Field(
+        default=60.0, description="Seconds between policy evaluations"
+    )
+    cleanup_max_runtime: float = Field(
+        default=300.0, description="Maximum seconds per scheduler pass"
+    )
+    cleanup_max_runs_per_hour: int = Field(
+        default=6, description="Policy runs allowed per hour overall"
+    )
+    image_cleanup_mode: Literal["lru", "prune"] = Field(
+        default="lru", description="Image cleanup strategy"
+    )
+    image_budget_gb: float = Field(
+        default=20.0, description="Image disk budget in LRU mode (GB)"
+    )
+    image_pins: List[str] = Field(
+        default_factory=list, description="Image tag globs never evicted"
+    )
+    build_cache_budget_gb: float = Field(
+        default=10.0, description="Build cache kept when pruning (GB)"
+    )
+    health_probe_interval: float = Field(
+        default=5.0, description="Seconds between Docker daemon pings"
+    )
+    health_probe_timeout: float = Field(
+        default=2.0, description="Seconds before a ping counts as failed"
+    )
+    docker_slow_warning_ms: float = Field(
+        default=250.0, description="Ping latency warning threshold (ms)"
+    )
+    docker_slow_critical_ms: float = Field(
+        default=1000.0, description="Ping latency critical threshold (ms)"
+    )
+    docker_timeout: float = Field(
+        default=30.0, description="Seconds a Docker API call may take"
+    )
+    docker_failure_threshold: int = Field(
+        default=3, description="Consecutive failures opening the breaker"
+    )
+    docker_reconnect_max_backoff: float = Field(
+        default=30.0, description="Maximum seconds between reconnects"
+    )
+    compression_min_bytes: int = Field(
+        default=1024, description="Minimum body size to compress"
+    )
+    container_change_log_size: int = Field(
+        default=1000, description="Container changes kept for delta sync"
+    )
+    ws_poll_interval: float = Field(
+        default=5.0, description="Seconds between WebSocket topic polls"
+    )
+    ws_send_queue_size: int = Field(
+        default=64, description="Messages buffered per WebSocket"
+    )
+    ws_max_log_topics: int = Field(
+        default=16, description="Log topics streamed at once"
+    )
+    event_replay_size: int = Field(
+        default=1000, description="Lifecycle events kept for SSE replay"
+    )
+    long_poll_max_timeout: float = Field(
+        default=120.0, description="Maximum long-poll wait in seconds"
+    )
+    sampling_floor: float = Field(
+        default=1.0, description="Shortest sampling interval in seconds"
+    )
+    sampling_ceiling: float = Field(
+        default=30.0, description="Longest sampling interval in seconds"
+    )
+    sampling_read_ttl: float = Field(
+        default=60.0, description="Seconds an HTTP read keeps sampling"
+    )
+    collector_workers: int = Field(
+        default=4, description="Threads running background collectors"
+    )
+    collector_io_workers: int = Field(
+        default=2, description="Threads running disk-heavy collectors"
+    )
+    host_mounts: List[str] = Field(
+        default_factory=lambda: ["/", "/var/lib/docker"],
+        description="Filesystems reported in host metrics",
+    )
+
+    @property
+    def project_path(self) -> Path:
+        """Get the compose project directory as an absolute path.
+
+        Returns:
+            Path: Resolved compose project directory.
+        """
+        return Path(self.compose_project_dir).expanduser().resolve()
+
+    @property
+    def state_path(self) -> Path:
+        """Get the state directory as a path.
+
+        Returns:
+            Path: Directory for persisted caches.
+        """
+        return Path(self.state_dir).expanduser()
+
+
+# Global settings instance
+settings = Settings()
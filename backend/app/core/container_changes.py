@@ -0,0 +1,201 @@
+"""Bounded change log of containers for delta sync.
+
+Every container change (Docker event or new size measurement) bumps the
+containers revision and is logged as ``(revision, container_id, kind)``.
+It also bumps the container's own revision (``containers:<ref>`` for
+its full ID, short ID and name), which detail long-polls wait on.
+Clients holding a revision token ask only for what changed since; once
+their revision has been compacted out of the log, or the events stream
+was lost in between, they are told to resync in full.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.revisions import RevisionTracker, revisions
+
+# Container actions that do not change what the listing reports
+IGNORED_ACTIONS = {
+    "attach",
+    "commit",
+    "copy",
+    "detach",
+    "export",
+    "resize",
+    "top",
+    "archive-path",
+    "extract-to-dir",
+}
+
+ADDED = "added"
+UPDATED = "updated"
+REMOVED = "removed"
+
+
+class ContainerChangeLog:
+    """Revision-ordered log of container changes.
+
+    Example:
+        >>> log = ContainerChangeLog(revisions, max_entries=1000)
+        >>> token = log.token()
+        >>> log.record("3f2a...", "updated")
+        >>> log.changes_since(token)
+        {'revision': '...', 'added': [], 'updated': ['3f2a...'], ...}
+    """
+
+    def __init__(self, tracker: RevisionTracker, max_entries: int = 1000):
+        """Initialize an empty log.
+
+        Args:
+            tracker: Revision tracker owning the containers revision.
+            max_entries: Changes kept before the oldest are compacted.
+        """
+        self.tracker = tracker
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Deque[Tuple[int, str, str]] = deque()
+        self._floor = tracker.get("containers")
+        self._names: Dict[str, str] = {}
+
+    @staticmethod
+    def resource(container: str) -> str:
+        """Get the revision resource of one container.
+
+        Args:
+            container: Container name, full ID or short ID.
+
+        Returns:
+            str: Resource name, e.g. ``containers:postgres``.
+        """
+        return f"containers:{container}"
+
+    def token(self) -> str:
+        """Get the token of the current containers revision.
+
+        Returns:
+            str: Opaque ``<epoch>.<revision>`` token.
+        """
+        return self.tracker.token("containers")
+
+    def record(
+        self, container_id: str, kind: str, names: Tuple[str, ...] = ()
+    ) -> int:
+        """Log a container change and bump the containers revisions.
+
+        Args:
+            container_id: Full container ID.
+            kind: ``added``, ``updated`` or ``removed``.
+            names: Names the container is (or was) known by, in
+                addition to the last one seen in its events.
+
+        Returns:
+            int: The new containers revision.
+        """
+        with self._lock:
+            revision = self.tracker.bump("containers")
+            self._entries.append((revision, container_id, kind))
+            while len(self._entries) > self.max_entries:
+                self._floor = self._entries.popleft()[0]
+            refs = {container_id, container_id[:12], *names}
+            known = self._names.get(container_id)
+            if known:
+                refs.add(known)
+            if kind == REMOVED:
+                self._names.pop(container_id, None)
+            elif names:
+                self._names[container_id] = names[0]
+        for ref in refs:
+            self.tracker.bump(self.resource(ref))
+        return revision
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Log container events.
+
+        Args:
+            event: Decoded Docker event.
+        """
+        if event.get("Type") != "container":
+            return
+        action = event.get("Action", "").split(":", 1)[0]
+        container_id = (event.get("Actor") or {}).get("ID", "")
+        if (
+            not container_id
+            or action in IGNORED_ACTIONS
+            or action.startswith("exec_")
+        ):
+            return
+        attributes = (event.get("Actor") or {}).get("Attributes") or {}
+        names = tuple(
+            name.lstrip("/")
+            for name in (attributes.get("name"), attributes.get("oldName"))
+            if name
+        )
+        if action == "create":
+            self.record(container_id, ADDED, names)
+        elif action == "destroy":
+            self.record(container_id, REMOVED, names)
+        else:
+            self.record(container_id, UPDATED, names)
+
+    def reset(self, *_: Any) -> None:
+        """Forget all changes (events may have been missed).
+
+        Accepts and ignores arguments so it can be used as a resync hook.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._names.clear()
+            self._floor = self.tracker.bump("containers")
+
+    def changes_since(self, since: str) -> Optional[Dict[str, Any]]:
+        """Get the net changes after a revision token.
+
+        A container created and destroyed in between is omitted; one
+        created and then changed is reported as added.
+
+        Args:
+            since: Token returned by :meth:`token`.
+
+        Returns:
+            Dictionary with revision (token), added, updated and removed
+            container IDs, or None if a full resync is required.
+        """
+        epoch, _, raw = since.partition(".")
+        try:
+            revision = int(raw)
+        except ValueError:
+            return None
+
+        with self._lock:
+            current = self.tracker.get("containers")
+            if (
+                epoch != self.tracker.epoch
+                or revision < self._floor
+                or revision > current
+            ):
+                return None
+            net: Dict[str, str] = {}
+            for entry_revision, container_id, kind in self._entries:
+                if entry_revision <= revision:
+                    continue
+                previous = net.get(container_id)
+                if previous == ADDED and kind == REMOVED:
+                    del net[container_id]
+                elif previous == ADDED:
+                    continue
+                else:
+                    net[container_id] = kind
+            token = f"{self.tracker.epoch}.{current}"
+
+        changes: Dict[str, List[str]] = {ADDED: [], UPDATED: [], REMOVED: []}
+        for container_id, kind in net.items():
+            changes[kind].append(container_id)
+        return {"revision": token, **changes}
+
+
+# Global change log fed by the shared event bus
+container_changes = ContainerChangeLog(
+    revisions, max_entries=settings.container_change_log_size
+)
@@ -0,0 +1,234 @@
+"""Background-computed container writable-layer sizes.
+
+``size=True`` on a container listing makes the daemon walk every
+container's writable layer. Here sizes are measured one container at a
+time by a low-priority worker and cached per container; a measurement
+is only repeated once the container has run since it was taken.
+Readers never wait: unknown sizes are queued and reported as missing.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from docker.client import DockerClient
+
+from app.core.activity import RequestActivity, request_activity
+from app.core.container_changes import UPDATED, container_changes
+
+logger = logging.getLogger(__name__)
+
+
+class ContainerSizeCache:
+    """Cache of SizeRw/SizeRootFs per container.
+
+    A size becomes stale when the container starts or stops after it
+    was measured. Sizes of containers that are still running are
+    refreshed at most every ``running_refresh`` seconds.
+
+    Example:
+        >>> sizes = ContainerSizeCache(request_activity)
+        >>> sizes.start(lambda: docker_client.client)
+        >>> sizes.get(container.id)
+        {'size_rw': 1048576, 'size_root_fs': 412090368, ...}
+    """
+
+    def __init__(
+        self,
+        activity: RequestActivity,
+        delay: float = 0.5,
+        running_refresh: float = 600.0,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            activity: Foreground request tracker; the worker pauses
+                while requests are in flight.
+            delay: Seconds to pause between two measurements.
+            running_refresh: Seconds before a running container's size
+                is measured again.
+        """
+        self.activity = activity
+        self.delay = delay
+        self.running_refresh = running_refresh
+
+        self._lock = threading.Lock()
+        self._sizes: Dict[str, Dict[str, Any]] = {}
+        self._pending: "OrderedDict[str, None]" = OrderedDict()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Check whether the worker thread is alive.
+
+        Returns:
+            bool: True if sizes are being measured.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def get(self, container_id: str) -> Optional[Dict[str, Any]]:
+        """Get the cached size of a container without blocking.
+
+        Missing or stale sizes are queued for measurement; the last
+        known value (if any) is still returned.
+
+        Args:
+            container_id: Full container ID.
+
+        Returns:
+            Dictionary with size_rw, size_root_fs and measured_at, or
+            None if the container was never measured.
+        """
+        with self._lock:
+            entry = self._sizes.get(container_id)
+            if entry is None or self._is_stale(entry):
+                self._enqueue(container_id)
+            if entry is None:
+                return None
+            return {
+                "size_rw": entry["size_rw"],
+                "size_root_fs": entry["size_root_fs"],
+                "measured_at": entry["measured_at"],
+            }
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Invalidate sizes of containers that ran.
+
+        Args:
+            event: Decoded Docker event.
+        """
+        action = event.get("Action", "")
+        container_id = (event.get("Actor") or {}).get("ID", "")
+        with self._lock:
+            entry = self._sizes.get(container_id)
+            if action == "destroy":
+                self._sizes.pop(container_id, None)
+                self._pending.pop(container_id, None)
+            elif entry is not None and action in ("start", "die"):
+                entry["stale"] = True
+                entry["running"] = action == "start"
+
+    def start(self, client_factory: Callable[[], DockerClient]) -> None:
+        """Start the measurement worker.
+
+        Args:
+            client_factory: Callable returning the Docker client.
+        """
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(client_factory,),
+            name="container-sizes",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the measurement worker.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def measure(self, client: DockerClient, container_id: str) -> None:
+        """Measure one container and cache the result.
+
+        Args:
+            client: Docker client.
+            container_id: Full container ID.
+        """
+        summaries = client.api.containers(
+            all=True, size=True, filters={"id": container_id}
+        )
+        with self._lock:
+            previous = self._sizes.get(container_id)
+            if not summaries:
+                self._sizes.pop(container_id, None)
+                return
+            summary = summaries[0]
+            size_rw = summary.get("SizeRw") or 0
+            size_root_fs = summary.get("SizeRootFs") or 0
+            changed = previous is None or (
+                previous["size_rw"],
+                previous["size_root_fs"],
+            ) != (size_rw, size_root_fs)
+            self._sizes[container_id] = {
+                "size_rw": size_rw,
+                "size_root_fs": size_root_fs,
+                "measured_at": datetime.now(timezone.utc).isoformat(),
+                "measured": time.monotonic(),
+                "running": summary.get("State") == "running",
+                "stale": False,
+            }
+        if changed:
+            container_changes.record(container_id, UPDATED)
+
+    def _is_stale(self, entry: Dict[str, Any]) -> bool:
+        """Check whether a measurement must be repeated.
+
+        Args:
+            entry: Cached size entry.
+
+        Returns:
+            bool: True if the container ran since it was measured.
+        """
+        if entry["stale"]:
+            return True
+        return (
+            entry["running"]
+            and time.monotonic() - entry["measured"] > self.running_refresh
+        )
+
+    def _enqueue(self, container_id: str) -> None:
+        """Queue a container for measurement (lock held by caller).
+
+        Args:
+            container_id: Full container ID.
+        """
+        if container_id not in self._pending:
+            self._pending[container_id] = None
+            self._wake.set()
+
+    def _run(self, client_factory: Callable[[], DockerClient]) -> None:
+        """Measure queued containers one at a time until stopped.
+
+        Args:
+            client_factory: Callable returning the Docker client.
+        """
+        while not self._stop.is_set():
+            with self._lock:
+                container_id = next(iter(self._pending), None)
+                if container_id is None:
+                    self._wake.clear()
+            if container_id is None:
+                self._wake.wait()
+                continue
+
+            # Low priority: never measure while requests are in flight
+            if self.activity.busy(quiet_period=1.0):
+                self._stop.wait(self.delay)
+                continue
+
+            try:
+                self.measure(client_factory(), container_id)
+            except Exception:
+                logger.warning("Failed to measure container %s", container_id)
+            with self._lock:
+                self._pending.pop(container_id, None)
+            self._stop.wait(self.delay)
+
+
+# Global size cache fed by the shared event bus
+container_sizes = ContainerSizeCache(request_activity)
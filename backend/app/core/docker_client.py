@@ -3,23 +3,90 @@
 This module provides a singleton pattern implementation for Docker client
 connections, ensuring a single point of access to the Docker Engine throughout
 the application lifecycle.
+
+The connection is opened lazily on first use, so the API starts (and
+answers liveness checks) while Docker is down. A circuit breaker opens
+after repeated failures: calls then fail fast with
+:class:`DockerUnavailableError` instead of waiting on the socket, and a
+reconnect is attempted with exponential backoff until the daemon is back.
 """
 
+import threading
+import time
+from typing import Any, Optional
+
 import docker
+import requests
 from docker.client import DockerClient
-from docker.errors import DockerException
+
+from app.core.config import settings
+
+# Transport errors meaning the daemon could not be reached at all
+UNREACHABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+class DockerUnavailableError(RuntimeError):
+    """Raised while the Docker daemon is unreachable.
+
+    Attributes:
+        retry_after: Seconds until the next reconnect attempt.
+    """
+
+    def __init__(self, message: str, retry_after: float = 0.0) -> None:
+        """Initialize with a reason and retry delay.
+
+        Args:
+            message: Failure reason.
+            retry_after: Seconds until the next reconnect attempt.
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LazyDockerClient:
+    """Stand-in for a DockerClient that resolves the connection per use.
+
+    Repositories keep a reference to this object; every attribute access
+    goes through the circuit breaker, so a reference taken at import time
+    keeps working across daemon restarts.
+    """
+
+    def __init__(self, manager: "DockerClientManager") -> None:
+        """Bind to a client manager.
+
+        Args:
+            manager: Manager owning the real connection.
+        """
+        self._manager = manager
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward attribute access to the connected client.
+
+        Args:
+            name: Attribute name.
+
+        Returns:
+            Attribute of the real DockerClient.
+
+        Raises:
+            DockerUnavailableError: If the daemon is unreachable.
+        """
+        return getattr(self._manager.get_client(), name)
 
 
 class DockerClientManager:
     """Manages Docker client connection using singleton pattern.
 
     This class ensures only one Docker client instance exists throughout
-    the application, providing efficient connection management and
+    the application, providing lazy connection, a circuit breaker and
     connection health checking.
 
     Attributes:
         _instance: Singleton instance of the class.
-        _client: Docker client instance.
+        _client: Connected Docker client, or None until first use.
 
     Example:
         >>> manager = DockerClientManager()
@@ -29,7 +96,8 @@ class DockerClientManager:
     """
 
     _instance = None
-    _client: DockerClient = None
+    _client: Optional[DockerClient] = None
+    _stream_api: Optional[docker.APIClient] = None
 
     def __new__(cls) -> "DockerClientManager":
         """Create or return existing singleton instance.
@@ -42,29 +110,146 @@ class DockerClientManager:
         return cls._instance
 
     def __init__(self) -> None:
-        """Initialize Docker client connection.
-
-        Connects to Docker Engine using environment variables (DOCKER_HOST).
-        Validates connection by pinging the Docker daemon.
+        """Initialize breaker state without connecting.
 
-        Raises:
-            RuntimeError: If connection to Docker daemon fails.
+        The daemon is contacted on first use of :attr:`client`.
         """
-        if self._client is None:
-            try:
-                self._client = docker.from_env()
-                self._client.ping()
-            except DockerException as e:
-                raise RuntimeError(f"Failed to connect to Docker: {e}")
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+        self._lock = threading.Lock()
+        self._proxy = LazyDockerClient(self)
+        self._connecting = False
+        self._failures = 0
+        self._backoff = 1.0
+        self._open_until = 0.0
+        self._last_error: Optional[str] = None
 
     @property
     def client(self) -> DockerClient:
         """Get Docker client instance.
 
+        Returns:
+            DockerClient: Client connecting lazily on first use.
+        """
+        return self._proxy
+
+    @property
+    def last_error(self) -> Optional[str]:
+        """Get the reason of the last connection failure.
+
+        Returns:
+            Error message, or None if the last attempt succeeded.
+        """
+        return self._last_error
+
+    def get_client(self) -> DockerClient:
+        """Get the connected Docker client, connecting if needed.
+
         Returns:
             DockerClient: The active Docker client.
+
+        Raises:
+            DockerUnavailableError: If the circuit is open, another
+                thread is reconnecting, or the connection attempt fails.
+        """
+        with self._lock:
+            if self._client is not None:
+                return self._client
+            wait = self._open_until - time.monotonic()
+            if wait > 0 or self._connecting:
+                raise DockerUnavailableError(
+                    f"Docker daemon unavailable: {self._last_error}",
+                    retry_after=max(wait, 0.0),
+                )
+            self._connecting = True
+
+        try:
+            client = docker.from_env(timeout=settings.docker_timeout)
+            client.ping()
+        except Exception as e:
+            with self._lock:
+                self._connecting = False
+            self.record_failure(e, trip=True)
+            raise DockerUnavailableError(
+                f"Failed to connect to Docker: {e}",
+                retry_after=self._backoff,
+            ) from e
+
+        with self._lock:
+            self._connecting = False
+            self._client = client
+        self.record_success()
+        return client
+
+    def get_stream_api(self) -> docker.APIClient:
+        """Get a low-level client without read timeout for follow streams.
+
+        The regular client gives up on a read after ``DOCKER_TIMEOUT``,
+        which ends a followed log stream whenever a container stays
+        quiet that long. Follow streams use this client instead; it is
+        only handed out while the regular connection is healthy.
+
+        Returns:
+            APIClient: Client whose reads never time out.
+
+        Raises:
+            DockerUnavailableError: If the daemon cannot be reached.
+        """
+        self.get_client()
+        with self._lock:
+            if self._stream_api is None:
+                self._stream_api = docker.from_env(timeout=None).api
+            return self._stream_api
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        with self._lock:
+            self._failures = 0
+            self._backoff = 1.0
+            self._open_until = 0.0
+            self._last_error = None
+
+    def record_failure(self, error: Exception, trip: bool = False) -> None:
+        """Count a failed call and open the circuit when due.
+
+        Opening the circuit drops the connection, so the next attempt
+        after the backoff reconnects from scratch.
+
+        Args:
+            error: The failure.
+            trip: Open the circuit immediately (failed connect).
+        """
+        with self._lock:
+            self._failures += 1
+            self._last_error = str(error) or error.__class__.__name__
+            if not trip and self._failures < settings.docker_failure_threshold:
+                return
+            self._open_until = time.monotonic() + self._backoff
+            self._backoff = min(
+                self._backoff * 2, settings.docker_reconnect_max_backoff
+            )
+            stale, self._client = self._client, None
+            stale_stream, self._stream_api = self._stream_api, None
+        for client in (stale, stale_stream):
+            if client is None:
+                continue
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def report(self, ok: bool, error: Optional[str] = None) -> None:
+        """Feed the outcome of a health probe into the breaker.
+
+        Args:
+            ok: Whether the probe succeeded.
+            error: Failure reason if it did not.
         """
-        return self._client
+        if ok:
+            self.record_success()
+        else:
+            self.record_failure(RuntimeError(error or "Docker ping failed"))
 
     def is_connected(self) -> bool:
         """Check if Docker daemon is accessible.
@@ -73,11 +258,32 @@ class DockerClientManager:
             bool: True if Docker daemon responds to ping, False otherwise.
         """
         try:
-            self._client.ping()
+            self.get_client().ping()
             return True
         except Exception:
             return False
 
 
+def unavailable_cause(error: BaseException) -> Optional[BaseException]:
+    """Find a Docker outage in an exception's cause/context chain.
+
+    Repositories and controllers wrap errors; this recovers whether the
+    root failure was the daemon being unreachable.
+
+    Args:
+        error: Exception raised while handling a request.
+
+    Returns:
+        The DockerUnavailableError or transport error, or None.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, (DockerUnavailableError,) + UNREACHABLE_ERRORS):
+            return error
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return None
+
+
 # Global singleton instance
 docker_client = DockerClientManager()
@@ -0,0 +1,209 @@
+"""Shared Docker events subscription.
+
+One background thread holds a single ``client.events()`` stream and
+fans each event out to in-process subscribers (indexes, caches, revision
+counters). Nothing else in the application should open its own events
+connection to the daemon.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from docker.client import DockerClient
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Dict[str, Any]], None]
+ResyncHook = Callable[[DockerClient], None]
+
+
+class DockerEventBus:
+    """Dispatches Docker events from one shared stream.
+
+    After every (re)connection the resync hooks run before events are
+    consumed, so subscribers can rebuild state that may have changed
+    while the stream was down. Handler errors are logged and never stop
+    the stream.
+
+    Example:
+        >>> bus = DockerEventBus()
+        >>> bus.subscribe(lambda e: print(e["Action"]), types={"container"})
+        >>> bus.start(lambda: docker_client.client)
+    """
+
+    def __init__(self, reconnect_delay: float = 1.0) -> None:
+        """Initialize an idle event bus.
+
+        Args:
+            reconnect_delay: Initial delay before reconnecting; doubled
+                on each consecutive failure up to 30 seconds.
+        """
+        self.reconnect_delay = reconnect_delay
+        self._handlers: List[tuple] = []
+        self._resync_hooks: List[ResyncHook] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stream = None
+
+    @property
+    def connected(self) -> bool:
+        """Check whether the events stream is currently open.
+
+        Returns:
+            bool: True if no event can be missed right now.
+        """
+        return self._stream is not None
+
+    @property
+    def running(self) -> bool:
+        """Check whether the dispatch thread is alive.
+
+        Returns:
+            bool: True if events are being consumed.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(
+        self, handler: EventHandler, types: Optional[set] = None
+    ) -> Callable[[], None]:
+        """Register an event handler.
+
+        Args:
+            handler: Callable receiving the decoded event dictionary.
+            types: Event types to receive (e.g. ``{"container"}``).
+                Defaults to all types.
+
+        Returns:
+            Callable that removes the subscription.
+        """
+        entry = (handler, frozenset(types) if types else None)
+        with self._lock:
+            self._handlers.append(entry)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if entry in self._handlers:
+                    self._handlers.remove(entry)
+
+        return unsubscribe
+
+    def add_resync_hook(self, hook: ResyncHook) -> Callable[[], None]:
+        """Register a callable run after every (re)connection.
+
+        Args:
+            hook: Callable receiving the Docker client.
+
+        Returns:
+            Callable that removes the hook.
+        """
+        with self._lock:
+            self._resync_hooks.append(hook)
+
+        def remove() -> None:
+            with self._lock:
+                if hook in self._resync_hooks:
+                    self._resync_hooks.remove(hook)
+
+        return remove
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        """Dispatch an event to matching handlers.
+
+        Args:
+            event: Decoded Docker event.
+        """
+        event_type = event.get("Type")
+        with self._lock:
+            handlers = list(self._handlers)
+
+        for handler, types in handlers:
+            if types is not None and event_type not in types:
+                continue
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("Docker event handler failed")
+
+    def start(self, client_factory: Callable[[], DockerClient]) -> None:
+        """Start consuming events in a background thread.
+
+        Args:
+            client_factory: Callable returning the Docker client.
+        """
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(client_factory,),
+            name="docker-events",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop consuming events.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit.
+        """
+        self._stop.set()
+        stream = self._stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self, client_factory: Callable[[], DockerClient]) -> None:
+        """Consume the events stream, reconnecting with backoff.
+
+        Args:
+            client_factory: Callable returning the Docker client.
+        """
+        delay = self.reconnect_delay
+        while not self._stop.is_set():
+            try:
+                client = client_factory()
+                self._stream = client.events(decode=True)
+                self._resync(client)
+                delay = self.reconnect_delay
+
+                for event in self._stream:
+                    if self._stop.is_set():
+                        break
+                    self.publish(event)
+            except Exception:
+                if self._stop.is_set():
+                    break
+                logger.warning(
+                    "Docker events stream lost, reconnecting in %.1fs", delay
+                )
+            finally:
+                self._stream = None
+
+            self._stop.wait(delay)
+            delay = min(delay * 2, 30.0)
+
+    def _resync(self, client: DockerClient) -> None:
+        """Run resync hooks after a (re)connection.
+
+        Args:
+            client: Connected Docker client.
+        """
+        with self._lock:
+            hooks = list(self._resync_hooks)
+        for hook in hooks:
+            try:
+                hook(client)
+            except Exception:
+                logger.exception("Docker event resync hook failed")
+
+
+# Global event bus shared by all subscribers
+event_bus = DockerEventBus()
@@ -0,0 +1,229 @@
+"""Fast JSON responses for trusted internal data.
+
+List endpoints used to build a Pydantic model per row, and FastAPI then
+validated and serialized every model again through ``response_model``.
+The rows come from our own repositories, so here they are projected
+onto the schema's fields by a :class:`SchemaEncoder` built once per
+model and written straight to JSON bytes by :class:`FastJSONResponse`.
+Routes keep their ``response_model`` so the OpenAPI schema is unchanged;
+returning a Response makes FastAPI skip its own validation.
+
+Run ``python -m app.core.fast_json`` to compare both paths on a
+500-container listing.
+"""
+
+import json
+import time
+import typing
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to compact JSON bytes.
+
+    Args:
+        content: JSON-compatible data.
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (stdlib json as fallback)."""
+
+    def render(self, content: Any) -> bytes:
+        """Render content to JSON bytes.
+
+        Args:
+            content: JSON-compatible data.
+
+        Returns:
+            bytes: Response body.
+        """
+        return dumps(content)
+
+
+class SchemaEncoder:
+    """Projects plain dicts onto a Pydantic model's JSON shape.
+
+    Keeps only the model's fields (by alias), fills defaults for missing
+    ones, converts ints to floats for float fields and recurses into
+    nested models, producing what ``model_dump(mode="json")`` would for
+    well-formed input, without validating it.
+
+    Example:
+        >>> encoder = SchemaEncoder(ContainerInfo)
+        >>> encoder.encode_many(repository.list_containers())
+        [{'id': 'abc123def456', 'name': 'local-postgres', ...}]
+    """
+
+    def __init__(self, model: Type[BaseModel]) -> None:
+        """Pre-build the per-field converters of a model.
+
+        Args:
+            model: Response schema.
+        """
+        self.model = model
+        self._fields: List[
+            Tuple[str, str, Callable[[], Any], Optional[Callable]]
+        ] = []
+        for name, field in model.model_fields.items():
+            default = field.default_factory or (lambda d=field.default: d)
+            self._fields.append(
+                (
+                    name,
+                    field.alias or name,
+                    default,
+                    self._converter(field.annotation),
+                )
+            )
+
+    def encode(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Project one row.
+
+        Args:
+            row: Trusted data with the model's field names as keys.
+
+        Returns:
+            JSON-ready dictionary.
+        """
+        result = {}
+        for name, key, default, convert in self._fields:
+            if name in row:
+                value = row[name]
+            elif key in row:
+                value = row[key]
+            else:
+                value = default()
+            if convert is not None and value is not None:
+                value = convert(value)
+            result[key] = value
+        return result
+
+    def encode_many(
+        self, rows: Iterable[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Project a list of rows.
+
+        Args:
+            rows: Trusted data.
+
+        Returns:
+            List of JSON-ready dictionaries.
+        """
+        return [self.encode(row) for row in rows]
+
+    @classmethod
+    def _converter(cls, annotation: Any) -> Optional[Callable[[Any], Any]]:
+        """Build the converter for a field annotation.
+
+        Args:
+            annotation: Field type.
+
+        Returns:
+            Callable converting a non-None value, or None to pass it
+            through unchanged.
+        """
+        origin = typing.get_origin(annotation)
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+
+        if origin in (list, List) and args:
+            item = cls._converter(args[0])
+            if item is None:
+                return None
+            return lambda values: [
+                v if v is None else item(v) for v in values
+            ]
+        if origin is not None and len(args) == 1:
+            # Optional[X]
+            return cls._converter(args[0])
+        if annotation is float:
+            return float
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            nested = SchemaEncoder(annotation)
+            return lambda value: (
+                value.model_dump(mode="json", by_alias=True)
+                if isinstance(value, BaseModel)
+                else nested.encode(value)
+            )
+        return None
+
+
+def benchmark(rows: int = 500, repeat: int = 50) -> Dict[str, float]:
+    """Compare CPU time per container listing on both paths.
+
+    The baseline mirrors the previous route: one model per row, then
+    FastAPI's response validation, serialization and ``json.dumps``.
+
+    Args:
+        rows: Containers per listing.
+        repeat: Listings per measurement.
+
+    Returns:
+        Dictionary with validated_ms, fast_ms (CPU milliseconds per
+        listing) and speedup.
+    """
+    from pydantic import TypeAdapter
+
+    from app.schemas import ContainerInfo
+
+    data = [
+        {
+            "id": f"{i:012x}",
+            "name": f"service-{i}",
+            "status": "running",
+            "state": "running",
+            "image": f"registry.local/service-{i}:latest",
+            "ports": [f"{8000 + i}:80/tcp"],
+            "created": "2025-10-29T10:00:00Z",
+            "running": True,
+            "size_rw_bytes": 1024 * i,
+            "size_root_fs_bytes": 1024**2 * i,
+            "size_measured_at": "2025-10-29T10:05:00+00:00",
+        }
+        for i in range(rows)
+    ]
+    adapter = TypeAdapter(List[ContainerInfo])
+    encoder = SchemaEncoder(ContainerInfo)
+
+    def validated() -> bytes:
+        models = [ContainerInfo(**c) for c in data]
+        content = adapter.validate_python([m.model_dump() for m in models])
+        return JSONResponse(adapter.dump_python(content, mode="json")).body
+
+    def fast() -> bytes:
+        return FastJSONResponse(encoder.encode_many(data)).body
+
+    timings = {}
+    for name, func in (("validated_ms", validated), ("fast_ms", fast)):
+        started = time.process_time()
+        for _ in range(repeat):
+            func()
+        timings[name] = (time.process_time() - started) * 1000 / repeat
+    timings["speedup"] = timings["validated_ms"] / max(
+        timings["fast_ms"], 1e-9
+    )
+    return timings
+
+
+if __name__ == "__main__":
+    result = benchmark()
+    print(
+        f"500 containers: validated {result['validated_ms']:.2f} ms, "
+        f"fast {result['fast_ms']:.2f} ms CPU per request "
+        f"({result['speedup']:.1f}x)"
+    )
@@ -0,0 +1,261 @@
+"""Background Docker daemon health prober.
+
+Pings the daemon on an interval with a short timeout and keeps the
+outcome in memory: reachability, the last error, a cumulative latency
+histogram and a window of recent latencies. Health endpoints, alerts
+and ``/metrics`` read this state instead of pinging on the request path,
+so a wedged daemon can never hang an API worker.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from docker.client import DockerClient
+
+from app.core.collectors import Collector
+from app.core.config import settings
+
+# Histogram bucket upper bounds in seconds (Prometheus style)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class DaemonHealth:
+    """Cached Docker daemon health with a latency histogram.
+
+    Attributes:
+        interval: Seconds between probes.
+        timeout: Seconds a ping may take before it counts as failed.
+
+    Example:
+        >>> health = DaemonHealth(interval=5, timeout=2)
+        >>> collectors.register(health.collector(lambda: client))
+        >>> health.snapshot()["connected"]
+        True
+    """
+
+    def __init__(
+        self, interval: float = 5.0, timeout: float = 2.0, window: int = 20
+    ) -> None:
+        """Initialize with no probe taken yet.
+
+        Args:
+            interval: Seconds between probes.
+            timeout: Seconds a ping may take.
+            window: Number of recent latencies kept for alerting.
+        """
+        self.interval = interval
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._latency_sum = 0.0
+        self._probes = 0
+        self._failures = 0
+        self._recent: Deque[float] = deque(maxlen=window)
+        self._connected: Optional[bool] = None
+        self._last_error: Optional[str] = None
+        self._last_latency: Optional[float] = None
+        self._checked_at: Optional[str] = None
+        self._consecutive_failures = 0
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="docker-ping"
+        )
+        self._inflight: Optional[Future] = None
+
+    @property
+    def probed(self) -> bool:
+        """Check whether at least one probe completed.
+
+        Returns:
+            bool: True once state is available.
+        """
+        return self._connected is not None
+
+    @property
+    def connected(self) -> bool:
+        """Get the cached reachability of the daemon.
+
+        Returns:
+            bool: True if the last probe succeeded.
+        """
+        return bool(self._connected)
+
+    def probe(self, client: DockerClient) -> bool:
+        """Ping the daemon once and record the outcome.
+
+        The ping runs in a helper thread so a wedged daemon only costs
+        ``timeout`` seconds; while a previous ping is still stuck no new
+        one is started.
+
+        Args:
+            client: Docker client.
+
+        Returns:
+            bool: True if the daemon answered within the timeout.
+        """
+        if self._inflight is not None and not self._inflight.done():
+            self._record(None, "Previous ping still pending")
+            return False
+
+        started = time.monotonic()
+        self._inflight = self._executor.submit(client.ping)
+        try:
+            self._inflight.result(timeout=self.timeout)
+        except FutureTimeout:
+            self._record(None, f"Ping timed out after {self.timeout:.1f}s")
+            return False
+        except Exception as e:
+            self._record(None, str(e) or e.__class__.__name__)
+            return False
+
+        self._record(time.monotonic() - started, None)
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the cached health state.
+
+        Returns:
+            Dictionary with connected, last_latency_ms,
+            recent_latency_ms (mean of the window), last_error,
+            consecutive_failures and checked_at.
+        """
+        with self._lock:
+            recent = (
+                sum(self._recent) / len(self._recent) if self._recent else None
+            )
+            return {
+                "connected": bool(self._connected),
+                "last_latency_ms": self._to_ms(self._last_latency),
+                "recent_latency_ms": self._to_ms(recent),
+                "last_error": self._last_error,
+                "consecutive_failures": self._consecutive_failures,
+                "checked_at": self._checked_at,
+            }
+
+    def render_prometheus(self) -> List[str]:
+        """Render the probe metrics in Prometheus text format.
+
+        Returns:
+            Exposition lines (without trailing newline).
+        """
+        with self._lock:
+            counts = list(self._bucket_counts)
+            total = self._latency_sum
+            probes = self._probes
+            failures = self._failures
+            up = 1 if self._connected else 0
+
+        name = "mylocalplace_docker_ping_seconds"
+        lines = [
+            "# HELP mylocalplace_docker_up Docker daemon reachable (1/0)",
+            "# TYPE mylocalplace_docker_up gauge",
+            f"mylocalplace_docker_up {up}",
+            "# HELP mylocalplace_docker_ping_failures_total Failed pings",
+            "# TYPE mylocalplace_docker_ping_failures_total counter",
+            f"mylocalplace_docker_ping_failures_total {failures}",
+            f"# HELP {name} Docker daemon ping latency",
+            f"# TYPE {name} histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {probes - failures}')
+        lines.append(f"{name}_sum {total:.6f}")
+        lines.append(f"{name}_count {probes - failures}")
+        return lines
+
+    def collector(
+        self,
+        client_factory: Callable[[], DockerClient],
+        on_result: Optional[Callable[[bool, Optional[str]], None]] = None,
+    ) -> Collector:
+        """Declare the periodic probe for the collector scheduler.
+
+        Args:
+            client_factory: Callable returning the Docker client.
+            on_result: Optional callback receiving each probe outcome
+                and error (e.g. to drive a circuit breaker).
+
+        Returns:
+            Collector probing every interval.
+        """
+        return Collector(
+            "docker_health",
+            lambda: self.tick(client_factory, on_result),
+            interval=self.interval,
+            timeout=self.timeout + 1.0,
+        )
+
+    def tick(
+        self,
+        client_factory: Callable[[], DockerClient],
+        on_result: Optional[Callable[[bool, Optional[str]], None]] = None,
+    ) -> None:
+        """Probe once and report the outcome.
+
+        Args:
+            client_factory: Callable returning the Docker client.
+            on_result: Optional callback receiving the probe outcome.
+        """
+        try:
+            ok = self.probe(client_factory())
+        except Exception as e:
+            # No client to ping (e.g. still reconnecting)
+            self._record(None, str(e))
+            return
+        if on_result is not None:
+            on_result(ok, self._last_error)
+
+    def _record(self, latency: Optional[float], error: Optional[str]) -> None:
+        """Store the outcome of a probe.
+
+        Args:
+            latency: Ping latency in seconds, or None if it failed.
+            error: Failure reason, or None on success.
+        """
+        with self._lock:
+            self._probes += 1
+            self._checked_at = datetime.now(timezone.utc).isoformat()
+            self._connected = error is None
+            self._last_error = error
+            if error is not None:
+                self._failures += 1
+                self._consecutive_failures += 1
+                return
+
+            self._consecutive_failures = 0
+            self._last_latency = latency
+            self._latency_sum += latency
+            self._recent.append(latency)
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if latency <= bound:
+                    self._bucket_counts[index] += 1
+                    break
+            else:
+                self._bucket_counts[-1] += 1
+
+    @staticmethod
+    def _to_ms(seconds: Optional[float]) -> Optional[float]:
+        """Convert seconds to rounded milliseconds.
+
+        Args:
+            seconds: Duration in seconds.
+
+        Returns:
+            Milliseconds, or None.
+        """
+        return None if seconds is None else round(seconds * 1000, 2)
+
+
+# Global daemon health state
+daemon_health = DaemonHealth(
+    interval=settings.health_probe_interval,
+    timeout=settings.health_probe_timeout,
+)
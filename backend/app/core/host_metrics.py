@@ -0,0 +1,355 @@
+"""Consolidated host metrics snapshots.
+
+A snapshot reads every host counter once: per-core CPU times, memory,
+swap, load average, the usage of every configured mount and the disk
+and network IO counters. Inside the API container ``/`` is the
+container's own overlay, so the host disks that matter (where
+``/var/lib/docker`` and the volumes live) are listed in ``HOST_MOUNTS``;
+mounts that do not exist are skipped.
+
+CPU usage and IO rates are computed from the counter deltas between two
+snapshots, so taking one never blocks to measure (the system endpoint
+used to hold a worker for a second in ``cpu_percent(interval=1)``). The
+first snapshot reports CPU averages since boot and no IO rates.
+
+The ``host`` collector takes one snapshot per tick, at the cadence the
+``host`` sampling demand asks for. The system endpoint, the WebSocket
+``system`` topic and alert rules read the latest snapshot and only take
+one themselves when it is older than they accept.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.collectors import Collector
+from app.core.config import settings
+from app.core.lazy_import import LazyModule
+from app.core.sampling import demand
+
+psutil = LazyModule("psutil")
+
+# Network interfaces left out of the IO rates
+IGNORED_INTERFACES = ("lo",)
+
+# Seconds a snapshot may take before the collector run counts as late
+SNAPSHOT_TIMEOUT = 5.0
+
+
+def _gb(value: float) -> float:
+    """Convert bytes to rounded gigabytes.
+
+    Args:
+        value: Size in bytes.
+
+    Returns:
+        float: Gigabytes with two decimals.
+    """
+    return round(value / 1024**3, 2)
+
+
+def _cpu_counters(times: Any) -> Tuple[float, float]:
+    """Reduce CPU times to total and idle seconds.
+
+    Guest time is already counted in user time on Linux, so it is left
+    out of the total like ``psutil.cpu_percent`` does.
+
+    Args:
+        times: ``psutil`` CPU times of one core.
+
+    Returns:
+        Tuple (total seconds, idle seconds including IO wait).
+    """
+    total = sum(times)
+    total -= getattr(times, "guest", 0.0) + getattr(times, "guest_nice", 0.0)
+    return total, times.idle + getattr(times, "iowait", 0.0)
+
+
+def _busy_percent(
+    current: Tuple[float, float], previous: Optional[Tuple[float, float]]
+) -> float:
+    """Compute CPU usage between two counter readings.
+
+    Args:
+        current: Current (total, idle) seconds.
+        previous: Earlier (total, idle) seconds, or None for since boot.
+
+    Returns:
+        float: Busy percent (0-100), one decimal.
+    """
+    total, idle = current
+    if previous is not None:
+        total, idle = total - previous[0], idle - previous[1]
+    if total <= 0:
+        return 0.0
+    return round(min(max(100.0 * (1 - idle / total), 0.0), 100.0), 1)
+
+
+def _rate(current: float, previous: float, elapsed: float) -> float:
+    """Compute a per-second rate from two counter values.
+
+    Args:
+        current: Current counter value.
+        previous: Earlier counter value.
+        elapsed: Seconds between both.
+
+    Returns:
+        float: Rate (0 if the counter was reset), one decimal.
+    """
+    return round(max(current - previous, 0) / elapsed, 1)
+
+
+class HostMetrics:
+    """Latest host snapshot shared by every reader.
+
+    Example:
+        >>> host = HostMetrics(mounts=["/", "/var/lib/docker"])
+        >>> host.latest(max_age=1.0)["cpu_per_core"]
+        [12.0, 3.5, 40.1, 7.9]
+    """
+
+    def __init__(self, mounts: List[str]) -> None:
+        """Initialize without any snapshot.
+
+        Args:
+            mounts: Paths whose filesystem usage is reported; the first
+                one that exists is also reported as ``disk``.
+        """
+        self.mounts = mounts
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._taken_at = 0.0
+        self._counters: Optional[Dict[str, Any]] = None
+
+    def latest(self, max_age: float) -> Dict[str, Any]:
+        """Get a snapshot no older than ``max_age``.
+
+        Concurrent readers of a stale snapshot share the one that the
+        first of them takes.
+
+        Args:
+            max_age: Seconds a snapshot may be old.
+
+        Returns:
+            Snapshot dictionary matching the ``SystemMetrics`` schema.
+        """
+        with self._lock:
+            if (
+                self._snapshot is None
+                or time.monotonic() - self._taken_at > max_age
+            ):
+                self._take()
+            return self._snapshot
+
+    def collector(self) -> Collector:
+        """Declare the periodic snapshot for the collector scheduler.
+
+        Returns:
+            Collector taking one snapshot per tick.
+        """
+        return Collector(
+            "host",
+            self.tick,
+            interval=demand.ceiling,
+            timeout=SNAPSHOT_TIMEOUT,
+        )
+
+    def tick(self) -> float:
+        """Take a snapshot unless a reader just took one.
+
+        Without demand the snapshot keeps being taken at the ceiling
+        interval, so CPU usage and rates stay relative to a recent
+        reading.
+
+        Returns:
+            float: Seconds until the next tick.
+        """
+        self.latest(max_age=demand.floor)
+        return demand.interval("host") or demand.ceiling
+
+    def _take(self) -> None:
+        """Read every host counter once and store the snapshot."""
+        now = time.monotonic()
+        cpu = [_cpu_counters(t) for t in psutil.cpu_times(percpu=True)]
+        memory = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        disk_io = psutil.disk_io_counters()
+        net_io = psutil.net_io_counters(pernic=True) or {}
+        nics = [
+            c for nic, c in net_io.items() if nic not in IGNORED_INTERFACES
+        ]
+        counters = {
+            "at": now,
+            "cpu": cpu,
+            "disk_io": disk_io,
+            "net": (
+                sum(c.bytes_recv for c in nics),
+                sum(c.bytes_sent for c in nics),
+            ),
+        }
+
+        previous = self._counters
+        if previous is not None and len(previous["cpu"]) != len(cpu):
+            # CPUs went on- or offline
+            previous = None
+        per_core = [
+            _busy_percent(c, previous["cpu"][i] if previous else None)
+            for i, c in enumerate(cpu)
+        ]
+        mounts = self._mounts()
+        elapsed = now - previous["at"] if previous else None
+
+        self._snapshot = {
+            "cpu_percent": (
+                round(sum(per_core) / len(per_core), 1) if per_core else 0.0
+            ),
+            "cpu_per_core": per_core,
+            "load_average": self._load_average(),
+            "memory": {
+                "total_gb": _gb(memory.total),
+                "used_gb": _gb(memory.used),
+                "percent": memory.percent,
+            },
+            "swap": {
+                "total_gb": _gb(swap.total),
+                "used_gb": _gb(swap.used),
+                "percent": swap.percent,
+            },
+            "disk": {
+                "total_gb": mounts[0]["total_gb"],
+                "used_gb": mounts[0]["used_gb"],
+                "percent": mounts[0]["percent"],
+            },
+            "mounts": mounts,
+            "disk_io": self._disk_rates(disk_io, previous, elapsed),
+            "network_io": self._net_rates(counters, previous, elapsed),
+            "sampled_at": datetime.now(timezone.utc).isoformat(),
+            "window_seconds": (
+                round(elapsed, 3) if elapsed is not None else None
+            ),
+        }
+        self._counters = counters
+        self._taken_at = now
+
+    def _mounts(self) -> List[Dict[str, Any]]:
+        """Read the usage of every configured mount.
+
+        Returns:
+            Usage dictionaries of the mounts that exist, or of ``/``
+            when none does.
+        """
+        mounts = []
+        for path in self.mounts:
+            try:
+                mounts.append(self._mount_usage(path))
+            except OSError:
+                continue
+        return mounts or [self._mount_usage("/")]
+
+    @staticmethod
+    def _mount_usage(path: str) -> Dict[str, Any]:
+        """Read the filesystem usage of one path.
+
+        Args:
+            path: Mount path.
+
+        Returns:
+            Dictionary with path, total_gb, used_gb, free_gb and percent.
+
+        Raises:
+            OSError: If the path does not exist or cannot be read.
+        """
+        usage = psutil.disk_usage(path)
+        return {
+            "path": path,
+            "total_gb": _gb(usage.total),
+            "used_gb": _gb(usage.used),
+            "free_gb": _gb(usage.free),
+            "percent": usage.percent,
+        }
+
+    @staticmethod
+    def _load_average() -> Optional[Dict[str, float]]:
+        """Read the 1, 5 and 15 minute load averages.
+
+        Returns:
+            Dictionary with load_1m, load_5m and load_15m, or None
+            where the platform has none.
+        """
+        try:
+            load = psutil.getloadavg()
+        except (AttributeError, OSError):
+            return None
+        return {
+            "load_1m": round(load[0], 2),
+            "load_5m": round(load[1], 2),
+            "load_15m": round(load[2], 2),
+        }
+
+    @staticmethod
+    def _disk_rates(
+        disk_io: Any,
+        previous: Optional[Dict[str, Any]],
+        elapsed: Optional[float],
+    ) -> Optional[Dict[str, float]]:
+        """Compute disk IO rates since the previous snapshot.
+
+        Args:
+            disk_io: Current ``psutil`` disk IO counters (or None).
+            previous: Previous counters, or None.
+            elapsed: Seconds since the previous snapshot.
+
+        Returns:
+            Dictionary with read/write bytes and operations per second,
+            or None without a previous reading.
+        """
+        if not elapsed or disk_io is None or previous["disk_io"] is None:
+            return None
+        before = previous["disk_io"]
+        return {
+            "read_bytes_per_sec": _rate(
+                disk_io.read_bytes, before.read_bytes, elapsed
+            ),
+            "write_bytes_per_sec": _rate(
+                disk_io.write_bytes, before.write_bytes, elapsed
+            ),
+            "read_ops_per_sec": _rate(
+                disk_io.read_count, before.read_count, elapsed
+            ),
+            "write_ops_per_sec": _rate(
+                disk_io.write_count, before.write_count, elapsed
+            ),
+        }
+
+    @staticmethod
+    def _net_rates(
+        counters: Dict[str, Any],
+        previous: Optional[Dict[str, Any]],
+        elapsed: Optional[float],
+    ) -> Optional[Dict[str, float]]:
+        """Compute network IO rates since the previous snapshot.
+
+        Args:
+            counters: Current counters.
+            previous: Previous counters, or None.
+            elapsed: Seconds since the previous snapshot.
+
+        Returns:
+            Dictionary with received and sent bytes per second, or None
+            without a previous reading.
+        """
+        if not elapsed:
+            return None
+        return {
+            "recv_bytes_per_sec": _rate(
+                counters["net"][0], previous["net"][0], elapsed
+            ),
+            "sent_bytes_per_sec": _rate(
+                counters["net"][1], previous["net"][1], elapsed
+            ),
+        }
+
+
+# Global host snapshot for the configured mounts
+host_metrics = HostMetrics(mounts=settings.host_mounts)
@@ -0,0 +1,310 @@
+"""Topic hub multiplexing live updates over WebSockets.
+
+Dashboard tabs used to poll containers, system metrics, health and one
+stats endpoint per container card. Instead a client opens one socket and
+subscribes to topics (``containers``, ``stats:<name>``, ``stats:*``,
+``system``, ``alerts``, ``logs:<name>``). Each topic is fed by a single
+collector task shared by all its subscribers, started with the first
+subscriber and cancelled with the last, and every message is serialized
+once per topic, not once per client.
+
+Each connection owns a bounded send queue drained by its own writer
+task. A slow consumer never delays the others: when its queue is full
+the oldest message is dropped (live state is superseded by the next
+message anyway) and counted.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from app.core.fast_json import dumps
+
+logger = logging.getLogger(__name__)
+
+Collector = Callable[["TopicHub", str], Awaitable[None]]
+
+# Seconds before a collector that ended or failed is restarted
+COLLECTOR_RETRY_DELAY = 5.0
+
+
+def parse_topics(raw: Optional[str]) -> List[str]:
+    """Split a comma-separated topic list.
+
+    Args:
+        raw: e.g. ``"containers,stats:*"``.
+
+    Returns:
+        List of non-empty topic names.
+    """
+    return [t.strip() for t in (raw or "").split(",") if t.strip()]
+
+
+class HubConnection:
+    """One subscriber socket with a bounded send queue.
+
+    Example:
+        >>> connection = HubConnection(websocket.send_text, queue_size=64)
+        >>> writer = asyncio.create_task(connection.run())
+    """
+
+    def __init__(
+        self, send: Callable[[str], Awaitable[None]], queue_size: int = 64
+    ) -> None:
+        """Initialize an idle connection.
+
+        Args:
+            send: Coroutine function sending one text frame.
+            queue_size: Messages buffered before the oldest is dropped.
+        """
+        self.topics: Set[str] = set()
+        self.dropped = 0
+        self._send = send
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=queue_size)
+
+    def offer(self, message: str) -> None:
+        """Queue a message without waiting, dropping the oldest if full.
+
+        Args:
+            message: Serialized message.
+        """
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(message)
+
+    async def run(self) -> None:
+        """Send queued messages until cancelled or the socket fails."""
+        while True:
+            message = await self._queue.get()
+            await self._send(message)
+
+
+class TopicHub:
+    """Routes collector output to subscribed connections.
+
+    Topics are ``<family>`` or ``<family>:<argument>``; a collector is
+    registered per family. Messages published on ``family:x`` also reach
+    subscribers of ``family:*``.
+
+    Example:
+        >>> hub = TopicHub()
+        >>> hub.register("system", collect_system)
+        >>> hub.subscribe(connection, "system")
+    """
+
+    def __init__(self) -> None:
+        """Initialize a hub without collectors or subscribers."""
+        self._collectors: Dict[str, Collector] = {}
+        self._subscribers: Dict[str, Set[HubConnection]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._retained: Dict[str, str] = {}
+        self._connections: Set[HubConnection] = set()
+        self._dropped_closed = 0
+
+    def register(self, family: str, collector: Collector) -> None:
+        """Register the collector feeding a topic family.
+
+        Args:
+            family: Topic family, e.g. ``stats``.
+            collector: Coroutine function ``(hub, topic)`` publishing
+                updates for one topic until cancelled.
+        """
+        self._collectors[family] = collector
+
+    def is_valid(self, topic: str) -> bool:
+        """Check whether a topic has a registered collector.
+
+        Args:
+            topic: Topic name.
+
+        Returns:
+            bool: True if the topic can be subscribed to.
+        """
+        family, separator, argument = topic.partition(":")
+        return family in self._collectors and bool(argument or not separator)
+
+    def has_subscribers(self, topic: str) -> bool:
+        """Check whether anyone is subscribed to a topic.
+
+        Args:
+            topic: Topic name.
+
+        Returns:
+            bool: True if at least one connection is subscribed.
+        """
+        return bool(self._subscribers.get(topic))
+
+    def connect(self, connection: HubConnection) -> None:
+        """Track a new connection.
+
+        Args:
+            connection: Accepted connection.
+        """
+        self._connections.add(connection)
+
+    def subscribe(self, connection: HubConnection, topic: str) -> None:
+        """Subscribe a connection, starting the topic's collector.
+
+        The last retained message of the topic is sent right away.
+
+        Args:
+            connection: Subscriber.
+            topic: Valid topic name.
+
+        Raises:
+            ValueError: If the topic is unknown.
+        """
+        if not self.is_valid(topic):
+            raise ValueError(f"Unknown topic: {topic}")
+        connection.topics.add(topic)
+        self._subscribers.setdefault(topic, set()).add(connection)
+        if topic not in self._tasks:
+            self._tasks[topic] = asyncio.create_task(
+                self._run_collector(topic), name=f"hub-{topic}"
+            )
+        retained = self._retained.get(topic)
+        if retained is not None:
+            connection.offer(retained)
+
+    def unsubscribe(self, connection: HubConnection, topic: str) -> None:
+        """Unsubscribe a connection, stopping an unused collector.
+
+        Args:
+            connection: Subscriber.
+            topic: Topic name.
+        """
+        connection.topics.discard(topic)
+        subscribers = self._subscribers.get(topic)
+        if subscribers is None:
+            return
+        subscribers.discard(connection)
+        if not subscribers:
+            del self._subscribers[topic]
+            self._retained.pop(topic, None)
+            task = self._tasks.pop(topic, None)
+            if task is not None:
+                task.cancel()
+
+    def disconnect(self, connection: HubConnection) -> None:
+        """Drop all subscriptions of a closed connection.
+
+        Args:
+            connection: Closed connection.
+        """
+        for topic in list(connection.topics):
+            self.unsubscribe(connection, topic)
+        if connection in self._connections:
+            self._connections.discard(connection)
+            self._dropped_closed += connection.dropped
+
+    def publish(
+        self,
+        topic: str,
+        data: object,
+        retain: bool = True,
+        interval: Optional[float] = None,
+    ) -> None:
+        """Serialize a message once and queue it for every subscriber.
+
+        Args:
+            topic: Concrete topic, e.g. ``stats:postgres``.
+            data: JSON-compatible payload.
+            retain: Keep it as the topic's current state, sent to new
+                subscribers; an identical retained message is not sent
+                again. Disable for event streams such as logs.
+            interval: Current sampling interval of the topic, sent along
+                so clients know when to expect the next update.
+        """
+        message = {"topic": topic, "data": data}
+        if interval is not None:
+            message["interval"] = interval
+        self._deliver(topic, dumps(message), retain)
+
+    def publish_error(self, topic: str, error: str) -> None:
+        """Tell subscribers a topic's collector failed.
+
+        Args:
+            topic: Topic name.
+            error: Error message.
+        """
+        self._deliver(topic, dumps({"topic": topic, "error": error}), False)
+
+    def stats(self) -> Dict[str, int]:
+        """Get hub counters.
+
+        Returns:
+            Dictionary with connections, subscriptions, collectors and
+            dropped (messages dropped for slow consumers).
+        """
+        return {
+            "connections": len(self._connections),
+            "subscriptions": sum(len(s) for s in self._subscribers.values()),
+            "collectors": len(self._tasks),
+            "dropped": self._dropped_closed
+            + sum(c.dropped for c in self._connections),
+        }
+
+    def render_prometheus(self) -> List[str]:
+        """Render the hub counters in Prometheus text format.
+
+        Returns:
+            Exposition lines (without trailing newline).
+        """
+        stats = self.stats()
+        return [
+            "# HELP mylocalplace_ws_connections Open WebSocket connections",
+            "# TYPE mylocalplace_ws_connections gauge",
+            f"mylocalplace_ws_connections {stats['connections']}",
+            "# HELP mylocalplace_ws_collectors Running topic collectors",
+            "# TYPE mylocalplace_ws_collectors gauge",
+            f"mylocalplace_ws_collectors {stats['collectors']}",
+            "# HELP mylocalplace_ws_dropped_total Messages dropped for "
+            "slow consumers",
+            "# TYPE mylocalplace_ws_dropped_total counter",
+            f"mylocalplace_ws_dropped_total {stats['dropped']}",
+        ]
+
+    def _deliver(self, topic: str, body: bytes, retain: bool) -> None:
+        """Queue a serialized message for a topic's subscribers.
+
+        Args:
+            topic: Concrete topic.
+            body: Serialized message.
+            retain: Store as the topic's current state.
+        """
+        message = body.decode("utf-8")
+        if retain:
+            if self._retained.get(topic) == message:
+                return
+            if topic in self._subscribers:
+                self._retained[topic] = message
+
+        targets = set(self._subscribers.get(topic, ()))
+        family, _, argument = topic.partition(":")
+        if argument and argument != "*":
+            targets |= self._subscribers.get(f"{family}:*", set())
+        for connection in targets:
+            connection.offer(message)
+
+    async def _run_collector(self, topic: str) -> None:
+        """Run a topic's collector, restarting it when it ends or fails.
+
+        Args:
+            topic: Topic name.
+        """
+        collector = self._collectors[topic.partition(":")[0]]
+        while True:
+            try:
+                # Returns when a stream ends (e.g. logs of a stopped container)
+                await collector(self, topic)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Collector %s failed: %s", topic, e)
+                self.publish_error(topic, str(e))
+            await asyncio.sleep(COLLECTOR_RETRY_DELAY)
+
+
+# Global hub shared by all WebSocket connections
+hub = TopicHub()
@@ -0,0 +1,153 @@
+"""Persisted last-used times of Docker images.
+
+Fed from container create/start and image pull/tag/load events on the
+shared event bus, and persisted to the state directory so that image
+eviction can evict least-recently-used images across restarts.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+# Image events that count as a use (a fresh pull should not be evicted)
+_IMAGE_ACTIONS = {"pull", "tag", "load", "import"}
+_CONTAINER_ACTIONS = {"create", "start"}
+
+
+class ImageUsageTracker:
+    """Tracks when each image reference was last used.
+
+    References are stored as they appear in events (tag or ID); lookups
+    take the most recent time over an image's ID and all its tags.
+
+    Attributes:
+        path: JSON file holding ``{reference: epoch_seconds}``.
+        save_interval: Minimum seconds between writes.
+
+    Example:
+        >>> tracker = ImageUsageTracker(Path("/tmp/image-usage.json"))
+        >>> tracker.touch("postgres:16")
+        >>> tracker.last_used("sha256:3f...", ["postgres:16"])
+        1764842400.0
+    """
+
+    def __init__(self, path: Path, save_interval: float = 30.0) -> None:
+        """Initialize; persisted usage times are read on first use.
+
+        Args:
+            path: JSON file holding usage times.
+            save_interval: Minimum seconds between writes.
+        """
+        self.path = path
+        self.save_interval = save_interval
+        self._lock = threading.Lock()
+        self._used: Optional[Dict[str, float]] = None
+        self._dirty = False
+        self._saved_at = 0.0
+
+    def load(self) -> None:
+        """Read persisted usage times if not loaded yet."""
+        with self._lock:
+            self._entries()
+
+    def touch(self, reference: str, when: Optional[float] = None) -> None:
+        """Record a use of an image reference.
+
+        Args:
+            reference: Image tag or ID.
+            when: Epoch seconds of the use. Defaults to now.
+        """
+        if not reference:
+            return
+        with self._lock:
+            self._entries()[reference] = when or time.time()
+            self._dirty = True
+        if time.monotonic() - self._saved_at >= self.save_interval:
+            self.save()
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Record image uses from a Docker event.
+
+        Args:
+            event: Decoded Docker event.
+        """
+        event_type = event.get("Type")
+        action = event.get("Action", "")
+        actor = event.get("Actor") or {}
+        when = event.get("time")
+
+        if event_type == "container" and action in _CONTAINER_ACTIONS:
+            image = (actor.get("Attributes") or {}).get("image")
+            self.touch(image, when)
+        elif event_type == "image" and action in _IMAGE_ACTIONS:
+            self.touch(actor.get("ID", ""), when)
+
+    def last_used(
+        self, image_id: str, tags: Optional[list] = None
+    ) -> Optional[float]:
+        """Get the last use of an image.
+
+        Args:
+            image_id: Image ID.
+            tags: Image repo tags.
+
+        Returns:
+            Epoch seconds, or None if the image was never seen in use.
+        """
+        references = [image_id, image_id.split(":", 1)[-1]] + (tags or [])
+        with self._lock:
+            used = self._entries()
+            times = [used[r] for r in references if r in used]
+        return max(times) if times else None
+
+    def save(self) -> None:
+        """Persist usage times atomically if they changed.
+
+        Failures are ignored: usage times only order eviction.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(self._used)
+            self._dirty = False
+            self._saved_at = time.monotonic()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as handle:
+                json.dump(data, handle)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def _entries(self) -> Dict[str, float]:
+        """Get usage times, loading them on first access (lock held).
+
+        Returns:
+            Mapping of reference to epoch seconds.
+        """
+        if self._used is None:
+            self._used = self._load()
+        return self._used
+
+    def _load(self) -> Dict[str, float]:
+        """Load persisted usage times.
+
+        Returns:
+            Mapping of reference to epoch seconds (empty if unreadable).
+        """
+        try:
+            with open(self.path) as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+
+# Global tracker fed by the shared event bus
+image_usage = ImageUsageTracker(settings.state_path / "image-usage.json")
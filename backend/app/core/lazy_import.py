@@ -0,0 +1,57 @@
+"""Deferred imports for modules only some requests need.
+
+``psutil`` and ``yaml`` are only used by a few endpoints and background
+jobs. Binding them through :class:`LazyModule` keeps them out of worker
+startup (paid on every ``--reload`` and once per production worker)
+while call sites keep using plain ``psutil.cpu_percent()`` and tests can
+still patch the module attribute.
+"""
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Any, Optional
+
+
+class LazyModule:
+    """Module placeholder importing the real module on first use.
+
+    Example:
+        >>> psutil = LazyModule("psutil")
+        >>> psutil.cpu_count()  # imports psutil here
+        8
+    """
+
+    def __init__(self, name: str) -> None:
+        """Remember the module to import.
+
+        Args:
+            name: Fully qualified module name.
+        """
+        self._name = name
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attr: str) -> Any:
+        """Import the module if needed and forward attribute access.
+
+        Args:
+            attr: Attribute name.
+
+        Returns:
+            Attribute of the real module.
+        """
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        """Describe the placeholder.
+
+        Returns:
+            str: Module name and whether it was imported.
+        """
+        state = "loaded" if self._module is not None else "deferred"
+        return f"<LazyModule {self._name} ({state})>"
@@ -0,0 +1,274 @@
+"""Normalized lifecycle events with a bounded replay buffer.
+
+Fed by the shared Docker events subscription (never by a connection of
+its own), this keeps the last ``EVENT_REPLAY_SIZE`` container, image and
+volume events under ``<epoch>-<sequence>`` IDs and hands them to
+Server-Sent Events listeners. A listener reconnecting with
+``Last-Event-ID`` gets the events it missed from the buffer, or a
+resync marker when they are no longer there (evicted, another process,
+or the Docker events stream itself was interrupted in between).
+
+Listeners live on the event loop; events arrive on the Docker events
+thread and are handed over with ``call_soon_threadsafe``. A listener
+that falls more than ``LISTENER_QUEUE_SIZE`` events behind is marked
+overflowed and closed; it resumes from the buffer on reconnect.
+"""
+
+import asyncio
+import threading
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+
+# Events buffered per listener before it is disconnected
+LISTENER_QUEUE_SIZE = 256
+
+EVENT_TYPES = ("container", "image", "volume")
+
+# Container actions too frequent or internal to be lifecycle events
+_NOISY_ACTIONS = ("exec_create", "exec_start", "exec_die", "exec_detach")
+
+EventItem = Tuple[str, Dict[str, Any]]
+
+
+def normalize(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Reduce a raw Docker event to the fields clients need.
+
+    Args:
+        event: Decoded Docker event.
+
+    Returns:
+        Dictionary with type, action, detail, id, name, project,
+        service, image and time, or None for ignored events.
+    """
+    event_type = event.get("Type")
+    action, _, detail = event.get("Action", "").partition(":")
+    if event_type not in EVENT_TYPES or action in _NOISY_ACTIONS:
+        return None
+
+    actor = event.get("Actor") or {}
+    attributes = actor.get("Attributes") or {}
+    time_nano = event.get("timeNano")
+    return {
+        "type": event_type,
+        "action": action,
+        "detail": detail.strip() or None,
+        "id": actor.get("ID", ""),
+        "name": attributes.get("name"),
+        "project": attributes.get("com.docker.compose.project"),
+        "service": attributes.get("com.docker.compose.service"),
+        "image": attributes.get("image"),
+        "time": time_nano / 1e9 if time_nano else event.get("time"),
+    }
+
+
+def matches(
+    event: Dict[str, Any],
+    types: Optional[Set[str]] = None,
+    container: Optional[str] = None,
+    project: Optional[str] = None,
+) -> bool:
+    """Check a normalized event against stream filters.
+
+    Args:
+        event: Normalized event.
+        types: Event types to keep.
+        container: Container name or ID prefix; keeps only events of
+            that container.
+        project: Compose project name.
+
+    Returns:
+        bool: True if the event passes every given filter.
+    """
+    if types and event["type"] not in types:
+        return False
+    if container and not (
+        event["type"] == "container"
+        and (event["name"] == container or event["id"].startswith(container))
+    ):
+        return False
+    return not project or event["project"] == project
+
+
+class EventListener:
+    """One stream client: missed events to replay, then live events.
+
+    Attributes:
+        replay: Buffered events after the client's Last-Event-ID.
+        resync: True if missed events could not be replayed.
+        overflowed: True once the client fell too far behind.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        replay: List[EventItem],
+        resync: bool,
+    ) -> None:
+        """Initialize a listener bound to the current event loop.
+
+        Args:
+            loop: Event loop serving the client.
+            replay: Events to send first.
+            resync: Whether to tell the client to reload its state.
+        """
+        self.replay = replay
+        self.resync = resync
+        self.overflowed = False
+        self._loop = loop
+        self._queue: "asyncio.Queue[Optional[EventItem]]" = asyncio.Queue(
+            maxsize=LISTENER_QUEUE_SIZE
+        )
+
+    def push(self, item: Optional[EventItem]) -> None:
+        """Hand an event over from any thread.
+
+        Args:
+            item: Event, or None for a resync marker.
+        """
+        try:
+            self._loop.call_soon_threadsafe(self._put, item)
+        except RuntimeError:
+            # Event loop already closed
+            pass
+
+    def _put(self, item: Optional[EventItem]) -> None:
+        """Queue an event on the loop thread.
+
+        Args:
+            item: Event, or None for a resync marker.
+        """
+        if self._queue.full():
+            self.overflowed = True
+        else:
+            self._queue.put_nowait(item)
+
+    async def get(self, timeout: float) -> Tuple[bool, Optional[EventItem]]:
+        """Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait.
+
+        Returns:
+            Tuple (received, item): received is False on timeout; item
+            None means resync.
+        """
+        try:
+            return True, await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return False, None
+
+
+class LifecycleEventStream:
+    """Sequenced lifecycle events shared by all stream clients.
+
+    Example:
+        >>> stream = LifecycleEventStream(max_events=1000)
+        >>> event_bus.subscribe(stream.handle_event, types=set(EVENT_TYPES))
+        >>> listener = stream.open(last_event_id="3f9a1c2e-41")
+    """
+
+    def __init__(self, max_events: int = 1000) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            max_events: Events kept for Last-Event-ID replay.
+        """
+        self._lock = threading.Lock()
+        self._epoch = uuid.uuid4().hex[:8]
+        self._sequence = 0
+        self._floor = 0
+        self._buffer: Deque[Tuple[int, EventItem]] = deque(maxlen=max_events)
+        self._listeners: Set[EventListener] = set()
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Buffer a Docker event and hand it to every listener.
+
+        Args:
+            event: Decoded Docker event.
+        """
+        normalized = normalize(event)
+        if normalized is None:
+            return
+        with self._lock:
+            self._sequence += 1
+            item = (f"{self._epoch}-{self._sequence}", normalized)
+            self._buffer.append((self._sequence, item))
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener.push(item)
+
+    def mark_gap(self, *_: Any) -> None:
+        """Record that events may have been missed.
+
+        Buffered events can no longer be replayed seamlessly: resuming
+        clients and connected listeners are told to resync. Accepts and
+        ignores arguments so it can be used as a resync hook.
+        """
+        with self._lock:
+            self._buffer.clear()
+            self._floor = self._sequence
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener.push(None)
+
+    def open(self, last_event_id: Optional[str] = None) -> EventListener:
+        """Register a listener on the running event loop.
+
+        Args:
+            last_event_id: ID of the last event the client received.
+
+        Returns:
+            EventListener with the events to replay.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            replay, resync = self._replay_after(last_event_id)
+            listener = EventListener(loop, replay, resync)
+            self._listeners.add(listener)
+        return listener
+
+    def close(self, listener: EventListener) -> None:
+        """Unregister a listener.
+
+        Args:
+            listener: Listener returned by :meth:`open`.
+        """
+        with self._lock:
+            self._listeners.discard(listener)
+
+    def _replay_after(
+        self, last_event_id: Optional[str]
+    ) -> Tuple[List[EventItem], bool]:
+        """Find buffered events after an ID (lock held).
+
+        Args:
+            last_event_id: ``<epoch>-<sequence>`` or None.
+
+        Returns:
+            Tuple (events to replay, resync needed).
+        """
+        if not last_event_id:
+            return [], False
+        epoch, _, raw = last_event_id.partition("-")
+        try:
+            sequence = int(raw)
+        except ValueError:
+            return [], True
+        oldest = self._buffer[0][0] if self._buffer else self._sequence + 1
+        if (
+            epoch != self._epoch
+            or sequence > self._sequence
+            or sequence <= self._floor
+            or sequence + 1 < oldest
+        ):
+            return [], True
+        return [item for seq, item in self._buffer if seq > sequence], False
+
+
+# Global stream fed by the shared event bus
+lifecycle_events = LifecycleEventStream(
+    max_events=settings.event_replay_size
+)
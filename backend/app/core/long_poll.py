@@ -0,0 +1,197 @@
+"""Long-poll waits on resource revisions.
+
+Tooling that waits for a container to reach ``running`` or ``exited``
+used to poll list endpoints in tight loops. With
+``?wait_for_revision=<token>&timeout=30`` (the ``X-Revision`` token of
+the previous response) the request is parked on an ``asyncio.Condition``
+per resource until the resource's revision passes the token's, then
+answered as usual.
+
+Revision counters are kept per worker process, so tokens carry the
+process epoch. A token from another worker or from before a restart
+(or one this process never issued) cannot be compared: the request is
+answered at once with ``X-Revision-Resync: true`` and a token of this
+worker instead of pretending something changed. The same signal is
+sent when all revisions are invalidated (events resync) while parked.
+
+A parked request holds no thread and costs nothing until its resource
+changes: revision watchers run on whichever thread bumped the revision
+and wake the loop with ``call_soon_threadsafe``.
+"""
+
+import asyncio
+from typing import Dict, Optional, Set
+
+from fastapi import Request, Response
+
+from app.core.activity import request_activity
+from app.core.events import event_bus
+from app.core.revisions import RevisionTracker, revisions
+
+# Outcomes of RevisionWaiter.wait
+CHANGED = "changed"
+TIMEOUT = "timeout"
+RESYNC = "resync"
+
+
+class RevisionWaiter:
+    """Parks coroutines until a resource revision moves.
+
+    Example:
+        >>> waiter = RevisionWaiter(revisions)
+        >>> await waiter.wait("containers", after=revisions.get("containers"),
+        ...                   timeout=30)
+        'changed'
+    """
+
+    def __init__(self, tracker: RevisionTracker) -> None:
+        """Watch a revision tracker.
+
+        Args:
+            tracker: Revision tracker to wait on.
+        """
+        self.tracker = tracker
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._conditions: Dict[str, asyncio.Condition] = {}
+        self._notifying: Set[asyncio.Task] = set()
+        tracker.watch(self._changed)
+
+    async def wait(self, resource: str, after: int, timeout: float) -> str:
+        """Wait until a resource's revision is greater than ``after``.
+
+        Args:
+            resource: Resource name.
+            after: Revision the caller already has.
+            timeout: Seconds to wait at most.
+
+        Returns:
+            str: ``CHANGED`` once the revision passed ``after``,
+            ``TIMEOUT`` without change, or ``RESYNC`` if ``after`` was
+            never reached or all revisions were invalidated meanwhile.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Conditions are bound to the loop they were created on
+            self._loop = loop
+            self._conditions = {}
+        generation = self.tracker.generation
+
+        def outcome() -> Optional[str]:
+            if self.tracker.generation != generation:
+                return RESYNC
+            revision = self.tracker.get(resource)
+            if revision < after:
+                return RESYNC
+            return CHANGED if revision > after else None
+
+        result = outcome()
+        if result is not None:
+            return result
+        condition = self._conditions.setdefault(resource, asyncio.Condition())
+        try:
+            async with condition:
+                await asyncio.wait_for(
+                    condition.wait_for(lambda: outcome() is not None),
+                    timeout,
+                )
+        except asyncio.TimeoutError:
+            return TIMEOUT
+        return outcome() or CHANGED
+
+    def _changed(self, resource: Optional[str]) -> None:
+        """Wake waiters of a resource from any thread.
+
+        Args:
+            resource: Changed resource, or None for all.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._wake, resource)
+        except RuntimeError:
+            # Event loop closed meanwhile
+            pass
+
+    def _wake(self, resource: Optional[str]) -> None:
+        """Notify the matching conditions (on the loop thread).
+
+        Args:
+            resource: Changed resource, or None for all.
+        """
+        if resource is None:
+            conditions = list(self._conditions.values())
+        else:
+            conditions = [self._conditions.get(resource)]
+        for condition in conditions:
+            if condition is not None:
+                task = asyncio.ensure_future(self._notify_all(condition))
+                self._notifying.add(task)
+                task.add_done_callback(self._notifying.discard)
+
+    @staticmethod
+    async def _notify_all(condition: asyncio.Condition) -> None:
+        """Wake every waiter of a condition.
+
+        Args:
+            condition: Condition to notify.
+        """
+        async with condition:
+            condition.notify_all()
+
+
+# Global waiter on the shared revisions
+revision_waiter = RevisionWaiter(revisions)
+
+
+async def wait_for_change(
+    request: Request,
+    resource: str,
+    token: Optional[str],
+    timeout: float,
+) -> bool:
+    """Park a request until a resource's revision passes a token's.
+
+    Returns at once when no token is given or the events stream is down
+    (revisions could miss changes). The parked time does not count as
+    foreground activity for background jobs.
+
+    Args:
+        request: Incoming request.
+        resource: Resource name.
+        token: ``wait_for_revision`` query value (``<epoch>.<revision>``).
+        timeout: Seconds to wait at most.
+
+    Returns:
+        bool: True if the client must resync: the token is not from
+        this process, or all revisions were invalidated while parked.
+    """
+    if token is None or not event_bus.connected:
+        return False
+    after = revisions.parse_token(token)
+    if after is None:
+        return True
+    tracked = getattr(request.state, "activity_tracked", False)
+    if tracked:
+        request_activity.end()
+    try:
+        result = await revision_waiter.wait(resource, after, timeout)
+    finally:
+        if tracked:
+            request_activity.begin()
+    return result == RESYNC
+
+
+def set_revision_headers(
+    response: Response, resource: str, resync: bool = False
+) -> None:
+    """Send the revision token to pass back as ``wait_for_revision``.
+
+    Args:
+        response: Outgoing response.
+        resource: Resource name.
+        resync: Whether to tell the client its token was not usable.
+    """
+    response.headers["X-Revision"] = revisions.token(resource)
+    if resync:
+        response.headers["X-Revision-Resync"] = "true"
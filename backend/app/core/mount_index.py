@@ -0,0 +1,226 @@
+"""Bidirectional volume <-> container mount index.
+
+Answers "which containers use this volume" and "which volumes does this
+container mount" in O(1). The index is built once from container
+listings and kept current from container create/destroy and volume
+create/destroy events, so no request ever walks every container's
+mounts.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from docker.client import DockerClient
+
+
+class MountIndex:
+    """Index of named-volume mounts per container and per volume.
+
+    Only ``volume`` mounts are indexed; bind mounts and tmpfs are not
+    Docker volumes. Until the first build completes ``ready`` is False
+    and callers should fall back to querying the daemon.
+
+    Example:
+        >>> index = MountIndex()
+        >>> index.rebuild(docker_client.client)
+        >>> index.consumers("postgres_data")
+        [{'container_id': '3f4e...', 'container_name': 'local-postgres', ...}]
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._lock = threading.RLock()
+        self._client: Optional[DockerClient] = None
+        self._volumes: Set[str] = set()
+        self._names: Dict[str, str] = {}
+        self._ids: Dict[str, str] = {}
+        self._container_mounts: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._volume_consumers: Dict[str, Set[str]] = {}
+        self.ready = False
+
+    def rebuild(self, client: DockerClient) -> None:
+        """Rebuild the index from the daemon.
+
+        Uses the container summary listing, which already carries each
+        container's mounts, so the build costs two daemon calls.
+
+        Args:
+            client: Docker client.
+        """
+        volumes = {v.name for v in client.volumes.list()}
+        containers = client.api.containers(all=True)
+
+        with self._lock:
+            self._client = client
+            self._volumes = volumes
+            self._names.clear()
+            self._ids.clear()
+            self._container_mounts.clear()
+            self._volume_consumers.clear()
+            for container in containers:
+                names = container.get("Names") or []
+                name = names[0].lstrip("/") if names else container["Id"][:12]
+                self._add_container(
+                    container["Id"], name, container.get("Mounts") or []
+                )
+            self.ready = True
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Apply a Docker event to the index.
+
+        Args:
+            event: Decoded Docker event.
+        """
+        event_type = event.get("Type")
+        action = event.get("Action", "")
+        actor = event.get("Actor") or {}
+        actor_id = actor.get("ID", "")
+
+        if event_type == "container" and action == "create":
+            # Inspect outside the lock so readers never wait on the daemon
+            self._inspect_and_add(actor_id)
+            return
+
+        with self._lock:
+            if event_type == "volume":
+                if action == "create":
+                    self._volumes.add(actor_id)
+                elif action == "destroy":
+                    self._volumes.discard(actor_id)
+                    self._volume_consumers.pop(actor_id, None)
+            elif event_type == "container":
+                if action == "destroy":
+                    self._remove_container(actor_id)
+                elif action == "rename":
+                    new_name = (actor.get("Attributes") or {}).get("name")
+                    if new_name and actor_id in self._names:
+                        self._ids.pop(self._names[actor_id], None)
+                        self._names[actor_id] = new_name
+                        self._ids[new_name] = actor_id
+
+    def consumers(self, volume: str) -> Optional[List[Dict[str, Any]]]:
+        """Get containers mounting a volume.
+
+        Args:
+            volume: Volume name.
+
+        Returns:
+            List of mount dictionaries, or None if the volume is unknown.
+        """
+        with self._lock:
+            if volume not in self._volumes:
+                return None
+            return [
+                self._container_mounts[cid][volume]
+                for cid in sorted(self._volume_consumers.get(volume, ()))
+            ]
+
+    def volumes_for(self, container: str) -> Optional[List[Dict[str, Any]]]:
+        """Get volumes mounted by a container.
+
+        Args:
+            container: Container name, full ID or ID prefix.
+
+        Returns:
+            List of mount dictionaries, or None if the container is
+            unknown.
+        """
+        with self._lock:
+            container_id = self._resolve(container)
+            if container_id is None:
+                return None
+            return list(self._container_mounts[container_id].values())
+
+    def unused_volumes(self) -> List[str]:
+        """Get volumes not mounted by any container.
+
+        Returns:
+            Sorted volume names.
+        """
+        with self._lock:
+            return sorted(
+                v for v in self._volumes if not self._volume_consumers.get(v)
+            )
+
+    def _resolve(self, container: str) -> Optional[str]:
+        """Resolve a container name or ID to its full ID.
+
+        Args:
+            container: Container name, full ID or ID prefix.
+
+        Returns:
+            Full container ID, or None if unknown.
+        """
+        if container in self._container_mounts:
+            return container
+        if container in self._ids:
+            return self._ids[container]
+        matches = [
+            c for c in self._container_mounts if c.startswith(container)
+        ]
+        return matches[0] if len(matches) == 1 else None
+
+    def _inspect_and_add(self, container_id: str) -> None:
+        """Inspect a newly created container and index its mounts.
+
+        Args:
+            container_id: Full container ID.
+        """
+        if self._client is None:
+            return
+        try:
+            attrs = self._client.api.inspect_container(container_id)
+        except Exception:
+            return
+        name = attrs.get("Name", "").lstrip("/")
+        with self._lock:
+            self._add_container(attrs["Id"], name, attrs.get("Mounts") or [])
+
+    def _add_container(
+        self, container_id: str, name: str, mounts: List[Dict[str, Any]]
+    ) -> None:
+        """Index a container's volume mounts.
+
+        Args:
+            container_id: Full container ID.
+            name: Container name.
+            mounts: Mount entries from inspect or listing data.
+        """
+        self._remove_container(container_id)
+        self._names[container_id] = name
+        self._ids[name] = container_id
+
+        volume_mounts: Dict[str, Dict[str, Any]] = {}
+        for mount in mounts:
+            if mount.get("Type") != "volume" or not mount.get("Name"):
+                continue
+            volume = mount["Name"]
+            volume_mounts[volume] = {
+                "volume": volume,
+                "container_id": container_id[:12],
+                "container_name": name,
+                "destination": mount.get("Destination", ""),
+                "read_only": not mount.get("RW", True),
+            }
+            self._volumes.add(volume)
+            self._volume_consumers.setdefault(volume, set()).add(container_id)
+
+        self._container_mounts[container_id] = volume_mounts
+
+    def _remove_container(self, container_id: str) -> None:
+        """Drop a container from the index.
+
+        Args:
+            container_id: Full container ID.
+        """
+        for volume in self._container_mounts.pop(container_id, {}):
+            consumers = self._volume_consumers.get(volume)
+            if consumers is not None:
+                consumers.discard(container_id)
+        name = self._names.pop(container_id, None)
+        if name is not None and self._ids.get(name) == container_id:
+            del self._ids[name]
+
+
+# Global mount index maintained from the shared event bus
+mount_index = MountIndex()
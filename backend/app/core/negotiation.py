@@ -0,0 +1,238 @@
+"""Content negotiation for bulk endpoints.
+
+Bulk payloads (listings, logs, history) are repetitive JSON. Clients
+may ask for MessagePack with ``Accept: application/msgpack`` and for
+compression with ``Accept-Encoding: br`` or ``gzip``. Bodies under
+``COMPRESSION_MIN_BYTES`` are sent as is, and compressed bodies are
+cached by content digest, so an unchanged snapshot is not recompressed
+on every request. Streaming responses never go through here.
+
+``msgpack`` and ``brotli`` are optional: without them the endpoints
+fall back to JSON and gzip.
+"""
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.core.config import settings
+from app.core.fast_json import dumps
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is in requirements.txt
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is in requirements.txt
+    brotli = None
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+JSON_MEDIA_TYPE = "application/json"
+
+
+def parse_header_values(header: str) -> Dict[str, float]:
+    """Parse an Accept-style header into values and q-weights.
+
+    Args:
+        header: Raw header value, e.g. ``"br;q=1.0, gzip;q=0.8"``.
+
+    Returns:
+        Mapping of lower-cased value to its quality (1.0 by default).
+    """
+    values = {}
+    for part in header.split(","):
+        value, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, raw = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(raw)
+                except ValueError:
+                    quality = 0.0
+        if value:
+            values[value.strip().lower()] = quality
+    return values
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the best supported content coding.
+
+    Args:
+        accept_encoding: Accept-Encoding header value.
+
+    Returns:
+        ``"br"``, ``"gzip"`` or None for identity.
+    """
+    offered = parse_header_values(accept_encoding)
+    candidates = [("br", 2)] if brotli is not None else []
+    candidates.append(("gzip", 1))
+
+    best: Optional[Tuple[float, int, str]] = None
+    for encoding, preference in candidates:
+        quality = offered.get(encoding, offered.get("*", 0.0))
+        if quality > 0 and (best is None or (quality, preference) > best[:2]):
+            best = (quality, preference, encoding)
+    return best[2] if best else None
+
+
+def wants_msgpack(accept: str) -> bool:
+    """Check whether the client prefers MessagePack over JSON.
+
+    Args:
+        accept: Accept header value.
+
+    Returns:
+        bool: True if MessagePack is accepted with a higher weight
+        than JSON and msgpack is installed.
+    """
+    if msgpack is None:
+        return False
+    offered = parse_header_values(accept)
+    packed = max(offered.get(t, 0.0) for t in MSGPACK_MEDIA_TYPES)
+    return packed > 0 and packed >= offered.get(JSON_MEDIA_TYPE, 0.0)
+
+
+class CompressedPayloadCache:
+    """LRU cache of compressed bodies keyed by content digest.
+
+    Example:
+        >>> cache = CompressedPayloadCache(max_entries=64)
+        >>> cache.compress(body, "gzip")  # compresses
+        >>> cache.compress(body, "gzip")  # reused
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Compressed bodies kept.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[bytes, str], bytes]" = OrderedDict()
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Compress a body, reusing a previous result for equal content.
+
+        Args:
+            body: Uncompressed body.
+            encoding: ``"br"`` or ``"gzip"``.
+
+        Returns:
+            bytes: Compressed body.
+        """
+        key = (hashlib.blake2b(body, digest_size=16).digest(), encoding)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        if encoding == "br":
+            compressed = brotli.compress(body, quality=5)
+        else:
+            compressed = gzip.compress(body, compresslevel=6)
+
+        with self._lock:
+            self._entries[key] = compressed
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compressed
+
+
+# Shared across bulk endpoints
+payload_cache = CompressedPayloadCache()
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """Check whether the client already holds this entity.
+
+    Uses weak comparison, so tags match regardless of format/coding.
+
+    Args:
+        request: Incoming request.
+        etag: Current entity tag.
+
+    Returns:
+        bool: True if ``If-None-Match`` lists the tag (or ``*``).
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == current for tag in header.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response.
+
+    Args:
+        etag: Current entity tag.
+
+    Returns:
+        Response: 304 Not Modified carrying the tag.
+    """
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Vary": "Accept, Accept-Encoding"},
+    )
+
+
+def negotiated_response(
+    request: Request,
+    content: Any,
+    status_code: int = 200,
+    etag: Optional[str] = None,
+) -> Response:
+    """Render content in the format and coding the client accepts.
+
+    Args:
+        request: Incoming request (Accept and Accept-Encoding).
+        content: JSON-compatible data.
+        status_code: HTTP status code.
+        etag: Entity tag of the content; answered with 304 when the
+            client already holds it.
+
+    Returns:
+        Response with JSON or MessagePack body, compressed when large
+        enough and accepted.
+    """
+    if etag is not None and if_none_match(request, etag):
+        return not_modified(etag)
+
+    if wants_msgpack(request.headers.get("accept", "")):
+        body = msgpack.packb(content, use_bin_type=True)
+        media_type = MSGPACK_MEDIA_TYPES[0]
+    else:
+        body = dumps(content)
+        media_type = JSON_MEDIA_TYPE
+
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if etag is not None:
+        headers["ETag"] = etag
+    encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+    if encoding is not None and len(body) >= settings.compression_min_bytes:
+        body = payload_cache.compress(body, encoding)
+        headers["Content-Encoding"] = encoding
+
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
@@ -0,0 +1,215 @@
+"""Monotonic revision counters for polled resources.
+
+Each resource (containers, volumes, alerts) carries a revision that is
+bumped only when its state changes: from Docker events on the shared
+bus (containers through the container change log), when background
+measurements land, or when a recomputed state differs from the last one
+observed. Routes turn the revision into an
+``ETag`` and answer ``If-None-Match`` with 304 without calling Docker,
+and watchers (long-poll waiters) are told about every change.
+"""
+
+import threading
+import uuid
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+# Called with the changed resource, or None when all may have changed
+RevisionWatcher = Callable[[Optional[str]], None]
+
+
+class RevisionTracker:
+    """Per-resource revision counters.
+
+    Example:
+        >>> revisions = RevisionTracker()
+        >>> revisions.bump("containers")
+        1
+        >>> revisions.etag("containers", "all")
+        'W/"containers-3f9a1c2e.0.1-all"'
+    """
+
+    def __init__(self) -> None:
+        """Initialize all revisions at zero.
+
+        ETags also carry a random per-process epoch, so tags issued by
+        another worker or before a restart never match by accident.
+        """
+        self._lock = threading.Lock()
+        self._epoch = uuid.uuid4().hex[:8]
+        self._generation = 0
+        self._revisions: Dict[str, int] = {}
+        self._states: Dict[str, Hashable] = {}
+        self._watchers: List[RevisionWatcher] = []
+
+    @property
+    def generation(self) -> int:
+        """Get the number of :meth:`bump_all` calls.
+
+        Returns:
+            int: Generation included in ETags.
+        """
+        return self._generation
+
+    def watch(self, watcher: RevisionWatcher) -> Callable[[], None]:
+        """Register a callable run (on the changing thread) after changes.
+
+        Args:
+            watcher: Callable receiving the resource name, or None after
+                :meth:`bump_all`.
+
+        Returns:
+            Callable that removes the watcher.
+        """
+        with self._lock:
+            self._watchers.append(watcher)
+
+        def unwatch() -> None:
+            with self._lock:
+                if watcher in self._watchers:
+                    self._watchers.remove(watcher)
+
+        return unwatch
+
+    def get(self, resource: str) -> int:
+        """Get the current revision of a resource.
+
+        Args:
+            resource: Resource name.
+
+        Returns:
+            int: Revision (0 until the first change).
+        """
+        with self._lock:
+            return self._revisions.get(resource, 0)
+
+    def bump(self, resource: str) -> int:
+        """Record a change of a resource.
+
+        Args:
+            resource: Resource name.
+
+        Returns:
+            int: The new revision.
+        """
+        with self._lock:
+            revision = self._revisions.get(resource, 0) + 1
+            self._revisions[resource] = revision
+        self._notify(resource)
+        return revision
+
+    def bump_all(self, *_: Any) -> None:
+        """Record a change of every resource (e.g. after missed events).
+
+        Accepts and ignores arguments so it can be used as a resync hook.
+        """
+        with self._lock:
+            self._generation += 1
+            self._states.clear()
+        self._notify(None)
+
+    def observe(self, resource: str, state: Hashable) -> int:
+        """Bump a resource only if its state differs from the last seen.
+
+        Args:
+            resource: Resource name.
+            state: Hashable summary of the resource's current state.
+
+        Returns:
+            int: The (possibly new) revision.
+        """
+        with self._lock:
+            revision = self._revisions.get(resource, 0)
+            changed = self._states.get(resource) != state
+            if changed:
+                revision += 1
+                self._revisions[resource] = revision
+                self._states[resource] = state
+        if changed:
+            self._notify(resource)
+        return revision
+
+    def etag(self, resource: str, variant: Optional[str] = None) -> str:
+        """Build the weak ETag of a resource's current revision.
+
+        Args:
+            resource: Resource name.
+            variant: Query variant sharing the revision (e.g. ``all``).
+
+        Returns:
+            str: Weak entity tag.
+        """
+        suffix = f"-{variant}" if variant else ""
+        with self._lock:
+            revision = self._revisions.get(resource, 0)
+            generation = self._generation
+        tag = f"{resource}-{self._epoch}.{generation}.{revision}{suffix}"
+        return f'W/"{tag}"'
+
+    def token(self, resource: str) -> str:
+        """Get the revision token of a resource.
+
+        Args:
+            resource: Resource name.
+
+        Returns:
+            str: Opaque ``<epoch>.<revision>`` token.
+        """
+        return f"{self._epoch}.{self.get(resource)}"
+
+    def parse_token(self, token: str) -> Optional[int]:
+        """Get the revision of a token issued by this tracker.
+
+        Args:
+            token: Token returned by :meth:`token`.
+
+        Returns:
+            Revision, or None if the token is malformed or was issued
+            by another process (other worker, before a restart).
+        """
+        epoch, _, raw = token.partition(".")
+        if epoch != self._epoch:
+            return None
+        try:
+            return int(raw)
+        except ValueError:
+            return None
+
+    @property
+    def epoch(self) -> str:
+        """Get the random per-process epoch.
+
+        Returns:
+            str: Epoch included in tags and revision tokens.
+        """
+        return self._epoch
+
+    def _notify(self, resource: Optional[str]) -> None:
+        """Run the watchers after a change.
+
+        Args:
+            resource: Changed resource, or None for all.
+        """
+        with self._lock:
+            watchers = list(self._watchers)
+        for watcher in watchers:
+            watcher(resource)
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Bump the volumes revision on events that change volumes.
+
+        Container revisions are owned by the container change log.
+
+        Args:
+            event: Decoded Docker event.
+        """
+        event_type = event.get("Type")
+        action = event.get("Action", "")
+        if event_type == "volume" or (
+            event_type == "container" and action in ("create", "destroy")
+        ):
+            # Container create/destroy changes volume reference counts
+            self.bump("volumes")
+
+
+# Global revisions fed by the shared event bus
+revisions = RevisionTracker()
@@ -0,0 +1,183 @@
+"""Demand-driven sampling cadence for collectors.
+
+Collectors ask how often a key (``stats:<container>``, ``host``) should
+be sampled instead of using a fixed interval. The answer comes from who
+is watching:
+
+* holds, for as long as a consumer is attached (a WebSocket topic
+  collector, an alert rule), each with the interval it wants;
+* touches, left by HTTP reads (an open stats modal polling its
+  endpoint): the interval starts at the floor and decays towards the
+  ceiling until the read is ``SAMPLING_READ_TTL`` seconds old.
+
+A hold on ``<family>:*`` applies to every key of the family. Keys nobody
+wants get no interval at all, so their sampling pauses. On top of that,
+:class:`AdaptiveCadence` doubles a key's interval while its samples show
+it idle, up to the ceiling, and falls back as soon as it is active.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+
+class DemandTracker:
+    """Tracks who wants samples of which keys, and how often.
+
+    Example:
+        >>> demand = DemandTracker(floor=1.0, ceiling=30.0, read_ttl=60.0)
+        >>> release = demand.hold("stats:*", 5.0)
+        >>> demand.touch("stats:postgres")
+        >>> demand.interval("stats:postgres")
+        1.0
+    """
+
+    def __init__(
+        self, floor: float = 1.0, ceiling: float = 30.0, read_ttl: float = 60.0
+    ) -> None:
+        """Initialize without any demand.
+
+        Args:
+            floor: Shortest interval handed out, in seconds.
+            ceiling: Longest interval handed out, in seconds.
+            read_ttl: Seconds an HTTP read keeps a key sampled.
+        """
+        self.floor = floor
+        self.ceiling = ceiling
+        self.read_ttl = read_ttl
+        self._lock = threading.Lock()
+        self._holds: Dict[str, List[Tuple[object, float]]] = {}
+        self._reads: Dict[str, float] = {}
+
+    def hold(self, key: str, interval: float) -> Callable[[], None]:
+        """Register a consumer attached to a key.
+
+        Args:
+            key: Sampled key, or ``<family>:*`` for a whole family.
+            interval: Seconds between samples the consumer wants.
+
+        Returns:
+            Callable releasing the hold.
+        """
+        entry = (object(), interval)
+        with self._lock:
+            self._holds.setdefault(key, []).append(entry)
+
+        def release() -> None:
+            with self._lock:
+                holds = self._holds.get(key, [])
+                if entry in holds:
+                    holds.remove(entry)
+                if not holds:
+                    self._holds.pop(key, None)
+
+        return release
+
+    def touch(self, key: str) -> None:
+        """Record an HTTP read of a key.
+
+        Args:
+            key: Sampled key.
+        """
+        with self._lock:
+            self._reads[key] = time.monotonic()
+
+    def interval(self, key: str) -> Optional[float]:
+        """Get the interval the current demand asks for.
+
+        Args:
+            key: Sampled key.
+
+        Returns:
+            Seconds between samples within [floor, ceiling], or None if
+            nobody wants the key (sampling pauses).
+        """
+        family = key.partition(":")[0]
+        now = time.monotonic()
+        with self._lock:
+            wanted = [i for _, i in self._holds.get(key, ())]
+            if family != key:
+                wanted += [i for _, i in self._holds.get(f"{family}:*", ())]
+            read_at = self._reads.get(key)
+            if read_at is not None:
+                age = now - read_at
+                if age < self.read_ttl:
+                    decay = age / self.read_ttl
+                    wanted.append(
+                        self.floor + (self.ceiling - self.floor) * decay
+                    )
+                else:
+                    del self._reads[key]
+        if not wanted:
+            return None
+        return min(max(min(wanted), self.floor), self.ceiling)
+
+    def active_keys(self) -> List[str]:
+        """List keys with holds or recent reads.
+
+        Returns:
+            Sorted key names (including ``<family>:*`` holds).
+        """
+        cutoff = time.monotonic() - self.read_ttl
+        with self._lock:
+            keys = set(self._holds)
+            keys.update(k for k, t in self._reads.items() if t > cutoff)
+        return sorted(keys)
+
+
+class AdaptiveCadence:
+    """Backs off the interval of keys whose samples show them idle.
+
+    Example:
+        >>> cadence = AdaptiveCadence(ceiling=30.0)
+        >>> cadence.next("stats:db", base=2.0, idle=True)
+        2.0
+        >>> cadence.next("stats:db", base=2.0, idle=True)
+        4.0
+    """
+
+    def __init__(self, ceiling: float = 30.0) -> None:
+        """Initialize without history.
+
+        Args:
+            ceiling: Longest interval, in seconds.
+        """
+        self.ceiling = ceiling
+        self._intervals: Dict[str, float] = {}
+
+    def next(self, key: str, base: float, idle: bool) -> float:
+        """Get the interval until a key's next sample.
+
+        Args:
+            key: Sampled key.
+            base: Interval from current demand.
+            idle: Whether the latest sample showed no activity.
+
+        Returns:
+            float: ``base`` while active, doubling while idle.
+        """
+        previous = self._intervals.get(key)
+        if idle and previous is not None:
+            interval = min(max(previous * 2, base), self.ceiling)
+        else:
+            interval = base
+        self._intervals[key] = interval
+        return max(interval, base)
+
+    def forget(self, key: str) -> None:
+        """Drop a key's history (e.g. container gone or paused).
+
+        Args:
+            key: Sampled key.
+        """
+        self._intervals.pop(key, None)
+
+
+# Global demand shared by collectors, routes and the WebSocket hub
+demand = DemandTracker(
+    floor=settings.sampling_floor,
+    ceiling=settings.sampling_ceiling,
+    read_ttl=settings.sampling_read_ttl,
+)
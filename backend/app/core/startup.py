@@ -0,0 +1,156 @@
+"""Worker startup: background warm-up and import-time budget.
+
+Startup only wires objects together; connecting to Docker, reading the
+compose files and loading persisted caches happen in :func:`warm_up`,
+concurrently and in the background, so the worker starts listening
+right away and the first requests find warm caches.
+
+The module can also be run to profile ``import app.main`` with
+``python -X importtime`` and fail when it exceeds a budget::
+
+    python -m app.core.startup --budget-ms 1500
+"""
+
+import argparse
+import logging
+import re
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# "import time: <self us> | <cumulative us> | <indent><module>"
+_IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)"
+)
+
+
+def warm_up(
+    tasks: Dict[str, Callable[[], object]], max_workers: int = 4
+) -> threading.Thread:
+    """Run warm-up tasks concurrently in the background.
+
+    Failures are logged and never stop the other tasks: everything
+    warmed here is also loaded on demand.
+
+    Args:
+        tasks: Task name -> callable.
+        max_workers: Tasks run in parallel.
+
+    Returns:
+        threading.Thread: The (daemon) thread driving the warm-up.
+
+    Example:
+        >>> warm_up({"compose": compose_catalog.refresh})
+    """
+
+    def run_task(name: str, task: Callable[[], object]) -> None:
+        started = time.monotonic()
+        try:
+            task()
+        except Exception as e:
+            logger.warning("Warm-up %s failed: %s", name, e)
+            return
+        logger.info(
+            "Warm-up %s done in %.0f ms",
+            name,
+            (time.monotonic() - started) * 1000,
+        )
+
+    def run() -> None:
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="warm-up"
+        ) as pool:
+            for name, task in tasks.items():
+                pool.submit(run_task, name, task)
+
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int]]:
+    """Parse ``python -X importtime`` output.
+
+    Args:
+        output: Captured stderr of the profiled interpreter.
+
+    Returns:
+        List of (module, self_us, cumulative_us), slowest cumulative
+        first.
+    """
+    rows = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            rows.append(
+                (match.group(4), int(match.group(1)), int(match.group(2)))
+            )
+    return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+def measure_imports(
+    module: str = "app.main", cwd: Optional[str] = None
+) -> List[Tuple[str, int, int]]:
+    """Profile importing a module in a fresh interpreter.
+
+    Args:
+        module: Module to import.
+        cwd: Working directory (the backend root). Defaults to the
+            current directory.
+
+    Returns:
+        Per-module import times as returned by parse_importtime.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    return parse_importtime(result.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print the slowest imports and check the total against a budget.
+
+    Args:
+        argv: Command line arguments.
+
+    Returns:
+        int: Exit code, 1 if the budget is exceeded.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    rows = measure_imports(args.module)
+    total_ms = next(
+        (cumulative / 1000 for name, _, cumulative in rows
+         if name == args.module),
+        0.0,
+    )
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cumulative in rows[: args.top]:
+        print(f"{cumulative / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+    print(f"\nimport {args.module}: {total_ms:.1f} ms")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"Over budget ({args.budget_ms:.0f} ms)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""Throttled background disk-usage scanner for volumes and bind mounts.
+
+``df()`` only reports named volumes and can be slow on large overlay
+setups. This scanner walks volume mountpoints and configured bind-mount
+directories itself, under an IO budget, and caches each directory's own
+size keyed by its mtime so that only changed directories are listed
+again on the next pass. Requests are always served from the cache.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from docker.client import DockerClient
+
+from app.core.collectors import Collector
+from app.core.config import settings
+
+# Share of one core scan passes may use on average
+SCAN_CPU_BUDGET = 0.1
+
+# Share of wall time scan passes may keep an IO worker busy
+SCAN_IO_BUDGET = 0.5
+
+
+class ScanBudget:
+    """Token bucket limiting how many filesystem entries are read.
+
+    Args:
+        rate: Entries per second; 0 disables throttling.
+        stop: Event that interrupts waiting.
+
+    Example:
+        >>> budget = ScanBudget(rate=1000)
+        >>> budget.consume(50)
+    """
+
+    def __init__(
+        self, rate: float, stop: Optional[threading.Event] = None
+    ) -> None:
+        """Initialize a full bucket holding one second of budget."""
+        self.rate = rate
+        self._stop = stop or threading.Event()
+        self._tokens = rate
+        self._updated = time.monotonic()
+
+    def consume(self, amount: int) -> bool:
+        """Take tokens from the bucket, sleeping until enough are available.
+
+        Args:
+            amount: Number of entries about to be read.
+
+        Returns:
+            bool: False if the wait was interrupted by the stop event.
+        """
+        if self.rate <= 0:
+            return True
+
+        now = time.monotonic()
+        self._tokens = min(
+            self.rate, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        self._tokens -= amount
+        if self._tokens >= 0:
+            return True
+        return not self._stop.wait(-self._tokens / self.rate)
+
+
+class VolumeScanner:
+    """Incremental, budgeted directory size scanner.
+
+    The cache maps each directory to ``(mtime_ns, own_bytes, own_files,
+    subdirs)``. A directory whose mtime is unchanged is not listed again;
+    only its subdirectories are stat'ed. Every stat and every listed
+    entry is charged to the IO budget. Because a directory's mtime only
+    moves when entries are added, removed or renamed, files growing in
+    place are picked up on the next full rescan (``full_rescan_every``
+    passes).
+
+    Attributes:
+        bind_paths: Extra host directories to scan alongside volumes.
+        interval: Seconds between scan passes.
+
+    Example:
+        >>> scanner = VolumeScanner(bind_paths=["/srv/ollama"])
+        >>> collectors.register(scanner.collector(lambda: client))
+        >>> scanner.results()
+    """
+
+    def __init__(
+        self,
+        bind_paths: Optional[List[str]] = None,
+        rate: float = 2000.0,
+        interval: float = 300.0,
+        full_rescan_every: int = 12,
+    ) -> None:
+        """Initialize an idle scanner.
+
+        Args:
+            bind_paths: Extra host directories to scan.
+            rate: IO budget in filesystem entries per second.
+            interval: Seconds between scan passes.
+            full_rescan_every: Ignore the mtime cache every N passes.
+        """
+        self.bind_paths = bind_paths or []
+        self.interval = interval
+        self.full_rescan_every = full_rescan_every
+
+        self._stop = threading.Event()
+        self._budget = ScanBudget(rate, self._stop)
+        self._lock = threading.Lock()
+        self._dirs: Dict[str, Tuple[int, int, int, List[str]]] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._passes = 0
+        self._collector: Optional[Collector] = None
+
+    def results(self) -> List[Dict[str, Any]]:
+        """Get the last scanned size of every target.
+
+        Returns:
+            List of dictionaries with name, kind, path, size_bytes,
+            file_count, last_scanned and scan_seconds, largest first.
+        """
+        with self._lock:
+            results = [dict(r) for r in self._results.values()]
+        return sorted(results, key=lambda r: r["size_bytes"], reverse=True)
+
+    def trigger(self) -> None:
+        """Request a scan pass without waiting for the interval."""
+        if self._collector is not None:
+            self._collector.trigger()
+
+    def collector(
+        self, client_factory: Callable[[], DockerClient]
+    ) -> Collector:
+        """Declare the periodic scan for the collector scheduler.
+
+        Passes run on the IO executor, apart from the shared pool, and
+        a long pass pushes the next one back to keep its IO budget.
+
+        Args:
+            client_factory: Callable returning the Docker client.
+
+        Returns:
+            Collector scanning every interval.
+        """
+        self._stop.clear()
+        self._collector = Collector(
+            "volume_scan",
+            lambda: self.scan(self._targets(client_factory())),
+            interval=self.interval,
+            jitter=self.interval * 0.1,
+            timeout=self.interval,
+            executor="io",
+            cpu_budget=SCAN_CPU_BUDGET,
+            io_budget=SCAN_IO_BUDGET,
+        )
+        return self._collector
+
+    def stop(self) -> None:
+        """Interrupt a scan pass in progress (e.g. on shutdown)."""
+        self._stop.set()
+
+    def scan(self, targets: List[Tuple[str, str, str]]) -> None:
+        """Run one scan pass over the given targets.
+
+        A pass interrupted by ``stop`` keeps the previous result of the
+        target it was measuring instead of storing a partial size.
+
+        Args:
+            targets: Tuples of (name, kind, path).
+        """
+        full = self._passes % self.full_rescan_every == 0
+        self._passes += 1
+        seen = set()
+        visited: set = set()
+
+        for name, kind, path in targets:
+            if self._stop.is_set():
+                return
+            if not os.path.isdir(path):
+                continue
+            started = time.monotonic()
+            scanned = self._scan_dir(path, full, visited)
+            if scanned is None:
+                return
+            size, files = scanned
+            seen.add(name)
+            with self._lock:
+                self._results[name] = {
+                    "name": name,
+                    "kind": kind,
+                    "path": path,
+                    "size_bytes": size,
+                    "file_count": files,
+                    "last_scanned": datetime.now(timezone.utc).isoformat(),
+                    "scan_seconds": round(time.monotonic() - started, 3),
+                }
+
+        with self._lock:
+            for name in list(self._results):
+                if name not in seen:
+                    del self._results[name]
+
+        # Forget directories that no longer belong to any target
+        for path in list(self._dirs):
+            if path not in visited:
+                del self._dirs[path]
+
+    def _targets(self, client: DockerClient) -> List[Tuple[str, str, str]]:
+        """Collect volume mountpoints and bind paths to scan.
+
+        Args:
+            client: Docker client.
+
+        Returns:
+            Tuples of (name, kind, path).
+        """
+        targets = [
+            (v.name, "volume", v.attrs.get("Mountpoint", ""))
+            for v in client.volumes.list()
+        ]
+        for path in self.bind_paths:
+            resolved = str(Path(path).expanduser())
+            targets.append((resolved, "bind", resolved))
+        return targets
+
+    def _scan_dir(
+        self, root: str, full: bool, visited: set
+    ) -> Optional[Tuple[int, int]]:
+        """Compute the size of a directory tree from the cache.
+
+        Args:
+            root: Directory to measure.
+            full: Re-list every directory regardless of mtime.
+            visited: Set collecting every directory reached.
+
+        Returns:
+            Tuple of (total bytes, total files), or None if the scan was
+            stopped before the whole tree was measured.
+        """
+        total_bytes = total_files = 0
+        stack = [root]
+
+        while stack:
+            path = stack.pop()
+            visited.add(path)
+            if not self._budget.consume(1) or self._stop.is_set():
+                return None
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                self._dirs.pop(path, None)
+                continue
+
+            cached = self._dirs.get(path)
+            if full or cached is None or cached[0] != mtime:
+                cached = self._list_dir(path, mtime)
+                if cached is None:
+                    if self._stop.is_set():
+                        return None
+                    continue
+                self._dirs[path] = cached
+
+            total_bytes += cached[1]
+            total_files += cached[2]
+            stack.extend(cached[3])
+
+        return total_bytes, total_files
+
+    def _list_dir(
+        self, path: str, mtime: int
+    ) -> Optional[Tuple[int, int, int, List[str]]]:
+        """List one directory, charging its entries to the IO budget.
+
+        Args:
+            path: Directory path.
+            mtime: Directory mtime at the time of listing.
+
+        Returns:
+            Cache entry, or None if the directory cannot be read.
+        """
+        own_bytes = own_files = 0
+        subdirs: List[str] = []
+        try:
+            with os.scandir(path) as entries:
+                entries = list(entries)
+        except OSError:
+            return None
+
+        if not self._budget.consume(len(entries)):
+            return None
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                else:
+                    own_bytes += entry.stat(follow_symlinks=False).st_size
+                    own_files += 1
+            except OSError:
+                continue
+
+        return mtime, own_bytes, own_files, subdirs
+
+
+# Global scanner for Docker volumes and configured bind mounts
+volume_scanner = VolumeScanner(
+    bind_paths=settings.scan_bind_paths,
+    rate=settings.volume_scan_rate,
+    interval=settings.volume_scan_interval,
+)
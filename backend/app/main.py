@@ -1,21 +1,123 @@
 """MyLocalPlace Backend API - Main application entry point.
 
 This module initializes and configures the FastAPI application,
-including middleware, CORS, and router registration.
+including middleware, CORS, router registration, and the lifecycle of
+background services such as the shared Docker events subscription.
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.exception_handlers import http_exception_handler
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from app.core import docker_client
+from app.core.docker_client import DockerUnavailableError, unavailable_cause
+from app.core.activity import request_activity
+from app.core.build_fingerprint import build_fingerprinter
+from app.core.cleanup_scheduler import cleanup_scheduler
+from app.core.collectors import collectors
+from app.core.compose_catalog import compose_catalog
+from app.core.container_changes import container_changes
+from app.core.container_sizes import container_sizes
+from app.core.events import event_bus
+from app.core.health import daemon_health
+from app.core.host_metrics import host_metrics
+from app.core.image_usage import image_usage
+from app.core.lifecycle_events import EVENT_TYPES, lifecycle_events
+from app.core.mount_index import mount_index
+from app.core.revisions import revisions
+from app.core.startup import warm_up
+from app.core.volume_scanner import volume_scanner
+from app.repositories.cleanup_repository import CleanupRepository
+from app.repositories.image_repository import ImageRepository
 
 from app.routers import (
     alerts_router,
+    builds_router,
     cleanup_router,
+    compose_router,
     containers_router,
+    debug_router,
+    events_router,
     health_router,
+    images_router,
+    metrics_router,
+    stream_router,
     system_router,
     volumes_router,
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background services on startup and stop them on shutdown.
+
+    Args:
+        app: FastAPI application instance.
+    """
+    subscriptions = [
+        event_bus.subscribe(
+            mount_index.handle_event, types={"container", "volume"}
+        ),
+        event_bus.add_resync_hook(mount_index.rebuild),
+        event_bus.subscribe(
+            image_usage.handle_event, types={"container", "image"}
+        ),
+        event_bus.subscribe(
+            ImageRepository.handle_event, types={"container", "image"}
+        ),
+        event_bus.subscribe(container_sizes.handle_event, types={"container"}),
+        event_bus.subscribe(
+            revisions.handle_event, types={"container", "volume"}
+        ),
+        event_bus.subscribe(
+            container_changes.handle_event, types={"container"}
+        ),
+        event_bus.subscribe(
+            lifecycle_events.handle_event, types=set(EVENT_TYPES)
+        ),
+        # Events may have been missed while the stream was down
+        event_bus.add_resync_hook(revisions.bump_all),
+        event_bus.add_resync_hook(container_changes.reset),
+        event_bus.add_resync_hook(lifecycle_events.mark_gap),
+    ]
+    collectors.register(
+        daemon_health.collector(
+            lambda: docker_client.client, docker_client.report
+        )
+    )
+    collectors.register(volume_scanner.collector(lambda: docker_client.client))
+    collectors.register(host_metrics.collector())
+    if cleanup_scheduler.policies:
+        collectors.register(
+            cleanup_scheduler.collector(CleanupRepository().run_policy)
+        )
+    collectors.start()
+    event_bus.start(lambda: docker_client.client)
+    container_sizes.start(lambda: docker_client.client)
+    # Connect and fill caches while the worker is already serving
+    warm_up(
+        {
+            "docker": docker_client.get_client,
+            "compose_catalog": compose_catalog.refresh,
+            "image_usage": image_usage.load,
+            "build_fingerprints": build_fingerprinter.load,
+        }
+    )
+
+    yield
+
+    container_sizes.stop()
+    volume_scanner.stop()
+    event_bus.stop()
+    await collectors.stop()
+    for unsubscribe in subscriptions:
+        unsubscribe()
+    image_usage.save()
+
+
 # Create FastAPI application instance
 app = FastAPI(
     title="MyLocalPlace API",
@@ -27,6 +129,7 @@ app = FastAPI(
         "name": "Lucas Biason",
         "url": "https://github.com/LucasBiason/my-local-place",
     },
+    lifespan=lifespan,
 )
 
 # Configure CORS middleware
@@ -41,6 +144,89 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def track_request_activity(request: Request, call_next):
+    """Record in-flight requests so background cleanup can step aside.
+
+    Args:
+        request: Incoming request.
+        call_next: Next handler in the middleware chain.
+
+    Returns:
+        Response from the next handler.
+    """
+    request_activity.begin()
+    # Lets long-poll waits step out of the in-flight count
+    request.state.activity_tracked = True
+    try:
+        return await call_next(request)
+    finally:
+        request_activity.end()
+
+
+def _docker_unavailable_response(error: BaseException) -> JSONResponse:
+    """Build the 503 response returned while Docker is unreachable.
+
+    Args:
+        error: The DockerUnavailableError or transport error.
+
+    Returns:
+        JSONResponse with a Retry-After header.
+    """
+    retry_after = getattr(error, "retry_after", 0.0)
+    detail = str(error)
+    if not isinstance(error, DockerUnavailableError):
+        detail = f"Docker daemon unreachable: {error}"
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": detail},
+        headers={"Retry-After": str(max(int(retry_after + 0.5), 1))},
+    )
+
+
+@app.exception_handler(DockerUnavailableError)
+async def docker_unavailable_handler(
+    request: Request, exc: DockerUnavailableError
+):
+    """Fail fast with 503 while the Docker circuit breaker is open.
+
+    Args:
+        request: Incoming request.
+        exc: Raised DockerUnavailableError.
+
+    Returns:
+        503 JSONResponse.
+    """
+    return _docker_unavailable_response(exc)
+
+
+@app.exception_handler(HTTPException)
+async def docker_outage_http_handler(request: Request, exc: HTTPException):
+    """Turn 500s caused by a Docker outage into 503s.
+
+    Controllers wrap every failure in a 500; when the root cause is an
+    unreachable daemon the client should retry instead. Transport errors
+    also count towards opening the circuit breaker.
+
+    Args:
+        request: Incoming request.
+        exc: Raised HTTPException.
+
+    Returns:
+        503 JSONResponse for Docker outages, the default response
+        otherwise.
+    """
+    cause = None
+    if exc.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR:
+        cause = unavailable_cause(exc)
+    if cause is None:
+        return await http_exception_handler(request, exc)
+    if not isinstance(cause, DockerUnavailableError):
+        docker_client.record_failure(cause)
+    return _docker_unavailable_response(cause)
+
+
 # Register routers
 app.include_router(health_router)
 app.include_router(containers_router)
@@ -48,6 +234,13 @@ app.include_router(system_router)
 app.include_router(alerts_router)
 app.include_router(volumes_router)
 app.include_router(cleanup_router)
+app.include_router(builds_router)
+app.include_router(compose_router)
+app.include_router(images_router)
+app.include_router(metrics_router)
+app.include_router(stream_router)
+app.include_router(events_router)
+app.include_router(debug_router)
 
 
 if __name__ == "__main__":
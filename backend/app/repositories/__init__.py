@@ -1,6 +1,19 @@
 """Repositories module - Data access layer."""
 
+from .build_cache_repository import BuildCacheRepository
+from .build_repository import BuildRepository
+from .cleanup_repository import CleanupRepository
+from .disk_usage_repository import DiskUsageRepository
 from .docker_repository import DockerRepository
+from .image_repository import ImageRepository
 from .volume_repository import VolumeRepository
 
-__all__ = ["DockerRepository", "VolumeRepository"]
+__all__ = [
+    "DockerRepository",
+    "VolumeRepository",
+    "BuildRepository",
+    "DiskUsageRepository",
+    "CleanupRepository",
+    "BuildCacheRepository",
+    "ImageRepository",
+]
@@ -0,0 +1,168 @@
+"""Build cache repository - BuildKit cache reporting and budgeted pruning.
+
+Reports the build cache by record type and age from the shared ``df()``
+snapshot, and prunes with the daemon's ``keep_storage`` semantics so
+BuildKit drops its oldest, least-used records first and keeps the rest
+of the cache warm for the next rebuild.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from app.core import docker_client
+from app.core.config import settings
+from app.repositories.disk_usage_repository import (
+    DiskUsageRepository,
+    parse_timestamp,
+)
+
+# Age buckets (upper bound in days, label), by last use
+AGE_BUCKETS = ((1, "<1d"), (7, "1-7d"), (30, "7-30d"), (None, ">30d"))
+
+
+class BuildCacheRepository:
+    """Repository for the BuildKit build cache.
+
+    Example:
+        >>> repo = BuildCacheRepository()
+        >>> report = repo.get_report()
+        >>> print(report["total_bytes"], report["budget_bytes"])
+    """
+
+    def __init__(self) -> None:
+        """Initialize repository with Docker client and df snapshot."""
+        self.client = docker_client.client
+        self.disk_usage = DiskUsageRepository()
+
+    def get_report(self) -> Dict[str, Any]:
+        """Summarize the build cache by type and age.
+
+        Returns:
+            Dictionary containing:
+                - total_bytes (int): Size of all cache records
+                - reclaimable_bytes (int): Size of records not in use
+                - record_count (int)
+                - by_type (dict): Type -> count and size_bytes
+                - by_age (dict): Age bucket -> count and size_bytes
+                - budget_bytes (int): Configured keep-storage budget
+                - over_budget_bytes (int): Bytes a prune would target
+
+        Example:
+            >>> report = BuildCacheRepository().get_report()
+            >>> print(report["by_type"]["regular"]["size_bytes"])
+        """
+        records = self.disk_usage.get_snapshot().get("BuildCache") or []
+        now = datetime.now(timezone.utc)
+        by_type: Dict[str, Dict[str, int]] = {}
+        by_age = {
+            label: {"count": 0, "size_bytes": 0} for _, label in AGE_BUCKETS
+        }
+        total = reclaimable = 0
+
+        for record in records:
+            size = record.get("Size") or 0
+            total += size
+            if not record.get("InUse"):
+                reclaimable += size
+
+            record_type = record.get("Type") or "unknown"
+            bucket = by_type.setdefault(
+                record_type, {"count": 0, "size_bytes": 0}
+            )
+            bucket["count"] += 1
+            bucket["size_bytes"] += size
+
+            used = parse_timestamp(
+                record.get("LastUsedAt") or record.get("CreatedAt")
+            )
+            age_days = (now - used).total_seconds() / 86400 if used else None
+            bucket = by_age[self._age_bucket(age_days)]
+            bucket["count"] += 1
+            bucket["size_bytes"] += size
+
+        budget = self._budget_bytes()
+        return {
+            "total_bytes": total,
+            "reclaimable_bytes": reclaimable,
+            "record_count": len(records),
+            "by_type": by_type,
+            "by_age": by_age,
+            "budget_bytes": budget,
+            "over_budget_bytes": max(total - budget, 0),
+        }
+
+    def prune_to_budget(
+        self, budget_bytes: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Prune the build cache down to a keep-storage budget.
+
+        BuildKit removes unused records oldest and least-used first
+        until the cache fits ``keep_storage``; nothing is removed when
+        the cache is already within budget.
+
+        Args:
+            budget_bytes: Bytes of cache to keep. Defaults to the
+                ``BUILD_CACHE_BUDGET_GB`` setting.
+
+        Returns:
+            Dictionary with total_bytes_before, caches_deleted,
+            space_freed_bytes, total_bytes_after, budget_bytes and
+            within_budget.
+
+        Raises:
+            RuntimeError: If the prune fails.
+        """
+        if budget_bytes is None:
+            budget_bytes = self._budget_bytes()
+        snapshot = self.disk_usage.get_snapshot(refresh=True)
+        before = sum(
+            r.get("Size") or 0 for r in snapshot.get("BuildCache") or []
+        )
+
+        freed = deleted = 0
+        if before > budget_bytes:
+            try:
+                result = self.client.api.prune_builds(
+                    keep_storage=budget_bytes
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to prune build cache: {e}")
+            freed = result.get("SpaceReclaimed", 0) or 0
+            deleted = len(result.get("CachesDeleted") or [])
+            self.disk_usage.invalidate()
+
+        after = max(before - freed, 0)
+        return {
+            "total_bytes_before": before,
+            "caches_deleted": deleted,
+            "space_freed_bytes": freed,
+            "total_bytes_after": after,
+            "budget_bytes": budget_bytes,
+            "within_budget": after <= budget_bytes,
+        }
+
+    @staticmethod
+    def _budget_bytes() -> int:
+        """Get the configured keep-storage budget.
+
+        Returns:
+            Budget in bytes.
+        """
+        return int(settings.build_cache_budget_gb * 1024**3)
+
+    @staticmethod
+    def _age_bucket(age_days: Optional[float]) -> str:
+        """Map an age to its bucket label.
+
+        Args:
+            age_days: Days since last use, or None if unknown.
+
+        Returns:
+            Bucket label.
+        """
+        if age_days is None:
+            return AGE_BUCKETS[-1][1]
+        for limit, label in AGE_BUCKETS:
+            if limit is None or age_days < limit:
+                return label
+        return AGE_BUCKETS[-1][1]
@@ -0,0 +1,164 @@
+"""Build repository - Data access layer for compose service builds.
+
+Reads build definitions from the compose catalog, fingerprints their
+build contexts and compares them with the fingerprint label stamped on
+the current images, so that unchanged services are never rebuilt.
+"""
+
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from docker.errors import NotFound
+
+from app.core import docker_client
+from app.core.build_fingerprint import FINGERPRINT_LABEL, build_fingerprinter
+from app.core.compose_catalog import compose_catalog
+
+
+class BuildRepository:
+    """Repository for compose build contexts and image fingerprints.
+
+    Example:
+        >>> repo = BuildRepository()
+        >>> stale = [s for s in repo.list_build_status() if s["stale"]]
+    """
+
+    def __init__(self) -> None:
+        """Initialize repository with Docker client and compose catalog."""
+        self.client = docker_client.client
+        self.catalog = compose_catalog
+        self.fingerprinter = build_fingerprinter
+
+    def get_build_config(self, service: str) -> Optional[Dict[str, Any]]:
+        """Get the build definition of a compose service.
+
+        Args:
+            service: Compose service or container name.
+
+        Returns:
+            Dictionary with service, file, context, dockerfile, target,
+            args and image, or None if the service is unknown or has
+            no build section.
+        """
+        entry = self.catalog.get(service)
+        if entry is None or not entry["build"]:
+            return None
+        return self._to_config(entry)
+
+    def compute_fingerprint(self, config: Dict[str, Any]) -> str:
+        """Fingerprint the build context of a service.
+
+        Args:
+            config: Build definition from get_build_config.
+
+        Returns:
+            Hex digest of the build inputs.
+        """
+        return self.fingerprinter.fingerprint(
+            config["context"],
+            dockerfile=config["dockerfile"],
+            target=config["target"],
+            build_args=config["args"],
+        )
+
+    def get_image_fingerprint(self, tag: str) -> Optional[str]:
+        """Get the fingerprint label stamped on an image.
+
+        Args:
+            tag: Image tag or ID.
+
+        Returns:
+            Fingerprint, or None if the image is missing or unlabelled.
+        """
+        try:
+            image = self.client.images.get(tag)
+        except NotFound:
+            return None
+        return (image.labels or {}).get(FINGERPRINT_LABEL)
+
+    def stamp_fingerprint(self, tag: str, fingerprint: str) -> None:
+        """Stamp the fingerprint label on an image built by compose.
+
+        Runs a metadata-only build of ``FROM <tag>`` with a single
+        ``LABEL`` instruction and re-tags the result, so the image
+        compose produced (BuildKit, secrets and all) is reused as is
+        and no build context is sent to the daemon.
+
+        Args:
+            tag: Tag of the image compose just built.
+            fingerprint: Fingerprint of the build context.
+
+        Raises:
+            RuntimeError: If the label cannot be applied.
+        """
+        dockerfile = f"FROM {tag}\nLABEL {FINGERPRINT_LABEL}={fingerprint}\n"
+        try:
+            self.client.images.build(
+                fileobj=BytesIO(dockerfile.encode()),
+                tag=tag,
+                rm=True,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to stamp fingerprint on {tag}: {e}")
+
+    def list_build_status(self) -> List[Dict[str, Any]]:
+        """Compare every buildable service with its current image.
+
+        Returns:
+            List of dictionaries containing:
+                - service (str): Compose service name
+                - context (str): Build context directory
+                - image (str): Image tag compose uses for the service
+                - fingerprint (str): Current build context fingerprint
+                - image_fingerprint (str | None): Label on the image
+                - stale (bool): True if the service needs a rebuild
+
+        Example:
+            >>> repo = BuildRepository()
+            >>> for status in repo.list_build_status():
+            ...     print(status["service"], status["stale"])
+        """
+        statuses = []
+        for entry in self.catalog.list_services():
+            if not entry["build"]:
+                continue
+            config = self._to_config(entry)
+            if not config["context"].is_dir():
+                continue
+
+            fingerprint = self.compute_fingerprint(config)
+            image_fingerprint = self.get_image_fingerprint(config["image"])
+            statuses.append(
+                {
+                    "service": config["service"],
+                    "context": str(config["context"]),
+                    "image": config["image"],
+                    "fingerprint": fingerprint,
+                    "image_fingerprint": image_fingerprint,
+                    "stale": image_fingerprint != fingerprint,
+                }
+            )
+
+        return statuses
+
+    @staticmethod
+    def _to_config(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a catalog entry into a build definition.
+
+        Args:
+            entry: Compose catalog entry with a build section.
+
+        Returns:
+            Build definition used by the fingerprint and build methods.
+        """
+        build = entry["build"]
+        return {
+            "service": entry["name"],
+            "file": entry["file"],
+            "context": Path(build["context"]),
+            "dockerfile": build["dockerfile"],
+            "target": build["target"],
+            "args": build["args"],
+            "image": entry["image"],
+        }
@@ -0,0 +1,663 @@
+"""Cleanup repository - Dry-run planning and exact execution of cleanups.
+
+Plans are computed from the shared ``df()`` snapshot and the mount
+index without touching anything, cached for a few minutes, and can be
+executed later so that exactly the planned objects are removed.
+"""
+
+import time
+import uuid
+from fnmatch import fnmatch
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core import docker_client
+from app.core.cache import TTLCache
+from app.core.config import CleanupPolicy, settings
+from app.core.image_usage import image_usage
+from app.core.mount_index import mount_index
+from app.repositories.disk_usage_repository import (
+    DiskUsageRepository,
+    parse_timestamp,
+)
+
+CATEGORIES = ("containers", "images", "volumes", "build_cache")
+PIN_LABEL = "io.mylocalplace.pin"
+
+# Computed plans, kept long enough to review and execute
+_plans = TTLCache(ttl=300.0)
+
+
+class CleanupRepository:
+    """Repository for cleanup plans.
+
+    Example:
+        >>> repo = CleanupRepository()
+        >>> plan = repo.build_plan()
+        >>> repo.execute_plan(plan["plan_id"], categories=["images"])
+    """
+
+    def __init__(self) -> None:
+        """Initialize repository with Docker client and df snapshot."""
+        self.client = docker_client.client
+        self.disk_usage = DiskUsageRepository()
+
+    def build_plan(self, refresh: bool = False) -> Dict[str, Any]:
+        """Compute what each cleanup category would remove.
+
+        Args:
+            refresh: Take a new ``df()`` snapshot instead of the cached one.
+
+        Returns:
+            Dictionary containing:
+                - plan_id (str): Identifier for execute_plan
+                - created_at (str): ISO timestamp
+                - snapshot_age (float): Age of the df snapshot in seconds
+                - categories (dict): Per category items, count and
+                  reclaimable_bytes
+                - total_reclaimable_bytes (int)
+
+        Example:
+            >>> plan = CleanupRepository().build_plan()
+            >>> print(plan["categories"]["images"]["reclaimable_bytes"])
+        """
+        df = self.disk_usage.get_snapshot(refresh=refresh)
+        items = {
+            "containers": self._plan_containers(df),
+            "images": self._plan_images(df),
+            "volumes": self._plan_volumes(df),
+            "build_cache": self._plan_build_cache(df),
+        }
+        categories = {
+            name: {
+                "items": entries,
+                "count": len(entries),
+                "reclaimable_bytes": sum(e["size_bytes"] for e in entries),
+            }
+            for name, entries in items.items()
+        }
+
+        plan = {
+            "plan_id": uuid.uuid4().hex[:12],
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "snapshot_age": round(self.disk_usage.get_snapshot_age(), 1),
+            "categories": categories,
+            "total_reclaimable_bytes": sum(
+                c["reclaimable_bytes"] for c in categories.values()
+            ),
+        }
+        _plans.set(plan["plan_id"], plan)
+        return plan
+
+    def execute_plan(
+        self, plan_id: str, categories: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Remove exactly the objects listed in a plan.
+
+        Objects that changed since planning (e.g. an image now used by a
+        new container) are reported as failed rather than forced.
+
+        Args:
+            plan_id: Identifier returned by build_plan.
+            categories: Categories to execute. Defaults to all.
+
+        Returns:
+            Dictionary with plan_id, removed (count per category),
+            failed (list of category, id, error) and space_freed_bytes.
+
+        Raises:
+            ValueError: If the plan is unknown or expired, or a category
+                name is invalid.
+        """
+        plan = _plans.get(plan_id)
+        if plan is None:
+            raise ValueError(f"Cleanup plan {plan_id} not found or expired")
+
+        selected = categories or list(CATEGORIES)
+        unknown = [c for c in selected if c not in CATEGORIES]
+        if unknown:
+            raise ValueError(f"Unknown cleanup categories: {unknown}")
+
+        removed = {name: 0 for name in selected}
+        failed: List[Dict[str, str]] = []
+        freed = 0
+
+        for category in selected:
+            entries = plan["categories"][category]["items"]
+            if category == "build_cache":
+                if entries:
+                    count, space = self._remove_build_cache(entries, failed)
+                    removed[category] = count
+                    freed += space
+                continue
+            for entry in entries:
+                try:
+                    self._remove(category, entry)
+                except Exception as e:
+                    failed.append(
+                        {
+                            "category": category,
+                            "id": entry["id"],
+                            "error": str(e),
+                        }
+                    )
+                    continue
+                removed[category] += 1
+                freed += entry["size_bytes"]
+
+        _plans.invalidate(plan_id)
+        self.disk_usage.invalidate()
+        return {
+            "plan_id": plan_id,
+            "removed": removed,
+            "failed": failed,
+            "space_freed_bytes": freed,
+        }
+
+    def evict_images(
+        self, budget_bytes: Optional[int] = None, dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """Evict least-recently-used images until a disk budget is met.
+
+        Only images no container (running or stopped) uses are
+        candidates. Images matching ``IMAGE_PINS`` or labelled
+        ``io.mylocalplace.pin=true`` are never evicted. Images never seen
+        in use are ordered by creation time.
+
+        Args:
+            budget_bytes: Target total image size. Defaults to the
+                ``IMAGE_BUDGET_GB`` setting.
+            dry_run: Only report what would be evicted.
+
+        Returns:
+            Dictionary containing:
+                - evicted (list): id, name, size_bytes, last_used
+                - failed (list): category, id, error
+                - space_freed_bytes (int)
+                - images_bytes (int): Image size before eviction
+                - budget_bytes (int)
+
+        Example:
+            >>> repo = CleanupRepository()
+            >>> result = repo.evict_images(budget_bytes=10 * 1024**3)
+            >>> print([i["name"] for i in result["evicted"]])
+        """
+        if budget_bytes is None:
+            budget_bytes = int(settings.image_budget_gb * 1024**3)
+        df = self.disk_usage.get_snapshot(refresh=not dry_run)
+        images = df.get("Images") or []
+        total = df.get("LayersSize") or sum(i.get("Size", 0) for i in images)
+
+        used = {c.get("ImageID") for c in df.get("Containers") or []}
+        candidates = []
+        for image in images:
+            tags = image.get("RepoTags") or []
+            if image["Id"] in used or self._is_pinned(image, tags):
+                continue
+            last_used = image_usage.last_used(image["Id"], tags)
+            shared = max(image.get("SharedSize") or 0, 0)
+            candidates.append(
+                {
+                    "id": image["Id"],
+                    "name": tags[0] if tags else "<none>",
+                    "tags": tags,
+                    "size_bytes": max((image.get("Size") or 0) - shared, 0),
+                    "last_used": last_used or image.get("Created", 0),
+                }
+            )
+        candidates.sort(key=lambda c: c["last_used"])
+
+        evicted: List[Dict[str, Any]] = []
+        failed: List[Dict[str, str]] = []
+        remaining = total
+        for candidate in candidates:
+            if remaining <= budget_bytes:
+                break
+            if not dry_run:
+                try:
+                    self._remove("images", candidate)
+                except Exception as e:
+                    failed.append(
+                        {
+                            "category": "images",
+                            "id": candidate["id"],
+                            "error": str(e),
+                        }
+                    )
+                    continue
+            remaining -= candidate["size_bytes"]
+            evicted.append(
+                {k: v for k, v in candidate.items() if k != "tags"}
+            )
+
+        if evicted and not dry_run:
+            self.disk_usage.invalidate()
+        return {
+            "evicted": evicted,
+            "failed": failed,
+            "space_freed_bytes": total - remaining,
+            "images_bytes": total,
+            "budget_bytes": budget_bytes,
+        }
+
+    @staticmethod
+    def _is_pinned(image: Dict[str, Any], tags: List[str]) -> bool:
+        """Check whether an image is protected from eviction.
+
+        Args:
+            image: Image entry from the df snapshot.
+            tags: Image repo tags.
+
+        Returns:
+            bool: True if pinned by label or by an IMAGE_PINS glob.
+        """
+        labels = image.get("Labels") or {}
+        if str(labels.get(PIN_LABEL, "")).lower() == "true":
+            return True
+        return any(
+            fnmatch(tag, pattern)
+            for tag in tags
+            for pattern in settings.image_pins
+        )
+
+    def run_policy(
+        self,
+        policy: CleanupPolicy,
+        deadline: float,
+        should_yield: Callable[[], bool],
+    ) -> Dict[str, Any]:
+        """Apply one background cleanup policy.
+
+        Exited containers and unused images are removed one at a time,
+        stopping early at the deadline or when foreground traffic
+        arrives; pinned images are never removed. Dangling images and
+        build cache use the daemon's ``until`` (and ``keep_storage``)
+        prune filters; volume prune has no age filter.
+
+        Args:
+            policy: Cleanup policy to apply.
+            deadline: Monotonic time by which to stop.
+            should_yield: Callable returning True when cleanup should
+                pause for foreground requests.
+
+        Returns:
+            Dictionary with deleted, space_freed_bytes and interrupted.
+
+        Example:
+            >>> repo.run_policy(policy, time.monotonic() + 60, lambda: False)
+            {'deleted': 3, 'space_freed_bytes': 10485760, 'interrupted': False}
+        """
+        if policy.action == "containers":
+            result = self._prune_exited_containers(
+                policy.older_than_hours, deadline, should_yield
+            )
+        elif policy.action == "images" and not policy.dangling_only:
+            result = self._prune_unused_images(
+                policy.older_than_hours, deadline, should_yield
+            )
+        else:
+            filters: Dict[str, Any] = {}
+            if policy.older_than_hours is not None:
+                filters["until"] = f"{policy.older_than_hours:g}h"
+
+            if policy.action == "images":
+                filters["dangling"] = True
+                filters["label!"] = f"{PIN_LABEL}=true"
+                pruned = self.client.images.prune(filters=filters)
+                deleted = len(pruned.get("ImagesDeleted") or [])
+            elif policy.action == "build_cache":
+                keep_gb = policy.keep_storage_gb
+                if keep_gb is None:
+                    keep_gb = settings.build_cache_budget_gb
+                keep = int(keep_gb * 1024**3)
+                pruned = self.client.api.prune_builds(
+                    filters=filters or None, keep_storage=keep
+                )
+                deleted = len(pruned.get("CachesDeleted") or [])
+            else:
+                pruned = self.client.volumes.prune()
+                deleted = len(pruned.get("VolumesDeleted") or [])
+
+            result = {
+                "deleted": deleted,
+                "space_freed_bytes": pruned.get("SpaceReclaimed", 0) or 0,
+                "interrupted": False,
+            }
+
+        self.disk_usage.invalidate()
+        return result
+
+    def _prune_exited_containers(
+        self,
+        older_than_hours: Optional[float],
+        deadline: float,
+        should_yield: Callable[[], bool],
+    ) -> Dict[str, Any]:
+        """Remove containers that exited more than a given time ago.
+
+        Args:
+            older_than_hours: Minimum hours since exit (None for any).
+            deadline: Monotonic time by which to stop.
+            should_yield: Callable returning True to stop early.
+
+        Returns:
+            Dictionary with deleted, space_freed_bytes and interrupted.
+        """
+        cutoff = None
+        if older_than_hours is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(
+                hours=older_than_hours
+            )
+
+        stopped = [
+            c
+            for c in self.disk_usage.get_snapshot().get("Containers") or []
+            if c.get("State") in ("exited", "dead")
+        ]
+        deleted = freed = 0
+        for container in stopped:
+            if time.monotonic() >= deadline or should_yield():
+                return {
+                    "deleted": deleted,
+                    "space_freed_bytes": freed,
+                    "interrupted": True,
+                }
+            if cutoff is not None:
+                state = self.client.api.inspect_container(container["Id"])
+                finished = parse_timestamp(state["State"].get("FinishedAt"))
+                if finished is None or finished > cutoff:
+                    continue
+            self.client.api.remove_container(container["Id"])
+            deleted += 1
+            freed += container.get("SizeRw") or 0
+
+        return {
+            "deleted": deleted,
+            "space_freed_bytes": freed,
+            "interrupted": False,
+        }
+
+    def _prune_unused_images(
+        self,
+        older_than_hours: Optional[float],
+        deadline: float,
+        should_yield: Callable[[], bool],
+    ) -> Dict[str, Any]:
+        """Remove images no container uses, least recently used first.
+
+        The daemon's prune would also delete pinned images, so candidates
+        are chosen here like in ``evict_images`` and removed one by one.
+
+        Args:
+            older_than_hours: Minimum image age in hours (None for any).
+            deadline: Monotonic time by which to stop.
+            should_yield: Callable returning True to stop early.
+
+        Returns:
+            Dictionary with deleted, space_freed_bytes and interrupted.
+        """
+        cutoff = None
+        if older_than_hours is not None:
+            cutoff = time.time() - older_than_hours * 3600
+        df = self.disk_usage.get_snapshot(refresh=True)
+        used = {c.get("ImageID") for c in df.get("Containers") or []}
+        candidates = []
+        for image in df.get("Images") or []:
+            tags = image.get("RepoTags") or []
+            if image["Id"] in used or self._is_pinned(image, tags):
+                continue
+            if cutoff is not None and image.get("Created", 0) > cutoff:
+                continue
+            shared = max(image.get("SharedSize") or 0, 0)
+            candidates.append(
+                (
+                    image_usage.last_used(image["Id"], tags)
+                    or image.get("Created", 0),
+                    {
+                        "id": image["Id"],
+                        "tags": tags,
+                        "size_bytes": max(
+                            (image.get("Size") or 0) - shared, 0
+                        ),
+                    },
+                )
+            )
+        candidates.sort(key=lambda c: c[0])
+
+        deleted = freed = 0
+        for _, candidate in candidates:
+            if time.monotonic() >= deadline or should_yield():
+                return {
+                    "deleted": deleted,
+                    "space_freed_bytes": freed,
+                    "interrupted": True,
+                }
+            try:
+                self._remove_image(candidate)
+            except Exception:
+                # Used or referenced again since the snapshot
+                continue
+            deleted += 1
+            freed += candidate["size_bytes"]
+
+        return {
+            "deleted": deleted,
+            "space_freed_bytes": freed,
+            "interrupted": False,
+        }
+
+    def _remove(self, category: str, entry: Dict[str, Any]) -> None:
+        """Remove one planned object without forcing.
+
+        Args:
+            category: containers, images or volumes.
+            entry: Planned item.
+        """
+        if category == "containers":
+            self.client.api.remove_container(entry["id"])
+        elif category == "images":
+            self._remove_image(entry)
+        else:
+            self.client.api.remove_volume(entry["id"])
+
+    def _remove_image(self, entry: Dict[str, Any]) -> None:
+        """Remove a planned image with all of its tags, or none of them.
+
+        The daemon only deletes an image referenced by several tags when
+        forced, so tags are removed one at a time and the image goes
+        with its last one. Containers created from the image since the
+        plan was made are checked for first; if a tag still fails, the
+        tags already removed are restored so the image is not left
+        half-untagged.
+
+        Args:
+            entry: Planned image item.
+
+        Raises:
+            RuntimeError: If a container uses the image.
+        """
+        image_id = entry["id"]
+        users = [
+            c
+            for c in self.client.api.containers(
+                all=True, filters={"ancestor": image_id}
+            )
+            if c.get("ImageID") == image_id
+        ]
+        if users:
+            raise RuntimeError(
+                f"Image {image_id[:19]} is used by container "
+                f"{users[0]['Id'][:12]}"
+            )
+
+        tags = entry.get("tags") or []
+        if not tags:
+            self.client.api.remove_image(image_id)
+            return
+        untagged: List[str] = []
+        try:
+            for ref in tags:
+                self.client.api.remove_image(ref)
+                untagged.append(ref)
+        except Exception:
+            for ref in untagged:
+                repository, _, tag = ref.rpartition(":")
+                self.client.api.tag(image_id, repository, tag)
+            raise
+
+    def _remove_build_cache(
+        self, entries: List[Dict[str, Any]], failed: List[Dict[str, str]]
+    ) -> Tuple[int, int]:
+        """Prune the planned build cache records.
+
+        ``all`` is set so that records the daemon considers shared or
+        recently used are pruned too; planned records the daemon still
+        did not delete are reported as failed.
+
+        Args:
+            entries: Planned build cache items.
+            failed: List collecting failures.
+
+        Returns:
+            Tuple (records deleted, bytes reclaimed) according to the
+            daemon.
+        """
+        try:
+            result = self.client.api.prune_builds(
+                filters={"id": [e["id"] for e in entries]}, all=True
+            )
+        except Exception as e:
+            failed.append(
+                {"category": "build_cache", "id": "*", "error": str(e)}
+            )
+            return 0, 0
+        deleted = set(result.get("CachesDeleted") or [])
+        for entry in entries:
+            if entry["id"] not in deleted:
+                failed.append(
+                    {
+                        "category": "build_cache",
+                        "id": entry["id"],
+                        "error": "Not deleted by the daemon",
+                    }
+                )
+        count = sum(1 for e in entries if e["id"] in deleted)
+        return count, result.get("SpaceReclaimed", 0) or 0
+
+    @staticmethod
+    def _plan_containers(df: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Plan removal of stopped containers.
+
+        Args:
+            df: Docker disk usage snapshot.
+
+        Returns:
+            Planned container items.
+        """
+        return [
+            {
+                "id": c["Id"],
+                "name": (c.get("Names") or [c["Id"][:12]])[0].lstrip("/"),
+                "size_bytes": c.get("SizeRw") or 0,
+            }
+            for c in df.get("Containers") or []
+            if c.get("State") in ("created", "exited", "dead")
+        ]
+
+    @staticmethod
+    def _plan_images(df: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Plan removal of images not used by any kept container.
+
+        Images used only by stopped containers count as reclaimable,
+        since the containers category removes those first. Pinned
+        images are left out like in ``evict_images`` and the rest are
+        listed least recently used first. Only the bytes unique to each
+        image are counted, so the estimate is conservative when several
+        planned images share layers.
+
+        Args:
+            df: Docker disk usage snapshot.
+
+        Returns:
+            Planned image items.
+        """
+        in_use = {
+            c.get("ImageID")
+            for c in df.get("Containers") or []
+            if c.get("State") not in ("created", "exited", "dead")
+        }
+        planned = []
+        last_used = {}
+        for image in df.get("Images") or []:
+            tags = image.get("RepoTags") or []
+            if image["Id"] in in_use or CleanupRepository._is_pinned(
+                image, tags
+            ):
+                continue
+            size = image.get("Size") or 0
+            shared = image.get("SharedSize") or 0
+            last_used[image["Id"]] = image_usage.last_used(
+                image["Id"], tags
+            ) or image.get("Created", 0)
+            planned.append(
+                {
+                    "id": image["Id"],
+                    "name": tags[0] if tags else "<none>",
+                    "size_bytes": max(size - max(shared, 0), 0),
+                    "tags": tags,
+                }
+            )
+        planned.sort(key=lambda item: last_used[item["id"]])
+        return planned
+
+    @staticmethod
+    def _plan_volumes(df: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Plan removal of volumes no container references.
+
+        The df reference count is cross-checked with the mount index
+        when it is available.
+
+        Args:
+            df: Docker disk usage snapshot.
+
+        Returns:
+            Planned volume items.
+        """
+        unused = None
+        if mount_index.ready:
+            unused = set(mount_index.unused_volumes())
+        planned = []
+        for volume in df.get("Volumes") or []:
+            usage = volume.get("UsageData") or {}
+            if usage.get("RefCount", 0) > 0:
+                continue
+            if unused is not None and volume["Name"] not in unused:
+                continue
+            planned.append(
+                {
+                    "id": volume["Name"],
+                    "name": volume["Name"],
+                    "size_bytes": max(usage.get("Size", 0), 0),
+                }
+            )
+        return planned
+
+    @staticmethod
+    def _plan_build_cache(df: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Plan removal of build cache records not in use.
+
+        Args:
+            df: Docker disk usage snapshot.
+
+        Returns:
+            Planned build cache items.
+        """
+        return [
+            {
+                "id": record["ID"],
+                "name": record.get("Type", ""),
+                "size_bytes": record.get("Size") or 0,
+            }
+            for record in df.get("BuildCache") or []
+            if not record.get("InUse")
+        ]
@@ -0,0 +1,85 @@
+"""Disk usage repository - Cached access to Docker's /system/df.
+
+A single ``df()`` call reports sizes and reference counts for every
+image, container, volume and build cache record. This repository keeps
+one shared snapshot with a TTL so that volume, image and cleanup views
+reuse it instead of scanning containers or calling the daemon per item.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from app.core import docker_client
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# Shared across repository instances so every view reuses one snapshot
+_snapshot_cache = TTLCache(ttl=settings.df_cache_ttl)
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Docker RFC 3339 timestamp with nanoseconds.
+
+    Args:
+        value: Timestamp such as ``2025-10-29T10:00:00.123456789Z``.
+
+    Returns:
+        Aware UTC datetime, or None for empty or zero timestamps.
+    """
+    if not value or value.startswith("0001-"):
+        return None
+    try:
+        parsed = datetime.strptime(value[:19], "%Y-%m-%dT%H:%M:%S")
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=timezone.utc)
+
+
+class DiskUsageRepository:
+    """Repository for Docker disk usage snapshots.
+
+    Example:
+        >>> repo = DiskUsageRepository()
+        >>> snapshot = repo.get_snapshot()
+        >>> print(snapshot["LayersSize"])
+    """
+
+    def __init__(self) -> None:
+        """Initialize repository with Docker client."""
+        self.client = docker_client.client
+
+    def get_snapshot(self, refresh: bool = False) -> Dict[str, Any]:
+        """Get the cached ``df()`` snapshot.
+
+        Args:
+            refresh: Bypass the cache and query the daemon.
+
+        Returns:
+            Raw ``/system/df`` response with LayersSize, Images,
+            Containers, Volumes and BuildCache keys.
+        """
+        if refresh:
+            _snapshot_cache.invalidate()
+        return _snapshot_cache.get_or_load("df", self.client.df)
+
+    def get_snapshot_age(self) -> float:
+        """Get seconds since the snapshot was taken.
+
+        Returns:
+            Snapshot age in seconds (0 if nothing is cached).
+        """
+        return _snapshot_cache.age("df") or 0.0
+
+    @staticmethod
+    def is_fresh() -> bool:
+        """Check whether a cached snapshot is still within its TTL.
+
+        Returns:
+            bool: True if get_snapshot would not query the daemon.
+        """
+        return _snapshot_cache.get("df") is not None
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop the cached snapshot after state-changing operations."""
+        _snapshot_cache.invalidate()
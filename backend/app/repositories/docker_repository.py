@@ -9,9 +9,14 @@ The repository acts as a data access layer between the business logic
 container management operations.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from app.core import docker_client
+from app.core.build_fingerprint import FINGERPRINT_LABEL
+from app.core.compose_catalog import compose_catalog
+from app.core.container_sizes import container_sizes
+from app.core.mount_index import mount_index
+from app.repositories.build_repository import BuildRepository
 from docker.errors import APIError, NotFound
 
 
@@ -38,11 +43,14 @@ class DockerRepository:
         """
         self.client = docker_client.client
 
-    def list_containers(self, all: bool = True) -> List[Dict[str, Any]]:
+    def list_containers(
+        self, all: bool = True, ids: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """List all Docker containers.
 
         Args:
             all: Include stopped containers. Defaults to True.
+            ids: Only list these container IDs (full or short).
 
         Returns:
             List of container information dictionaries containing:
@@ -54,13 +62,26 @@ class DockerRepository:
                 - ports (List[str]): Port mappings
                 - created (str): Creation timestamp
                 - running (bool): True if container is running
+                - size_rw_bytes (int | None): Writable layer size
+                - size_root_fs_bytes (int | None): Total filesystem size
+                - size_measured_at (str | None): When sizes were measured
+
+            Sizes come from the background size cache and are None until
+            a container has been measured; listing never waits on them.
 
         Example:
             >>> repo = DockerRepository()
             >>> containers = repo.list_containers(all=False)
             >>> running_names = [c['name'] for c in containers if c['running']]
         """
-        containers = self.client.containers.list(all=all)
+        if ids is not None:
+            if not ids:
+                return []
+            containers = self.client.containers.list(
+                all=all, filters={"id": ids}
+            )
+        else:
+            containers = self.client.containers.list(all=all)
 
         return [
             {
@@ -74,10 +95,34 @@ class DockerRepository:
                 "ports": self._format_ports(c.ports),
                 "created": c.attrs["Created"],
                 "running": c.status == "running",
+                **self._format_size(container_sizes.get(c.id)),
             }
             for c in containers
         ]
 
+    @staticmethod
+    def _format_size(size: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert a cached container size into response fields.
+
+        Args:
+            size: Entry from the container size cache, or None.
+
+        Returns:
+            Dictionary with size_rw_bytes, size_root_fs_bytes and
+            size_measured_at (all None if not measured yet).
+        """
+        if size is None:
+            return {
+                "size_rw_bytes": None,
+                "size_root_fs_bytes": None,
+                "size_measured_at": None,
+            }
+        return {
+            "size_rw_bytes": size["size_rw"],
+            "size_root_fs_bytes": size["size_root_fs"],
+            "size_measured_at": size["measured_at"],
+        }
+
     def get_container(self, name: str) -> Dict[str, Any]:
         """Get detailed information about a specific container.
 
@@ -238,6 +283,45 @@ class DockerRepository:
         except NotFound:
             raise ValueError(f"Container {name} not found")
 
+    def follow_logs(
+        self, name: str, tail: int = 0, since: Optional[int] = None
+    ) -> Any:
+        """Open a stream of new container log output.
+
+        The stream is read without a read timeout, so it stays open
+        while the container is quiet.
+
+        Args:
+            name: Container name or ID.
+            tail: Existing lines to include first. Defaults to 0.
+            since: Epoch seconds to resume from instead; every line
+                written since then is included.
+
+        Returns:
+            Blocking iterator of raw log chunks (bytes) with timestamps;
+            its ``close()`` ends the stream from another thread.
+
+        Raises:
+            ValueError: If container not found.
+
+        Example:
+            >>> stream = repo.follow_logs("postgres")
+            >>> for chunk in stream:
+            ...     print(chunk.decode())
+        """
+        try:
+            container = self.client.containers.get(name)
+        except NotFound:
+            raise ValueError(f"Container {name} not found")
+        return docker_client.get_stream_api().logs(
+            container.id,
+            stream=True,
+            follow=True,
+            timestamps=True,
+            tail="all" if since is not None else tail,
+            since=since,
+        )
+
     def get_stats(self, name: str) -> Dict[str, Any]:
         """Get container resource usage statistics.
 
@@ -302,12 +386,59 @@ class DockerRepository:
         except NotFound:
             raise ValueError(f"Container {name} not found")
 
+    def get_container_volumes(self, name: str) -> List[Dict[str, Any]]:
+        """Get named volumes mounted by a container.
+
+        Served from the mount index once it is built, otherwise from the
+        container's inspect data.
+
+        Args:
+            name: Container name or ID.
+
+        Returns:
+            List of mount dictionaries with volume, container_id,
+            container_name, destination and read_only.
+
+        Raises:
+            ValueError: If container not found.
+
+        Example:
+            >>> repo = DockerRepository()
+            >>> mounts = repo.get_container_volumes("local-postgres")
+            >>> print([m["volume"] for m in mounts])
+        """
+        if mount_index.ready:
+            mounts = mount_index.volumes_for(name)
+            if mounts is not None:
+                return mounts
+
+        try:
+            container = self.client.containers.get(name)
+        except NotFound:
+            raise ValueError(f"Container {name} not found")
+
+        return [
+            {
+                "volume": mount["Name"],
+                "container_id": container.short_id,
+                "container_name": container.name,
+                "destination": mount.get("Destination", ""),
+                "read_only": not mount.get("RW", True),
+            }
+            for mount in container.attrs.get("Mounts", [])
+            if mount.get("Type") == "volume" and mount.get("Name")
+        ]
+
     def rebuild_container(self, name: str) -> Dict[str, str]:
         """Rebuild and restart a container using docker-compose.
 
-        Stops the container, rebuilds it using docker-compose build,
-        and restarts it. This requires docker-compose to be available
-        and the container to be part of a docker-compose project.
+        Fingerprints the service's build context and compares it with
+        the fingerprint label on the container's image. When nothing
+        changed the build is skipped entirely; otherwise the container
+        is stopped, the service rebuilt with ``docker-compose build
+        --no-cache`` (so BuildKit, secrets and ssh keep working), the
+        new image stamped with the fingerprint, and the service
+        restarted with docker-compose.
 
         Args:
             name: Container name or ID to rebuild.
@@ -340,34 +471,34 @@ class DockerRepository:
                     "project. Cannot rebuild without compose context."
                 )
 
-            # Find docker-compose.yml (try common locations)
-            compose_file = None
-            base_path = (
-                "/home/lucas-biason/Projetos/Infraestrutura/"
-                "my-local-place/docker-compose.yml"
-            )
-            possible_paths = [
-                Path(base_path),
-                Path.cwd() / "docker-compose.yml",
-                Path.home() / "my-local-place" / "docker-compose.yml",
-            ]
-
-            for path in possible_paths:
-                if path.exists():
-                    compose_file = path
-                    break
-
-            if not compose_file:
+            service = compose_catalog.get(service_name)
+            if service is None:
                 raise RuntimeError(
-                    "docker-compose.yml not found. Cannot rebuild container."
+                    f"Service {service_name} not found in compose files. "
+                    "Cannot rebuild container."
                 )
 
+            builds = BuildRepository()
+            compose_file = Path(service["file"])
+            compose_dir = compose_file.parent
+            config = builds.get_build_config(service_name)
+
+            if config:
+                fingerprint = builds.compute_fingerprint(config)
+                image_labels = container.image.labels or {}
+                if image_labels.get(FINGERPRINT_LABEL) == fingerprint:
+                    return {
+                        "status": "success",
+                        "message": (
+                            f"Container {name} is up to date, rebuild skipped"
+                        ),
+                    }
+
             # Stop container first
             if container.status == "running":
                 container.stop(timeout=10)
 
             # Rebuild using docker-compose
-            compose_dir = compose_file.parent
             result = subprocess.run(
                 [
                     "docker-compose",
@@ -388,6 +519,9 @@ class DockerRepository:
                     f"Failed to rebuild container: {result.stderr}"
                 )
 
+            if config:
+                builds.stamp_fingerprint(config["image"], fingerprint)
+
             # Restart using docker-compose
             result = subprocess.run(
                 [
@@ -396,6 +530,7 @@ class DockerRepository:
                     str(compose_file),
                     "up",
                     "-d",
+                    "--no-build",
                     service_name,
                 ],
                 cwd=str(compose_dir),
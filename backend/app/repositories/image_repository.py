@@ -0,0 +1,176 @@
+"""Image repository - Image inventory with shared-layer accounting.
+
+Builds the image list from the shared ``df()`` snapshot, where each
+image reports both its full size and the part shared with other images,
+so the space an image really costs (its unique size) can be summed per
+repository and per compose project without double-counting layers.
+
+``df()`` does not say which images share a layer, so layers shared only
+between images of the same repository or project count as shared and
+are left out of that group's unique total: the total is a lower bound
+of what removing the whole group frees, while ``size_bytes`` counts
+such layers once per image and is the upper bound.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.image_usage import image_usage
+from app.repositories.disk_usage_repository import DiskUsageRepository
+
+GROUP_LABEL = "com.docker.compose.project"
+
+# Computed inventory; dropped on image and container events
+_inventory_cache = TTLCache(ttl=settings.df_cache_ttl)
+
+
+class ImageRepository:
+    """Repository for the Docker image inventory.
+
+    Example:
+        >>> repo = ImageRepository()
+        >>> inventory = repo.get_inventory()
+        >>> print(inventory["total_size_bytes"])
+    """
+
+    def __init__(self) -> None:
+        """Initialize repository with the shared df snapshot."""
+        self.disk_usage = DiskUsageRepository()
+
+    def get_inventory(self) -> Dict[str, Any]:
+        """Get every image with sizes, grouped by repository and project.
+
+        Returns:
+            Dictionary containing:
+                - images (list): Per image id, tags, repository, group,
+                  size_bytes, shared_size_bytes, unique_size_bytes,
+                  containers, created and last_used
+                - repositories (list): Totals per image repository
+                - groups (list): Totals per compose project label
+                - total_size_bytes (int): Disk used by all layers
+                - naive_size_bytes (int): Sum of image sizes, counting
+                  shared layers once per image
+
+        Example:
+            >>> inventory = ImageRepository().get_inventory()
+            >>> top = inventory["repositories"][0]
+            >>> print(top["name"], top["unique_size_bytes"])
+        """
+        return _inventory_cache.get_or_load("inventory", self._build)
+
+    @staticmethod
+    def handle_event(event: Dict[str, Any]) -> None:
+        """Drop the cached inventory when images or their users change.
+
+        Args:
+            event: Decoded Docker event.
+        """
+        event_type = event.get("Type")
+        action = event.get("Action", "")
+        if event_type == "image" or (
+            event_type == "container" and action in ("create", "destroy")
+        ):
+            _inventory_cache.invalidate()
+            DiskUsageRepository.invalidate()
+
+    def _build(self) -> Dict[str, Any]:
+        """Compute the inventory from the df snapshot.
+
+        Returns:
+            Inventory dictionary described in get_inventory.
+        """
+        df = self.disk_usage.get_snapshot()
+        images = [self._format_image(i) for i in df.get("Images") or []]
+        images.sort(key=lambda i: i["unique_size_bytes"], reverse=True)
+
+        naive = sum(i["size_bytes"] for i in images)
+        return {
+            "images": images,
+            "repositories": self._summarize(images, "repository"),
+            "groups": self._summarize(images, "group"),
+            "total_size_bytes": df.get("LayersSize") or naive,
+            "naive_size_bytes": naive,
+        }
+
+    @staticmethod
+    def _format_image(image: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a df image entry into an inventory item.
+
+        Args:
+            image: Image entry from the df snapshot.
+
+        Returns:
+            Inventory item dictionary.
+        """
+        tags = [t for t in image.get("RepoTags") or [] if t != "<none>:<none>"]
+        size = image.get("Size") or 0
+        # -1 means the daemon did not compute shared size
+        shared = max(image.get("SharedSize") or 0, 0)
+        last_used = image_usage.last_used(image["Id"], tags)
+        labels = image.get("Labels") or {}
+
+        return {
+            "id": image["Id"].split(":", 1)[-1][:12],
+            "tags": tags,
+            "repository": tags[0].rsplit(":", 1)[0] if tags else "<none>",
+            "group": labels.get(GROUP_LABEL) or "ungrouped",
+            "size_bytes": size,
+            "shared_size_bytes": shared,
+            "unique_size_bytes": max(size - shared, 0),
+            "containers": max(image.get("Containers") or 0, 0),
+            "created": ImageRepository._isoformat(image.get("Created")),
+            "last_used": ImageRepository._isoformat(last_used),
+        }
+
+    @staticmethod
+    def _summarize(
+        images: List[Dict[str, Any]], key: str
+    ) -> List[Dict[str, Any]]:
+        """Total image sizes by a grouping key.
+
+        The unique total leaves out layers the group's images only share
+        with each other (see the module docstring).
+
+        Args:
+            images: Inventory items.
+            key: Item field to group by.
+
+        Returns:
+            Summaries with name, image_count, unique_size_bytes and
+            size_bytes, largest unique size first.
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        for image in images:
+            summary = totals.setdefault(
+                image[key],
+                {
+                    "name": image[key],
+                    "image_count": 0,
+                    "unique_size_bytes": 0,
+                    "size_bytes": 0,
+                },
+            )
+            summary["image_count"] += 1
+            summary["unique_size_bytes"] += image["unique_size_bytes"]
+            summary["size_bytes"] += image["size_bytes"]
+        return sorted(
+            totals.values(),
+            key=lambda s: s["unique_size_bytes"],
+            reverse=True,
+        )
+
+    @staticmethod
+    def _isoformat(epoch: Optional[float]) -> Optional[str]:
+        """Format epoch seconds as an ISO timestamp.
+
+        Args:
+            epoch: Epoch seconds.
+
+        Returns:
+            ISO 8601 string, or None if not set.
+        """
+        if not epoch:
+            return None
+        return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat()
@@ -1,6 +1,7 @@
 """Volume repository - Data access layer for Docker volumes.
 
-Provides data access layer for Docker volume operations.
+Provides data access layer for Docker volume operations. Sizes and
+usage come from the shared disk usage snapshot.
 """
 
 from typing import Any, Dict, List
@@ -8,6 +9,9 @@ from typing import Any, Dict, List
 from docker.errors import APIError, NotFound
 
 from app.core import docker_client
+from app.core.mount_index import mount_index
+from app.core.volume_scanner import volume_scanner
+from app.repositories.disk_usage_repository import DiskUsageRepository
 
 
 class VolumeRepository:
@@ -24,31 +28,29 @@ class VolumeRepository:
     def __init__(self) -> None:
         """Initialize repository with Docker client."""
         self.client = docker_client.client
+        self.disk_usage = DiskUsageRepository()
 
     def list_volumes(self) -> List[Dict[str, Any]]:
-        """List all Docker volumes.
+        """List all Docker volumes with size and usage.
+
+        Backed by the cached ``df()`` snapshot, which reports
+        ``UsageData.Size`` and ``RefCount`` for every volume, so no
+        container scan is needed.
 
         Returns:
-            List of volume information dictionaries.
+            List of volume information dictionaries, including:
+                - size_bytes (int | None): Disk usage, None if unknown
+                - size_mb (float | None): Disk usage in MB
+                - ref_count (int | None): Containers referencing it
+                - in_use (bool | None): True if referenced
 
         Example:
             >>> repo = VolumeRepository()
             >>> volumes = repo.list_volumes()
-            >>> total_size = sum(v['size_mb'] for v in volumes)
+            >>> total_size = sum(v['size_mb'] or 0 for v in volumes)
         """
-        volumes = self.client.volumes.list()
-
-        return [
-            {
-                "name": v.name,
-                "driver": v.attrs.get("Driver", "local"),
-                "mountpoint": v.attrs.get("Mountpoint", ""),
-                "created": v.attrs.get("CreatedAt", ""),
-                "labels": v.attrs.get("Labels") or {},
-                "scope": v.attrs.get("Scope", "local"),
-            }
-            for v in volumes
-        ]
+        snapshot = self.disk_usage.get_snapshot()
+        return [self._format_volume(v) for v in snapshot.get("Volumes") or []]
 
     def get_volume_details(self, name: str) -> Dict[str, Any]:
         """Get detailed volume information.
@@ -89,6 +91,7 @@ class VolumeRepository:
         """
         try:
             result = self.client.volumes.prune()
+            self.disk_usage.invalidate()
             return {
                 "volumes_deleted": len(result.get("VolumesDeleted") or []),
                 "space_reclaimed_bytes": result.get("SpaceReclaimed", 0),
@@ -102,6 +105,10 @@ class VolumeRepository:
     def get_unused_volumes(self) -> List[str]:
         """Get list of unused volume names.
 
+        Served from the mount index once it is built; until then the
+        ``dangling=true`` filter is pushed down to the daemon. Neither
+        path walks every container's mounts.
+
         Returns:
             List of volume names not in use.
 
@@ -110,13 +117,100 @@ class VolumeRepository:
             >>> unused = repo.get_unused_volumes()
             >>> print(f"{len(unused)} volumes unused")
         """
-        all_volumes = {v.name for v in self.client.volumes.list()}
-        used_volumes = set()
+        if mount_index.ready:
+            return mount_index.unused_volumes()
+
+        volumes = self.client.volumes.list(filters={"dangling": True})
+        return [v.name for v in volumes]
+
+    def get_disk_usage(self) -> List[Dict[str, Any]]:
+        """Get scanned disk usage of volumes and bind mounts.
+
+        Served from the background scanner's cache; never touches the
+        filesystem on the request path.
+
+        Returns:
+            List of dictionaries with name, kind, path, size_bytes,
+            file_count, last_scanned and scan_seconds.
+
+        Example:
+            >>> repo = VolumeRepository()
+            >>> for usage in repo.get_disk_usage():
+            ...     print(usage["name"], usage["size_bytes"])
+        """
+        return volume_scanner.results()
+
+    def get_volume_consumers(self, name: str) -> List[Dict[str, Any]]:
+        """Get containers that mount a volume.
+
+        Args:
+            name: Volume name.
+
+        Returns:
+            List of mount dictionaries with volume, container_id,
+            container_name, destination and read_only.
+
+        Raises:
+            ValueError: If volume not found.
+
+        Example:
+            >>> repo = VolumeRepository()
+            >>> users = repo.get_volume_consumers("postgres_data")
+            >>> print([u["container_name"] for u in users])
+        """
+        if mount_index.ready:
+            consumers = mount_index.consumers(name)
+            if consumers is None:
+                raise ValueError(f"Volume {name} not found")
+            return consumers
 
-        for container in self.client.containers.list(all=True):
-            for mount in container.attrs.get("Mounts", []):
-                if mount.get("Type") == "volume":
-                    used_volumes.add(mount.get("Name"))
+        try:
+            self.client.volumes.get(name)
+        except NotFound:
+            raise ValueError(f"Volume {name} not found")
 
-        return list(all_volumes - used_volumes)
+        containers = self.client.containers.list(
+            all=True, filters={"volume": name}
+        )
+        return [
+            {
+                "volume": name,
+                "container_id": c.short_id,
+                "container_name": c.name,
+                "destination": mount.get("Destination", ""),
+                "read_only": not mount.get("RW", True),
+            }
+            for c in containers
+            for mount in c.attrs.get("Mounts", [])
+            if mount.get("Type") == "volume" and mount.get("Name") == name
+        ]
+
+    @staticmethod
+    def _format_volume(volume: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a ``df()`` volume entry.
 
+        The daemon reports ``-1`` for sizes and reference counts it has
+        not computed; these are returned as None.
+
+        Args:
+            volume: Volume entry from the disk usage snapshot.
+
+        Returns:
+            Volume information dictionary.
+        """
+        usage = volume.get("UsageData") or {}
+        size = usage.get("Size", -1)
+        ref_count = usage.get("RefCount", -1)
+
+        return {
+            "name": volume.get("Name", ""),
+            "driver": volume.get("Driver", "local"),
+            "mountpoint": volume.get("Mountpoint", ""),
+            "created": volume.get("CreatedAt", ""),
+            "labels": volume.get("Labels") or {},
+            "scope": volume.get("Scope", "local"),
+            "size_bytes": size if size >= 0 else None,
+            "size_mb": round(size / 1024 / 1024, 2) if size >= 0 else None,
+            "ref_count": ref_count if ref_count >= 0 else None,
+            "in_use": ref_count > 0 if ref_count >= 0 else None,
+        }
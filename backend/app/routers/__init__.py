@@ -1,9 +1,16 @@
 """API routers."""
 
 from .alerts import router as alerts_router
+from .builds import router as builds_router
 from .cleanup import router as cleanup_router
+from .compose import router as compose_router
 from .containers import router as containers_router
+from .debug import router as debug_router
+from .events import router as events_router
 from .health import router as health_router
+from .images import router as images_router
+from .metrics import router as metrics_router
+from .stream import router as stream_router
 from .system import router as system_router
 from .volumes import router as volumes_router
 
@@ -14,4 +21,11 @@ __all__ = [
     "alerts_router",
     "volumes_router",
     "cleanup_router",
+    "builds_router",
+    "compose_router",
+    "images_router",
+    "metrics_router",
+    "stream_router",
+    "events_router",
+    "debug_router",
 ]
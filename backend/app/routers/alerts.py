@@ -1,33 +1,47 @@
 """Alerts router - API endpoints for resource alerts."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
 from app.controllers.alert_controller import AlertController
+from app.core.events import event_bus
+from app.core.negotiation import (
+    if_none_match,
+    negotiated_response,
+    not_modified,
+)
+from app.core.revisions import revisions
+from app.core.sampling import demand
 from app.schemas.alert import AlertsResponse
 
 router = APIRouter(prefix="/api/v1/alerts", tags=["Alerts"])
 
 
 @router.get("", response_model=AlertsResponse)
-async def get_alerts() -> AlertsResponse:
+async def get_alerts(request: Request) -> Response:
     """Get all active resource alerts.
 
+    Carries an ``ETag`` that changes only when the alert inputs change
+    (raised host usage alerts and their values, container/volume
+    revisions, daemon state);
+    ``If-None-Match`` is answered with 304 without calling Docker. No
+    tag is sent while the Docker events stream is down. Each read
+    counts as ``host`` demand, so host usage alerts stay fresh.
+
+    Args:
+        request: Incoming request, used for content negotiation.
+
     Returns:
         Active alerts categorized by severity.
 
     Example:
         GET /api/v1/alerts
     """
-    alerts = AlertController.check_all()
-
-    critical = sum(1 for a in alerts if a["level"] == "critical")
-    warning = sum(1 for a in alerts if a["level"] == "warning")
-    info = sum(1 for a in alerts if a["level"] == "info")
-
-    return AlertsResponse(
-        alerts=alerts,
-        critical_count=critical,
-        warning_count=warning,
-        info_count=info,
-    )
-
+    demand.touch("host")
+    etag = None
+    if event_bus.connected:
+        revisions.observe("alerts", AlertController.state_key())
+        etag = revisions.etag("alerts")
+        if if_none_match(request, etag):
+            return not_modified(etag)
+
+    return negotiated_response(request, AlertController.summary(), etag=etag)
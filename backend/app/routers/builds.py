@@ -0,0 +1,72 @@
+"""Builds router - API endpoints for compose service build status."""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Query
+
+from app.controllers.build_controller import BuildController
+from app.repositories.build_cache_repository import BuildCacheRepository
+from app.repositories.build_repository import BuildRepository
+from app.schemas.build import (
+    BuildCachePruneResult,
+    BuildCacheReport,
+    BuildStatus,
+)
+
+router = APIRouter(prefix="/api/v1/builds", tags=["Builds"])
+
+repository = BuildRepository()
+cache_repository = BuildCacheRepository()
+
+
+@router.get("/stale", response_model=List[BuildStatus])
+async def list_stale_builds() -> List[BuildStatus]:
+    """List compose services whose build context changed.
+
+    A service is stale when the fingerprint of its build context does
+    not match the fingerprint label on its current image, so only these
+    services need a rebuild.
+
+    Returns:
+        List of stale services with both fingerprints.
+
+    Example:
+        GET /api/v1/builds/stale
+    """
+    return BuildController.list_stale(repository)
+
+
+@router.get("/cache", response_model=BuildCacheReport)
+async def get_build_cache() -> BuildCacheReport:
+    """Report BuildKit cache usage by type and age.
+
+    Returns:
+        Cache size, reclaimable bytes and the keep-storage budget.
+
+    Example:
+        GET /api/v1/builds/cache
+    """
+    return BuildController.get_cache_report(cache_repository)
+
+
+@router.post("/cache/prune", response_model=BuildCachePruneResult)
+async def prune_build_cache(
+    budget_gb: Optional[float] = Query(
+        None, ge=0, description="Cache to keep (default: setting)"
+    )
+) -> BuildCachePruneResult:
+    """Prune the build cache down to its keep-storage budget.
+
+    Oldest and least-used records go first; the rest of the cache is
+    kept so rebuilds stay incremental.
+
+    Args:
+        budget_gb: Cache to keep in GB.
+
+    Returns:
+        Bytes freed and cache size against the budget.
+
+    Example:
+        POST /api/v1/builds/cache/prune?budget_gb=10
+    """
+    return BuildController.prune_cache(cache_repository, budget_gb)
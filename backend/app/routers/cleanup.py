@@ -1,11 +1,74 @@
 """Cleanup router - API endpoints for Docker cleanup operations."""
 
-from fastapi import APIRouter, HTTPException, status
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 from app.controllers.cleanup_controller import CleanupController
-from app.schemas.volume import CleanupResult
+from app.core.cleanup_scheduler import cleanup_scheduler
+from app.core.fast_json import SchemaEncoder
+from app.core.negotiation import negotiated_response
+from app.repositories.cleanup_repository import CleanupRepository
+from app.schemas.volume import (
+    CleanupPlan,
+    CleanupPlanResult,
+    CleanupPolicyStatus,
+    CleanupResult,
+    CleanupRun,
+    ImageEvictionResult,
+)
 
 router = APIRouter(prefix="/api/v1/cleanup", tags=["Cleanup"])
+repository = CleanupRepository()
+run_encoder = SchemaEncoder(CleanupRun)
+
+CleanupCategory = Literal["containers", "images", "volumes", "build_cache"]
+
+
+@router.get("/plan", response_model=CleanupPlan)
+async def get_cleanup_plan(
+    refresh: bool = Query(False, description="Take a new df() snapshot")
+) -> CleanupPlan:
+    """Preview what a cleanup would remove and reclaim.
+
+    Nothing is deleted. The plan is kept for five minutes and can be
+    executed with ``POST /api/v1/cleanup/plan/{plan_id}/execute``.
+
+    Args:
+        refresh: Take a new disk usage snapshot instead of the cached one.
+
+    Returns:
+        Planned removals and reclaimable bytes per category.
+
+    Example:
+        GET /api/v1/cleanup/plan
+    """
+    return CleanupController.get_plan(repository, refresh)
+
+
+@router.post("/plan/{plan_id}/execute", response_model=CleanupPlanResult)
+async def execute_cleanup_plan(
+    plan_id: str,
+    categories: Optional[List[CleanupCategory]] = Query(
+        None, description="Categories to execute (default: all)"
+    ),
+) -> CleanupPlanResult:
+    """Remove exactly the objects listed in a cleanup plan.
+
+    Args:
+        plan_id: Identifier returned by the plan endpoint.
+        categories: Categories to execute.
+
+    Returns:
+        Removed counts, failures and bytes freed.
+
+    Raises:
+        404: Plan unknown or expired.
+
+    Example:
+        POST /api/v1/cleanup/plan/3f2a9c1b7e40/execute?categories=images
+    """
+    return CleanupController.execute_plan(repository, plan_id, categories)
 
 
 @router.post("/all", response_model=CleanupResult)
@@ -18,8 +81,11 @@ async def cleanup_all() -> CleanupResult:
     - Unused volumes
     - Build cache
 
+    A failing or timed-out step is reported in ``steps`` while the
+    statistics of the successful steps are still returned.
+
     Returns:
-        Cleanup statistics.
+        Cleanup statistics with a per-step report.
 
     Example:
         POST /api/v1/cleanup/all
@@ -69,3 +135,60 @@ async def cleanup_images() -> dict:
             detail=str(e),
         )
 
+
+@router.post("/images/evict", response_model=ImageEvictionResult)
+async def evict_images(
+    budget_gb: Optional[float] = Query(
+        None, ge=0, description="Image disk budget (default: setting)"
+    ),
+    dry_run: bool = Query(False, description="Only report what would go"),
+) -> ImageEvictionResult:
+    """Evict least-recently-used images until the budget is met.
+
+    Images used by any container, matching ``IMAGE_PINS`` or labelled
+    ``io.mylocalplace.pin=true`` are kept.
+
+    Args:
+        budget_gb: Target total image size in GB.
+        dry_run: Only report what would be evicted.
+
+    Returns:
+        Evicted images and bytes freed.
+
+    Example:
+        POST /api/v1/cleanup/images/evict?budget_gb=15&dry_run=true
+    """
+    return CleanupController.evict_images(repository, budget_gb, dry_run)
+
+
+@router.get("/policies", response_model=List[CleanupPolicyStatus])
+async def get_cleanup_policies() -> List[CleanupPolicyStatus]:
+    """List background cleanup policies and when each is next due.
+
+    Policies are configured with the ``CLEANUP_POLICIES`` setting.
+
+    Returns:
+        Configured policies with their scheduling state.
+
+    Example:
+        GET /api/v1/cleanup/policies
+    """
+    return [CleanupPolicyStatus(**p) for p in cleanup_scheduler.status()]
+
+
+@router.get("/history", response_model=List[CleanupRun])
+async def get_cleanup_history(request: Request) -> Response:
+    """List recent background cleanup runs, most recent first.
+
+    Args:
+        request: Incoming request, used for content negotiation.
+
+    Returns:
+        Runs with duration, objects deleted and bytes freed.
+
+    Example:
+        GET /api/v1/cleanup/history
+    """
+    return negotiated_response(
+        request, run_encoder.encode_many(cleanup_scheduler.history())
+    )
@@ -0,0 +1,44 @@
+"""Compose router - API endpoints for the compose service catalog."""
+
+from typing import List
+
+from fastapi import APIRouter
+
+from app.controllers.compose_controller import ComposeController
+from app.core.compose_catalog import compose_catalog
+from app.schemas.compose import ComposeService
+
+router = APIRouter(prefix="/api/v1/compose", tags=["Compose"])
+
+
+@router.get("/services", response_model=List[ComposeService])
+async def list_compose_services() -> List[ComposeService]:
+    """List services defined across all configured compose files.
+
+    Returns:
+        Compose service definitions, including services without a
+        container.
+
+    Example:
+        GET /api/v1/compose/services
+    """
+    return ComposeController.list_services(compose_catalog)
+
+
+@router.get("/services/{name}", response_model=ComposeService)
+async def get_compose_service(name: str) -> ComposeService:
+    """Get a compose service by service or container name.
+
+    Args:
+        name: Service name or container name.
+
+    Returns:
+        Compose service definition.
+
+    Raises:
+        404: Service not defined in any compose file.
+
+    Example:
+        GET /api/v1/compose/services/local-postgres
+    """
+    return ComposeController.get_service(compose_catalog, name)
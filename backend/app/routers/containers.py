@@ -4,17 +4,30 @@ This module defines REST API endpoints for Docker container operations
 including listing, starting, stopping, and monitoring containers.
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
 from app.controllers import ContainerController
+from app.core.config import settings
+from app.core.container_changes import container_changes
+from app.core.events import event_bus
+from app.core.long_poll import set_revision_headers, wait_for_change
+from app.core.negotiation import (
+    if_none_match,
+    negotiated_response,
+    not_modified,
+)
+from app.core.revisions import revisions
+from app.core.sampling import demand
 from app.repositories import DockerRepository
 from app.schemas import (
     ContainerAction,
+    ContainerChanges,
     ContainerInfo,
     ContainerLogs,
     ContainerStats,
+    VolumeMount,
 )
 
 router = APIRouter(prefix="/api/v1/containers", tags=["Containers"])
@@ -25,14 +38,38 @@ repository = DockerRepository()
 
 @router.get("", response_model=List[ContainerInfo])
 async def list_containers(
-    all: bool = Query(True, description="Include stopped containers")
-) -> List[ContainerInfo]:
+    request: Request,
+    all: bool = Query(True, description="Include stopped containers"),
+    wait_for_revision: Optional[str] = Query(
+        None, description="Wait until the revision passes this token"
+    ),
+    timeout: float = Query(
+        30.0,
+        ge=0,
+        le=settings.long_poll_max_timeout,
+        description="Seconds to wait for a new revision",
+    ),
+) -> Response:
     """List all Docker containers.
 
     Returns a list of all containers, optionally filtered to running only.
+    Rows are written straight to JSON (or MessagePack) without
+    re-validation, compressed when the client accepts it. The ``ETag``
+    follows the container revision (bumped by container events and new
+    size measurements), so ``If-None-Match`` polls get a 304 without
+    calling Docker. No tag is sent while the events stream is down.
+
+    ``X-Revision`` carries the container revision token; pass it back
+    as ``wait_for_revision`` to hold the request until something changes
+    (or ``timeout`` seconds pass) instead of polling in a loop. Tokens
+    from another worker are answered at once with
+    ``X-Revision-Resync: true``.
 
     Args:
+        request: Incoming request, used for content negotiation.
         all: Include stopped containers. Defaults to True.
+        wait_for_revision: Revision token the client already has.
+        timeout: Seconds to wait for a newer revision.
 
     Returns:
         List of container information.
@@ -40,16 +77,84 @@ async def list_containers(
     Example:
         GET /api/v1/containers?all=true
         GET /api/v1/containers?all=false
+        GET /api/v1/containers?wait_for_revision=3f9a1c2e.42&timeout=30
     """
-    return ContainerController.list_all(repository, all=all)
+    resync = await wait_for_change(
+        request, "containers", wait_for_revision, timeout
+    )
+    etag = None
+    if event_bus.connected:
+        etag = revisions.etag("containers", "all" if all else "running")
+        if not resync and if_none_match(request, etag):
+            response = not_modified(etag)
+            set_revision_headers(response, "containers")
+            return response
+
+    response = negotiated_response(
+        request, ContainerController.list_rows(repository, all=all), etag=etag
+    )
+    set_revision_headers(response, "containers", resync)
+    return response
+
+
+@router.get("/changes", response_model=ContainerChanges)
+async def get_container_changes(
+    request: Request,
+    since: Optional[str] = Query(
+        None, description="Revision token from the previous response"
+    ),
+) -> Response:
+    """Get containers added, updated and removed since a revision.
+
+    Clients keep the ``revision`` token of each response and send it
+    back as ``since``; only changed containers are returned. When the
+    token is missing, from before a restart or older than the bounded
+    change log, ``full_resync`` is true and ``added`` holds every
+    container.
+
+    Args:
+        request: Incoming request, used for content negotiation.
+        since: Revision token from the previous response.
+
+    Returns:
+        Container changes and the new revision token.
+
+    Example:
+        GET /api/v1/containers/changes
+        GET /api/v1/containers/changes?since=3f9a1c2e.42
+    """
+    return negotiated_response(
+        request, ContainerController.get_changes(repository, since)
+    )
 
 
 @router.get("/{name}", response_model=ContainerInfo)
-async def get_container(name: str) -> ContainerInfo:
+async def get_container(
+    name: str,
+    request: Request,
+    response: Response,
+    wait_for_revision: Optional[str] = Query(
+        None, description="Wait until the revision passes this token"
+    ),
+    timeout: float = Query(
+        30.0,
+        ge=0,
+        le=settings.long_poll_max_timeout,
+        description="Seconds to wait for a new revision",
+    ),
+) -> ContainerInfo:
     """Get detailed information about a specific container.
 
+    Supports the same ``wait_for_revision`` long-poll as the list, on
+    this container's own revision (returned in ``X-Revision``): changes
+    to other containers do not wake the request.
+
     Args:
         name: Container name or ID.
+        request: Incoming request.
+        response: Outgoing response, for the revision header.
+        wait_for_revision: Revision token the client already has.
+        timeout: Seconds to wait for a newer revision.
 
     Returns:
         Container information with full details.
@@ -60,7 +165,13 @@ async def get_container(name: str) -> ContainerInfo:
 
     Example:
         GET /api/v1/containers/postgres
+        GET /api/v1/containers/postgres?wait_for_revision=3f9a1c2e.42
     """
+    resource = container_changes.resource(name)
+    resync = await wait_for_change(
+        request, resource, wait_for_revision, timeout
+    )
+    set_revision_headers(response, resource, resync)
     return ContainerController.get_details(repository, name)
 
 
@@ -126,14 +237,16 @@ async def restart_container(name: str) -> ContainerAction:
 
 @router.get("/{name}/logs", response_model=ContainerLogs)
 async def get_logs(
+    request: Request,
     name: str,
     tail: int = Query(
         100, ge=1, le=1000, description="Number of log lines"
     ),
-) -> ContainerLogs:
+) -> Response:
     """Get container logs with timestamps.
 
     Args:
+        request: Incoming request, used for content negotiation.
         name: Container name or ID.
         tail: Number of log lines to retrieve (1-1000). Defaults to 100.
 
@@ -148,14 +261,17 @@ async def get_logs(
     Example:
         GET /api/v1/containers/postgres/logs?tail=50
     """
-    return ContainerController.get_logs(repository, name, tail=tail)
+    logs = ContainerController.get_logs(repository, name, tail=tail)
+    return negotiated_response(request, logs.model_dump(mode="json"))
 
 
 @router.get("/{name}/stats", response_model=ContainerStats)
 async def get_stats(name: str) -> ContainerStats:
     """Get container resource usage statistics.
 
-    Retrieves real-time CPU, memory, and network metrics.
+    Retrieves real-time CPU, memory, and network metrics. Each read
+    also speeds up the container's sampling for WebSocket ``stats``
+    subscribers for a while (see ``SAMPLING_READ_TTL``).
 
     Args:
         name: Container name or ID.
@@ -170,6 +286,7 @@ async def get_stats(name: str) -> ContainerStats:
     Example:
         GET /api/v1/containers/postgres/stats
     """
+    demand.touch(f"stats:{name}")
     return ContainerController.get_stats(repository, name)
 
 
@@ -194,3 +311,23 @@ async def rebuild_container(name: str) -> ContainerAction:
         POST /api/v1/containers/mylocalplace-api/rebuild
     """
     return ContainerController.rebuild(repository, name)
+
+
+@router.get("/{name}/volumes", response_model=List[VolumeMount])
+async def get_container_volumes(name: str) -> List[VolumeMount]:
+    """Get named volumes mounted by a container.
+
+    Args:
+        name: Container name or ID.
+
+    Returns:
+        Volume mounts of the container.
+
+    Raises:
+        404: Container not found.
+        500: Failed to retrieve mounts.
+
+    Example:
+        GET /api/v1/containers/local-postgres/volumes
+    """
+    return ContainerController.get_volumes(repository, name)
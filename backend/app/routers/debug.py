@@ -0,0 +1,42 @@
+"""Debug router - introspection of background work."""
+
+from typing import List
+
+from fastapi import APIRouter
+
+from app.core.collectors import collectors
+from app.core.sampling import demand
+from app.schemas import CollectorStatus
+
+router = APIRouter(prefix="/api/v1/debug", tags=["Debug"])
+
+
+@router.get("/collectors", response_model=List[CollectorStatus])
+async def get_collectors() -> List[CollectorStatus]:
+    """List background collectors with their run statistics.
+
+    Shows each collector's interval, executor, timeout and CPU budget
+    next to its runs, errors, timeouts, skipped ticks, durations, lag
+    and CPU time. The same counters are exported on ``/metrics``.
+
+    Returns:
+        Collectors sorted by name.
+
+    Example:
+        GET /api/v1/debug/collectors
+    """
+    return [CollectorStatus(**c) for c in collectors.stats()]
+
+
+@router.get("/sampling", response_model=List[str])
+async def get_sampling_demand() -> List[str]:
+    """List the keys currently sampled on demand.
+
+    Returns:
+        Keys (``stats:<name>``, ``host``, ``stats:*``) held by a
+        consumer or read recently.
+
+    Example:
+        GET /api/v1/debug/sampling
+    """
+    return demand.active_keys()
@@ -0,0 +1,117 @@
+"""Events router - Server-Sent Events stream of lifecycle events.
+
+For clients that cannot use the WebSocket hub (curl, scripts, simple
+proxies). Every client is served from the shared Docker events
+subscription through the lifecycle event buffer; none opens its own
+events connection to the daemon.
+"""
+
+from typing import AsyncIterator, Optional, Set
+
+from fastapi import APIRouter, Header, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.fast_json import dumps
+from app.core.lifecycle_events import (
+    EventListener,
+    lifecycle_events,
+    matches,
+)
+
+router = APIRouter(prefix="/api/v1/events", tags=["Events"])
+
+# Seconds between comment lines keeping idle connections open
+KEEPALIVE_INTERVAL = 15.0
+
+
+async def _event_source(
+    request: Request,
+    listener: EventListener,
+    types: Set[str],
+    container: Optional[str],
+    project: Optional[str],
+) -> AsyncIterator[bytes]:
+    """Render a listener's events in text/event-stream format.
+
+    Args:
+        request: Incoming request, polled for disconnection.
+        listener: Registered lifecycle event listener.
+        types: Event types to keep (all if empty).
+        container: Container name or ID prefix to keep.
+        project: Compose project to keep.
+
+    Yields:
+        bytes: SSE frames.
+    """
+
+    def frame(item) -> bytes:
+        event_id, event = item
+        return b"id: %s\ndata: %s\n\n" % (event_id.encode(), dumps(event))
+
+    resync = b'event: resync\ndata: {"resync":true}\n\n'
+    try:
+        yield b"retry: 3000\n\n"
+        if listener.resync:
+            yield resync
+        for item in listener.replay:
+            if matches(item[1], types, container, project):
+                yield frame(item)
+
+        # Overflowed clients are closed and resume via Last-Event-ID
+        while not listener.overflowed:
+            received, item = await listener.get(KEEPALIVE_INTERVAL)
+            if not received:
+                if await request.is_disconnected():
+                    break
+                yield b": keep-alive\n\n"
+            elif item is None:
+                yield resync
+            elif matches(item[1], types, container, project):
+                yield frame(item)
+    finally:
+        lifecycle_events.close(listener)
+
+
+@router.get("", response_class=StreamingResponse)
+async def stream_events(
+    request: Request,
+    type: Optional[str] = Query(
+        None, description="Comma-separated types: container, image, volume"
+    ),
+    container: Optional[str] = Query(
+        None, description="Container name or ID prefix"
+    ),
+    project: Optional[str] = Query(None, description="Compose project"),
+    last_event_id: Optional[str] = Header(None),
+) -> StreamingResponse:
+    """Stream container, image and volume lifecycle events as SSE.
+
+    Each event is sent as ``data:`` JSON with type, action, detail, id,
+    name, project, service, image and time. Reconnecting clients send
+    ``Last-Event-ID`` (browsers' EventSource does it automatically) and
+    get the events they missed from a bounded replay buffer; when those
+    are gone an ``event: resync`` tells them to reload their state.
+
+    Args:
+        request: Incoming request.
+        type: Comma-separated event types to keep.
+        container: Keep only events of this container (name or ID
+            prefix).
+        project: Keep only events of this compose project.
+        last_event_id: ID of the last event received before
+            reconnecting.
+
+    Returns:
+        text/event-stream response.
+
+    Example:
+        GET /api/v1/events?type=container&project=mylocalplace
+        curl -N -H "Last-Event-ID: 3f9a1c2e-41" localhost:8000/api/v1/events
+    """
+    types = {t.strip() for t in (type or "").split(",") if t.strip()}
+    listener = lifecycle_events.open(last_event_id)
+    return StreamingResponse(
+        _event_source(request, listener, types, container, project),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
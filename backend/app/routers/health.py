@@ -1,13 +1,16 @@
 """Health router - API endpoints for health checks.
 
 This module defines REST API endpoints for verifying API availability
-and Docker daemon connectivity.
+and Docker daemon connectivity. Docker state comes from the background
+daemon prober, so no endpoint pings the daemon on the request path.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
 
 from app.core import docker_client
-from app.schemas import HealthResponse
+from app.core.health import daemon_health
+from app.schemas import HealthResponse, LivenessResponse, ReadinessResponse
 
 router = APIRouter(tags=["Health"])
 
@@ -19,6 +22,8 @@ async def health_check() -> HealthResponse:
 
     Verifies API is running and Docker daemon is accessible.
     This endpoint is exposed at both root (/) and /health paths.
+    Connectivity is read from the daemon prober; only before its first
+    probe is the daemon pinged directly.
 
     Returns:
         Health status with Docker connectivity and timestamp.
@@ -31,10 +36,70 @@ async def health_check() -> HealthResponse:
         {
             "status": "healthy",
             "docker_connected": true,
+            "docker_latency_ms": 1.8,
             "timestamp": "2025-10-29T20:42:25.695125",
             "version": "2.0.0"
         }
     """
+    if daemon_health.probed:
+        state = daemon_health.snapshot()
+        return HealthResponse(
+            status="healthy",
+            docker_connected=state["connected"],
+            docker_latency_ms=state["last_latency_ms"],
+        )
     return HealthResponse(
         status="healthy", docker_connected=docker_client.is_connected()
     )
+
+
+@router.get("/health/live", response_model=LivenessResponse)
+async def liveness() -> LivenessResponse:
+    """Liveness probe.
+
+    Answers as long as the API process serves requests; it never
+    depends on the Docker daemon.
+
+    Returns:
+        Liveness status.
+
+    Example:
+        GET /health/live
+    """
+    return LivenessResponse()
+
+
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse}},
+)
+async def readiness():
+    """Readiness probe.
+
+    Ready while the last cached daemon ping succeeded; otherwise 503
+    with the last error.
+
+    Returns:
+        Readiness status with daemon latency and last error.
+
+    Example:
+        GET /health/ready
+    """
+    state = daemon_health.snapshot()
+    ready = daemon_health.probed and state["connected"]
+    body = ReadinessResponse(
+        status="ready" if ready else "not_ready",
+        docker_connected=state["connected"],
+        last_latency_ms=state["last_latency_ms"],
+        recent_latency_ms=state["recent_latency_ms"],
+        last_error=state["last_error"],
+        consecutive_failures=state["consecutive_failures"],
+        checked_at=state["checked_at"],
+    )
+    if ready:
+        return body
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=body.model_dump(),
+    )
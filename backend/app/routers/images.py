@@ -0,0 +1,42 @@
+"""Images router - API endpoints for the Docker image inventory."""
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from app.core.fast_json import SchemaEncoder
+from app.core.negotiation import negotiated_response
+from app.repositories.image_repository import ImageRepository
+from app.schemas.image import ImageInventory
+
+router = APIRouter(prefix="/api/v1/images", tags=["Images"])
+
+repository = ImageRepository()
+inventory_encoder = SchemaEncoder(ImageInventory)
+
+
+@router.get("", response_model=ImageInventory)
+async def list_images(request: Request) -> Response:
+    """List images with shared-layer aware sizes.
+
+    Built from one cached ``df()`` snapshot; the result is reused until
+    an image or container create/destroy event invalidates it.
+
+    Args:
+        request: Incoming request, used for content negotiation.
+
+    Returns:
+        Images, per-repository and per-group totals.
+
+    Raises:
+        500: Failed to read disk usage.
+
+    Example:
+        GET /api/v1/images
+    """
+    try:
+        inventory = inventory_encoder.encode(repository.get_inventory())
+        return negotiated_response(request, inventory)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to list images: {str(e)}",
+        )
@@ -0,0 +1,37 @@
+"""Metrics router - Prometheus exposition of in-process metrics."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.collectors import collectors
+from app.core.health import daemon_health
+from app.core.hub import hub
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Expose metrics in Prometheus text format.
+
+    Includes Docker daemon reachability, failed pings and the ping
+    latency histogram from the background prober, plus WebSocket hub
+    connections, running collectors and dropped messages, and the runs,
+    errors, timeouts, skipped ticks, duration, lag and CPU time of each
+    background collector.
+
+    Returns:
+        Prometheus text exposition.
+
+    Example:
+        GET /metrics
+    """
+    lines = (
+        daemon_health.render_prometheus()
+        + hub.render_prometheus()
+        + collectors.render_prometheus()
+    )
+    return PlainTextResponse(
+        "\n".join(lines) + "\n",
+        media_type="text/plain; version=0.0.4",
+    )
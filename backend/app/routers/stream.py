@@ -0,0 +1,389 @@
+"""Stream router - WebSocket hub for live dashboard updates.
+
+This module defines the multiplexed WebSocket endpoint and the topic
+collectors feeding it. Collectors only run while their topic has
+subscribers, and Docker/psutil calls run in worker threads so the event
+loop keeps serving. Stats and host sampling follow the demand tracked in
+:mod:`app.core.sampling`.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+
+from app.controllers import ContainerController, SystemController
+from app.controllers.alert_controller import AlertController
+from app.core.config import settings
+from app.core.container_changes import container_changes
+from app.core.events import event_bus
+from app.core.fast_json import dumps
+from app.core.hub import (
+    COLLECTOR_RETRY_DELAY,
+    HubConnection,
+    TopicHub,
+    hub,
+    parse_topics,
+)
+from app.core.revisions import revisions
+from app.core.sampling import AdaptiveCadence, demand
+from app.repositories import DockerRepository
+from app.repositories.disk_usage_repository import parse_timestamp
+
+router = APIRouter(prefix="/api/v1/ws", tags=["Stream"])
+
+# Repository instance (singleton pattern via module-level)
+repository = DockerRepository()
+
+# Containers below this CPU usage count as idle and are sampled less
+IDLE_CPU_PERCENT = 0.5
+
+# Log topics currently streaming, capped by WS_MAX_LOG_TOPICS
+_log_topics: Set[str] = set()
+
+
+async def collect_containers(hub: TopicHub, topic: str) -> None:
+    """Publish the container list when the containers revision moves.
+
+    Args:
+        hub: Topic hub.
+        topic: ``containers``.
+    """
+    last_token = None
+    while True:
+        token = container_changes.token()
+        if not event_bus.connected or token != last_token:
+            rows = await asyncio.to_thread(
+                ContainerController.list_rows, repository
+            )
+            hub.publish(topic, rows)
+            last_token = token
+        await asyncio.sleep(settings.ws_poll_interval)
+
+
+async def collect_stats(hub: TopicHub, topic: str) -> None:
+    """Publish container stats on ``stats:<name>`` topics.
+
+    While running, the collector holds sampling demand for its topic:
+    the floor interval for one container, ``WS_POLL_INTERVAL`` for
+    ``stats:*``. Each container is sampled at the interval its demand
+    asks for (faster while its stats endpoint is being read), backing
+    off while idle, and the interval is sent with every sample.
+    ``stats:*`` samples every running container in parallel; while it
+    runs, single-container collectors leave their container to it.
+
+    Args:
+        hub: Topic hub.
+        topic: ``stats:<name>`` or ``stats:*``.
+    """
+    name = topic.partition(":")[2]
+    release = demand.hold(
+        topic, settings.ws_poll_interval if name == "*" else demand.floor
+    )
+    cadence = AdaptiveCadence(ceiling=demand.ceiling)
+    due: Dict[str, float] = {}
+    names: List[str] = []
+    listed_at = float("-inf")
+    try:
+        while True:
+            now = time.monotonic()
+            if name != "*":
+                names = [] if hub.has_subscribers("stats:*") else [name]
+            elif now - listed_at >= settings.ws_poll_interval:
+                rows = await asyncio.to_thread(
+                    repository.list_containers, all=False
+                )
+                names = [row["name"] for row in rows]
+                listed_at = now
+                for gone in set(due) - set(names):
+                    del due[gone]
+                    cadence.forget(f"stats:{gone}")
+
+            bases = {
+                n: demand.interval(f"stats:{n}")
+                for n in names
+                if due.get(n, 0.0) <= now
+            }
+            batch = [n for n, base in bases.items() if base is not None]
+            results = await asyncio.gather(
+                *(asyncio.to_thread(repository.get_stats, n) for n in batch),
+                return_exceptions=True,
+            )
+            for container, result in zip(batch, results):
+                key = f"stats:{container}"
+                if isinstance(result, Exception):
+                    hub.publish_error(key, str(result))
+                    due[container] = now + demand.ceiling
+                    continue
+                interval = cadence.next(
+                    key,
+                    bases[container],
+                    idle=result["cpu_percent"] < IDLE_CPU_PERCENT,
+                )
+                due[container] = now + interval
+                hub.publish(key, result, interval=interval)
+            await asyncio.sleep(demand.floor)
+    finally:
+        release()
+
+
+async def collect_system(hub: TopicHub, topic: str) -> None:
+    """Publish the host snapshot at the demanded interval.
+
+    Reuses the snapshot of the ``host`` collector while it is younger
+    than the interval.
+
+    Args:
+        hub: Topic hub.
+        topic: ``system``.
+    """
+    release = demand.hold("host", settings.ws_poll_interval)
+    try:
+        while True:
+            interval = demand.interval("host") or settings.ws_poll_interval
+            metrics = await asyncio.to_thread(
+                SystemController.get_metrics, interval
+            )
+            hub.publish(
+                topic, metrics.model_dump(mode="json"), interval=interval
+            )
+            await asyncio.sleep(interval)
+    finally:
+        release()
+
+
+async def collect_alerts(hub: TopicHub, topic: str) -> None:
+    """Publish active alerts when their inputs change.
+
+    Holds ``host`` demand while running, since host usage alerts are
+    derived from the host snapshot.
+
+    Args:
+        hub: Topic hub.
+        topic: ``alerts``.
+    """
+    release = demand.hold("host", settings.ws_poll_interval)
+    last_revision = None
+    try:
+        while True:
+            state = await asyncio.to_thread(AlertController.state_key)
+            revision = revisions.observe("alerts", state)
+            if not event_bus.connected or revision != last_revision:
+                summary = await asyncio.to_thread(AlertController.summary)
+                hub.publish(topic, summary)
+                last_revision = revision
+            await asyncio.sleep(settings.ws_poll_interval)
+    finally:
+        release()
+
+
+def _log_time(line: str) -> Optional[Tuple[str, str]]:
+    """Get the sortable timestamp Docker prefixes a log line with.
+
+    Args:
+        line: Log line such as ``2025-10-29T10:00:00.1234Z message``.
+
+    Returns:
+        Tuple (seconds part, nanoseconds padded to 9 digits), or None
+        if the line carries no timestamp.
+    """
+    stamp = line.partition(" ")[0]
+    if not stamp.endswith("Z") or parse_timestamp(stamp) is None:
+        return None
+    whole, _, fraction = stamp[:-1].partition(".")
+    return whole, fraction.ljust(9, "0")
+
+
+def _pump_logs(
+    stream: Any, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue
+) -> None:
+    """Read a log stream, handing each chunk to the event loop.
+
+    Runs on a thread of its own, so an idle stream blocks that thread
+    instead of one of the default executor's workers. ``None`` is queued
+    when the stream ends.
+
+    Args:
+        stream: Blocking iterator of log chunks.
+        loop: Event loop of the collector.
+        queue: Queue the collector reads.
+    """
+    try:
+        for chunk in stream:
+            loop.call_soon_threadsafe(queue.put_nowait, chunk)
+    except Exception:
+        # Stream closed by the collector, or the container went away
+        pass
+    try:
+        loop.call_soon_threadsafe(queue.put_nowait, None)
+    except RuntimeError:
+        # Event loop already closed
+        pass
+
+
+async def collect_logs(hub: TopicHub, topic: str) -> None:
+    """Publish new log lines of a container as they are written.
+
+    Each topic reads its stream on a dedicated thread; at most
+    ``WS_MAX_LOG_TOPICS`` topics stream at once, further ones report an
+    error and retry until a slot frees up. When the stream ends (the
+    container stopped or the connection dropped) it is reopened from
+    the last published timestamp, skipping the lines already sent, so
+    nothing written in between is lost.
+
+    Args:
+        hub: Topic hub.
+        topic: ``logs:<name>``.
+
+    Raises:
+        RuntimeError: If too many log topics are streaming.
+    """
+    if len(_log_topics) >= settings.ws_max_log_topics:
+        raise RuntimeError(
+            f"Too many log streams (limit {settings.ws_max_log_topics})"
+        )
+    _log_topics.add(topic)
+    last: Optional[Tuple[str, str]] = None
+    try:
+        while True:
+            since = None
+            if last is not None:
+                since = int(parse_timestamp(last[0]).timestamp())
+            stream = await asyncio.to_thread(
+                repository.follow_logs, topic.partition(":")[2], since=since
+            )
+            last = await _relay_logs(hub, topic, stream, last)
+            await asyncio.sleep(COLLECTOR_RETRY_DELAY)
+    finally:
+        _log_topics.discard(topic)
+
+
+async def _relay_logs(
+    hub: TopicHub,
+    topic: str,
+    stream: Any,
+    last: Optional[Tuple[str, str]],
+) -> Optional[Tuple[str, str]]:
+    """Publish the lines of one log stream until it ends.
+
+    Args:
+        hub: Topic hub.
+        topic: ``logs:<name>``.
+        stream: Stream returned by ``follow_logs``.
+        last: Timestamp of the last line already published, if any.
+
+    Returns:
+        Timestamp of the last line published.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    threading.Thread(
+        target=_pump_logs,
+        args=(stream, asyncio.get_running_loop(), queue),
+        name=f"hub-{topic}",
+        daemon=True,
+    ).start()
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                return last
+            text = chunk.decode("utf-8", errors="ignore")
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                stamp = _log_time(line)
+                if stamp is not None:
+                    if last is not None and stamp <= last:
+                        continue
+                    last = stamp
+                hub.publish(topic, line, retain=False)
+    finally:
+        # Unblocks the reader thread
+        stream.close()
+
+
+hub.register("containers", collect_containers)
+hub.register("stats", collect_stats)
+hub.register("system", collect_system)
+hub.register("alerts", collect_alerts)
+hub.register("logs", collect_logs)
+
+
+def _apply(connection: HubConnection, action: str, topics: Any) -> None:
+    """Subscribe or unsubscribe a connection and acknowledge it.
+
+    Args:
+        connection: Client connection.
+        action: ``subscribe`` or ``unsubscribe``.
+        topics: List of topics or comma-separated string.
+    """
+    names: Iterable[str] = (
+        parse_topics(topics) if isinstance(topics, str) else topics
+    )
+    for topic in names:
+        if action == "unsubscribe":
+            hub.unsubscribe(connection, str(topic))
+            continue
+        try:
+            hub.subscribe(connection, str(topic))
+        except ValueError as e:
+            connection.offer(dumps({"error": str(e)}).decode("utf-8"))
+    connection.offer(
+        dumps({"topics": sorted(connection.topics)}).decode("utf-8")
+    )
+
+
+@router.websocket("")
+async def hub_socket(
+    websocket: WebSocket,
+    topics: Optional[str] = Query(
+        None, description="Comma-separated topics to subscribe to"
+    ),
+) -> None:
+    """Stream live updates for subscribed topics over one WebSocket.
+
+    Topics: ``containers``, ``stats:<name>``, ``stats:*``, ``system``,
+    ``alerts`` and ``logs:<name>``. Subscribe with ``?topics=`` or by
+    sending ``{"subscribe": [...]}`` / ``{"unsubscribe": [...]}``; each
+    change is acknowledged with ``{"topics": [...]}``. Updates arrive as
+    ``{"topic": ..., "data": ...}`` and collector failures as
+    ``{"topic": ..., "error": ...}``. A client that reads too slowly
+    loses its oldest pending updates instead of slowing others down.
+
+    Args:
+        websocket: Client connection.
+        topics: Comma-separated topics to subscribe to on connect.
+
+    Example:
+        ws://localhost:8000/api/v1/ws?topics=containers,stats:*
+        -> {"subscribe": ["logs:local-postgres"]}
+    """
+    await websocket.accept()
+    connection = HubConnection(
+        websocket.send_text, queue_size=settings.ws_send_queue_size
+    )
+    hub.connect(connection)
+    writer = asyncio.create_task(connection.run())
+    try:
+        if topics:
+            _apply(connection, "subscribe", topics)
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except ValueError:
+                message = None
+            if not isinstance(message, dict):
+                connection.offer(
+                    dumps({"error": "Expected a JSON object"}).decode("utf-8")
+                )
+                continue
+            for action in ("subscribe", "unsubscribe"):
+                if action in message:
+                    _apply(connection, action, message[action])
+    except WebSocketDisconnect:
+        pass
+    finally:
+        hub.disconnect(connection)
+        writer.cancel()
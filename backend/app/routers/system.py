@@ -1,12 +1,13 @@
 """System router - API endpoints for system resource monitoring.
 
 This module defines REST API endpoints for retrieving host system
-resource metrics including CPU, memory, and disk usage.
+resource metrics including CPU, memory, disk and IO usage.
 """
 
 from fastapi import APIRouter
 
 from app.controllers import SystemController
+from app.core.sampling import demand
 from app.schemas import SystemMetrics
 
 router = APIRouter(prefix="/api/v1/system", tags=["System"])
@@ -16,8 +17,10 @@ router = APIRouter(prefix="/api/v1/system", tags=["System"])
 async def get_system_metrics() -> SystemMetrics:
     """Get host system resource metrics.
 
-    Retrieves real-time CPU usage, memory statistics, and disk space
-    information for the host machine.
+    Retrieves CPU usage (overall and per core), load average, memory,
+    swap, the usage of every ``HOST_MOUNTS`` filesystem and disk and
+    network IO rates from the latest host snapshot. Reads also speed up
+    host sampling for WebSocket ``system`` subscribers for a while.
 
     Returns:
         System resource metrics.
@@ -40,7 +43,16 @@ async def get_system_metrics() -> SystemMetrics:
                 "total_gb": 936.79,
                 "used_gb": 583.07,
                 "percent": 65.6
-            }
+            },
+            "cpu_per_core": [30.2, 12.5, 25.0, 19.5],
+            "load_average": {"load_1m": 1.12, ...},
+            "swap": {"total_gb": 2.0, "used_gb": 0.25, "percent": 12.5},
+            "mounts": [{"path": "/var/lib/docker", "free_gb": 232.6, ...}],
+            "disk_io": {"read_bytes_per_sec": 52428.8, ...},
+            "network_io": {"recv_bytes_per_sec": 20480.0, ...},
+            "sampled_at": "2025-10-29T20:42:25.695125+00:00",
+            "window_seconds": 5.002
         }
     """
+    demand.touch("host")
     return SystemController.get_metrics()
@@ -1,27 +1,82 @@
 """Volumes router - API endpoints for volume management."""
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
+from app.core.config import settings
+from app.core.events import event_bus
+from app.core.fast_json import SchemaEncoder, dumps
+from app.core.long_poll import set_revision_headers, wait_for_change
+from app.core.negotiation import (
+    if_none_match,
+    negotiated_response,
+    not_modified,
+)
+from app.core.revisions import revisions
+from app.repositories.disk_usage_repository import DiskUsageRepository
 from app.repositories.volume_repository import VolumeRepository
-from app.schemas.volume import VolumeInfo
+from app.schemas.volume import VolumeDiskUsage, VolumeInfo, VolumeMount
 
 router = APIRouter(prefix="/api/v1/volumes", tags=["Volumes"])
 
 repository = VolumeRepository()
+volume_encoder = SchemaEncoder(VolumeInfo)
 
 
 @router.get("", response_model=List[VolumeInfo])
-async def list_volumes() -> List[VolumeInfo]:
+async def list_volumes(
+    request: Request,
+    wait_for_revision: Optional[str] = Query(
+        None, description="Wait until the revision passes this token"
+    ),
+    timeout: float = Query(
+        30.0,
+        ge=0,
+        le=settings.long_poll_max_timeout,
+        description="Seconds to wait for a new revision",
+    ),
+) -> Response:
     """List all Docker volumes.
 
+    The ``ETag`` follows the volume revision, bumped by volume events,
+    container create/destroy and size changes in a new ``df()``
+    snapshot. While the snapshot is fresh and the events stream is up,
+    ``If-None-Match`` is answered with 304 without calling Docker.
+    ``X-Revision`` carries the revision token for ``wait_for_revision``
+    long-polls (``X-Revision-Resync: true`` when a token from another
+    worker could not be used).
+
+    Args:
+        request: Incoming request, used for content negotiation.
+        wait_for_revision: Revision token the client already has.
+        timeout: Seconds to wait for a newer revision.
+
     Returns:
         List of volume information.
     """
+    resync = await wait_for_change(
+        request, "volumes", wait_for_revision, timeout
+    )
+    etag = revisions.etag("volumes")
+    if (
+        not resync
+        and event_bus.connected
+        and DiskUsageRepository.is_fresh()
+        and if_none_match(request, etag)
+    ):
+        response = not_modified(etag)
+        set_revision_headers(response, "volumes")
+        return response
+
     try:
-        volumes = repository.list_volumes()
-        return [VolumeInfo(**v) for v in volumes]
+        volumes = volume_encoder.encode_many(repository.list_volumes())
+        revisions.observe("volumes", hash(dumps(volumes)))
+        response = negotiated_response(
+            request, volumes, etag=revisions.etag("volumes")
+        )
+        set_revision_headers(response, "volumes", resync)
+        return response
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -44,3 +99,58 @@ async def get_unused_volumes() -> List[str]:
             detail=f"Failed to get unused volumes: {str(e)}",
         )
 
+
+@router.get("/disk-usage", response_model=List[VolumeDiskUsage])
+async def get_disk_usage() -> List[VolumeDiskUsage]:
+    """Get scanned disk usage of volumes and bind mounts.
+
+    Sizes come from the throttled background scanner, each with the time
+    it was last measured. Targets not scanned yet are omitted.
+
+    Returns:
+        Disk usage entries, largest first.
+
+    Raises:
+        500: Failed to read scan results.
+
+    Example:
+        GET /api/v1/volumes/disk-usage
+    """
+    try:
+        return [VolumeDiskUsage(**u) for u in repository.get_disk_usage()]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get disk usage: {str(e)}",
+        )
+
+
+@router.get("/{name}/consumers", response_model=List[VolumeMount])
+async def get_volume_consumers(name: str) -> List[VolumeMount]:
+    """Get containers that mount a volume.
+
+    Args:
+        name: Volume name.
+
+    Returns:
+        Mounts of the volume, one per container.
+
+    Raises:
+        404: Volume not found.
+        500: Failed to retrieve consumers.
+
+    Example:
+        GET /api/v1/volumes/postgres_data/consumers
+    """
+    try:
+        consumers = repository.get_volume_consumers(name)
+        return [VolumeMount(**m) for m in consumers]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get volume consumers: {str(e)}",
+        )
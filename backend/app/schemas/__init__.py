@@ -1,25 +1,85 @@
 """Pydantic schemas."""
 
 from .alert import Alert, AlertsResponse
+from .build import (
+    BuildCacheBucket,
+    BuildCachePruneResult,
+    BuildCacheReport,
+    BuildStatus,
+)
+from .compose import ComposeBuild, ComposeService
 from .container import (
     ContainerAction,
+    ContainerChanges,
     ContainerInfo,
     ContainerLogs,
     ContainerStats,
 )
-from .health import HealthResponse
-from .system import SystemMetrics
-from .volume import CleanupResult, VolumeInfo
+from .health import HealthResponse, LivenessResponse, ReadinessResponse
+from .image import ImageGroupSummary, ImageInfo, ImageInventory
+from .system import (
+    CollectorStatus,
+    DiskIORates,
+    LoadAverage,
+    MountUsage,
+    NetworkIORates,
+    SystemMetrics,
+)
+from .volume import (
+    CleanupPlan,
+    CleanupPlanCategory,
+    CleanupPlanFailure,
+    CleanupPlanItem,
+    CleanupPlanResult,
+    CleanupPolicyStatus,
+    CleanupResult,
+    CleanupRun,
+    CleanupStep,
+    EvictedImage,
+    ImageEvictionResult,
+    VolumeDiskUsage,
+    VolumeInfo,
+    VolumeMount,
+)
 
 __all__ = [
     "ContainerInfo",
     "ContainerAction",
     "ContainerStats",
     "ContainerLogs",
+    "ContainerChanges",
     "SystemMetrics",
+    "MountUsage",
+    "LoadAverage",
+    "DiskIORates",
+    "NetworkIORates",
+    "CollectorStatus",
     "HealthResponse",
+    "LivenessResponse",
+    "ReadinessResponse",
     "Alert",
     "AlertsResponse",
+    "VolumeDiskUsage",
     "VolumeInfo",
+    "VolumeMount",
     "CleanupResult",
+    "CleanupStep",
+    "EvictedImage",
+    "ImageEvictionResult",
+    "CleanupPlan",
+    "CleanupPlanCategory",
+    "CleanupPlanFailure",
+    "CleanupPlanItem",
+    "CleanupPlanResult",
+    "CleanupPolicyStatus",
+    "CleanupRun",
+    "BuildStatus",
+    "BuildCacheBucket",
+    "BuildCacheReport",
+    "BuildCachePruneResult",
+    "ComposeBuild",
+    "ComposeService",
+    "ImageInfo",
+    "ImageGroupSummary",
+    "ImageInventory",
 ]
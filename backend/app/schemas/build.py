@@ -0,0 +1,72 @@
+"""Build schemas for compose service build status."""
+
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BuildStatus(BaseModel):
+    """Build status of a compose service.
+
+    Compares the fingerprint of the service's build context with the
+    fingerprint label stamped on its current image.
+    """
+
+    service: str = Field(..., description="Compose service name")
+    context: str = Field(..., description="Build context directory")
+    image: str = Field(..., description="Image tag used by the service")
+    fingerprint: str = Field(..., description="Build context fingerprint")
+    image_fingerprint: Optional[str] = Field(
+        default=None, description="Fingerprint label on the current image"
+    )
+    stale: bool = Field(..., description="Service needs a rebuild")
+
+    class Config:
+        """Pydantic configuration."""
+
+        json_schema_extra = {
+            "example": {
+                "service": "api",
+                "context": "/srv/my-local-place/backend",
+                "image": "my-local-place-api",
+                "fingerprint": "9f2c...e41a",
+                "image_fingerprint": "07be...c3d9",
+                "stale": True,
+            }
+        }
+
+
+class BuildCacheBucket(BaseModel):
+    """Build cache records grouped by type or age."""
+
+    count: int = Field(..., description="Number of cache records")
+    size_bytes: int = Field(..., description="Total size in bytes")
+
+
+class BuildCacheReport(BaseModel):
+    """BuildKit cache usage against the keep-storage budget."""
+
+    total_bytes: int = Field(..., description="Size of all cache records")
+    reclaimable_bytes: int = Field(..., description="Size not in use")
+    record_count: int = Field(..., description="Number of cache records")
+    by_type: Dict[str, BuildCacheBucket] = Field(
+        ..., description="Records by type (regular, source.local, ...)"
+    )
+    by_age: Dict[str, BuildCacheBucket] = Field(
+        ..., description="Records by time since last use"
+    )
+    budget_bytes: int = Field(..., description="Keep-storage budget")
+    over_budget_bytes: int = Field(..., description="Bytes over budget")
+
+
+class BuildCachePruneResult(BaseModel):
+    """Result of pruning the build cache to its budget."""
+
+    total_bytes_before: int = Field(..., description="Cache size before")
+    caches_deleted: int = Field(
+        default=0, description="Cache records removed"
+    )
+    space_freed_bytes: int = Field(..., description="Bytes reclaimed")
+    total_bytes_after: int = Field(..., description="Cache size after")
+    budget_bytes: int = Field(..., description="Keep-storage budget")
+    within_budget: bool = Field(..., description="Cache fits the budget")
@@ -0,0 +1,61 @@
+"""Compose schemas for the compose service catalog."""
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ComposeBuild(BaseModel):
+    """Build section of a compose service."""
+
+    context: str = Field(..., description="Build context directory")
+    dockerfile: str = Field(..., description="Dockerfile relative path")
+    target: Optional[str] = Field(default=None, description="Build target")
+    args: Dict[str, str] = Field(
+        default_factory=dict, description="Build arguments"
+    )
+
+
+class ComposeService(BaseModel):
+    """Compose service catalog entry.
+
+    Describes a service as declared in the compose files, whether or not
+    a container exists for it yet.
+    """
+
+    name: str = Field(..., description="Compose service name")
+    file: str = Field(..., description="Compose file declaring the service")
+    container_name: Optional[str] = Field(
+        default=None, description="Explicit container name"
+    )
+    image: Optional[str] = Field(default=None, description="Image tag")
+    build: Optional[ComposeBuild] = Field(
+        default=None, description="Build section"
+    )
+    depends_on: List[str] = Field(
+        default_factory=list, description="Service dependencies"
+    )
+    ports: List[str] = Field(default_factory=list, description="Port mappings")
+    volumes: List[str] = Field(
+        default_factory=list, description="Volume mounts"
+    )
+    profiles: List[str] = Field(
+        default_factory=list, description="Compose profiles"
+    )
+
+    class Config:
+        """Pydantic configuration."""
+
+        json_schema_extra = {
+            "example": {
+                "name": "local-postgres",
+                "file": "/srv/my-local-place/docker-compose.yml",
+                "container_name": "local-postgres",
+                "image": "postgres:17-alpine",
+                "build": None,
+                "depends_on": [],
+                "ports": ["5432:5432"],
+                "volumes": ["postgres_data:/data/postgres"],
+                "profiles": ["services"],
+            }
+        }
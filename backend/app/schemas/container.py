@@ -4,7 +4,7 @@ This module defines Pydantic models for Docker container-related
 data structures, ensuring type safety and automatic validation.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -24,6 +24,9 @@ class ContainerInfo(BaseModel):
         ports: List of port mappings (e.g., ['8000:80/tcp']).
         created: ISO 8601 creation timestamp.
         running: True if container is currently running.
+        size_rw_bytes: Cached writable layer size, if measured.
+        size_root_fs_bytes: Cached total filesystem size, if measured.
+        size_measured_at: ISO 8601 time the sizes were measured.
 
     Example:
         >>> info = ContainerInfo(
@@ -46,6 +49,15 @@ class ContainerInfo(BaseModel):
     ports: List[str] = Field(default_factory=list, description="Port mappings")
     created: str = Field(..., description="Creation timestamp")
     running: bool = Field(..., description="Is container running")
+    size_rw_bytes: Optional[int] = Field(
+        default=None, description="Writable layer size (cached)"
+    )
+    size_root_fs_bytes: Optional[int] = Field(
+        default=None, description="Total filesystem size (cached)"
+    )
+    size_measured_at: Optional[str] = Field(
+        default=None, description="When the sizes were measured"
+    )
 
     class Config:
         """Pydantic configuration."""
@@ -177,3 +189,52 @@ class ContainerLogs(BaseModel):
                 "tail": 2,
             }
         }
+
+
+class ContainerChanges(BaseModel):
+    """Container list changes since a revision (delta sync).
+
+    Attributes:
+        revision: Token to send as ``since`` on the next request.
+        full_resync: True if the client's revision is unknown or was
+            compacted away; ``added`` then holds the full list.
+        added: Containers created since the revision.
+        updated: Containers changed since the revision.
+        removed: Short IDs of containers removed since the revision.
+
+    Example:
+        >>> changes = ContainerChanges(
+        ...     revision="3f9a1c2e.42",
+        ...     full_resync=False,
+        ...     added=[],
+        ...     updated=[],
+        ...     removed=["abc123def456"],
+        ... )
+    """
+
+    revision: str = Field(..., description="Revision token for next sync")
+    full_resync: bool = Field(
+        False, description="Full list returned in added"
+    )
+    added: List[ContainerInfo] = Field(
+        default_factory=list, description="Created containers"
+    )
+    updated: List[ContainerInfo] = Field(
+        default_factory=list, description="Changed containers"
+    )
+    removed: List[str] = Field(
+        default_factory=list, description="Short IDs of removed containers"
+    )
+
+    class Config:
+        """Pydantic configuration."""
+
+        json_schema_extra = {
+            "example": {
+                "revision": "3f9a1c2e.42",
+                "full_resync": False,
+                "added": [],
+                "updated": [],
+                "removed": ["abc123def456"],
+            }
+        }
@@ -5,6 +5,7 @@ used to verify API availability and Docker connectivity.
 """
 
 from datetime import datetime
+from typing import Optional
 
 from pydantic import BaseModel, Field
 
@@ -17,6 +18,7 @@ class HealthResponse(BaseModel):
     Attributes:
         status: Health status ('healthy' or 'unhealthy').
         docker_connected: Docker daemon connectivity status.
+        docker_latency_ms: Latest daemon ping latency, if known.
         timestamp: ISO 8601 timestamp of the check.
         version: API version string.
 
@@ -31,6 +33,9 @@ class HealthResponse(BaseModel):
 
     status: str = Field(..., description="Health status")
     docker_connected: bool = Field(..., description="Docker connection status")
+    docker_latency_ms: Optional[float] = Field(
+        default=None, description="Latest daemon ping latency (ms)"
+    )
     timestamp: str = Field(
         default_factory=lambda: datetime.utcnow().isoformat(),
         description="Timestamp",
@@ -48,3 +53,33 @@ class HealthResponse(BaseModel):
                 "version": "2.0.0",
             }
         }
+
+
+class LivenessResponse(BaseModel):
+    """Liveness probe response; only reports that the API process runs."""
+
+    status: str = Field(default="alive", description="Always 'alive'")
+    timestamp: str = Field(
+        default_factory=lambda: datetime.utcnow().isoformat(),
+        description="Timestamp",
+    )
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness probe response built from the cached daemon probe."""
+
+    status: str = Field(..., description="'ready' or 'not_ready'")
+    docker_connected: bool = Field(..., description="Last ping succeeded")
+    last_latency_ms: Optional[float] = Field(
+        default=None, description="Latency of the last successful ping"
+    )
+    recent_latency_ms: Optional[float] = Field(
+        default=None, description="Mean latency of recent pings"
+    )
+    last_error: Optional[str] = Field(
+        default=None, description="Error of the last ping, if it failed"
+    )
+    consecutive_failures: int = Field(default=0, description="Failed pings")
+    checked_at: Optional[str] = Field(
+        default=None, description="Time of the last ping (ISO)"
+    )
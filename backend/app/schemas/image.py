@@ -0,0 +1,81 @@
+"""Image schemas for the Docker image inventory."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ImageInfo(BaseModel):
+    """Image with shared-layer aware sizes."""
+
+    id: str = Field(..., description="Image short ID")
+    tags: List[str] = Field(default_factory=list, description="Repo tags")
+    repository: str = Field(..., description="Repository of the first tag")
+    group: str = Field(..., description="Compose project or ungrouped")
+    size_bytes: int = Field(..., description="Full image size")
+    shared_size_bytes: int = Field(
+        ..., description="Size of layers shared with other images"
+    )
+    unique_size_bytes: int = Field(
+        ..., description="Size freed by removing only this image"
+    )
+    containers: int = Field(..., description="Containers using the image")
+    created: Optional[str] = Field(default=None, description="ISO timestamp")
+    last_used: Optional[str] = Field(
+        default=None, description="Last container create/start (ISO)"
+    )
+
+
+class ImageGroupSummary(BaseModel):
+    """Image sizes totalled per repository or compose project."""
+
+    name: str = Field(..., description="Repository or group name")
+    image_count: int = Field(..., description="Number of images")
+    unique_size_bytes: int = Field(
+        ...,
+        description="Sum of unique sizes; layers shared within the group "
+        "are not included",
+    )
+    size_bytes: int = Field(
+        ...,
+        description="Sum of full sizes; layers shared within the group "
+        "count once per image",
+    )
+
+
+class ImageInventory(BaseModel):
+    """All images with per-repository and per-group totals."""
+
+    images: List[ImageInfo] = Field(default_factory=list)
+    repositories: List[ImageGroupSummary] = Field(default_factory=list)
+    groups: List[ImageGroupSummary] = Field(default_factory=list)
+    total_size_bytes: int = Field(..., description="Disk used by all layers")
+    naive_size_bytes: int = Field(
+        ..., description="Sum of image sizes, double-counting shared layers"
+    )
+
+    class Config:
+        """Pydantic configuration."""
+
+        json_schema_extra = {
+            "example": {
+                "images": [
+                    {
+                        "id": "3f4e9a1c2b7d",
+                        "tags": ["ollama/ollama:latest"],
+                        "repository": "ollama/ollama",
+                        "group": "ungrouped",
+                        "size_bytes": 3221225472,
+                        "shared_size_bytes": 77594624,
+                        "unique_size_bytes": 3143630848,
+                        "containers": 1,
+                        "created": "2025-11-20T09:12:00+00:00",
+                        "last_used": "2025-12-04T08:00:00+00:00",
+                    }
+                ],
+                "repositories": [],
+                "groups": [],
+                "total_size_bytes": 9663676416,
+                "naive_size_bytes": 11811160064,
+            }
+        }
@@ -4,6 +4,8 @@ This module defines Pydantic models for system resource metrics,
 including CPU, memory, and disk usage information.
 """
 
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -71,16 +73,66 @@ class DiskInfo(BaseModel):
         }
 
 
+class MountUsage(BaseModel):
+    """Filesystem usage of one configured mount.
+
+    Attributes:
+        path: Mount path as configured in ``HOST_MOUNTS``.
+        total_gb: Filesystem size in gigabytes.
+        used_gb: Used space in gigabytes.
+        free_gb: Space available in gigabytes.
+        percent: Usage percentage (0-100).
+    """
+
+    path: str = Field(..., description="Mount path")
+    total_gb: float = Field(..., description="Filesystem size in GB")
+    used_gb: float = Field(..., description="Used space in GB")
+    free_gb: float = Field(..., description="Available space in GB")
+    percent: float = Field(..., description="Usage percentage")
+
+
+class LoadAverage(BaseModel):
+    """Host load averages over 1, 5 and 15 minutes."""
+
+    load_1m: float = Field(..., description="1 minute load average")
+    load_5m: float = Field(..., description="5 minute load average")
+    load_15m: float = Field(..., description="15 minute load average")
+
+
+class DiskIORates(BaseModel):
+    """Host disk IO rates between the last two snapshots."""
+
+    read_bytes_per_sec: float = Field(..., description="Bytes read/s")
+    write_bytes_per_sec: float = Field(..., description="Bytes written/s")
+    read_ops_per_sec: float = Field(..., description="Read operations/s")
+    write_ops_per_sec: float = Field(..., description="Write operations/s")
+
+
+class NetworkIORates(BaseModel):
+    """Host network IO rates between the last two snapshots."""
+
+    recv_bytes_per_sec: float = Field(..., description="Bytes received/s")
+    sent_bytes_per_sec: float = Field(..., description="Bytes sent/s")
+
+
 class SystemMetrics(BaseModel):
     """System resource metrics model.
 
     Aggregates CPU, memory, and disk usage information
-    for the host system.
+    for the host system, taken from one consolidated snapshot.
 
     Attributes:
         cpu_percent: CPU usage as percentage (0-100+).
         memory: Memory usage information.
-        disk: Disk space information.
+        disk: Disk space of the first configured mount.
+        cpu_per_core: CPU usage of each core.
+        load_average: 1, 5 and 15 minute load averages.
+        swap: Swap usage information.
+        mounts: Usage of every configured mount.
+        disk_io: Disk IO rates (None on the first snapshot).
+        network_io: Network IO rates (None on the first snapshot).
+        sampled_at: ISO 8601 time the snapshot was taken.
+        window_seconds: Seconds the usage and rates are measured over.
 
     Example:
         >>> metrics = SystemMetrics(
@@ -93,6 +145,30 @@ class SystemMetrics(BaseModel):
     cpu_percent: float = Field(..., description="CPU usage percentage")
     memory: MemoryInfo = Field(..., description="Memory information")
     disk: DiskInfo = Field(..., description="Disk information")
+    cpu_per_core: List[float] = Field(
+        default_factory=list, description="CPU usage percentage per core"
+    )
+    load_average: Optional[LoadAverage] = Field(
+        default=None, description="Load averages"
+    )
+    swap: Optional[MemoryInfo] = Field(
+        default=None, description="Swap information"
+    )
+    mounts: List[MountUsage] = Field(
+        default_factory=list, description="Configured mounts"
+    )
+    disk_io: Optional[DiskIORates] = Field(
+        default=None, description="Disk IO rates"
+    )
+    network_io: Optional[NetworkIORates] = Field(
+        default=None, description="Network IO rates"
+    )
+    sampled_at: Optional[str] = Field(
+        default=None, description="Snapshot time (ISO 8601)"
+    )
+    window_seconds: Optional[float] = Field(
+        default=None, description="Measurement window in seconds"
+    )
 
     class Config:
         """Pydantic configuration."""
@@ -110,5 +186,101 @@ class SystemMetrics(BaseModel):
                     "used_gb": 583.07,
                     "percent": 65.6,
                 },
+                "cpu_per_core": [30.2, 12.5, 25.0, 19.5],
+                "load_average": {
+                    "load_1m": 1.12,
+                    "load_5m": 0.98,
+                    "load_15m": 0.85,
+                },
+                "swap": {"total_gb": 2.0, "used_gb": 0.25, "percent": 12.5},
+                "mounts": [
+                    {
+                        "path": "/",
+                        "total_gb": 936.79,
+                        "used_gb": 583.07,
+                        "free_gb": 306.1,
+                        "percent": 65.6,
+                    },
+                    {
+                        "path": "/var/lib/docker",
+                        "total_gb": 467.87,
+                        "used_gb": 211.4,
+                        "free_gb": 232.6,
+                        "percent": 47.6,
+                    },
+                ],
+                "disk_io": {
+                    "read_bytes_per_sec": 52428.8,
+                    "write_bytes_per_sec": 1048576.0,
+                    "read_ops_per_sec": 4.2,
+                    "write_ops_per_sec": 38.0,
+                },
+                "network_io": {
+                    "recv_bytes_per_sec": 20480.0,
+                    "sent_bytes_per_sec": 8192.0,
+                },
+                "sampled_at": "2025-10-29T20:42:25.695125+00:00",
+                "window_seconds": 5.002,
             }
         }
+
+
+class CollectorStatus(BaseModel):
+    """Background collector configuration and self-metrics.
+
+    Attributes:
+        name: Collector name.
+        executor: Where runs execute (loop, thread or io).
+        interval: Seconds between runs.
+        running: Whether a run is in progress.
+        runs: Completed runs.
+        errors: Runs that raised.
+        timeouts: Runs that exceeded the timeout.
+        skipped: Ticks skipped while the previous run was going.
+        max_lag_seconds: Largest delay of a run's start.
+        cpu_seconds: CPU time of executor runs.
+
+    Example:
+        >>> status = CollectorStatus(
+        ...     name="docker_health", executor="thread", interval=5.0,
+        ...     running=False, runs=120, errors=0, timeouts=0, skipped=0,
+        ...     max_lag_seconds=0.004, cpu_seconds=0.21
+        ... )
+    """
+
+    name: str = Field(..., description="Collector name")
+    executor: str = Field(..., description="loop, thread or io")
+    interval: float = Field(..., description="Seconds between runs")
+    jitter: float = Field(default=0.0, description="Maximum jitter (s)")
+    timeout: Optional[float] = Field(default=None, description="Timeout (s)")
+    cpu_budget: Optional[float] = Field(
+        default=None, description="Share of one core allowed on average"
+    )
+    io_budget: Optional[float] = Field(
+        default=None, description="Share of wall time allowed running"
+    )
+    running: bool = Field(..., description="Run in progress")
+    runs: int = Field(..., description="Completed runs")
+    errors: int = Field(..., description="Runs that raised")
+    timeouts: int = Field(..., description="Runs past the timeout")
+    skipped: int = Field(..., description="Ticks skipped (overlap)")
+    last_duration_seconds: Optional[float] = Field(
+        default=None, description="Duration of the last run"
+    )
+    avg_duration_seconds: Optional[float] = Field(
+        default=None, description="Mean run duration"
+    )
+    last_lag_seconds: Optional[float] = Field(
+        default=None, description="Delay of the last run's start"
+    )
+    max_lag_seconds: float = Field(..., description="Largest start delay")
+    cpu_seconds: float = Field(..., description="CPU time of runs")
+    last_error: Optional[str] = Field(
+        default=None, description="Error of the last run, if it failed"
+    )
+    last_run_at: Optional[str] = Field(
+        default=None, description="ISO 8601 end time of the last run"
+    )
+    next_run_in_seconds: Optional[float] = Field(
+        default=None, description="Seconds until the next run"
+    )
@@ -1,6 +1,6 @@
 """Volume schemas for Docker volume management."""
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -16,6 +16,50 @@ class VolumeInfo(BaseModel):
         default_factory=dict, description="Volume labels"
     )
     scope: str = Field(..., description="Volume scope")
+    size_bytes: Optional[int] = Field(
+        default=None, description="Disk usage in bytes (None if unknown)"
+    )
+    size_mb: Optional[float] = Field(
+        default=None, description="Disk usage in MB (None if unknown)"
+    )
+    ref_count: Optional[int] = Field(
+        default=None, description="Number of containers referencing it"
+    )
+    in_use: Optional[bool] = Field(
+        default=None, description="Referenced by at least one container"
+    )
+
+
+class VolumeMount(BaseModel):
+    """Named volume mounted by a container."""
+
+    volume: str = Field(..., description="Volume name")
+    container_id: str = Field(..., description="Container short ID")
+    container_name: str = Field(..., description="Container name")
+    destination: str = Field(..., description="Mount path in the container")
+    read_only: bool = Field(default=False, description="Mounted read-only")
+
+
+class VolumeDiskUsage(BaseModel):
+    """Scanned disk usage of a volume or bind-mount directory."""
+
+    name: str = Field(..., description="Volume name or bind path")
+    kind: str = Field(..., description="volume or bind")
+    path: str = Field(..., description="Scanned host path")
+    size_bytes: int = Field(..., description="Total size in bytes")
+    file_count: int = Field(..., description="Number of files")
+    last_scanned: str = Field(..., description="ISO timestamp of last scan")
+    scan_seconds: float = Field(..., description="Duration of last scan")
+
+
+class CleanupStep(BaseModel):
+    """Outcome of one cleanup_all step."""
+
+    name: str = Field(..., description="Step name")
+    duration_seconds: float = Field(..., description="Step duration")
+    space_freed_mb: float = Field(default=0.0, description="Space freed in MB")
+    deleted: int = Field(default=0, description="Objects deleted")
+    error: Optional[str] = Field(default=None, description="Failure reason")
 
 
 class CleanupResult(BaseModel):
@@ -33,4 +77,98 @@ class CleanupResult(BaseModel):
     total_freed_mb: float = Field(
         ..., description="Total space freed in MB"
     )
+    steps: List[CleanupStep] = Field(
+        default_factory=list, description="Per-step report"
+    )
+
+
+class CleanupPlanItem(BaseModel):
+    """Object a cleanup plan would remove."""
+
+    id: str = Field(..., description="Object ID (volume name for volumes)")
+    name: str = Field(..., description="Human readable name")
+    size_bytes: int = Field(..., description="Bytes reclaimed by removal")
+
+
+class CleanupPlanCategory(BaseModel):
+    """Planned removals for one cleanup category."""
+
+    items: List[CleanupPlanItem] = Field(default_factory=list)
+    count: int = Field(..., description="Number of objects")
+    reclaimable_bytes: int = Field(..., description="Bytes reclaimable")
+
+
+class CleanupPlan(BaseModel):
+    """Dry-run result of a cleanup."""
+
+    plan_id: str = Field(..., description="Identifier used to execute it")
+    created_at: str = Field(..., description="ISO timestamp of the plan")
+    snapshot_age: float = Field(..., description="Age of the df snapshot (s)")
+    categories: Dict[str, CleanupPlanCategory] = Field(
+        ..., description="containers, images, volumes and build_cache"
+    )
+    total_reclaimable_bytes: int = Field(..., description="Sum of categories")
+
+
+class CleanupPlanFailure(BaseModel):
+    """Planned object that could not be removed."""
+
+    category: str
+    id: str
+    error: str
+
+
+class EvictedImage(BaseModel):
+    """Image chosen for LRU eviction."""
+
+    id: str = Field(..., description="Image ID")
+    name: str = Field(..., description="First repo tag or <none>")
+    size_bytes: int = Field(..., description="Bytes unique to the image")
+    last_used: float = Field(..., description="Last use (epoch seconds)")
+
+
+class ImageEvictionResult(BaseModel):
+    """Result of an LRU image eviction."""
 
+    evicted: List[EvictedImage] = Field(default_factory=list)
+    failed: List[CleanupPlanFailure] = Field(default_factory=list)
+    space_freed_bytes: int = Field(..., description="Bytes reclaimed")
+    images_bytes: int = Field(..., description="Image size before eviction")
+    budget_bytes: int = Field(..., description="Target image size")
+
+
+class CleanupPlanResult(BaseModel):
+    """Result of executing a cleanup plan."""
+
+    plan_id: str
+    removed: Dict[str, int] = Field(..., description="Removed per category")
+    failed: List[CleanupPlanFailure] = Field(default_factory=list)
+    space_freed_bytes: int = Field(..., description="Bytes reclaimed")
+
+
+class CleanupPolicyStatus(BaseModel):
+    """Configured background cleanup policy and when it is next due."""
+
+    name: str
+    action: str
+    older_than_hours: Optional[float] = None
+    dangling_only: bool = True
+    keep_storage_gb: Optional[float] = None
+    disk_percent_above: Optional[float] = None
+    min_interval_minutes: float
+    seconds_until_due: int = Field(..., description="0 when due now")
+
+
+class CleanupRun(BaseModel):
+    """One background cleanup policy run."""
+
+    policy: str
+    action: str
+    started_at: str = Field(..., description="ISO timestamp")
+    duration_seconds: float
+    deleted: int = 0
+    space_freed_bytes: int = 0
+    interrupted: bool = Field(
+        default=False, description="Stopped early for deadline or traffic"
+    )
+    error: Optional[str] = None
@@ -16,12 +16,14 @@ Commands:
   dev           Start development server (hot reload)
   runserver     Start production server (multi-worker)
   health        Check API health and Docker connectivity
+  import-profile  Profile app import time (fails above IMPORT_BUDGET_MS)
   *             Display this help message
 
 Environment Variables:
   PORT          Server port (default: 8000)
   WORKERS       Number of workers for production (default: 4)
   LOG_LEVEL     Logging level (default: info)
+  IMPORT_BUDGET_MS  Import time budget for import-profile (default: 1500)
 "
   exit 1
 }
@@ -104,6 +106,10 @@ case "${1:-runserver}" in
     echo "API is ready to start"
     ;;
 
+  import-profile)
+    exec python -m app.core.startup --budget-ms "${IMPORT_BUDGET_MS:-1500}"
+    ;;
+
   *)
     cli_help
     ;;
@@ -0,0 +1,67 @@
+"""Unit tests for AlertController."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.controllers.alert_controller import AlertController
+
+
+def _snapshot(cpu, memory=40.0, disk=50.0):
+    return {
+        "cpu_percent": cpu,
+        "memory": {"percent": memory},
+        "disk": {"percent": disk},
+    }
+
+
+@pytest.fixture
+def mock_host():
+    """Patch the host snapshot and leave the daemon unprobed."""
+    with patch(
+        "app.controllers.alert_controller.host_metrics"
+    ) as host, patch(
+        "app.controllers.alert_controller.daemon_health"
+    ) as health:
+        health.probed = False
+        yield host
+
+
+def test_state_key_follows_alert_values(mock_host):
+    """Test the key changes with the value shown by a raised alert."""
+    mock_host.latest.return_value = _snapshot(cpu=86.0)
+    first = AlertController.state_key()
+
+    mock_host.latest.return_value = _snapshot(cpu=88.5)
+    second = AlertController.state_key()
+
+    assert first != second
+    assert second[0] == (("cpu", "warning", "CPU usage high: 88.5%", 88.5),)
+
+
+def test_state_key_ignores_values_below_thresholds(mock_host):
+    """Test values that raise no alert do not change the key."""
+    mock_host.latest.return_value = _snapshot(cpu=10.0, memory=20.0)
+    first = AlertController.state_key()
+
+    mock_host.latest.return_value = _snapshot(cpu=35.0, memory=60.0)
+
+    assert AlertController.state_key() == first
+
+
+def test_state_key_matches_rendered_alerts(mock_host):
+    """Test the key holds exactly the host alerts check_all renders."""
+    mock_host.latest.return_value = _snapshot(cpu=97.0, disk=90.0)
+
+    with patch(
+        "app.controllers.alert_controller.DockerRepository"
+    ), patch("app.controllers.alert_controller.VolumeRepository"):
+        alerts = AlertController.check_all()
+
+    assert AlertController.state_key()[0] == tuple(
+        (a["type"], a["level"], a["message"], a["value"]) for a in alerts
+    )
+    assert [a["message"] for a in alerts] == [
+        "CPU usage critically high: 97.0%",
+        "Disk usage high: 90.0%",
+    ]
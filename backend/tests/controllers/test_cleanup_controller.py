@@ -0,0 +1,127 @@
+"""Unit tests for cleanup controller."""
+
+import threading
+import time
+
+import pytest
+
+from app.controllers import cleanup_controller
+from app.controllers.cleanup_controller import CleanupController
+
+
+@pytest.fixture
+def steps(monkeypatch):
+    """Replace the prune steps with recorders."""
+    calls = []
+    containers_done = threading.Event()
+
+    def containers():
+        time.sleep(0.05)
+        calls.append("containers")
+        containers_done.set()
+        return {"containers_deleted": 2, "space_freed_mb": 1.5}
+
+    def images():
+        assert containers_done.is_set()
+        calls.append("images")
+        return {"images_deleted": 3, "space_freed_mb": 10.0}
+
+    def volumes():
+        assert containers_done.is_set()
+        raise RuntimeError("Failed to cleanup volumes: boom")
+
+    def build_cache():
+        calls.append("build_cache")
+        return {"build_cache_deleted": 5, "space_freed_mb": 4.0}
+
+    for name, func in {
+        "cleanup_containers": containers,
+        "cleanup_images": images,
+        "cleanup_volumes": volumes,
+        "cleanup_build_cache": build_cache,
+    }.items():
+        monkeypatch.setattr(CleanupController, name, staticmethod(func))
+    return calls
+
+
+def test_cleanup_all_isolates_failures(steps):
+    """Test a failing step keeps the results of the others."""
+    result = CleanupController.cleanup_all()
+
+    assert result["containers_deleted"] == 2
+    assert result["images_deleted"] == 3
+    assert result["volumes_deleted"] == 0
+    assert result["total_freed_mb"] == 15.5
+    reports = {step["name"]: step for step in result["steps"]}
+    assert reports["volumes"]["error"] == "Failed to cleanup volumes: boom"
+    assert reports["images"]["error"] is None
+    assert reports["build_cache"]["deleted"] == 5
+    assert steps.index("containers") < steps.index("images")
+
+
+def test_cleanup_all_step_timeout(steps, monkeypatch):
+    """Test a step exceeding its timeout is reported, not awaited."""
+    monkeypatch.setattr(
+        cleanup_controller.settings, "cleanup_step_timeout", 0.2
+    )
+    release = threading.Event()
+
+    def slow_build_cache():
+        release.wait(2)
+        return {"space_freed_mb": 99.0}
+
+    monkeypatch.setattr(
+        CleanupController,
+        "cleanup_build_cache",
+        staticmethod(slow_build_cache),
+    )
+
+    started = time.monotonic()
+    result = CleanupController.cleanup_all()
+    release.set()
+
+    assert time.monotonic() - started < 1
+    reports = {step["name"]: step for step in result["steps"]}
+    assert reports["build_cache"]["error"].startswith("Timed out")
+    assert result["total_freed_mb"] == 11.5
+
+
+def test_cleanup_all_blocked_by_containers(steps, monkeypatch):
+    """Test images and volumes wait out a failed containers step."""
+
+    def failing_containers():
+        raise RuntimeError("Failed to cleanup containers: busy")
+
+    monkeypatch.setattr(
+        CleanupController,
+        "cleanup_containers",
+        staticmethod(failing_containers),
+    )
+
+    result = CleanupController.cleanup_all()
+
+    reports = {step["name"]: step for step in result["steps"]}
+    assert reports["images"]["error"].startswith("Blocked by containers")
+    assert reports["volumes"]["error"].startswith("Blocked by containers")
+    assert "images" not in steps
+    assert reports["build_cache"]["error"] is None
+    assert result["total_freed_mb"] == 4.0
+
+
+def test_cleanup_build_cache_counts_deleted(monkeypatch):
+    """Test the build cache step reports the records the daemon removed."""
+    monkeypatch.setattr(
+        cleanup_controller.BuildCacheRepository,
+        "prune_to_budget",
+        lambda self: {"caches_deleted": 3, "space_freed_bytes": 1024**2},
+    )
+    monkeypatch.setattr(
+        cleanup_controller.BuildCacheRepository,
+        "__init__",
+        lambda self: None,
+    )
+
+    assert CleanupController.cleanup_build_cache() == {
+        "build_cache_deleted": 3,
+        "space_freed_mb": 1.0,
+    }
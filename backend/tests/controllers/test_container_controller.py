@@ -9,31 +9,30 @@ from app.controllers.container_controller import ContainerController
 from app.schemas import ContainerAction, ContainerInfo, ContainerLogs, ContainerStats
 
 
-def test_list_all_success(mock_docker_repository, sample_container_data):
-    """Test list_all returns container list."""
+def test_list_rows_matches_schema(
+    mock_docker_repository, sample_container_data
+):
+    """Test list_rows returns JSON-ready rows shaped like ContainerInfo."""
     mock_docker_repository.list_containers.return_value = [
         sample_container_data
     ]
 
-    result = ContainerController.list_all(mock_docker_repository, all=True)
+    result = ContainerController.list_rows(mock_docker_repository, all=False)
 
-    assert len(result) == 1
-    assert isinstance(result[0], ContainerInfo)
-    assert result[0].name == "test-container"
-    mock_docker_repository.list_containers.assert_called_once_with(all=True)
+    assert result == [
+        ContainerInfo(**sample_container_data).model_dump(mode="json")
+    ]
+    mock_docker_repository.list_containers.assert_called_once_with(all=False)
 
 
-def test_list_all_error(mock_docker_repository):
-    """Test list_all handles errors."""
-    mock_docker_repository.list_containers.side_effect = Exception(
-        "Docker error"
-    )
+def test_list_rows_error(mock_docker_repository):
+    """Test list_rows maps errors to 500."""
+    mock_docker_repository.list_containers.side_effect = Exception("boom")
 
     with pytest.raises(HTTPException) as exc:
-        ContainerController.list_all(mock_docker_repository)
+        ContainerController.list_rows(mock_docker_repository)
 
     assert exc.value.status_code == 500
-    assert "Failed to list containers" in exc.value.detail
 
 
 def test_get_details_success(mock_docker_repository, sample_container_data):
@@ -262,3 +261,44 @@ def test_get_stats_generic_error(mock_docker_repository):
 
     assert exc.value.status_code == 500
     assert "Failed to get stats" in exc.value.detail
+
+
+def test_get_changes_without_token_is_full_resync(
+    mock_docker_repository, sample_container_data
+):
+    """Test get_changes returns the full list when no token is given."""
+    mock_docker_repository.list_containers.return_value = [
+        sample_container_data
+    ]
+
+    result = ContainerController.get_changes(mock_docker_repository)
+
+    assert result["full_resync"] is True
+    assert [row["id"] for row in result["added"]] == ["abc123"]
+    mock_docker_repository.list_containers.assert_called_once_with(all=True)
+
+
+def test_get_changes_fetches_only_changed(
+    mock_docker_repository, sample_container_data
+):
+    """Test get_changes lists only changed containers by ID."""
+    from app.core.container_changes import container_changes
+
+    token = container_changes.token()
+    container_changes.record("abc123", "updated")
+    container_changes.record("vanished", "updated")
+    container_changes.record("deleted", "removed")
+    mock_docker_repository.list_containers.return_value = [
+        sample_container_data
+    ]
+
+    result = ContainerController.get_changes(mock_docker_repository, token)
+
+    assert result["full_resync"] is False
+    assert result["revision"] == container_changes.token()
+    assert result["added"] == []
+    assert [row["id"] for row in result["updated"]] == ["abc123"]
+    assert result["removed"] == ["deleted", "vanished"]
+    mock_docker_repository.list_containers.assert_called_once_with(
+        all=True, ids=["abc123", "vanished"]
+    )
@@ -1,6 +1,6 @@
 """Unit tests for SystemController."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from fastapi import HTTPException
@@ -8,41 +8,53 @@ from fastapi import HTTPException
 from app.controllers.system_controller import SystemController
 from app.schemas import SystemMetrics
 
-
-@patch("app.controllers.system_controller.psutil")
-def test_get_metrics_success(mock_psutil):
-    """Test get_metrics returns system metrics."""
-    mock_psutil.cpu_percent.return_value = 25.5
-
-    mock_memory = MagicMock()
-    mock_memory.total = 32 * 1024**3
-    mock_memory.used = 18 * 1024**3
-    mock_memory.percent = 56.25
-    mock_psutil.virtual_memory.return_value = mock_memory
-
-    mock_disk = MagicMock()
-    mock_disk.total = 1000 * 1024**3
-    mock_disk.used = 600 * 1024**3
-    mock_disk.percent = 60.0
-    mock_psutil.disk_usage.return_value = mock_disk
-
-    result = SystemController.get_metrics()
+SNAPSHOT = {
+    "cpu_percent": 25.5,
+    "cpu_per_core": [30.0, 21.0],
+    "load_average": {"load_1m": 1.5, "load_5m": 1.0, "load_15m": 0.5},
+    "memory": {"total_gb": 32.0, "used_gb": 18.0, "percent": 56.25},
+    "swap": {"total_gb": 2.0, "used_gb": 0.0, "percent": 0.0},
+    "disk": {"total_gb": 1000.0, "used_gb": 600.0, "percent": 60.0},
+    "mounts": [
+        {
+            "path": "/",
+            "total_gb": 1000.0,
+            "used_gb": 600.0,
+            "free_gb": 400.0,
+            "percent": 60.0,
+        }
+    ],
+    "disk_io": None,
+    "network_io": {"recv_bytes_per_sec": 10.0, "sent_bytes_per_sec": 5.0},
+    "sampled_at": "2025-10-29T20:42:25.695125+00:00",
+    "window_seconds": 5.0,
+}
+
+
+@patch("app.controllers.system_controller.host_metrics")
+def test_get_metrics_success(mock_host):
+    """Test get_metrics returns the host snapshot."""
+    mock_host.latest.return_value = SNAPSHOT
+
+    result = SystemController.get_metrics(max_age=5)
 
     assert isinstance(result, SystemMetrics)
     assert result.cpu_percent == 25.5
     assert result.memory.total_gb == 32.0
     assert result.disk.percent == 60.0
-    mock_psutil.cpu_percent.assert_called_once_with(interval=1)
+    assert result.cpu_per_core == [30.0, 21.0]
+    assert result.mounts[0].free_gb == 400.0
+    assert result.network_io.recv_bytes_per_sec == 10.0
+    mock_host.latest.assert_called_once_with(5)
 
 
-@patch("app.controllers.system_controller.psutil")
-def test_get_metrics_error(mock_psutil):
+@patch("app.controllers.system_controller.host_metrics")
+def test_get_metrics_error(mock_host):
     """Test get_metrics handles errors."""
-    mock_psutil.cpu_percent.side_effect = Exception("System error")
+    mock_host.latest.side_effect = Exception("System error")
 
     with pytest.raises(HTTPException) as exc:
         SystemController.get_metrics()
 
     assert exc.value.status_code == 500
     assert "Failed to get system metrics" in exc.value.detail
-
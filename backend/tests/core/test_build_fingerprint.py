@@ -0,0 +1,106 @@
+"""Unit tests for build context fingerprinting."""
+
+import os
+
+import pytest
+
+from app.core.build_fingerprint import BuildFingerprinter, DockerIgnore
+
+
+@pytest.fixture
+def context(tmp_path):
+    """Create a small build context."""
+    ctx = tmp_path / "ctx"
+    (ctx / "app").mkdir(parents=True)
+    (ctx / "node_modules" / "lib").mkdir(parents=True)
+    (ctx / "Dockerfile").write_text("FROM python:3.13-slim\n")
+    (ctx / "app" / "main.py").write_text("print('hi')\n")
+    (ctx / "node_modules" / "lib" / "index.js").write_text("x")
+    (ctx / ".dockerignore").write_text("node_modules\n*.log\n")
+    return ctx
+
+
+@pytest.fixture
+def fingerprinter(tmp_path):
+    """Create fingerprinter with a temporary cache file."""
+    return BuildFingerprinter(tmp_path / "state" / "fp.json")
+
+
+def test_dockerignore_directory_excludes_subtree():
+    """Test a directory pattern excludes everything below it."""
+    ignore = DockerIgnore(["node_modules"])
+
+    assert ignore.is_excluded("node_modules/react/index.js")
+    assert not ignore.is_excluded("src/node_modules.py")
+
+
+def test_dockerignore_globs_and_exceptions():
+    """Test wildcard, double-star and exception patterns."""
+    ignore = DockerIgnore(["*.log", "**/__pycache__", "!keep.log", "# c"])
+
+    assert ignore.is_excluded("debug.log")
+    assert not ignore.is_excluded("logs/debug.log")
+    assert ignore.is_excluded("app/core/__pycache__/x.pyc")
+    assert not ignore.is_excluded("keep.log")
+    assert ignore.has_exceptions
+
+
+def test_fingerprint_is_stable(context, fingerprinter):
+    """Test fingerprint does not change for an unchanged context."""
+    first = fingerprinter.fingerprint(context)
+    second = fingerprinter.fingerprint(context)
+
+    assert first == second
+    assert len(first) == 64
+
+
+def test_fingerprint_ignores_dockerignored_files(context, fingerprinter):
+    """Test changes in ignored files do not change the fingerprint."""
+    before = fingerprinter.fingerprint(context)
+    (context / "node_modules" / "lib" / "index.js").write_text("changed")
+    (context / "build.log").write_text("noise")
+
+    assert fingerprinter.fingerprint(context) == before
+
+
+def test_fingerprint_changes_with_content(context, fingerprinter):
+    """Test content changes produce a new fingerprint."""
+    before = fingerprinter.fingerprint(context)
+    (context / "app" / "main.py").write_text("print('bye')\n")
+
+    assert fingerprinter.fingerprint(context) != before
+
+
+def test_fingerprint_includes_build_options(context, fingerprinter):
+    """Test target and build args are part of the fingerprint."""
+    base = fingerprinter.fingerprint(context)
+
+    assert fingerprinter.fingerprint(context, target="test") != base
+    assert fingerprinter.fingerprint(context, build_args={"A": "1"}) != base
+
+
+def test_hash_cache_skips_unchanged_files(context, fingerprinter, tmp_path):
+    """Test cached hashes are reused when mtime and size match."""
+    fingerprinter.fingerprint(context)
+    assert fingerprinter.cache_path.exists()
+
+    main_py = context / "app" / "main.py"
+    stat = main_py.stat()
+    reloaded = BuildFingerprinter(fingerprinter.cache_path)
+    reloaded.load()
+    reloaded._cache[str(main_py.resolve())][2] = "cached"
+
+    digest, changed = reloaded._hash_file(main_py.resolve())
+    assert digest == "cached"
+    assert changed is False
+
+    os.utime(main_py, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    digest, changed = reloaded._hash_file(main_py.resolve())
+    assert digest != "cached"
+    assert changed is True
+
+
+def test_fingerprint_missing_context(fingerprinter, tmp_path):
+    """Test missing context raises ValueError."""
+    with pytest.raises(ValueError):
+        fingerprinter.fingerprint(tmp_path / "missing")
@@ -0,0 +1,66 @@
+"""Unit tests for the TTL cache."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from app.core.cache import TTLCache
+
+
+def test_get_or_load_caches_value():
+    """Test loader runs once while the entry is fresh."""
+    cache = TTLCache(ttl=60)
+    loader = MagicMock(return_value={"Volumes": []})
+
+    first = cache.get_or_load("df", loader)
+    second = cache.get_or_load("df", loader)
+
+    assert first is second
+    loader.assert_called_once()
+
+
+def test_entries_expire():
+    """Test expired entries are reloaded."""
+    cache = TTLCache(ttl=0.01)
+    loader = MagicMock(side_effect=[1, 2])
+
+    assert cache.get_or_load("k", loader) == 1
+    time.sleep(0.02)
+    assert cache.get_or_load("k", loader) == 2
+
+
+def test_invalidate():
+    """Test invalidate drops one or all entries."""
+    cache = TTLCache(ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.invalidate()
+    assert cache.get("b") is None
+    assert cache.age("b") is None
+
+
+def test_concurrent_misses_load_once():
+    """Test concurrent misses share a single load."""
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "snapshot"
+
+    threads = [
+        threading.Thread(target=cache.get_or_load, args=("df", loader))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
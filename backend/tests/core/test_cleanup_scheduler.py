@@ -0,0 +1,137 @@
+"""Unit tests for the background cleanup scheduler."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.activity import RequestActivity
+from app.core.cleanup_scheduler import CleanupScheduler
+from app.core.config import CleanupPolicy
+
+
+def _policies():
+    return [
+        CleanupPolicy(name="images", action="images", min_interval_minutes=60),
+        CleanupPolicy(
+            name="disk-pressure", action="build_cache", disk_percent_above=90
+        ),
+    ]
+
+
+@pytest.fixture
+def runner():
+    """Create a runner reporting one deleted object."""
+    return MagicMock(
+        return_value={
+            "deleted": 1,
+            "space_freed_bytes": 1024,
+            "interrupted": False,
+        }
+    )
+
+
+def test_runs_due_policies(runner):
+    """Test due policies run and disk conditions are honoured."""
+    scheduler = CleanupScheduler(
+        _policies(), RequestActivity(), disk_percent=lambda: 50.0
+    )
+    scheduler.runner = runner
+
+    runs = scheduler.run_pending()
+
+    assert [r["policy"] for r in runs] == ["images"]
+    assert scheduler.history()[0]["space_freed_bytes"] == 1024
+    assert scheduler.run_pending() == []
+
+
+def test_disk_pressure_policy(runner):
+    """Test disk-conditioned policies run above the threshold."""
+    scheduler = CleanupScheduler(
+        _policies(), RequestActivity(), disk_percent=lambda: 95.0
+    )
+    scheduler.runner = runner
+
+    runs = scheduler.run_pending()
+
+    assert [r["policy"] for r in runs] == ["images", "disk-pressure"]
+
+
+def test_deferred_while_requests_in_flight(runner):
+    """Test passes are skipped while foreground requests run."""
+    activity = RequestActivity()
+    scheduler = CleanupScheduler(_policies(), activity)
+    scheduler.runner = runner
+    activity.begin()
+
+    assert scheduler.run_pending() is None
+    runner.assert_not_called()
+
+
+def test_forced_after_max_deferral(runner):
+    """Test constant traffic cannot starve cleanup forever."""
+    activity = RequestActivity()
+    scheduler = CleanupScheduler(
+        _policies()[:1],
+        activity,
+        max_deferral=0.05,
+        disk_percent=lambda: 0.0,
+    )
+    scheduler.runner = runner
+    activity.begin()
+
+    assert scheduler.run_pending() is None
+    time.sleep(0.06)
+    runs = scheduler.run_pending()
+
+    assert [r["policy"] for r in runs] == ["images"]
+    should_yield = runner.call_args.args[2]
+    assert should_yield() is False
+
+
+def test_rate_limit(runner):
+    """Test the hourly run budget caps policy runs."""
+    scheduler = CleanupScheduler(
+        _policies(),
+        RequestActivity(),
+        max_runs_per_hour=1,
+        disk_percent=lambda: 95.0,
+    )
+    scheduler.runner = runner
+
+    runs = scheduler.run_pending()
+
+    assert len(runs) == 1
+
+
+def test_runner_error_recorded(runner):
+    """Test a failing policy is recorded in history."""
+    runner.side_effect = RuntimeError("daemon gone")
+    scheduler = CleanupScheduler(
+        _policies()[:1], RequestActivity(), disk_percent=lambda: 0.0
+    )
+    scheduler.runner = runner
+
+    scheduler.run_pending()
+
+    assert scheduler.history()[0]["error"] == "daemon gone"
+
+
+@patch("app.core.cleanup_scheduler.host_metrics")
+def test_disk_percent_from_docker_mount(mock_host):
+    """Test disk conditions read the /var/lib/docker mount first."""
+    mock_host.latest.return_value = {
+        "disk": {"percent": 40.0},
+        "mounts": [
+            {"path": "/", "percent": 40.0},
+            {"path": "/var/lib/docker", "percent": 93.0},
+        ],
+    }
+    scheduler = CleanupScheduler(_policies(), RequestActivity())
+
+    assert scheduler.disk_percent() == 93.0
+
+    mock_host.latest.return_value["mounts"] = [
+        {"path": "/", "percent": 40.0}
+    ]
+    assert scheduler.disk_percent() == 40.0
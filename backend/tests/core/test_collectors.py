@@ -0,0 +1,151 @@
+"""Unit tests for the collector scheduler."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.collectors import Collector, CollectorScheduler
+
+
+async def _until(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+def test_unknown_executor_rejected():
+    """Test collectors must run on a known executor."""
+    with pytest.raises(ValueError):
+        Collector("x", lambda: None, interval=1, executor="gpu")
+
+
+def test_cpu_budget_stretches_delay():
+    """Test a run over its CPU budget pushes the next run back."""
+    collector = Collector("x", lambda: None, interval=1, cpu_budget=0.1)
+    collector.last_cpu = 0.5
+
+    assert collector.next_delay() == pytest.approx(5.0)
+    assert collector.next_delay(override=10.0) == pytest.approx(10.0)
+
+
+def test_io_budget_stretches_delay():
+    """Test a run over its IO budget pushes the next run back."""
+    collector = Collector("x", lambda: None, interval=1, io_budget=0.25)
+    collector.last_duration = 2.0
+
+    assert collector.next_delay() == pytest.approx(8.0)
+
+
+async def test_runs_records_errors_and_honours_override():
+    """Test runs, errors and the delay returned by a run."""
+    calls = []
+
+    def func():
+        calls.append(threading.current_thread().name)
+        if len(calls) == 3:
+            raise RuntimeError("boom")
+        return 0.01
+
+    scheduler = CollectorScheduler(workers=1)
+    collector = scheduler.register(Collector("job", func, interval=60))
+    scheduler.start()
+    await _until(lambda: collector.runs >= 3)
+    await scheduler.stop()
+
+    assert calls[0].startswith("collector")
+    assert collector.errors == 1
+    assert collector.last_error == "boom"
+    assert collector.stats()["avg_duration_seconds"] is not None
+
+
+async def test_timed_out_run_skips_overlapping_ticks():
+    """Test an executor run past its timeout blocks new runs."""
+    release = threading.Event()
+    scheduler = CollectorScheduler()
+    collector = scheduler.register(
+        Collector(
+            "slow",
+            lambda: release.wait(2),
+            interval=0.01,
+            timeout=0.01,
+            executor="io",
+        )
+    )
+    scheduler.start()
+    await _until(lambda: collector.skipped >= 2)
+    assert collector.timeouts == 1
+    assert collector.runs == 0
+
+    release.set()
+    await _until(lambda: collector.runs >= 1)
+    await scheduler.stop()
+
+
+async def test_slow_io_collector_does_not_block_others():
+    """Test a stuck IO collector leaves the IO pool to the others."""
+    release = threading.Event()
+    scheduler = CollectorScheduler(io_workers=2)
+    slow = scheduler.register(
+        Collector("scan", lambda: release.wait(2), interval=60, executor="io")
+    )
+    fast = scheduler.register(
+        Collector("sizes", lambda: 0.01, interval=60, executor="io")
+    )
+    scheduler.start()
+    await _until(lambda: slow.running and fast.runs >= 3)
+    assert slow.runs == 0
+
+    release.set()
+    await _until(lambda: slow.runs >= 1)
+    await scheduler.stop()
+
+
+async def test_loop_collector_cancelled_on_timeout():
+    """Test a loop collector past its timeout is cancelled."""
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    scheduler = CollectorScheduler()
+    collector = scheduler.register(
+        Collector("hang", hang, interval=60, timeout=0.01, executor="loop")
+    )
+    scheduler.start()
+    await _until(lambda: collector.runs >= 1)
+    await scheduler.stop()
+
+    assert collector.timeouts == 1
+    assert not collector.running
+
+
+async def test_trigger_runs_before_interval():
+    """Test a triggered collector runs without waiting its interval."""
+    scheduler = CollectorScheduler()
+    collector = scheduler.register(
+        Collector("scan", lambda: None, interval=60)
+    )
+    scheduler.start()
+    await _until(lambda: collector.runs == 1)
+
+    assert scheduler.trigger("scan")
+    await _until(lambda: collector.runs == 2)
+    await scheduler.stop()
+
+    assert not scheduler.trigger("missing")
+    assert collector.stats()["last_lag_seconds"] == 0.0
+
+
+def test_render_prometheus_labels_collectors():
+    """Test metrics are exported per collector."""
+    scheduler = CollectorScheduler()
+    scheduler.register(Collector("docker_health", lambda: None, interval=5))
+
+    lines = scheduler.render_prometheus()
+
+    assert (
+        'mylocalplace_collector_runs_total{collector="docker_health"} 0'
+        in lines
+    )
+    assert "# TYPE mylocalplace_collector_duration_seconds summary" in lines
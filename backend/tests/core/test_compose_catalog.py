@@ -0,0 +1,132 @@
+"""Unit tests for the compose service catalog."""
+
+import os
+
+import pytest
+
+from app.core.compose_catalog import ComposeCatalog
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a compose project with an extended service file."""
+    (tmp_path / "services").mkdir()
+    (tmp_path / "backend").mkdir()
+    (tmp_path / "docker-compose.yml").write_text(
+        "services:\n"
+        "  api:\n"
+        "    build:\n"
+        "      context: ./backend\n"
+        "      target: production\n"
+        "    container_name: mylocalplace-api\n"
+        "    ports: ['8800:8000']\n"
+        "  local-postgres:\n"
+        "    container_name: local-postgres\n"
+        "    extends:\n"
+        "      file: services/postgres.yml\n"
+        "      service: postgres\n"
+        "    depends_on:\n"
+        "      api:\n"
+        "        condition: service_started\n"
+        "    profiles: ['services']\n"
+    )
+    (tmp_path / "services" / "postgres.yml").write_text(
+        "services:\n"
+        "  postgres:\n"
+        "    image: postgres:17-alpine\n"
+        "    volumes: ['postgres_data:/data/postgres']\n"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def catalog(project):
+    """Create catalog over the test project."""
+    return ComposeCatalog(
+        project,
+        patterns=["docker-compose.yml", "services/*.yml"],
+        project_name="mlp",
+        check_interval=0,
+    )
+
+
+def test_indexes_services_from_all_files(catalog):
+    """Test services from every file are indexed in order."""
+    names = [s["name"] for s in catalog.list_services()]
+
+    assert names == ["api", "local-postgres", "postgres"]
+
+
+def test_resolves_extends(catalog, project):
+    """Test extended services inherit the base definition."""
+    service = catalog.get("local-postgres")
+
+    assert service["image"] == "postgres:17-alpine"
+    assert service["volumes"] == ["postgres_data:/data/postgres"]
+    assert service["depends_on"] == ["api"]
+    assert service["profiles"] == ["services"]
+    assert service["file"] == str(project.resolve() / "docker-compose.yml")
+
+
+def test_build_section_and_default_image(catalog, project):
+    """Test build context is resolved and default image tag derived."""
+    service = catalog.get("api")
+
+    assert service["build"]["context"] == str(project.resolve() / "backend")
+    assert service["build"]["target"] == "production"
+    assert service["image"] == "mlp-api"
+
+
+def test_lookup_by_container_name(catalog):
+    """Test services can be found by container name."""
+    assert catalog.get("mylocalplace-api")["name"] == "api"
+    assert catalog.get("missing") is None
+
+
+def test_reloads_only_changed_files(catalog, project, monkeypatch):
+    """Test only files with a new mtime are re-parsed."""
+    catalog.refresh(force=True)
+    parsed = []
+    original = ComposeCatalog._parse
+    monkeypatch.setattr(
+        ComposeCatalog,
+        "_parse",
+        staticmethod(lambda path: parsed.append(path) or original(path)),
+    )
+
+    assert catalog.refresh(force=True) is False
+    assert parsed == []
+
+    postgres = project / "services" / "postgres.yml"
+    postgres.write_text(
+        "services:\n  postgres:\n    image: postgres:18-alpine\n"
+    )
+    stat = postgres.stat()
+    os.utime(postgres, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert catalog.refresh(force=True) is True
+    assert parsed == [postgres.resolve()]
+    assert catalog.get("local-postgres")["image"] == "postgres:18-alpine"
+
+
+def test_refresh_is_throttled(project):
+    """Test mtime checks are skipped within the check interval."""
+    catalog = ComposeCatalog(project, check_interval=60)
+
+    assert catalog.refresh() is True
+    assert catalog.refresh() is False
+
+
+def test_warns_once_when_no_compose_files(tmp_path, caplog):
+    """Test a missing project directory is reported at refresh."""
+    catalog = ComposeCatalog(tmp_path / "missing", check_interval=0)
+
+    with caplog.at_level("WARNING"):
+        catalog.refresh()
+        catalog.refresh(force=True)
+
+    assert catalog.list_services() == []
+    warnings = [
+        r for r in caplog.records if "COMPOSE_PROJECT_DIR" in r.message
+    ]
+    assert len(warnings) == 1
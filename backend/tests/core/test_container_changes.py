@@ -0,0 +1,88 @@
+"""Unit tests for the container change log."""
+
+from app.core.container_changes import ContainerChangeLog
+from app.core.revisions import RevisionTracker
+
+
+def _event(action, container_id="c1"):
+    return {
+        "Type": "container",
+        "Action": action,
+        "Actor": {"ID": container_id},
+    }
+
+
+def test_changes_since_nets_out_events():
+    """Test the net added/updated/removed sets since a token."""
+    log = ContainerChangeLog(RevisionTracker())
+    log.handle_event(_event("start", "old"))
+    token = log.token()
+
+    log.handle_event(_event("create", "new"))
+    log.handle_event(_event("start", "new"))
+    log.handle_event(_event("die", "old"))
+    log.handle_event(_event("create", "gone"))
+    log.handle_event(_event("destroy", "gone"))
+    log.handle_event(_event("destroy", "old"))
+    log.handle_event(_event("exec_start: sh", "new"))
+    log.handle_event(_event("top", "new"))
+
+    changes = log.changes_since(token)
+
+    assert changes == {
+        "revision": log.token(),
+        "added": ["new"],
+        "updated": [],
+        "removed": ["old"],
+    }
+    assert log.changes_since(log.token())["updated"] == []
+
+
+def test_record_bumps_containers_revision():
+    """Test every recorded change bumps the containers revision."""
+    tracker = RevisionTracker()
+    log = ContainerChangeLog(tracker)
+
+    assert log.record("c1", "updated") == 1
+    assert tracker.get("containers") == 1
+
+
+def test_compacted_revision_requires_resync():
+    """Test tokens older than the kept entries get None."""
+    log = ContainerChangeLog(RevisionTracker(), max_entries=2)
+    token = log.token()
+    for name in ("a", "b", "c"):
+        log.record(name, "updated")
+
+    assert log.changes_since(token) is None
+    assert log.changes_since(log.token()) is not None
+
+
+def test_reset_and_foreign_tokens_require_resync():
+    """Test tokens after a reset, from another epoch or malformed."""
+    log = ContainerChangeLog(RevisionTracker())
+    token = log.token()
+    log.reset()
+
+    assert log.changes_since(token) is None
+    assert log.changes_since("deadbeef.0") is None
+    assert log.changes_since("garbage") is None
+    assert log.changes_since(f"{log.tracker.epoch}.999") is None
+
+
+def test_container_revisions_per_reference():
+    """Test a change only bumps the revisions of the changed container."""
+    tracker = RevisionTracker()
+    log = ContainerChangeLog(tracker)
+    event = _event("start", "a" * 64)
+    event["Actor"]["Attributes"] = {"name": "web"}
+
+    log.handle_event(event)
+    log.record("a" * 64, "updated")
+    log.handle_event(_event("start", "b" * 64))
+
+    assert tracker.get(log.resource("web")) == 2
+    assert tracker.get(log.resource("a" * 64)) == 2
+    assert tracker.get(log.resource("a" * 12)) == 2
+    assert tracker.get(log.resource("b" * 12)) == 1
+    assert tracker.get("containers") == 3
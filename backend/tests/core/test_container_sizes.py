@@ -0,0 +1,81 @@
+"""Unit tests for the container size cache."""
+
+import threading
+from unittest.mock import MagicMock
+
+from app.core.activity import RequestActivity
+from app.core.container_sizes import ContainerSizeCache
+
+
+def _client(state="exited"):
+    client = MagicMock()
+    client.api.containers.return_value = [
+        {"Id": "c1", "SizeRw": 2048, "SizeRootFs": 4096, "State": state}
+    ]
+    return client
+
+
+def test_get_queues_unknown_containers():
+    """Test unknown containers are queued, not measured inline."""
+    cache = ContainerSizeCache(RequestActivity())
+
+    assert cache.get("c1") is None
+    assert list(cache._pending) == ["c1"]
+
+
+def test_measure_and_get():
+    """Test measured sizes are served from the cache."""
+    cache = ContainerSizeCache(RequestActivity())
+    client = _client()
+
+    cache.measure(client, "c1")
+
+    size = cache.get("c1")
+    assert size["size_rw"] == 2048
+    assert size["size_root_fs"] == 4096
+    assert size["measured_at"]
+    client.api.containers.assert_called_once_with(
+        all=True, size=True, filters={"id": "c1"}
+    )
+    assert not cache._pending
+
+
+def test_stale_only_after_running():
+    """Test a size is re-measured only once the container ran."""
+    cache = ContainerSizeCache(RequestActivity())
+    cache.measure(_client(), "c1")
+
+    cache.handle_event({"Action": "exec_start", "Actor": {"ID": "c1"}})
+    cache.get("c1")
+    assert not cache._pending
+
+    cache.handle_event({"Action": "start", "Actor": {"ID": "c1"}})
+    assert cache.get("c1")["size_rw"] == 2048
+    assert list(cache._pending) == ["c1"]
+
+
+def test_destroy_drops_entry():
+    """Test destroyed containers are forgotten."""
+    cache = ContainerSizeCache(RequestActivity())
+    cache.measure(_client(), "c1")
+
+    cache.handle_event({"Action": "destroy", "Actor": {"ID": "c1"}})
+
+    assert cache._sizes == {}
+
+
+def test_worker_measures_queue():
+    """Test the background worker measures queued containers."""
+    cache = ContainerSizeCache(RequestActivity(), delay=0)
+    client = _client()
+    measured = threading.Event()
+    client.api.containers.side_effect = lambda **kw: (
+        measured.set() or [{"Id": "c1", "SizeRw": 1, "SizeRootFs": 2}]
+    )
+
+    cache.get("c1")
+    cache.start(lambda: client)
+    assert measured.wait(2)
+    cache.stop()
+
+    assert cache.get("c1")["size_rw"] == 1
@@ -5,7 +5,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 from docker.errors import DockerException
 
-from app.core.docker_client import DockerClientManager
+from app.core.docker_client import (
+    DockerClientManager,
+    DockerUnavailableError,
+    unavailable_cause,
+)
 
 
 @patch("app.core.docker_client.docker.from_env")
@@ -56,3 +60,83 @@ def test_client_property():
 
     assert docker_client.client is not None
 
+
+@pytest.fixture
+def fresh_manager():
+    """Create a manager with reset breaker state."""
+    manager = DockerClientManager()
+    saved = dict(manager.__dict__)
+    manager.__dict__.pop("_initialized", None)
+    manager._client = None
+    DockerClientManager.__init__(manager)
+    yield manager
+    manager.__dict__.clear()
+    manager.__dict__.update(saved)
+
+
+@patch("app.core.docker_client.docker.from_env")
+def test_client_connects_lazily(mock_from_env, fresh_manager):
+    """Test no connection is made until the client is used."""
+    real = MagicMock()
+    mock_from_env.return_value = real
+
+    proxy = fresh_manager.client
+    mock_from_env.assert_not_called()
+
+    proxy.containers.list()
+
+    mock_from_env.assert_called_once()
+    real.containers.list.assert_called_once()
+
+
+@patch("app.core.docker_client.time.monotonic")
+@patch("app.core.docker_client.docker.from_env")
+def test_breaker_fails_fast_then_reconnects(
+    mock_from_env, mock_monotonic, fresh_manager
+):
+    """Test a failed connect opens the breaker until the backoff ends."""
+    mock_monotonic.return_value = 100.0
+    mock_from_env.side_effect = DockerException("connection refused")
+
+    with pytest.raises(DockerUnavailableError):
+        fresh_manager.get_client()
+    # Open: no new connection attempt inside the backoff window
+    with pytest.raises(DockerUnavailableError) as exc_info:
+        fresh_manager.get_client()
+    assert mock_from_env.call_count == 1
+    assert exc_info.value.retry_after > 0
+
+    real = MagicMock()
+    mock_from_env.side_effect = None
+    mock_from_env.return_value = real
+    mock_monotonic.return_value = 200.0
+
+    assert fresh_manager.get_client() is real
+    assert fresh_manager.last_error is None
+
+
+@patch("app.core.docker_client.docker.from_env")
+def test_repeated_failures_drop_connection(mock_from_env, fresh_manager):
+    """Test the breaker opens after the failure threshold."""
+    mock_from_env.return_value = MagicMock()
+    fresh_manager.get_client()
+
+    for _ in range(3):
+        fresh_manager.report(False, "ping timed out")
+
+    assert fresh_manager._client is None
+    with pytest.raises(DockerUnavailableError):
+        fresh_manager.get_client()
+
+
+def test_unavailable_cause_walks_context():
+    """Test outages are found behind wrapping exceptions."""
+    try:
+        try:
+            raise DockerUnavailableError("down")
+        except Exception as e:
+            raise RuntimeError(f"Failed to list containers: {e}")
+    except RuntimeError as wrapped:
+        assert isinstance(unavailable_cause(wrapped), DockerUnavailableError)
+
+    assert unavailable_cause(RuntimeError("boom")) is None
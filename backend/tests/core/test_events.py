@@ -0,0 +1,67 @@
+"""Unit tests for the shared Docker events bus."""
+
+import threading
+from unittest.mock import MagicMock
+
+from app.core.events import DockerEventBus
+
+
+def test_publish_filters_by_type():
+    """Test handlers only receive subscribed event types."""
+    bus = DockerEventBus()
+    received = []
+    bus.subscribe(received.append, types={"volume"})
+
+    bus.publish({"Type": "container", "Action": "start"})
+    bus.publish({"Type": "volume", "Action": "create"})
+
+    assert [e["Type"] for e in received] == ["volume"]
+
+
+def test_handler_error_does_not_stop_dispatch():
+    """Test a failing handler does not block other handlers."""
+    bus = DockerEventBus()
+    received = []
+    bus.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+    bus.subscribe(received.append)
+
+    bus.publish({"Type": "container", "Action": "die"})
+
+    assert len(received) == 1
+
+
+def test_unsubscribe():
+    """Test unsubscribed handlers receive nothing."""
+    bus = DockerEventBus()
+    received = []
+    unsubscribe = bus.subscribe(received.append)
+    unsubscribe()
+
+    bus.publish({"Type": "container", "Action": "die"})
+
+    assert received == []
+
+
+def test_start_resyncs_then_dispatches():
+    """Test the stream runs resync hooks before dispatching events."""
+    bus = DockerEventBus()
+    calls = []
+    done = threading.Event()
+    client = MagicMock()
+    client.events.return_value = iter(
+        [{"Type": "container", "Action": "start"}]
+    )
+
+    bus.add_resync_hook(lambda c: calls.append("resync"))
+
+    def handler(event):
+        calls.append(event["Action"])
+        done.set()
+
+    bus.subscribe(handler)
+    bus.start(lambda: client)
+    assert done.wait(2)
+    bus.stop()
+
+    assert calls[:2] == ["resync", "start"]
+    assert not bus.running
@@ -0,0 +1,87 @@
+"""Unit tests for the fast JSON serialization path."""
+
+import json
+from unittest.mock import patch
+
+from app.core import fast_json
+from app.core.fast_json import FastJSONResponse, SchemaEncoder, dumps
+from app.schemas import ContainerInfo, VolumeInfo
+from app.schemas.alert import Alert, AlertsResponse
+
+CONTAINER = {
+    "id": "abc123def456",
+    "name": "local-postgres",
+    "status": "running",
+    "state": "running",
+    "image": "postgres:17",
+    "ports": ["5432:5432/tcp"],
+    "created": "2025-10-29T10:00:00Z",
+    "running": True,
+    "size_rw_bytes": 1024,
+    "size_root_fs_bytes": None,
+    "size_measured_at": None,
+    "internal_only": "dropped",
+}
+
+
+def test_encoder_matches_model_dump():
+    """Test encoded rows equal what response_model validation produced."""
+    encoded = SchemaEncoder(ContainerInfo).encode(CONTAINER)
+
+    assert encoded == ContainerInfo(**CONTAINER).model_dump(mode="json")
+    assert "internal_only" not in encoded
+
+
+def test_encoder_fills_defaults():
+    """Test missing optional fields get their schema defaults."""
+    volume = {
+        "name": "pgdata",
+        "driver": "local",
+        "mountpoint": "/var/lib/docker/volumes/pgdata/_data",
+        "created": "2025-10-29T10:00:00Z",
+        "scope": "local",
+    }
+
+    encoded = SchemaEncoder(VolumeInfo).encode(volume)
+
+    assert encoded == VolumeInfo(**volume).model_dump(mode="json")
+    assert encoded["labels"] == {}
+
+
+def test_encoder_nested_models_and_floats():
+    """Test nested model lists are encoded and ints become floats."""
+    alert = {"type": "cpu", "level": "warning", "message": "CPU", "value": 85}
+    response = {
+        "alerts": [alert],
+        "critical_count": 0,
+        "warning_count": 1,
+        "info_count": 0,
+    }
+
+    encoded = SchemaEncoder(AlertsResponse).encode(response)
+
+    assert encoded == AlertsResponse(**response).model_dump(mode="json")
+    assert isinstance(SchemaEncoder(Alert).encode(alert)["value"], float)
+
+
+def test_fast_response_renders_compact_json():
+    """Test the response body is valid compact JSON."""
+    response = FastJSONResponse([{"a": 1, "b": "ç"}])
+
+    assert json.loads(response.body) == [{"a": 1, "b": "ç"}]
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_dumps_without_orjson():
+    """Test the stdlib fallback produces the same document."""
+    with patch.object(fast_json, "orjson", None):
+        body = dumps({"name": "ç", "size": 1})
+
+    assert body == '{"name":"ç","size":1}'.encode("utf-8")
+
+
+def test_benchmark_reports_cpu_time():
+    """Test the benchmark runs both paths."""
+    result = fast_json.benchmark(rows=10, repeat=2)
+
+    assert set(result) == {"validated_ms", "fast_ms", "speedup"}
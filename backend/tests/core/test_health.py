@@ -0,0 +1,56 @@
+"""Unit tests for the Docker daemon health prober."""
+
+import threading
+from unittest.mock import MagicMock
+
+from app.core.health import DaemonHealth
+
+
+def test_probe_success_records_latency():
+    """Test a successful ping updates state and histogram."""
+    health = DaemonHealth(timeout=1)
+    client = MagicMock()
+
+    assert health.probe(client) is True
+
+    state = health.snapshot()
+    assert health.probed
+    assert state["connected"] is True
+    assert state["last_latency_ms"] is not None
+    assert state["consecutive_failures"] == 0
+    metrics = "\n".join(health.render_prometheus())
+    assert "mylocalplace_docker_up 1" in metrics
+    assert 'mylocalplace_docker_ping_seconds_bucket{le="+Inf"} 1' in metrics
+    assert "mylocalplace_docker_ping_seconds_count 1" in metrics
+
+
+def test_probe_failure_records_error():
+    """Test a failing ping is recorded with its error."""
+    health = DaemonHealth(timeout=1)
+    client = MagicMock()
+    client.ping.side_effect = RuntimeError("connection refused")
+
+    assert health.probe(client) is False
+
+    state = health.snapshot()
+    assert state["connected"] is False
+    assert state["last_error"] == "connection refused"
+    assert state["consecutive_failures"] == 1
+    assert "mylocalplace_docker_ping_failures_total 1" in "\n".join(
+        health.render_prometheus()
+    )
+
+
+def test_probe_timeout_does_not_hang():
+    """Test a wedged daemon only costs the probe timeout."""
+    health = DaemonHealth(timeout=0.05)
+    release = threading.Event()
+    client = MagicMock()
+    client.ping.side_effect = lambda: release.wait(2)
+
+    assert health.probe(client) is False
+    assert "timed out" in health.snapshot()["last_error"]
+    # The stuck ping is not stacked up by the next probe
+    assert health.probe(client) is False
+    assert client.ping.call_count == 1
+    release.set()
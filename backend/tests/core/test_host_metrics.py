@@ -0,0 +1,126 @@
+"""Unit tests for consolidated host snapshots."""
+
+from collections import namedtuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.host_metrics import HostMetrics
+
+CpuTimes = namedtuple("CpuTimes", "user system idle iowait guest")
+DiskIO = namedtuple(
+    "DiskIO", "read_count write_count read_bytes write_bytes"
+)
+NetIO = namedtuple("NetIO", "bytes_recv bytes_sent")
+Usage = namedtuple("Usage", "total used free percent")
+Memory = namedtuple("Memory", "total used percent")
+
+GB = 1024**3
+
+
+def _psutil(cpu, disk_io, net_io):
+    psutil = MagicMock()
+    psutil.cpu_times.return_value = cpu
+    psutil.virtual_memory.return_value = Memory(32 * GB, 8 * GB, 25.0)
+    psutil.swap_memory.return_value = Memory(2 * GB, 0, 0.0)
+    psutil.disk_io_counters.return_value = disk_io
+    psutil.net_io_counters.return_value = net_io
+    psutil.getloadavg.return_value = (1.234, 1.0, 0.5)
+
+    def disk_usage(path):
+        if path == "/missing":
+            raise FileNotFoundError(path)
+        return Usage(100 * GB, 40 * GB, 60 * GB, 40.0)
+
+    psutil.disk_usage.side_effect = disk_usage
+    return psutil
+
+
+@patch("app.core.host_metrics.time")
+def test_snapshot_rates_from_counter_deltas(mock_time):
+    """Test CPU usage and IO rates come from deltas between snapshots."""
+    psutil = _psutil(
+        [CpuTimes(10, 10, 80, 0, 0), CpuTimes(0, 0, 100, 0, 0)],
+        DiskIO(0, 0, 0, 0),
+        {"lo": NetIO(999, 999), "eth0": NetIO(1000, 500)},
+    )
+    host = HostMetrics(mounts=["/missing", "/var/lib/docker"])
+    mock_time.monotonic.return_value = 100.0
+
+    with patch("app.core.host_metrics.psutil", psutil):
+        snapshot = host.latest(max_age=1)
+
+    assert snapshot["cpu_per_core"] == [20.0, 0.0]
+    assert snapshot["disk_io"] is None
+    assert snapshot["network_io"] is None
+    assert [m["path"] for m in snapshot["mounts"]] == ["/var/lib/docker"]
+    assert snapshot["disk"] == {
+        "total_gb": 100.0, "used_gb": 40.0, "percent": 40.0
+    }
+    assert snapshot["load_average"]["load_1m"] == 1.23
+
+    psutil.cpu_times.return_value = [
+        CpuTimes(15, 15, 90, 0, 0), CpuTimes(5, 0, 100, 0, 0)
+    ]
+    psutil.disk_io_counters.return_value = DiskIO(20, 40, 2048, 4096)
+    psutil.net_io_counters.return_value = {
+        "lo": NetIO(5000, 5000), "eth0": NetIO(3000, 1500)
+    }
+    mock_time.monotonic.return_value = 102.0
+
+    with patch("app.core.host_metrics.psutil", psutil):
+        snapshot = host.latest(max_age=1)
+
+    assert snapshot["cpu_per_core"] == [50.0, 100.0]
+    assert snapshot["cpu_percent"] == 75.0
+    assert snapshot["disk_io"] == {
+        "read_bytes_per_sec": 1024.0,
+        "write_bytes_per_sec": 2048.0,
+        "read_ops_per_sec": 10.0,
+        "write_ops_per_sec": 20.0,
+    }
+    assert snapshot["network_io"] == {
+        "recv_bytes_per_sec": 1000.0, "sent_bytes_per_sec": 500.0
+    }
+    assert snapshot["window_seconds"] == 2.0
+
+
+def test_latest_reuses_fresh_snapshot():
+    """Test every counter is read once per snapshot."""
+    psutil = _psutil([CpuTimes(1, 1, 8, 0, 0)], None, {})
+    host = HostMetrics(mounts=["/"])
+
+    with patch("app.core.host_metrics.psutil", psutil):
+        first = host.latest(max_age=60)
+        second = host.latest(max_age=60)
+
+    assert first is second
+    assert psutil.virtual_memory.call_count == 1
+    assert psutil.disk_usage.call_count == 1
+
+
+def test_missing_mounts_fall_back_to_root():
+    """Test ``/`` is reported when no configured mount exists."""
+    psutil = _psutil([CpuTimes(1, 1, 8, 0, 0)], None, {})
+    psutil.getloadavg.side_effect = OSError
+
+    with patch("app.core.host_metrics.psutil", psutil):
+        snapshot = HostMetrics(mounts=["/missing"]).latest(max_age=60)
+
+    assert [m["path"] for m in snapshot["mounts"]] == ["/"]
+    assert snapshot["load_average"] is None
+
+
+@pytest.mark.parametrize("interval, expected", [(None, 30.0), (2.0, 2.0)])
+def test_tick_follows_host_demand(interval, expected):
+    """Test the collector runs at the interval host demand asks for."""
+    host = HostMetrics(mounts=["/"])
+    with patch.object(host, "latest"), patch(
+        "app.core.host_metrics.demand"
+    ) as mock_demand:
+        mock_demand.interval.return_value = interval
+        mock_demand.ceiling = 30.0
+        mock_demand.floor = 1.0
+
+        assert host.tick() == expected
+        host.latest.assert_called_once_with(max_age=1.0)
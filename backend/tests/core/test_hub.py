@@ -0,0 +1,96 @@
+"""Unit tests for the WebSocket topic hub."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.core.hub import HubConnection, TopicHub, parse_topics
+
+
+class Recorder:
+    """Collects sent frames."""
+
+    def __init__(self):
+        self.frames = []
+
+    async def send(self, message):
+        self.frames.append(json.loads(message))
+
+
+def make_hub(calls):
+    hub = TopicHub()
+
+    async def collector(hub, topic):
+        calls.append(topic)
+        hub.publish(topic, {"n": len(calls)})
+        await asyncio.Event().wait()
+
+    hub.register("system", collector)
+    hub.register("stats", collector)
+    return hub
+
+
+async def test_collector_shared_and_stopped_with_last_subscriber():
+    """Test one collector per topic, cancelled when unused."""
+    calls = []
+    hub = make_hub(calls)
+    first = HubConnection(Recorder().send)
+    second = HubConnection(Recorder().send)
+
+    hub.subscribe(first, "system")
+    hub.subscribe(second, "system")
+    await asyncio.sleep(0)
+    assert calls == ["system"]
+    assert hub.stats()["collectors"] == 1
+
+    hub.unsubscribe(first, "system")
+    assert hub.stats()["collectors"] == 1
+    hub.disconnect(second)
+    assert hub.stats()["collectors"] == 0
+    assert not hub.has_subscribers("system")
+
+
+async def test_wildcard_retain_and_dedupe():
+    """Test wildcard fan-out, retained state and duplicate suppression."""
+    hub = make_hub([])
+    recorder = Recorder()
+    connection = HubConnection(recorder.send)
+    writer = asyncio.create_task(connection.run())
+
+    hub._subscribers["stats:*"] = {connection}
+    hub._subscribers["stats:db"] = {connection}
+    hub.publish("stats:db", {"cpu": 1})
+    hub.publish("stats:db", {"cpu": 1})
+    hub.publish("stats:web", {"cpu": 2})
+    hub.publish("stats:db", "line", retain=False)
+    await asyncio.sleep(0.01)
+    writer.cancel()
+
+    assert recorder.frames == [
+        {"topic": "stats:db", "data": {"cpu": 1}},
+        {"topic": "stats:web", "data": {"cpu": 2}},
+        {"topic": "stats:db", "data": "line"},
+    ]
+
+
+def test_slow_consumer_drops_oldest():
+    """Test a full queue drops the oldest message."""
+    connection = HubConnection(Recorder().send, queue_size=2)
+
+    for message in ("a", "b", "c"):
+        connection.offer(message)
+
+    assert connection.dropped == 1
+    assert connection._queue.get_nowait() == "b"
+
+
+def test_topic_validation():
+    """Test unknown families and empty arguments are rejected."""
+    hub = make_hub([])
+
+    assert hub.is_valid("system") and hub.is_valid("stats:*")
+    assert not hub.is_valid("stats:") and not hub.is_valid("nope")
+    with pytest.raises(ValueError):
+        hub.subscribe(HubConnection(Recorder().send), "nope")
+    assert parse_topics(" system, stats:* ,") == ["system", "stats:*"]
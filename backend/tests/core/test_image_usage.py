@@ -0,0 +1,48 @@
+"""Unit tests for the image usage tracker."""
+
+from app.core.image_usage import ImageUsageTracker
+
+
+def test_events_record_usage(tmp_path):
+    """Test container and image events record last use."""
+    tracker = ImageUsageTracker(tmp_path / "usage.json")
+
+    tracker.handle_event(
+        {
+            "Type": "container",
+            "Action": "start",
+            "time": 100,
+            "Actor": {"ID": "c1", "Attributes": {"image": "postgres:16"}},
+        }
+    )
+    tracker.handle_event(
+        {"Type": "image", "Action": "pull", "time": 200,
+         "Actor": {"ID": "ollama/ollama:latest"}}
+    )
+    tracker.handle_event(
+        {"Type": "container", "Action": "die", "time": 300,
+         "Actor": {"ID": "c1", "Attributes": {"image": "postgres:16"}}}
+    )
+
+    assert tracker.last_used("sha256:abc", ["postgres:16"]) == 100
+    assert tracker.last_used("sha256:def", ["ollama/ollama:latest"]) == 200
+    assert tracker.last_used("sha256:zzz", ["redis:7"]) is None
+
+
+def test_last_used_takes_latest_reference(tmp_path):
+    """Test the latest use over ID and tags wins."""
+    tracker = ImageUsageTracker(tmp_path / "usage.json")
+    tracker.touch("sha256:abc", 50)
+    tracker.touch("app:latest", 70)
+
+    assert tracker.last_used("sha256:abc", ["app:latest"]) == 70
+
+
+def test_persisted_across_restarts(tmp_path):
+    """Test usage times survive a reload."""
+    path = tmp_path / "usage.json"
+    tracker = ImageUsageTracker(path, save_interval=3600)
+    tracker.touch("postgres:16", 100)
+    tracker.save()
+
+    assert ImageUsageTracker(path).last_used("x", ["postgres:16"]) == 100
@@ -0,0 +1,85 @@
+"""Unit tests for the lifecycle event replay buffer."""
+
+import asyncio
+
+from app.core.lifecycle_events import LifecycleEventStream, matches, normalize
+
+
+def _event(action, name="web", project="demo", event_type="container"):
+    return {
+        "Type": event_type,
+        "Action": action,
+        "Actor": {
+            "ID": f"{name}-id",
+            "Attributes": {
+                "name": name,
+                "com.docker.compose.project": project,
+            },
+        },
+        "timeNano": 1_700_000_000_000_000_000,
+    }
+
+
+def test_normalize_and_filters():
+    """Test normalization, ignored actions and filters."""
+    event = normalize(_event("health_status: healthy"))
+
+    assert event["action"] == "health_status"
+    assert event["detail"] == "healthy"
+    assert event["time"] == 1_700_000_000.0
+    assert normalize(_event("exec_start: sh")) is None
+    assert normalize(_event("connect", event_type="network")) is None
+
+    assert matches(event, {"container"}, "web", "demo")
+    assert matches(event, container="web-i")
+    assert not matches(event, {"image"})
+    assert not matches(event, project="other")
+
+
+async def test_resume_replays_missed_events():
+    """Test Last-Event-ID replay and live delivery."""
+    stream = LifecycleEventStream()
+    stream.handle_event(_event("create"))
+    stream.handle_event(_event("start"))
+    first_id = f"{stream._epoch}-1"
+
+    listener = stream.open(first_id)
+    stream.handle_event(_event("die"))
+    received, item = await listener.get(timeout=1)
+
+    assert [e["action"] for _, e in listener.replay] == ["start"]
+    assert not listener.resync
+    assert received and item[1]["action"] == "die"
+    stream.close(listener)
+
+
+async def test_unknown_or_lost_ids_require_resync():
+    """Test evicted, foreign and pre-gap IDs get a resync."""
+    stream = LifecycleEventStream(max_events=2)
+    for action in ("create", "start", "die"):
+        stream.handle_event(_event(action))
+
+    assert stream.open(f"{stream._epoch}-0").resync
+    assert not stream.open(f"{stream._epoch}-1").resync
+    assert stream.open("deadbeef-2").resync
+    assert stream.open("garbage").resync
+
+    listener = stream.open(f"{stream._epoch}-3")
+    stream.mark_gap()
+    assert stream.open(f"{stream._epoch}-3").resync
+    assert await listener.get(timeout=1) == (True, None)
+
+
+async def test_slow_listener_overflows(monkeypatch):
+    """Test a listener falling too far behind is marked overflowed."""
+    monkeypatch.setattr(
+        "app.core.lifecycle_events.LISTENER_QUEUE_SIZE", 1
+    )
+    stream = LifecycleEventStream()
+    listener = stream.open()
+
+    stream.handle_event(_event("start"))
+    stream.handle_event(_event("stop"))
+    await asyncio.sleep(0)
+
+    assert listener.overflowed
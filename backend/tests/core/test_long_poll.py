@@ -0,0 +1,72 @@
+"""Unit tests for long-poll revision waits."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.core.long_poll import (
+    CHANGED,
+    RESYNC,
+    TIMEOUT,
+    RevisionWaiter,
+    wait_for_change,
+)
+from app.core.revisions import RevisionTracker, revisions
+
+
+async def test_wait_wakes_on_bump_from_another_thread():
+    """Test a parked wait returns once another thread bumps."""
+    tracker = RevisionTracker()
+    waiter = RevisionWaiter(tracker)
+    loop = asyncio.get_running_loop()
+    loop.call_later(
+        0.05, threading.Thread(target=tracker.bump, args=("c",)).start
+    )
+
+    assert await waiter.wait("c", after=0, timeout=5) == CHANGED
+    assert tracker.get("c") == 1
+
+
+async def test_wait_times_out_without_change():
+    """Test other resources do not wake the wait."""
+    tracker = RevisionTracker()
+    waiter = RevisionWaiter(tracker)
+    asyncio.get_running_loop().call_later(0.01, tracker.bump, "other")
+
+    assert await waiter.wait("c", after=0, timeout=0.1) == TIMEOUT
+
+
+async def test_wait_returns_at_once_when_revision_already_greater():
+    """Test a revision past the caller's returns without parking."""
+    tracker = RevisionTracker()
+    waiter = RevisionWaiter(tracker)
+    tracker.bump("c")
+    tracker.bump("c")
+
+    assert await waiter.wait("c", after=1, timeout=5) == CHANGED
+
+
+async def test_wait_resyncs_for_unreached_revision_or_bump_all():
+    """Test revisions never reached and bump_all signal a resync."""
+    tracker = RevisionTracker()
+    waiter = RevisionWaiter(tracker)
+
+    assert await waiter.wait("c", after=7, timeout=5) == RESYNC
+
+    asyncio.get_running_loop().call_later(0.01, tracker.bump_all)
+    assert await waiter.wait("c", after=0, timeout=5) == RESYNC
+
+
+@patch("app.core.long_poll.event_bus")
+async def test_token_from_other_epoch_resyncs_without_waiting(mock_bus):
+    """Test a token issued by another worker is not compared."""
+    mock_bus.connected = True
+    request = SimpleNamespace(state=SimpleNamespace())
+    foreign = f"{RevisionTracker().epoch}.{revisions.get('c')}"
+
+    assert await wait_for_change(request, "c", foreign, timeout=5)
+    assert await wait_for_change(request, "c", "garbage", timeout=5)
+    assert not await wait_for_change(
+        request, "c", revisions.token("c"), timeout=0.01
+    )
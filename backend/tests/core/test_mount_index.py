@@ -0,0 +1,133 @@
+"""Unit tests for the volume <-> container mount index."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.mount_index import MountIndex
+
+
+def _volume(name):
+    volume = MagicMock()
+    volume.name = name
+    return volume
+
+
+@pytest.fixture
+def index():
+    """Create an index built from two containers and three volumes."""
+    client = MagicMock()
+    client.volumes.list.return_value = [
+        _volume("pg_data"),
+        _volume("redis_data"),
+        _volume("orphan"),
+    ]
+    client.api.containers.return_value = [
+        {
+            "Id": "a" * 64,
+            "Names": ["/local-postgres"],
+            "Mounts": [
+                {
+                    "Type": "volume",
+                    "Name": "pg_data",
+                    "Destination": "/var/lib/postgresql/data",
+                    "RW": True,
+                },
+                {"Type": "bind", "Source": "/srv", "Destination": "/srv"},
+            ],
+        },
+        {
+            "Id": "b" * 64,
+            "Names": ["/local-redis"],
+            "Mounts": [
+                {
+                    "Type": "volume",
+                    "Name": "redis_data",
+                    "Destination": "/data",
+                    "RW": False,
+                }
+            ],
+        },
+    ]
+    index = MountIndex()
+    index.rebuild(client)
+    return index
+
+
+def test_rebuild(index):
+    """Test both directions are indexed after a rebuild."""
+    assert index.ready
+    consumers = index.consumers("pg_data")
+    assert [c["container_name"] for c in consumers] == ["local-postgres"]
+    assert consumers[0]["destination"] == "/var/lib/postgresql/data"
+
+    mounts = index.volumes_for("local-redis")
+    assert mounts[0]["volume"] == "redis_data"
+    assert mounts[0]["read_only"] is True
+    assert index.unused_volumes() == ["orphan"]
+
+
+def test_unknown_lookups(index):
+    """Test unknown volumes and containers return None."""
+    assert index.consumers("missing") is None
+    assert index.volumes_for("missing") is None
+    assert index.consumers("orphan") == []
+
+
+def test_lookup_by_id_prefix(index):
+    """Test containers resolve by ID prefix."""
+    assert index.volumes_for("bbbbbbbbbbbb")[0]["volume"] == "redis_data"
+
+
+def test_container_destroy_event(index):
+    """Test destroying a container frees its volumes."""
+    index.handle_event(
+        {"Type": "container", "Action": "destroy", "Actor": {"ID": "a" * 64}}
+    )
+
+    assert index.consumers("pg_data") == []
+    assert index.unused_volumes() == ["orphan", "pg_data"]
+    assert index.volumes_for("local-postgres") is None
+
+
+def test_container_create_event(index):
+    """Test a created container is inspected and indexed."""
+    index._client.api.inspect_container.return_value = {
+        "Id": "c" * 64,
+        "Name": "/backup",
+        "Mounts": [{"Type": "volume", "Name": "orphan", "Destination": "/b"}],
+    }
+
+    index.handle_event(
+        {"Type": "container", "Action": "create", "Actor": {"ID": "c" * 64}}
+    )
+
+    assert index.consumers("orphan")[0]["container_name"] == "backup"
+    assert index.unused_volumes() == []
+
+
+def test_container_rename_event(index):
+    """Test renamed containers resolve by their new name."""
+    index.handle_event(
+        {
+            "Type": "container",
+            "Action": "rename",
+            "Actor": {"ID": "b" * 64, "Attributes": {"name": "cache"}},
+        }
+    )
+
+    assert index.volumes_for("cache") is not None
+    assert index.volumes_for("local-redis") is None
+
+
+def test_volume_events(index):
+    """Test volume create and destroy events update known volumes."""
+    index.handle_event(
+        {"Type": "volume", "Action": "create", "Actor": {"ID": "new"}}
+    )
+    index.handle_event(
+        {"Type": "volume", "Action": "destroy", "Actor": {"ID": "orphan"}}
+    )
+
+    assert index.unused_volumes() == ["new"]
+    assert index.consumers("orphan") is None
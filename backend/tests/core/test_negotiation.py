@@ -0,0 +1,101 @@
+"""Unit tests for bulk response content negotiation."""
+
+import gzip
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core import negotiation
+from app.core.negotiation import (
+    CompressedPayloadCache,
+    choose_encoding,
+    negotiated_response,
+    parse_header_values,
+    wants_msgpack,
+)
+
+
+def make_request(accept="", accept_encoding=""):
+    """Create a request stub with negotiation headers."""
+    request = MagicMock()
+    request.headers = {"accept": accept, "accept-encoding": accept_encoding}
+    return request
+
+
+def test_parse_header_values():
+    """Test values and q-weights are parsed."""
+    parsed = parse_header_values("gzip;q=0.5, br, identity;q=bad")
+
+    assert parsed == {"gzip": 0.5, "br": 1.0, "identity": 0.0}
+
+
+def test_choose_encoding_prefers_br():
+    """Test br wins over gzip at equal weight, q=0 disables a coding."""
+    assert choose_encoding("gzip, br") == "br"
+    assert choose_encoding("gzip, br;q=0") == "gzip"
+    assert choose_encoding("") is None
+
+
+def test_choose_encoding_without_brotli():
+    """Test gzip is used when brotli is not installed."""
+    with patch.object(negotiation, "brotli", None):
+        assert choose_encoding("br, gzip") == "gzip"
+
+
+def test_wants_msgpack():
+    """Test MessagePack is chosen only when preferred over JSON."""
+    assert wants_msgpack("application/msgpack")
+    assert not wants_msgpack("application/json, application/msgpack;q=0.5")
+    assert not wants_msgpack("*/*")
+    with patch.object(negotiation, "msgpack", None):
+        assert not wants_msgpack("application/msgpack")
+
+
+def test_payload_cache_reuses_compressed_body():
+    """Test an unchanged body is compressed once."""
+    cache = CompressedPayloadCache(max_entries=1)
+    body = b'{"name":"pgdata"}' * 100
+
+    first = cache.compress(body, "gzip")
+    second = cache.compress(body, "gzip")
+
+    assert first is second
+    assert gzip.decompress(first) == body
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.compress(b"other", "gzip")
+    cache.compress(body, "gzip")
+    assert cache.misses == 3
+
+
+def test_small_bodies_are_not_compressed():
+    """Test bodies below the threshold are sent as is."""
+    response = negotiated_response(make_request(accept_encoding="gzip"), [1])
+
+    assert "content-encoding" not in response.headers
+    assert response.body == b"[1]"
+    assert response.headers["vary"] == "Accept, Accept-Encoding"
+
+
+def test_large_bodies_are_compressed():
+    """Test large bodies are compressed with the accepted coding."""
+    content = [{"line": "x" * 40}] * 100
+
+    response = negotiated_response(
+        make_request(accept_encoding="gzip"), content
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(response.body).startswith(b'[{"line"')
+
+
+def test_msgpack_body():
+    """Test MessagePack is returned when requested."""
+    msgpack = pytest.importorskip("msgpack")
+
+    response = negotiated_response(
+        make_request(accept="application/msgpack"), {"a": [1, 2]}
+    )
+
+    assert response.media_type == "application/msgpack"
+    assert msgpack.unpackb(response.body) == {"a": [1, 2]}
@@ -0,0 +1,53 @@
+"""Unit tests for resource revision counters."""
+
+from app.core.revisions import RevisionTracker
+
+
+def test_bump_changes_etag():
+    """Test a bump yields a new weak ETag."""
+    revisions = RevisionTracker()
+    before = revisions.etag("containers", "all")
+
+    assert revisions.bump("containers") == 1
+    after = revisions.etag("containers", "all")
+
+    assert before != after
+    assert after.startswith('W/"containers-') and after.endswith('-all"')
+
+
+def test_observe_bumps_only_on_change():
+    """Test observing the same state keeps the revision."""
+    revisions = RevisionTracker()
+
+    assert revisions.observe("alerts", ("warning", None)) == 1
+    assert revisions.observe("alerts", ("warning", None)) == 1
+    assert revisions.observe("alerts", (None, None)) == 2
+
+
+def test_bump_all_invalidates_every_tag():
+    """Test a resync changes tags of untouched resources too."""
+    revisions = RevisionTracker()
+    tag = revisions.etag("volumes")
+
+    revisions.bump_all(object())
+
+    assert revisions.etag("volumes") != tag
+
+
+def test_epoch_differs_between_trackers():
+    """Test tags from another process never match."""
+    assert RevisionTracker().etag("containers") != RevisionTracker().etag(
+        "containers"
+    )
+
+
+def test_handle_event():
+    """Test events bump volumes; containers belong to the change log."""
+    revisions = RevisionTracker()
+
+    revisions.handle_event({"Type": "container", "Action": "start"})
+    assert revisions.get("volumes") == 0
+
+    revisions.handle_event({"Type": "container", "Action": "destroy"})
+    revisions.handle_event({"Type": "volume", "Action": "create"})
+    assert (revisions.get("containers"), revisions.get("volumes")) == (0, 2)
@@ -0,0 +1,49 @@
+"""Unit tests for demand-driven sampling cadence."""
+
+from unittest.mock import patch
+
+from app.core.sampling import AdaptiveCadence, DemandTracker
+
+
+def test_no_demand_pauses_sampling():
+    """Test keys nobody holds or reads get no interval."""
+    demand = DemandTracker(floor=1.0, ceiling=30.0)
+
+    assert demand.interval("stats:db") is None
+
+
+def test_holds_clamped_and_wildcards_apply():
+    """Test the fastest hold wins, clamped to floor and ceiling."""
+    demand = DemandTracker(floor=1.0, ceiling=30.0)
+    release_all = demand.hold("stats:*", 5.0)
+    release_db = demand.hold("stats:db", 0.1)
+
+    assert demand.interval("stats:web") == 5.0
+    assert demand.interval("stats:db") == 1.0
+
+    release_db()
+    release_all()
+    assert demand.interval("stats:db") is None
+    assert demand.active_keys() == []
+
+
+def test_reads_decay_towards_ceiling_then_expire():
+    """Test an HTTP read starts at the floor and fades out."""
+    demand = DemandTracker(floor=1.0, ceiling=31.0, read_ttl=60.0)
+    with patch("app.core.sampling.time.monotonic", return_value=100.0):
+        demand.touch("host")
+        assert demand.interval("host") == 1.0
+    with patch("app.core.sampling.time.monotonic", return_value=130.0):
+        assert demand.interval("host") == 16.0
+    with patch("app.core.sampling.time.monotonic", return_value=161.0):
+        assert demand.interval("host") is None
+
+
+def test_idle_backs_off_and_activity_resets():
+    """Test idle samples double the interval up to the ceiling."""
+    cadence = AdaptiveCadence(ceiling=8.0)
+
+    intervals = [cadence.next("k", 2.0, idle=True) for _ in range(4)]
+
+    assert intervals == [2.0, 4.0, 8.0, 8.0]
+    assert cadence.next("k", 2.0, idle=False) == 2.0
@@ -0,0 +1,55 @@
+"""Unit tests for startup warm-up and import profiling."""
+
+import threading
+from pathlib import Path
+
+from app.core.startup import measure_imports, parse_importtime, warm_up
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2085 |      15323 |     psutil
+import time:     41496 |    1201958 | app.main
+"""
+
+
+def test_parse_importtime():
+    """Test importtime lines are parsed slowest first."""
+    rows = parse_importtime(SAMPLE)
+
+    assert rows[0] == ("app.main", 41496, 1201958)
+    assert ("psutil", 2085, 15323) in rows
+    assert len(rows) == 3
+
+
+def test_warm_up_runs_tasks_concurrently():
+    """Test tasks run in parallel and a failing task is isolated."""
+    barrier = threading.Barrier(2, timeout=2)
+    done = []
+
+    def failing():
+        raise RuntimeError("docker down")
+
+    thread = warm_up(
+        {
+            "a": lambda: done.append(barrier.wait()),
+            "b": lambda: done.append(barrier.wait()),
+            "broken": failing,
+        }
+    )
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert len(done) == 2
+
+
+def test_import_app_defers_heavy_modules():
+    """Test importing the app does not load psutil or yaml."""
+    rows = measure_imports("app.main", cwd=str(BACKEND_DIR))
+    modules = {name for name, _, _ in rows}
+
+    assert "app.main" in modules
+    assert "psutil" not in modules
+    assert "yaml" not in modules
@@ -0,0 +1,106 @@
+"""Unit tests for the background volume scanner."""
+
+import os
+import time
+
+from app.core.volume_scanner import ScanBudget, VolumeScanner
+
+
+def _write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+def test_scan_sizes_tree(tmp_path):
+    """Test a pass reports total size and file count."""
+    _write(tmp_path / "a.bin", 100)
+    _write(tmp_path / "sub" / "b.bin", 50)
+    scanner = VolumeScanner(rate=0)
+
+    scanner.scan([("data", "volume", str(tmp_path))])
+
+    result = scanner.results()[0]
+    assert result["name"] == "data"
+    assert result["size_bytes"] == 150
+    assert result["file_count"] == 2
+    assert result["last_scanned"]
+
+
+def test_unchanged_directories_not_relisted(tmp_path, monkeypatch):
+    """Test only directories whose mtime changed are listed again."""
+    _write(tmp_path / "a" / "one.bin", 10)
+    _write(tmp_path / "b" / "two.bin", 20)
+    scanner = VolumeScanner(rate=0, full_rescan_every=100)
+    scanner.scan([("data", "volume", str(tmp_path))])
+
+    listed = []
+    original = scanner._list_dir
+    monkeypatch.setattr(
+        scanner,
+        "_list_dir",
+        lambda path, mtime: listed.append(path) or original(path, mtime),
+    )
+    _write(tmp_path / "b" / "three.bin", 5)
+    stat = os.stat(tmp_path / "b")
+    os.utime(tmp_path / "b", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    scanner.scan([("data", "volume", str(tmp_path))])
+
+    assert listed == [str(tmp_path / "b")]
+    assert scanner.results()[0]["size_bytes"] == 35
+
+
+def test_missing_targets_dropped(tmp_path):
+    """Test targets that disappear are removed from results."""
+    scanner = VolumeScanner(rate=0)
+    scanner.scan([("data", "volume", str(tmp_path))])
+
+    scanner.scan([("gone", "volume", str(tmp_path / "missing"))])
+
+    assert scanner.results() == []
+
+
+def test_budget_throttles():
+    """Test the token bucket waits once the budget is spent."""
+    budget = ScanBudget(rate=100)
+    started = time.monotonic()
+
+    assert budget.consume(100)
+    assert budget.consume(10)
+
+    assert time.monotonic() - started >= 0.09
+
+
+def test_unchanged_directories_charged(tmp_path, monkeypatch):
+    """Test stat'ing unchanged directories is charged to the budget."""
+    _write(tmp_path / "a" / "one.bin", 10)
+    _write(tmp_path / "b" / "two.bin", 20)
+    scanner = VolumeScanner(rate=0, full_rescan_every=100)
+    scanner.scan([("data", "volume", str(tmp_path))])
+
+    charged = []
+    monkeypatch.setattr(
+        scanner._budget, "consume", lambda n: charged.append(n) or True
+    )
+    scanner.scan([("data", "volume", str(tmp_path))])
+
+    assert charged == [1, 1, 1]
+
+
+def test_stopped_scan_keeps_previous_result(tmp_path, monkeypatch):
+    """Test an interrupted pass does not store a partial size."""
+    _write(tmp_path / "a" / "one.bin", 10)
+    _write(tmp_path / "b" / "two.bin", 20)
+    scanner = VolumeScanner(rate=0, full_rescan_every=1)
+    scanner.scan([("data", "volume", str(tmp_path))])
+    previous = scanner.results()
+
+    original = scanner._list_dir
+
+    def list_then_stop(path, mtime):
+        scanner.stop()
+        return original(path, mtime)
+
+    monkeypatch.setattr(scanner, "_list_dir", list_then_stop)
+    scanner.scan([("data", "volume", str(tmp_path))])
+
+    assert scanner.results() == previous
@@ -0,0 +1,76 @@
+"""Unit tests for build cache repository."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.repositories import build_cache_repository
+from app.repositories.build_cache_repository import BuildCacheRepository
+
+GB = 1024**3
+
+
+def _ago(days):
+    moment = datetime.now(timezone.utc) - timedelta(days=days)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.123456789Z")
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    """Create repository over a fixed build cache snapshot."""
+    monkeypatch.setattr(
+        build_cache_repository.settings, "build_cache_budget_gb", 2.0
+    )
+    repo = BuildCacheRepository()
+    repo.client = MagicMock()
+    repo.disk_usage = MagicMock()
+    repo.disk_usage.get_snapshot.return_value = {
+        "BuildCache": [
+            {"ID": "a", "Type": "regular", "Size": 2 * GB, "InUse": False,
+             "LastUsedAt": _ago(0.5)},
+            {"ID": "b", "Type": "source.local", "Size": GB, "InUse": True,
+             "LastUsedAt": _ago(3)},
+            {"ID": "c", "Type": "regular", "Size": GB, "InUse": False,
+             "CreatedAt": _ago(60), "LastUsedAt": None},
+        ]
+    }
+    return repo
+
+
+def test_get_report(repository):
+    """Test the report groups the cache by type and age."""
+    report = repository.get_report()
+
+    assert report["total_bytes"] == 4 * GB
+    assert report["reclaimable_bytes"] == 3 * GB
+    assert report["by_type"]["regular"] == {"count": 2, "size_bytes": 3 * GB}
+    assert report["by_age"]["<1d"]["count"] == 1
+    assert report["by_age"]["1-7d"]["count"] == 1
+    assert report["by_age"][">30d"]["size_bytes"] == GB
+    assert report["over_budget_bytes"] == 2 * GB
+
+
+def test_prune_to_budget(repository):
+    """Test pruning keeps the configured storage."""
+    repository.client.api.prune_builds.return_value = {
+        "CachesDeleted": ["b1", "b2"],
+        "SpaceReclaimed": 2 * GB,
+    }
+
+    result = repository.prune_to_budget()
+
+    repository.client.api.prune_builds.assert_called_once_with(
+        keep_storage=2 * GB
+    )
+    assert result["space_freed_bytes"] == 2 * GB
+    assert result["caches_deleted"] == 2
+    assert result["within_budget"] is True
+
+
+def test_prune_within_budget_is_noop(repository):
+    """Test nothing is pruned when the cache fits the budget."""
+    result = repository.prune_to_budget(budget_bytes=10 * GB)
+
+    repository.client.api.prune_builds.assert_not_called()
+    assert result["space_freed_bytes"] == 0
@@ -0,0 +1,100 @@
+"""Unit tests for BuildRepository."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.build_fingerprint import FINGERPRINT_LABEL, BuildFingerprinter
+from app.core.compose_catalog import ComposeCatalog
+from app.repositories.build_repository import BuildRepository
+
+
+@pytest.fixture
+def compose_file(tmp_path):
+    """Create a compose project with one buildable service."""
+    project = tmp_path / "project"
+    (project / "backend").mkdir(parents=True)
+    (project / "backend" / "Dockerfile").write_text("FROM scratch\n")
+    compose = project / "docker-compose.yml"
+    compose.write_text(
+        "services:\n"
+        "  api:\n"
+        "    build:\n"
+        "      context: ./backend\n"
+        "      target: production\n"
+        "      args: [\"MODE=prod\"]\n"
+        "  cache:\n"
+        "    image: redis:7\n"
+    )
+    return compose
+
+
+@pytest.fixture
+def repository(tmp_path, compose_file):
+    """Create repository with mocked client and temporary cache."""
+    repo = BuildRepository()
+    repo.client = MagicMock()
+    repo.catalog = ComposeCatalog(compose_file.parent, check_interval=0)
+    repo.fingerprinter = BuildFingerprinter(tmp_path / "fp.json")
+    return repo
+
+
+def test_get_build_config(repository, compose_file):
+    """Test build section is normalized."""
+    config = repository.get_build_config("api")
+
+    assert config["context"] == (compose_file.parent / "backend").resolve()
+    assert config["target"] == "production"
+    assert config["args"] == {"MODE": "prod"}
+    assert config["image"] == "project-api"
+
+
+def test_get_build_config_image_only(repository):
+    """Test services without build section return None."""
+    assert repository.get_build_config("cache") is None
+
+
+def test_list_build_status_stale(repository):
+    """Test service is stale when image label differs."""
+    repository.client.images.get.return_value.labels = {
+        FINGERPRINT_LABEL: "old"
+    }
+
+    statuses = repository.list_build_status()
+
+    assert len(statuses) == 1
+    assert statuses[0]["service"] == "api"
+    assert statuses[0]["stale"] is True
+
+
+def test_list_build_status_up_to_date(repository):
+    """Test service is fresh when image label matches."""
+    fingerprint = repository.compute_fingerprint(
+        repository.get_build_config("api")
+    )
+    repository.client.images.get.return_value.labels = {
+        FINGERPRINT_LABEL: fingerprint
+    }
+
+    statuses = repository.list_build_status()
+
+    assert statuses[0]["stale"] is False
+
+
+def test_stamp_fingerprint_labels_existing_image(repository):
+    """Test the stamp is a FROM/LABEL build on the compose image."""
+    repository.stamp_fingerprint("project-api", "abc")
+
+    kwargs = repository.client.images.build.call_args.kwargs
+    dockerfile = kwargs["fileobj"].read().decode()
+    assert dockerfile == f"FROM project-api\nLABEL {FINGERPRINT_LABEL}=abc\n"
+    assert kwargs["tag"] == "project-api"
+    assert "path" not in kwargs
+
+
+def test_stamp_fingerprint_failure(repository):
+    """Test stamping errors are wrapped in RuntimeError."""
+    repository.client.images.build.side_effect = Exception("boom")
+
+    with pytest.raises(RuntimeError):
+        repository.stamp_fingerprint("t", "f")
@@ -0,0 +1,315 @@
+"""Unit tests for cleanup repository."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.config import CleanupPolicy
+from app.repositories import cleanup_repository
+from app.repositories.cleanup_repository import CleanupRepository
+
+DF = {
+    "Containers": [
+        {"Id": "c1", "Names": ["/old"], "State": "exited", "SizeRw": 100,
+         "ImageID": "sha256:img-old"},
+        {"Id": "c2", "Names": ["/web"], "State": "running", "SizeRw": 5,
+         "ImageID": "sha256:img-web"},
+    ],
+    "Images": [
+        {"Id": "sha256:img-old", "RepoTags": ["old:1", "old:latest"],
+         "Size": 1000, "SharedSize": 400, "Containers": 1},
+        {"Id": "sha256:img-web", "RepoTags": ["web:1"], "Size": 2000,
+         "SharedSize": 400, "Containers": 1},
+    ],
+    "Volumes": [
+        {"Name": "orphan", "UsageData": {"Size": 50, "RefCount": 0}},
+        {"Name": "pg_data", "UsageData": {"Size": 900, "RefCount": 1}},
+    ],
+    "BuildCache": [
+        {"ID": "b1", "Type": "regular", "Size": 70, "InUse": False},
+        {"ID": "b2", "Type": "regular", "Size": 30, "InUse": True},
+    ],
+}
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    """Create repository over a fixed df snapshot."""
+    monkeypatch.setattr(cleanup_repository.mount_index, "ready", False)
+    repo = CleanupRepository()
+    repo.client = MagicMock()
+    repo.disk_usage = MagicMock()
+    repo.disk_usage.get_snapshot.return_value = DF
+    repo.disk_usage.get_snapshot_age.return_value = 3.0
+    return repo
+
+
+def test_build_plan(repository):
+    """Test the plan lists exactly what each category would remove."""
+    plan = repository.build_plan()
+    categories = plan["categories"]
+
+    assert [i["name"] for i in categories["containers"]["items"]] == ["old"]
+    assert [i["name"] for i in categories["images"]["items"]] == ["old:1"]
+    assert categories["images"]["reclaimable_bytes"] == 600
+    assert [i["id"] for i in categories["volumes"]["items"]] == ["orphan"]
+    assert [i["id"] for i in categories["build_cache"]["items"]] == ["b1"]
+    assert plan["total_reclaimable_bytes"] == 100 + 600 + 50 + 70
+    repository.client.api.remove_container.assert_not_called()
+
+
+def test_build_plan_keeps_pinned_images(repository, monkeypatch):
+    """Test pinned images never appear in a plan."""
+    monkeypatch.setattr(cleanup_repository.settings, "image_pins", ["keep:*"])
+    repository.disk_usage.get_snapshot.return_value = {
+        "Images": [
+            {"Id": "sha256:recent", "RepoTags": ["recent:1"], "Size": 80,
+             "Created": 1},
+            {"Id": "sha256:pinned", "RepoTags": ["keep:1"], "Size": 800,
+             "Created": 1},
+            {"Id": "sha256:label", "RepoTags": [], "Size": 100,
+             "Created": 1, "Labels": {"io.mylocalplace.pin": "true"}},
+            {"Id": "sha256:old", "RepoTags": ["old:1"], "Size": 50,
+             "Created": 1},
+        ],
+    }
+    usage = {"sha256:old": 100.0, "sha256:recent": 900.0}
+    monkeypatch.setattr(
+        cleanup_repository.image_usage,
+        "last_used",
+        lambda image_id, tags=None: usage.get(image_id),
+    )
+
+    images = repository.build_plan()["categories"]["images"]
+
+    assert [i["name"] for i in images["items"]] == ["old:1", "recent:1"]
+    assert images["reclaimable_bytes"] == 130
+
+
+def test_execute_plan(repository):
+    """Test executing a plan removes the planned objects only."""
+    plan = repository.build_plan()
+    repository.client.api.remove_volume.side_effect = RuntimeError("in use")
+
+    result = repository.execute_plan(
+        plan["plan_id"], ["containers", "images", "volumes"]
+    )
+
+    repository.client.api.remove_container.assert_called_once_with("c1")
+    removed_refs = [
+        c.args[0] for c in repository.client.api.remove_image.call_args_list
+    ]
+    assert removed_refs == ["old:1", "old:latest"]
+    assert result["removed"] == {"containers": 1, "images": 1, "volumes": 0}
+    assert result["failed"][0]["id"] == "orphan"
+    assert result["space_freed_bytes"] == 700
+    repository.client.api.prune_builds.assert_not_called()
+
+
+def test_execute_plan_image_conflict_on_second_tag(repository):
+    """Test an image failing on a later tag gets its tags back."""
+    plan = repository.build_plan()
+    repository.client.api.remove_image.side_effect = [
+        None,
+        RuntimeError("conflict"),
+    ]
+
+    result = repository.execute_plan(plan["plan_id"], ["images"])
+
+    repository.client.api.tag.assert_called_once_with(
+        "sha256:img-old", "old", "1"
+    )
+    assert result["removed"] == {"images": 0}
+    assert result["failed"] == [
+        {"category": "images", "id": "sha256:img-old", "error": "conflict"}
+    ]
+    assert result["space_freed_bytes"] == 0
+
+
+def test_execute_plan_image_in_use(repository):
+    """Test an image a new container uses is not untagged at all."""
+    plan = repository.build_plan()
+    repository.client.api.containers.return_value = [
+        {"Id": "c3" * 6, "ImageID": "sha256:img-old"}
+    ]
+
+    result = repository.execute_plan(plan["plan_id"], ["images"])
+
+    repository.client.api.remove_image.assert_not_called()
+    assert result["failed"][0]["id"] == "sha256:img-old"
+
+
+def test_execute_plan_build_cache(repository):
+    """Test build cache counts come from what the daemon deleted."""
+    repository.disk_usage.get_snapshot.return_value = {
+        "BuildCache": [
+            {"ID": "b1", "Size": 70, "InUse": False},
+            {"ID": "b3", "Size": 20, "InUse": False},
+        ],
+    }
+    plan = repository.build_plan()
+    repository.client.api.prune_builds.return_value = {
+        "CachesDeleted": ["b1"],
+        "SpaceReclaimed": 70,
+    }
+
+    result = repository.execute_plan(plan["plan_id"], ["build_cache"])
+
+    repository.client.api.prune_builds.assert_called_once_with(
+        filters={"id": ["b1", "b3"]}, all=True
+    )
+    assert result["removed"] == {"build_cache": 1}
+    assert [f["id"] for f in result["failed"]] == ["b3"]
+    assert result["space_freed_bytes"] == 70
+
+
+def test_execute_plan_once(repository):
+    """Test a plan cannot be executed twice."""
+    plan = repository.build_plan()
+    repository.execute_plan(plan["plan_id"], ["containers"])
+
+    with pytest.raises(ValueError):
+        repository.execute_plan(plan["plan_id"])
+
+
+def test_run_policy_exited_containers(repository):
+    """Test the containers policy only removes long-exited containers."""
+    repository.client.api.inspect_container.return_value = {
+        "State": {"FinishedAt": "2020-01-01T00:00:00.123456789Z"}
+    }
+    policy = CleanupPolicy(
+        name="old", action="containers", older_than_hours=168
+    )
+
+    result = repository.run_policy(
+        policy, time.monotonic() + 60, lambda: False
+    )
+
+    repository.client.api.remove_container.assert_called_once_with("c1")
+    assert result == {
+        "deleted": 1,
+        "space_freed_bytes": 100,
+        "interrupted": False,
+    }
+
+
+def test_run_policy_yields_to_traffic(repository):
+    """Test container removal stops when foreground traffic arrives."""
+    policy = CleanupPolicy(name="old", action="containers")
+
+    result = repository.run_policy(policy, time.monotonic() + 60, lambda: True)
+
+    assert result["interrupted"] is True
+    repository.client.api.remove_container.assert_not_called()
+
+
+def test_run_policy_build_cache(repository):
+    """Test build cache policies prune with keep_storage and until."""
+    repository.client.api.prune_builds.return_value = {"SpaceReclaimed": 5}
+    policy = CleanupPolicy(
+        name="cache",
+        action="build_cache",
+        keep_storage_gb=10,
+        older_than_hours=24,
+    )
+
+    result = repository.run_policy(
+        policy, time.monotonic() + 60, lambda: False
+    )
+
+    repository.client.api.prune_builds.assert_called_once_with(
+        filters={"until": "24h"}, keep_storage=10 * 1024**3
+    )
+    assert result["space_freed_bytes"] == 5
+
+
+def test_run_policy_images_keeps_pinned(repository, monkeypatch):
+    """Test an all-images policy never removes pinned images."""
+    monkeypatch.setattr(cleanup_repository.settings, "image_pins", ["keep:*"])
+    repository.disk_usage.get_snapshot.return_value = {
+        "Containers": [{"Id": "c1", "ImageID": "sha256:used"}],
+        "Images": [
+            {"Id": "sha256:used", "RepoTags": ["pg:16"], "Size": 900},
+            {"Id": "sha256:old", "RepoTags": ["old:1"], "Size": 500},
+            {"Id": "sha256:pinned", "RepoTags": ["keep:1"], "Size": 800},
+            {"Id": "sha256:label", "RepoTags": ["tool:1"], "Size": 100,
+             "Labels": {"io.mylocalplace.pin": "true"}},
+        ],
+    }
+    repository.client.api.containers.return_value = []
+    policy = CleanupPolicy(
+        name="images", action="images", dangling_only=False
+    )
+
+    result = repository.run_policy(
+        policy, time.monotonic() + 60, lambda: False
+    )
+
+    repository.client.api.remove_image.assert_called_once_with("old:1")
+    repository.client.images.prune.assert_not_called()
+    assert result == {
+        "deleted": 1,
+        "space_freed_bytes": 500,
+        "interrupted": False,
+    }
+
+
+def test_run_policy_dangling_images_skip_pin_label(repository):
+    """Test dangling image prunes exclude the pin label."""
+    repository.client.images.prune.return_value = {
+        "ImagesDeleted": [{"Deleted": "sha256:x"}],
+        "SpaceReclaimed": 10,
+    }
+    policy = CleanupPolicy(name="dangling", action="images")
+
+    result = repository.run_policy(
+        policy, time.monotonic() + 60, lambda: False
+    )
+
+    repository.client.images.prune.assert_called_once_with(
+        filters={"dangling": True, "label!": "io.mylocalplace.pin=true"}
+    )
+    assert result["deleted"] == 1
+
+
+def test_evict_images_lru(repository, monkeypatch):
+    """Test eviction removes least-recently-used images first."""
+    monkeypatch.setattr(cleanup_repository.settings, "image_pins", ["keep:*"])
+    repository.disk_usage.get_snapshot.return_value = {
+        "LayersSize": 3000,
+        "Containers": [{"Id": "c1", "ImageID": "sha256:used"}],
+        "Images": [
+            {"Id": "sha256:used", "RepoTags": ["pg:16"], "Size": 900,
+             "SharedSize": 0, "Created": 1},
+            {"Id": "sha256:old", "RepoTags": ["old:1"], "Size": 500,
+             "SharedSize": 0, "Created": 10},
+            {"Id": "sha256:recent", "RepoTags": ["recent:1"], "Size": 800,
+             "SharedSize": 0, "Created": 5},
+            {"Id": "sha256:pinned", "RepoTags": ["keep:1"], "Size": 800,
+             "SharedSize": 0, "Created": 1},
+            {"Id": "sha256:label", "RepoTags": [], "Size": 100,
+             "SharedSize": 0, "Created": 1,
+             "Labels": {"io.mylocalplace.pin": "true"}},
+        ],
+    }
+    usage = {"sha256:old": 100.0, "sha256:recent": 900.0}
+    monkeypatch.setattr(
+        cleanup_repository.image_usage,
+        "last_used",
+        lambda image_id, tags=None: usage.get(image_id),
+    )
+
+    result = repository.evict_images(budget_bytes=2400)
+
+    assert [i["name"] for i in result["evicted"]] == ["old:1", "recent:1"]
+    assert result["space_freed_bytes"] == 1300
+    repository.client.api.remove_image.assert_any_call("old:1")
+
+
+def test_evict_images_within_budget(repository):
+    """Test nothing is evicted when images fit the budget."""
+    result = repository.evict_images(budget_bytes=10**12, dry_run=True)
+
+    assert result["evicted"] == []
+    repository.client.api.remove_image.assert_not_called()
@@ -1,6 +1,6 @@
 """Unit tests for DockerRepository."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -103,6 +103,28 @@ def test_get_logs(repository, mock_container):
     mock_container.logs.assert_called_once()
 
 
+@patch("app.repositories.docker_repository.docker_client")
+def test_follow_logs_without_read_timeout(
+    mock_manager, repository, mock_container
+):
+    """Test follow streams use the timeout-free client and resume."""
+    repository.client.containers.get.return_value = mock_container
+    mock_container.id = "abc123def456"
+    api = mock_manager.get_stream_api.return_value
+
+    repository.follow_logs("test", since=1735725601)
+
+    api.logs.assert_called_once_with(
+        "abc123def456",
+        stream=True,
+        follow=True,
+        timestamps=True,
+        tail="all",
+        since=1735725601,
+    )
+    mock_container.logs.assert_not_called()
+
+
 def test_get_stats(repository, mock_container):
     """Test get_stats returns formatted statistics."""
     repository.client.containers.get.return_value = mock_container
@@ -152,3 +174,75 @@ def test_format_ports_no_host_port():
     result = DockerRepository._format_ports(ports)
 
     assert result == []
+
+
+def test_rebuild_container_skips_unchanged(
+    repository, mock_container, monkeypatch
+):
+    """Test rebuild is skipped when the build fingerprint matches."""
+    from app.core.build_fingerprint import FINGERPRINT_LABEL
+    from app.repositories import docker_repository
+
+    mock_container.labels = {
+        "com.docker.compose.project": "project",
+        "com.docker.compose.service": "api",
+    }
+    mock_container.image.labels = {FINGERPRINT_LABEL: "same"}
+    repository.client.containers.get.return_value = mock_container
+
+    builds = MagicMock()
+    builds.get_build_config.return_value = {"service": "api"}
+    builds.compute_fingerprint.return_value = "same"
+    monkeypatch.setattr(
+        docker_repository, "BuildRepository", MagicMock(return_value=builds)
+    )
+    monkeypatch.setattr(docker_repository, "compose_catalog", MagicMock())
+    docker_repository.compose_catalog.get.return_value = {
+        "file": "/srv/docker-compose.yml"
+    }
+
+    result = repository.rebuild_container("api")
+
+    assert "skipped" in result["message"]
+    mock_container.stop.assert_not_called()
+    builds.stamp_fingerprint.assert_not_called()
+
+
+def test_rebuild_container_builds_with_compose(
+    repository, mock_container, monkeypatch
+):
+    """Test a changed context is rebuilt by compose, then stamped."""
+    import subprocess
+
+    from app.core.build_fingerprint import FINGERPRINT_LABEL
+    from app.repositories import docker_repository
+
+    mock_container.labels = {
+        "com.docker.compose.project": "project",
+        "com.docker.compose.service": "api",
+    }
+    mock_container.image.labels = {FINGERPRINT_LABEL: "old"}
+    repository.client.containers.get.return_value = mock_container
+
+    builds = MagicMock()
+    builds.get_build_config.return_value = {
+        "service": "api",
+        "image": "project-api",
+    }
+    builds.compute_fingerprint.return_value = "new"
+    monkeypatch.setattr(
+        docker_repository, "BuildRepository", MagicMock(return_value=builds)
+    )
+    monkeypatch.setattr(docker_repository, "compose_catalog", MagicMock())
+    docker_repository.compose_catalog.get.return_value = {
+        "file": "/srv/docker-compose.yml"
+    }
+    run = MagicMock(return_value=MagicMock(returncode=0))
+    monkeypatch.setattr(subprocess, "run", run)
+
+    result = repository.rebuild_container("api")
+
+    assert "rebuilt" in result["message"]
+    build_cmd = run.call_args_list[0].args[0]
+    assert build_cmd[3:] == ["build", "--no-cache", "api"]
+    builds.stamp_fingerprint.assert_called_once_with("project-api", "new")
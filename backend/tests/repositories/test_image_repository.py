@@ -0,0 +1,81 @@
+"""Unit tests for image repository."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.repositories import image_repository
+from app.repositories.image_repository import ImageRepository
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    """Create repository over a fixed df snapshot."""
+    image_repository._inventory_cache.invalidate()
+    monkeypatch.setattr(
+        image_repository.image_usage,
+        "last_used",
+        lambda image_id, tags=None: 1764842400.0 if tags else None,
+    )
+    repo = ImageRepository()
+    repo.disk_usage = MagicMock()
+    repo.disk_usage.get_snapshot.return_value = {
+        "LayersSize": 2500,
+        "Images": [
+            {"Id": "sha256:aaaaaaaaaaaaaaaa", "RepoTags": ["app-api:latest"],
+             "Size": 1200, "SharedSize": 500, "Containers": 1,
+             "Created": 1764000000,
+             "Labels": {"com.docker.compose.project": "app"}},
+            {"Id": "sha256:bbbbbbbbbbbbbbbb", "RepoTags": ["app-api:old"],
+             "Size": 1100, "SharedSize": 500, "Containers": 0,
+             "Created": 1763000000,
+             "Labels": {"com.docker.compose.project": "app"}},
+            {"Id": "sha256:cccccccccccccccc", "RepoTags": ["<none>:<none>"],
+             "Size": 700, "SharedSize": -1, "Containers": -1,
+             "Created": 1762000000},
+        ],
+    }
+    return repo
+
+
+def test_get_inventory(repository):
+    """Test sizes are split into shared and unique parts."""
+    inventory = repository.get_inventory()
+
+    first = inventory["images"][0]
+    assert first["id"] == "aaaaaaaaaaaa"
+    assert first["unique_size_bytes"] == 700
+    assert first["last_used"].startswith("2025-12-04")
+    dangling = [i for i in inventory["images"] if i["repository"] == "<none>"]
+    assert dangling[0]["tags"] == []
+    assert dangling[0]["shared_size_bytes"] == 0
+    assert dangling[0]["containers"] == 0
+    assert dangling[0]["last_used"] is None
+    assert inventory["total_size_bytes"] == 2500
+    assert inventory["naive_size_bytes"] == 3000
+
+
+def test_inventory_totals(repository):
+    """Test totals per repository and compose project."""
+    inventory = repository.get_inventory()
+
+    repositories = {r["name"]: r for r in inventory["repositories"]}
+    assert repositories["app-api"]["image_count"] == 2
+    assert repositories["app-api"]["unique_size_bytes"] == 1300
+    groups = {g["name"]: g for g in inventory["groups"]}
+    assert groups["ungrouped"]["unique_size_bytes"] == 700
+
+
+def test_inventory_cached_until_event(repository):
+    """Test the inventory is reused until an image event arrives."""
+    repository.get_inventory()
+    repository.get_inventory()
+    assert repository.disk_usage.get_snapshot.call_count == 1
+
+    ImageRepository.handle_event({"Type": "container", "Action": "start"})
+    repository.get_inventory()
+    assert repository.disk_usage.get_snapshot.call_count == 1
+
+    ImageRepository.handle_event({"Type": "image", "Action": "delete"})
+    repository.get_inventory()
+    assert repository.disk_usage.get_snapshot.call_count == 2
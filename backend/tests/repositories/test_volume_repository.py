@@ -0,0 +1,85 @@
+"""Unit tests for VolumeRepository."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.repositories.disk_usage_repository import DiskUsageRepository
+from app.repositories.volume_repository import VolumeRepository
+
+
+@pytest.fixture
+def repository():
+    """Create repository with mocked client."""
+    DiskUsageRepository.invalidate()
+    repo = VolumeRepository()
+    repo.client = MagicMock()
+    repo.disk_usage.client = repo.client
+    yield repo
+    DiskUsageRepository.invalidate()
+
+
+def test_list_volumes_uses_single_df(repository):
+    """Test volumes come from one df() call with sizes."""
+    repository.client.df.return_value = {
+        "Volumes": [
+            {
+                "Name": "postgres_data",
+                "Driver": "local",
+                "Mountpoint": "/var/lib/docker/volumes/postgres_data/_data",
+                "CreatedAt": "2025-10-29T10:00:00Z",
+                "Labels": None,
+                "Scope": "local",
+                "UsageData": {"Size": 5 * 1024 * 1024, "RefCount": 1},
+            },
+            {
+                "Name": "orphan",
+                "Driver": "local",
+                "Mountpoint": "",
+                "CreatedAt": "",
+                "Scope": "local",
+                "UsageData": {"Size": -1, "RefCount": 0},
+            },
+        ]
+    }
+
+    result = repository.list_volumes()
+    repository.list_volumes()
+
+    assert result[0]["size_mb"] == 5.0
+    assert result[0]["in_use"] is True
+    assert result[1]["size_bytes"] is None
+    assert result[1]["in_use"] is False
+    repository.client.df.assert_called_once()
+    repository.client.containers.list.assert_not_called()
+
+
+def test_get_unused_volumes_filters_on_daemon(repository):
+    """Test unused volumes use the dangling filter."""
+    volume = MagicMock()
+    volume.name = "orphan"
+    repository.client.volumes.list.return_value = [volume]
+
+    result = repository.get_unused_volumes()
+
+    assert result == ["orphan"]
+    repository.client.volumes.list.assert_called_once_with(
+        filters={"dangling": True}
+    )
+    repository.client.containers.list.assert_not_called()
+
+
+def test_prune_volumes_invalidates_snapshot(repository):
+    """Test prune drops the cached df snapshot."""
+    repository.client.df.return_value = {"Volumes": []}
+    repository.client.volumes.prune.return_value = {
+        "VolumesDeleted": ["a"],
+        "SpaceReclaimed": 1024 * 1024,
+    }
+    repository.list_volumes()
+
+    result = repository.prune_volumes()
+    repository.list_volumes()
+
+    assert result["volumes_deleted"] == 1
+    assert repository.client.df.call_count == 2
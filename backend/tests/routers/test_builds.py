@@ -0,0 +1,89 @@
+"""Unit tests for builds router."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return TestClient(app)
+
+
+@patch("app.routers.builds.repository")
+def test_list_stale_builds(mock_repository, client):
+    """Test only stale services are returned."""
+    mock_repository.list_build_status.return_value = [
+        {
+            "service": "api",
+            "context": "/srv/backend",
+            "image": "project-api",
+            "fingerprint": "new",
+            "image_fingerprint": "old",
+            "stale": True,
+        },
+        {
+            "service": "frontend",
+            "context": "/srv/frontend",
+            "image": "project-frontend",
+            "fingerprint": "same",
+            "image_fingerprint": "same",
+            "stale": False,
+        },
+    ]
+
+    response = client.get("/api/v1/builds/stale")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [s["service"] for s in data] == ["api"]
+
+
+@patch("app.routers.builds.repository")
+def test_list_stale_builds_error(mock_repository, client):
+    """Test errors are mapped to 500."""
+    mock_repository.list_build_status.side_effect = RuntimeError("no file")
+
+    response = client.get("/api/v1/builds/stale")
+
+    assert response.status_code == 500
+
+
+@patch("app.routers.builds.cache_repository")
+def test_get_build_cache(mock_repository, client):
+    """Test build cache report endpoint."""
+    mock_repository.get_report.return_value = {
+        "total_bytes": 100,
+        "reclaimable_bytes": 60,
+        "record_count": 2,
+        "by_type": {"regular": {"count": 2, "size_bytes": 100}},
+        "by_age": {"<1d": {"count": 2, "size_bytes": 100}},
+        "budget_bytes": 50,
+        "over_budget_bytes": 50,
+    }
+
+    response = client.get("/api/v1/builds/cache")
+
+    assert response.status_code == 200
+    assert response.json()["over_budget_bytes"] == 50
+
+
+@patch("app.routers.builds.cache_repository")
+def test_prune_build_cache(mock_repository, client):
+    """Test build cache prune passes the budget in bytes."""
+    mock_repository.prune_to_budget.return_value = {
+        "total_bytes_before": 3 * 1024**3,
+        "space_freed_bytes": 2 * 1024**3,
+        "total_bytes_after": 1024**3,
+        "budget_bytes": 1024**3,
+        "within_budget": True,
+    }
+
+    response = client.post("/api/v1/builds/cache/prune?budget_gb=1")
+
+    assert response.status_code == 200
+    mock_repository.prune_to_budget.assert_called_once_with(1024**3)
@@ -0,0 +1,96 @@
+"""Unit tests for cleanup router."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return TestClient(app)
+
+
+@patch("app.routers.cleanup.repository")
+def test_get_cleanup_plan(mock_repository, client):
+    """Test plan endpoint."""
+    mock_repository.build_plan.return_value = {
+        "plan_id": "abc123",
+        "created_at": "2025-12-04T10:00:00+00:00",
+        "snapshot_age": 1.0,
+        "categories": {
+            "images": {
+                "items": [
+                    {"id": "sha256:1", "name": "old:1", "size_bytes": 10}
+                ],
+                "count": 1,
+                "reclaimable_bytes": 10,
+            }
+        },
+        "total_reclaimable_bytes": 10,
+    }
+
+    response = client.get("/api/v1/cleanup/plan")
+
+    assert response.status_code == 200
+    assert response.json()["categories"]["images"]["count"] == 1
+
+
+@patch("app.routers.cleanup.repository")
+def test_execute_cleanup_plan(mock_repository, client):
+    """Test executing a plan with selected categories."""
+    mock_repository.execute_plan.return_value = {
+        "plan_id": "abc123",
+        "removed": {"images": 1},
+        "failed": [],
+        "space_freed_bytes": 10,
+    }
+
+    response = client.post(
+        "/api/v1/cleanup/plan/abc123/execute?categories=images"
+    )
+
+    assert response.status_code == 200
+    mock_repository.execute_plan.assert_called_once_with("abc123", ["images"])
+
+
+@patch("app.routers.cleanup.repository")
+def test_execute_cleanup_plan_expired(mock_repository, client):
+    """Test executing an unknown plan returns 404."""
+    mock_repository.execute_plan.side_effect = ValueError("expired")
+
+    response = client.post("/api/v1/cleanup/plan/missing/execute")
+
+    assert response.status_code == 404
+
+
+def test_execute_cleanup_plan_bad_category(client):
+    """Test unknown categories are rejected."""
+    response = client.post("/api/v1/cleanup/plan/abc/execute?categories=x")
+
+    assert response.status_code == 422
+
+
+@patch("app.routers.cleanup.cleanup_scheduler")
+def test_get_cleanup_history(mock_scheduler, client):
+    """Test cleanup history endpoint."""
+    mock_scheduler.history.return_value = [
+        {
+            "policy": "dangling-images",
+            "action": "images",
+            "started_at": "2025-12-04T10:00:00+00:00",
+            "duration_seconds": 1.2,
+            "deleted": 4,
+            "space_freed_bytes": 2048,
+            "interrupted": False,
+            "error": None,
+        }
+    ]
+
+    response = client.get("/api/v1/cleanup/history")
+
+    assert response.status_code == 200
+    assert response.json()[0]["deleted"] == 4
@@ -0,0 +1,62 @@
+"""Unit tests for compose router."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def service_data():
+    """Sample compose catalog entry."""
+    return {
+        "name": "local-redis",
+        "file": "/srv/docker-compose.yml",
+        "container_name": "local-redis",
+        "image": "redis:7",
+        "build": None,
+        "depends_on": [],
+        "ports": ["6379:6379"],
+        "volumes": ["redis_data:/data"],
+        "profiles": ["services"],
+    }
+
+
+@patch("app.routers.compose.compose_catalog")
+def test_list_compose_services(mock_catalog, client, service_data):
+    """Test list compose services endpoint."""
+    mock_catalog.list_services.return_value = [service_data]
+
+    response = client.get("/api/v1/compose/services")
+
+    assert response.status_code == 200
+    assert response.json()[0]["name"] == "local-redis"
+
+
+@patch("app.routers.compose.compose_catalog")
+def test_get_compose_service(mock_catalog, client, service_data):
+    """Test get compose service endpoint."""
+    mock_catalog.get.return_value = service_data
+
+    response = client.get("/api/v1/compose/services/local-redis")
+
+    assert response.status_code == 200
+    assert response.json()["profiles"] == ["services"]
+
+
+@patch("app.routers.compose.compose_catalog")
+def test_get_compose_service_not_found(mock_catalog, client):
+    """Test unknown services return 404."""
+    mock_catalog.get.return_value = None
+
+    response = client.get("/api/v1/compose/services/missing")
+
+    assert response.status_code == 404
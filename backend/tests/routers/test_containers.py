@@ -1,5 +1,6 @@
 """Unit tests for containers router."""
 
+import time
 from unittest.mock import patch
 
 import pytest
@@ -136,3 +137,208 @@ def test_get_stats(mock_repository, client):
     assert data["cpu_percent"] == 2.5
     assert data["memory_usage_mb"] == 100.0
 
+
+@patch("app.routers.containers.repository")
+def test_get_container_volumes(mock_repository, client):
+    """Test container volumes endpoint."""
+    mock_repository.get_container_volumes.return_value = [
+        {
+            "volume": "postgres_data",
+            "container_id": "abc123def456",
+            "container_name": "local-postgres",
+            "destination": "/var/lib/postgresql/data",
+            "read_only": False,
+        }
+    ]
+
+    response = client.get("/api/v1/containers/local-postgres/volumes")
+
+    assert response.status_code == 200
+    assert response.json()[0]["volume"] == "postgres_data"
+
+
+@patch("app.routers.containers.repository")
+def test_list_containers_compressed(
+    mock_repository, client, sample_container_data
+):
+    """Test large listings are compressed when the client accepts it."""
+    mock_repository.list_containers.return_value = [
+        dict(sample_container_data, name=f"c{i}") for i in range(50)
+    ]
+
+    response = client.get(
+        "/api/v1/containers", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 50
+
+
+@patch("app.routers.containers.event_bus")
+@patch("app.routers.containers.repository")
+def test_list_containers_not_modified(
+    mock_repository, mock_event_bus, client, sample_container_data
+):
+    """Test If-None-Match with the current ETag skips Docker."""
+    mock_event_bus.connected = True
+    mock_repository.list_containers.return_value = [sample_container_data]
+
+    first = client.get("/api/v1/containers")
+    etag = first.headers["etag"]
+    second = client.get(
+        "/api/v1/containers", headers={"If-None-Match": etag}
+    )
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    mock_repository.list_containers.assert_called_once()
+
+
+@patch("app.routers.containers.event_bus")
+@patch("app.routers.containers.repository")
+def test_list_containers_etag_changes_on_event(
+    mock_repository, mock_event_bus, client, sample_container_data
+):
+    """Test a container event invalidates the previous ETag."""
+    from app.core.container_changes import container_changes
+
+    mock_event_bus.connected = True
+    mock_repository.list_containers.return_value = [sample_container_data]
+
+    etag = client.get("/api/v1/containers").headers["etag"]
+    container_changes.handle_event(
+        {"Type": "container", "Action": "die", "Actor": {"ID": "abc"}}
+    )
+    response = client.get(
+        "/api/v1/containers", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@patch("app.routers.containers.event_bus")
+@patch("app.routers.containers.repository")
+def test_list_containers_no_etag_without_events(
+    mock_repository, mock_event_bus, client, sample_container_data
+):
+    """Test no ETag is sent while the events stream is down."""
+    mock_event_bus.connected = False
+    mock_repository.list_containers.return_value = [sample_container_data]
+
+    response = client.get("/api/v1/containers")
+
+    assert "etag" not in response.headers
+
+
+@patch("app.routers.containers.repository")
+def test_get_container_changes(
+    mock_repository, client, sample_container_data
+):
+    """Test the changes route is not shadowed by /{name}."""
+    mock_repository.list_containers.side_effect = (
+        lambda all=True, ids=None: [
+            c for c in [sample_container_data] if ids is None or c["id"] in ids
+        ]
+    )
+
+    first = client.get("/api/v1/containers/changes").json()
+    second = client.get(
+        "/api/v1/containers/changes", params={"since": first["revision"]}
+    ).json()
+
+    assert first["full_resync"] is True
+    assert first["added"][0]["name"] == "test-container"
+    assert second == {
+        "revision": first["revision"],
+        "full_resync": False,
+        "added": [],
+        "updated": [],
+        "removed": [],
+    }
+    mock_repository.get_container.assert_not_called()
+
+
+@patch("app.core.long_poll.event_bus")
+@patch("app.routers.containers.event_bus")
+@patch("app.routers.containers.repository")
+def test_list_containers_wait_for_revision(
+    mock_repository,
+    mock_event_bus,
+    mock_long_poll_bus,
+    client,
+    sample_container_data,
+):
+    """Test long-poll times out, then answers with the current revision."""
+    from app.core.revisions import revisions
+
+    mock_event_bus.connected = False
+    mock_long_poll_bus.connected = True
+    mock_repository.list_containers.return_value = [sample_container_data]
+    token = revisions.token("containers")
+
+    response = client.get(
+        "/api/v1/containers",
+        params={"wait_for_revision": token, "timeout": 0.05},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["x-revision"] == token
+    assert "x-revision-resync" not in response.headers
+    assert response.json()[0]["name"] == "test-container"
+
+
+@patch("app.core.long_poll.event_bus")
+@patch("app.routers.containers.event_bus")
+@patch("app.routers.containers.repository")
+def test_list_containers_wait_for_revision_other_epoch(
+    mock_repository,
+    mock_event_bus,
+    mock_long_poll_bus,
+    client,
+    sample_container_data,
+):
+    """Test a token from another worker is answered with a resync."""
+    from app.core.revisions import RevisionTracker, revisions
+
+    mock_event_bus.connected = True
+    mock_long_poll_bus.connected = True
+    mock_repository.list_containers.return_value = [sample_container_data]
+    foreign = RevisionTracker().token("containers")
+
+    response = client.get(
+        "/api/v1/containers",
+        params={"wait_for_revision": foreign, "timeout": 30},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["x-revision-resync"] == "true"
+    assert response.headers["x-revision"] == revisions.token("containers")
+
+
+@patch("app.core.long_poll.event_bus")
+@patch("app.routers.containers.repository")
+def test_get_container_waits_on_own_revision(
+    mock_repository, mock_long_poll_bus, client, sample_container_data
+):
+    """Test a detail long-poll ignores changes to other containers."""
+    from app.core.container_changes import container_changes
+    from app.core.revisions import revisions
+
+    mock_long_poll_bus.connected = True
+    mock_repository.get_container.return_value = sample_container_data
+    resource = container_changes.resource("web")
+    token = revisions.token(resource)
+    revisions.bump(container_changes.resource("other"))
+
+    started = time.monotonic()
+    response = client.get(
+        "/api/v1/containers/web",
+        params={"wait_for_revision": token, "timeout": 0.2},
+    )
+
+    assert time.monotonic() - started >= 0.2
+    assert response.status_code == 200
+    assert response.headers["x-revision"] == token
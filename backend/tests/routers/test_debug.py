@@ -0,0 +1,50 @@
+"""Tests for debug endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.collectors import Collector, collectors
+from app.core.sampling import demand
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return TestClient(app)
+
+
+def test_get_collectors(client):
+    """Test collectors are listed with their statistics."""
+    collectors.register(Collector("test_job", lambda: None, interval=30))
+
+    response = client.get("/api/v1/debug/collectors")
+
+    assert response.status_code == 200
+    job = next(c for c in response.json() if c["name"] == "test_job")
+    assert job["interval"] == 30
+    assert job["runs"] == 0
+    assert job["executor"] == "thread"
+
+
+def test_get_sampling_demand(client):
+    """Test keys with sampling demand are listed."""
+    release = demand.hold("stats:debug-test", 5)
+    try:
+        response = client.get("/api/v1/debug/sampling")
+    finally:
+        release()
+
+    assert response.status_code == 200
+    assert "stats:debug-test" in response.json()
+
+
+def test_metrics_include_collectors(client):
+    """Test /metrics exports collector self-metrics."""
+    collectors.register(Collector("test_job", lambda: None, interval=30))
+
+    response = client.get("/metrics")
+
+    assert 'mylocalplace_collector_runs_total{collector="test_job"}' in (
+        response.text
+    )
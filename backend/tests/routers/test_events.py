@@ -0,0 +1,47 @@
+"""Unit tests for the Server-Sent Events router."""
+
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.core.lifecycle_events import LifecycleEventStream
+from app.main import app
+
+
+def _event(action, name):
+    return {
+        "Type": "container",
+        "Action": action,
+        "Actor": {"ID": f"{name}-id", "Attributes": {"name": name}},
+    }
+
+
+def test_stream_replays_after_last_event_id():
+    """Test filtered replay after Last-Event-ID as SSE frames."""
+    stream = LifecycleEventStream()
+    for action, name in (("create", "web"), ("start", "web"), ("start", "db")):
+        stream.handle_event(_event(action, name))
+    open_stream = stream.open
+
+    def open_closing(last_event_id=None):
+        # Ends the response once the replay is sent
+        listener = open_stream(last_event_id)
+        listener.overflowed = True
+        return listener
+
+    with patch("app.routers.events.lifecycle_events", stream), patch.object(
+        stream, "open", side_effect=open_closing
+    ):
+        response = TestClient(app).get(
+            "/api/v1/events?container=web",
+            headers={"Last-Event-ID": f"{stream._epoch}-1"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = response.text.split("\n\n")
+    assert frames[0] == "retry: 3000"
+    assert frames[1].startswith(f"id: {stream._epoch}-2\ndata: ")
+    assert '"action":"start"' in frames[1] and '"name":"web"' in frames[1]
+    assert frames[2:] == [""]
+    assert stream._listeners == set()
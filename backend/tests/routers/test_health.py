@@ -53,3 +53,72 @@ def test_health_check_docker_disconnected(mock_is_connected, client):
     data = response.json()
     assert data["docker_connected"] is False
 
+
+def test_liveness(client):
+    """Test liveness never depends on Docker."""
+    response = client.get("/health/live")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "alive"
+
+
+@patch("app.routers.health.daemon_health")
+def test_readiness_ready(mock_health, client):
+    """Test readiness answers from the cached probe."""
+    mock_health.probed = True
+    mock_health.snapshot.return_value = {
+        "connected": True,
+        "last_latency_ms": 1.5,
+        "recent_latency_ms": 2.0,
+        "last_error": None,
+        "consecutive_failures": 0,
+        "checked_at": "2025-12-04T10:00:00+00:00",
+    }
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+
+@patch("app.routers.health.daemon_health")
+def test_readiness_not_ready(mock_health, client):
+    """Test readiness returns 503 with the last error."""
+    mock_health.probed = True
+    mock_health.snapshot.return_value = {
+        "connected": False,
+        "last_latency_ms": None,
+        "recent_latency_ms": None,
+        "last_error": "Ping timed out after 2.0s",
+        "consecutive_failures": 3,
+        "checked_at": "2025-12-04T10:00:00+00:00",
+    }
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["last_error"] == "Ping timed out after 2.0s"
+
+
+def test_metrics(client):
+    """Test Prometheus metrics exposition."""
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "mylocalplace_docker_ping_seconds_bucket" in response.text
+
+
+@patch("app.routers.containers.repository")
+def test_docker_outage_returns_503(mock_repo, client):
+    """Test requests fail fast with 503 while Docker is unavailable."""
+    from app.core.docker_client import DockerUnavailableError
+
+    mock_repo.list_containers.side_effect = DockerUnavailableError(
+        "Docker daemon unavailable", retry_after=4
+    )
+
+    response = client.get("/api/v1/containers")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "4"
@@ -0,0 +1,61 @@
+"""Unit tests for images router."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return TestClient(app)
+
+
+@patch("app.routers.images.repository")
+def test_list_images(mock_repository, client):
+    """Test images endpoint."""
+    mock_repository.get_inventory.return_value = {
+        "images": [
+            {
+                "id": "3f4e9a1c2b7d",
+                "tags": ["postgres:16"],
+                "repository": "postgres",
+                "group": "ungrouped",
+                "size_bytes": 400,
+                "shared_size_bytes": 100,
+                "unique_size_bytes": 300,
+                "containers": 1,
+                "created": None,
+                "last_used": None,
+            }
+        ],
+        "repositories": [
+            {
+                "name": "postgres",
+                "image_count": 1,
+                "unique_size_bytes": 300,
+                "size_bytes": 400,
+            }
+        ],
+        "groups": [],
+        "total_size_bytes": 400,
+        "naive_size_bytes": 400,
+    }
+
+    response = client.get("/api/v1/images")
+
+    assert response.status_code == 200
+    assert response.json()["images"][0]["unique_size_bytes"] == 300
+
+
+@patch("app.routers.images.repository")
+def test_list_images_error(mock_repository, client):
+    """Test images endpoint error handling."""
+    mock_repository.get_inventory.side_effect = RuntimeError("daemon down")
+
+    response = client.get("/api/v1/images")
+
+    assert response.status_code == 500
@@ -0,0 +1,162 @@
+"""Unit tests for the WebSocket stream router."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return TestClient(app)
+
+
+@patch("app.routers.stream.event_bus")
+@patch("app.routers.stream.repository")
+def test_subscribe_containers_and_stats(
+    mock_repository, mock_event_bus, client, sample_container_data
+):
+    """Test topic subscription over one socket, with sample cadence."""
+    mock_event_bus.connected = False
+    mock_repository.list_containers.return_value = [sample_container_data]
+    mock_repository.get_stats.return_value = {"cpu_percent": 1.5}
+
+    with client.websocket_connect("/api/v1/ws?topics=containers") as ws:
+        assert ws.receive_json() == {"topics": ["containers"]}
+        message = ws.receive_json()
+        assert message["topic"] == "containers"
+        assert message["data"][0]["name"] == "test-container"
+
+        ws.send_json({"subscribe": ["stats:*", "bogus"]})
+        assert ws.receive_json() == {"error": "Unknown topic: bogus"}
+        assert ws.receive_json() == {"topics": ["containers", "stats:*"]}
+        assert ws.receive_json() == {
+            "topic": "stats:test-container",
+            "data": {"cpu_percent": 1.5},
+            "interval": 5.0,
+        }
+
+    mock_repository.get_stats.assert_called_once_with("test-container")
+
+
+def test_rejects_non_object_messages(client):
+    """Test malformed client messages get an error frame."""
+    with client.websocket_connect("/api/v1/ws") as ws:
+        ws.send_text("not json")
+        assert ws.receive_json() == {"error": "Expected a JSON object"}
+
+
+@patch("app.routers.stream.repository")
+def test_subscribe_logs(mock_repository, client):
+    """Test log lines read on the topic's thread reach the socket."""
+    stream = MagicMock()
+    stream.__iter__.return_value = iter([b"one\ntwo\n", b"three\n"])
+    mock_repository.follow_logs.return_value = stream
+
+    with client.websocket_connect("/api/v1/ws?topics=logs:web") as ws:
+        assert ws.receive_json() == {"topics": ["logs:web"]}
+        lines = [ws.receive_json()["data"] for _ in range(3)]
+
+    assert lines == ["one", "two", "three"]
+    mock_repository.follow_logs.assert_called_with("web", since=None)
+
+
+class _TimingOutStream:
+    """Log stream yielding some chunks, then failing like a read timeout."""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+
+    def __iter__(self):
+        yield from self.chunks
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        pass
+
+
+@patch("app.routers.stream.COLLECTOR_RETRY_DELAY", 0.01)
+@patch("app.routers.stream.repository")
+def test_logs_resume_after_timeout(mock_repository, client):
+    """Test a stream failing mid-way is reopened without losing lines."""
+    streams = [
+        _TimingOutStream(
+            [b"2025-01-01T10:00:01.5Z one\n"],
+            requests.exceptions.ReadTimeout("read timed out"),
+        ),
+        _TimingOutStream(
+            [
+                b"2025-01-01T10:00:01.5Z one\n",
+                b"2025-01-01T10:00:02.25Z two\n",
+                b"2025-01-01T10:00:03Z three\n",
+            ]
+        ),
+    ]
+    mock_repository.follow_logs.side_effect = lambda name, since=None: (
+        streams.pop(0) if streams else _TimingOutStream([])
+    )
+
+    with client.websocket_connect("/api/v1/ws?topics=logs:web") as ws:
+        assert ws.receive_json() == {"topics": ["logs:web"]}
+        lines = [ws.receive_json()["data"] for _ in range(3)]
+
+    assert lines == [
+        "2025-01-01T10:00:01.5Z one",
+        "2025-01-01T10:00:02.25Z two",
+        "2025-01-01T10:00:03Z three",
+    ]
+    calls = mock_repository.follow_logs.call_args_list
+    assert calls[0].kwargs == {"since": None}
+    assert calls[1].kwargs == {"since": 1735725601}
+
+
+@patch("app.routers.stream.repository")
+def test_log_topics_capped(mock_repository, client, monkeypatch):
+    """Test log topics beyond WS_MAX_LOG_TOPICS report an error."""
+    monkeypatch.setattr(
+        "app.routers.stream.settings.ws_max_log_topics", 0
+    )
+
+    with client.websocket_connect("/api/v1/ws?topics=logs:web") as ws:
+        assert ws.receive_json() == {"topics": ["logs:web"]}
+        assert ws.receive_json() == {
+            "topic": "logs:web",
+            "error": "Too many log streams (limit 0)",
+        }
+
+    mock_repository.follow_logs.assert_not_called()
+
+
+@patch("app.routers.stream.AlertController")
+def test_alerts_topic_holds_host_demand(mock_alerts, client):
+    """Test the alerts topic keeps host sampling alive off the loop."""
+    import asyncio
+
+    from app.core.sampling import demand
+
+    seen = {}
+
+    def state_key():
+        seen["interval"] = demand.interval("host")
+        try:
+            asyncio.get_running_loop()
+            seen["on_loop"] = True
+        except RuntimeError:
+            seen["on_loop"] = False
+        return ()
+
+    mock_alerts.state_key.side_effect = state_key
+    mock_alerts.summary.return_value = {"total": 0}
+
+    with client.websocket_connect("/api/v1/ws?topics=alerts") as ws:
+        assert ws.receive_json() == {"topics": ["alerts"]}
+        assert ws.receive_json()["topic"] == "alerts"
+
+    assert seen["interval"] is not None
+    assert seen["on_loop"] is False
@@ -1,6 +1,6 @@
 """Unit tests for system router."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -14,22 +14,24 @@ def client():
     return TestClient(app)
 
 
-@patch("app.controllers.system_controller.psutil")
-def test_get_system_metrics(mock_psutil, client):
+@patch("app.controllers.system_controller.host_metrics")
+def test_get_system_metrics(mock_host, client):
     """Test get system metrics endpoint."""
-    mock_psutil.cpu_percent.return_value = 25.5
-
-    mock_memory = MagicMock()
-    mock_memory.total = 32 * 1024**3
-    mock_memory.used = 18 * 1024**3
-    mock_memory.percent = 56.25
-    mock_psutil.virtual_memory.return_value = mock_memory
-
-    mock_disk = MagicMock()
-    mock_disk.total = 1000 * 1024**3
-    mock_disk.used = 600 * 1024**3
-    mock_disk.percent = 60.0
-    mock_psutil.disk_usage.return_value = mock_disk
+    mock_host.latest.return_value = {
+        "cpu_percent": 25.5,
+        "memory": {"total_gb": 32.0, "used_gb": 18.0, "percent": 56.25},
+        "disk": {"total_gb": 1000.0, "used_gb": 600.0, "percent": 60.0},
+        "cpu_per_core": [25.5],
+        "mounts": [
+            {
+                "path": "/var/lib/docker",
+                "total_gb": 1000.0,
+                "used_gb": 600.0,
+                "free_gb": 400.0,
+                "percent": 60.0,
+            }
+        ],
+    }
 
     response = client.get("/api/v1/system/metrics")
 
@@ -38,4 +40,5 @@ def test_get_system_metrics(mock_psutil, client):
     assert data["cpu_percent"] == 25.5
     assert data["memory"]["total_gb"] == 32.0
     assert data["disk"]["percent"] == 60.0
-
+    assert data["mounts"][0]["path"] == "/var/lib/docker"
+    assert data["disk_io"] is None
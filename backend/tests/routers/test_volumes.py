@@ -0,0 +1,136 @@
+"""Unit tests for volumes router."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return TestClient(app)
+
+
+@patch("app.routers.volumes.repository")
+def test_list_volumes(mock_repository, client):
+    """Test list volumes endpoint returns sizes."""
+    mock_repository.list_volumes.return_value = [
+        {
+            "name": "postgres_data",
+            "driver": "local",
+            "mountpoint": "/var/lib/docker/volumes/postgres_data/_data",
+            "created": "2025-10-29T10:00:00Z",
+            "labels": {},
+            "scope": "local",
+            "size_bytes": 1048576,
+            "size_mb": 1.0,
+            "ref_count": 1,
+            "in_use": True,
+        }
+    ]
+
+    response = client.get("/api/v1/volumes")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["size_mb"] == 1.0
+    assert data[0]["in_use"] is True
+
+
+@patch("app.routers.volumes.repository")
+def test_get_unused_volumes(mock_repository, client):
+    """Test unused volumes endpoint."""
+    mock_repository.get_unused_volumes.return_value = ["orphan"]
+
+    response = client.get("/api/v1/volumes/unused")
+
+    assert response.status_code == 200
+    assert response.json() == ["orphan"]
+
+
+@patch("app.routers.volumes.repository")
+def test_get_volume_consumers(mock_repository, client):
+    """Test volume consumers endpoint."""
+    mock_repository.get_volume_consumers.return_value = [
+        {
+            "volume": "postgres_data",
+            "container_id": "abc123def456",
+            "container_name": "local-postgres",
+            "destination": "/var/lib/postgresql/data",
+            "read_only": False,
+        }
+    ]
+
+    response = client.get("/api/v1/volumes/postgres_data/consumers")
+
+    assert response.status_code == 200
+    assert response.json()[0]["container_name"] == "local-postgres"
+
+
+@patch("app.routers.volumes.repository")
+def test_get_volume_consumers_not_found(mock_repository, client):
+    """Test volume consumers endpoint with unknown volume."""
+    mock_repository.get_volume_consumers.side_effect = ValueError(
+        "Volume missing not found"
+    )
+
+    response = client.get("/api/v1/volumes/missing/consumers")
+
+    assert response.status_code == 404
+
+
+@patch("app.routers.volumes.repository")
+def test_get_disk_usage(mock_repository, client):
+    """Test disk usage endpoint serves scanner results."""
+    mock_repository.get_disk_usage.return_value = [
+        {
+            "name": "ollama_models",
+            "kind": "volume",
+            "path": "/var/lib/docker/volumes/ollama_models/_data",
+            "size_bytes": 4096,
+            "file_count": 3,
+            "last_scanned": "2025-12-04T10:00:00+00:00",
+            "scan_seconds": 0.2,
+        }
+    ]
+
+    response = client.get("/api/v1/volumes/disk-usage")
+
+    assert response.status_code == 200
+    assert response.json()[0]["size_bytes"] == 4096
+
+
+@patch("app.routers.volumes.DiskUsageRepository")
+@patch("app.routers.volumes.event_bus")
+@patch("app.routers.volumes.repository")
+def test_list_volumes_not_modified(
+    mock_repository, mock_event_bus, mock_disk_usage, client
+):
+    """Test an unchanged listing is answered with 304."""
+    mock_event_bus.connected = True
+    mock_disk_usage.is_fresh.return_value = True
+    mock_repository.list_volumes.return_value = [
+        {
+            "name": "pgdata",
+            "driver": "local",
+            "mountpoint": "/var/lib/docker/volumes/pgdata/_data",
+            "created": "2025-10-29T10:00:00Z",
+            "scope": "local",
+        }
+    ]
+
+    etag = client.get("/api/v1/volumes").headers["etag"]
+    response = client.get("/api/v1/volumes", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    mock_repository.list_volumes.assert_called_once()
+
+    # Snapshot expired: recomputed, still unchanged, still 304
+    mock_disk_usage.is_fresh.return_value = False
+    response = client.get("/api/v1/volumes", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert mock_repository.list_volumes.call_count == 2